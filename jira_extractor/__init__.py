@@ -5,6 +5,7 @@ JIRA Client - JIRA REST API client for MCP server
 """
 
 from .client import JiraClient
+from .async_client import AsyncJiraClient
 
 __version__ = "1.0.0"
-__all__ = ["JiraClient"]
\ No newline at end of file
+__all__ = ["JiraClient", "AsyncJiraClient"]
\ No newline at end of file
@@ -0,0 +1,778 @@
+#!/usr/bin/env python3
+"""
+Async JIRA Client - non-blocking REST API client for JIRA interactions
+
+Mirrors the public surface of :class:`jira_extractor.client.JiraClient` but is
+built on ``httpx.AsyncClient`` so callers running inside an event loop (such as
+the FastMCP server) can overlap requests on the network instead of blocking
+the loop on every round trip.
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import time
+from collections import deque
+from urllib.parse import urljoin, urlencode
+from typing import Optional, Dict, Any, List, Iterable, AsyncIterator, Tuple, Callable
+
+import httpx
+
+from .client import (
+    CHILD_SUMMARY_FIELDS,
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_MAX_GET_QUERY_LENGTH,
+    DEFAULT_PAGE_CONCURRENCY,
+    DEFAULT_SEARCH_PAGE_SIZE,
+    FIELD_STORE_NAMESPACE,
+    SEARCH_PAGE_PATHS,
+    BatchCallback,
+    FieldSpec,
+    PageCallback,
+    TraversalCallback,
+    _batched_in_clauses,
+    _collect_batched_issues,
+    _issue_id,
+    _join_fields,
+    _keyset_jql,
+    _quote_jql_value,
+    _search_body,
+    _strip_order_by,
+)
+from .breaker import CircuitBreaker, CircuitOpenError
+from .cache import (
+    IssueCache,
+    DEFAULT_ISSUE_CACHE_MAX_BYTES,
+    DEFAULT_ISSUE_CACHE_REVALIDATE_TTL,
+    DEFAULT_ISSUE_CACHE_STALE_TTL,
+    DEFAULT_ISSUE_CACHE_TTL,
+)
+from .deadline import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    DeadlineExceeded,
+    check_deadline,
+    deadline_expired,
+    request_timeout,
+)
+from .decoding import PathSpec, decode_body, decode_json
+from .fields import FieldIndex, FieldRegistry
+from .freshness import fresh_required
+from .retry import RetryPolicy
+from .singleflight import AsyncSingleFlight, request_key
+from .store import PersistentStore
+from .traversal import DescendantTraversal, DIRECTION_DOWN
+
+# Default size of the async connection pool
+DEFAULT_MAX_CONNECTIONS = 20
+
+
+class AsyncJiraClient:
+    """Async JIRA API client for extracting issues and relationships"""
+
+    def __init__(self, base_url: str, username: Optional[str] = None, password: Optional[str] = None,
+                 token: Optional[str] = None, bearer_token: Optional[str] = None,
+                 max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 issue_cache_max_bytes: int = DEFAULT_ISSUE_CACHE_MAX_BYTES,
+                 issue_cache_ttl: float = DEFAULT_ISSUE_CACHE_TTL):
+        """
+        Initialize async JIRA client
+
+        Args:
+            base_url: JIRA instance URL
+            username: Username for Basic Auth (used with password or token)
+            password: Password for Basic Auth
+            token: API token for Basic Auth (used with username)
+            bearer_token: Personal Access Token for Bearer Auth
+            max_connections: Size of the connection pool shared by all requests
+            issue_cache_max_bytes: Approximate byte budget of the issue cache (0 disables it)
+            issue_cache_ttl: Seconds a cached issue stays fresh
+
+        Raises:
+            ValueError: If authentication parameters are invalid
+        """
+        self.base_url = base_url.rstrip('/')
+        self.api_base = urljoin(self.base_url, '/rest/api/2/')
+        self.store: Optional[PersistentStore] = None  # On-disk cache shared across restarts, when configured
+        self.fields = FieldRegistry()  # Indexed /field metadata, also used by JiraTools
+        self.issue_cache = IssueCache(issue_cache_max_bytes, issue_cache_ttl, stale_ttl=DEFAULT_ISSUE_CACHE_STALE_TTL,
+                                      revalidate_ttl=DEFAULT_ISSUE_CACHE_REVALIDATE_TTL)
+        self.json_decoder = decode_json  # Full-document JSON decoder (orjson when installed)
+        self.single_flight = AsyncSingleFlight()  # Coalesces concurrent identical requests
+        self.max_get_query_length = DEFAULT_MAX_GET_QUERY_LENGTH  # Longer searches use POST
+        self.retry_policy = RetryPolicy()  # Backoff on 429/5xx and shared rate limiting
+        self.circuit_breaker = CircuitBreaker()  # Fails fast while JIRA is degraded
+        self.connect_timeout = DEFAULT_CONNECT_TIMEOUT  # Clipped to the current deadline per request
+        self.read_timeout = DEFAULT_READ_TIMEOUT
+        self._in_flight = 0  # Requests currently awaiting a response
+        self._revalidating: Dict[Tuple[str, str, str], asyncio.Task] = {}  # Background issue refreshes
+
+        headers = {
+            'Content-Type': 'application/json',
+            'Accept': 'application/json'
+        }
+        auth = self._setup_auth(headers, username, password, token, bearer_token)
+
+        self.session = httpx.AsyncClient(
+            auth=auth,
+            headers=headers,
+            limits=httpx.Limits(max_connections=max_connections,
+                                max_keepalive_connections=max_connections),
+        )
+
+    @property
+    def in_flight_requests(self) -> int:
+        """Number of HTTP requests currently awaiting a response"""
+        return self._in_flight
+
+    @staticmethod
+    def _setup_auth(headers: Dict[str, str], username: Optional[str] = None, password: Optional[str] = None,
+                    token: Optional[str] = None, bearer_token: Optional[str] = None) -> Optional[httpx.Auth]:
+        """Resolve authentication into an httpx auth object or an Authorization header"""
+        if username and password:
+            return httpx.BasicAuth(username, password)
+        elif username and token:
+            # For API token, use token as password with basic auth
+            return httpx.BasicAuth(username, token)
+        elif bearer_token:
+            # For Bearer token (Personal Access Token), use Authorization header
+            headers['Authorization'] = f'Bearer {bearer_token}'
+            return None
+        elif not username:
+            # No authentication - for public issues
+            return None
+        else:
+            raise ValueError("Authentication parameters are invalid.")
+
+    async def aclose(self) -> None:
+        """Cancel background refreshes and close the underlying connection pool"""
+        for task in list(self._revalidating.values()):
+            task.cancel()
+        await self.session.aclose()
+
+    async def _make_api_request(self, url: str, params: Optional[Dict[str, Any]] = None,
+                                resource_name: str = "resource",
+                                handle_404_as_empty: bool = False, paths: PathSpec = None,
+                                json_body: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Make an API request with centralized error handling
+
+        Concurrent identical requests (same URL, parameters, body and 404 handling)
+        share one in-flight request and its parsed JSON.
+
+        Args:
+            url: API endpoint URL
+            params: Query parameters
+            resource_name: Name of resource for error messages
+            handle_404_as_empty: If True, return empty list for 404 errors
+            paths: Keep only these JSON paths (e.g. ``issues[].key``); see :mod:`jira_extractor.decoding`
+            json_body: Send a read-only POST with this JSON body instead of a GET
+
+        Returns:
+            JSON response data or empty list for 404 when handle_404_as_empty=True
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open
+            Exception: For authentication, permission, or HTTP errors
+        """
+        paths = tuple(paths) if paths else None
+        body_key = request_key('POST', json_body) if json_body is not None else None
+        key = request_key(url, params, handle_404_as_empty, paths, body_key)
+        return await self.single_flight.do(
+            key, lambda: self._request(url, params, resource_name, handle_404_as_empty, paths, json_body)
+        )
+
+    async def _request(self, url: str, params: Optional[Dict[str, Any]],
+                       resource_name: str, handle_404_as_empty: bool,
+                       paths: PathSpec = None, json_body: Optional[Dict[str, Any]] = None) -> Any:
+        """Perform one GET (or body-carrying POST) request with retries and map error statuses
+
+        See :meth:`_make_api_request`.
+        """
+        logging.debug(f"Making async API request to: {url}")
+        if params:
+            logging.debug(f"Query parameters: {params}")
+        if json_body is not None:
+            logging.debug(f"Request body: {json_body}")
+
+        await self._check_circuit()
+        attempt = 0
+        while True:
+            wait = self.retry_policy.before_request()
+            if wait:
+                check_deadline(wait, f"rate-limited request to {url}")
+                logging.debug(f"Rate limited; waiting {wait:.2f}s before request")
+                await asyncio.sleep(wait)
+
+            connect, read = request_timeout(self.connect_timeout, self.read_timeout, f"request to {url}")
+            self._in_flight += 1
+            sent_at = time.monotonic()
+            try:
+                timeout = httpx.Timeout(read, connect=connect)
+                if json_body is not None:
+                    response = await self.session.post(url, params=params or {}, json=json_body, timeout=timeout)
+                else:
+                    response = await self.session.get(url, params=params or {}, timeout=timeout)
+            except httpx.TransportError as e:
+                if isinstance(e, httpx.TimeoutException) and deadline_expired():
+                    # Clipped by the caller's own deadline, not a sign that JIRA is failing
+                    raise DeadlineExceeded(f"Deadline exceeded waiting for {resource_name}") from e
+                self.circuit_breaker.record_failure()
+                raise
+            finally:
+                self._in_flight -= 1
+
+            self.circuit_breaker.record_response(response.status_code, time.monotonic() - sent_at)
+            self.retry_policy.after_response(response.headers)
+            if self.circuit_breaker.is_open or not self.retry_policy.should_retry(response.status_code, attempt):
+                break
+            delay = self.retry_policy.backoff(response.status_code, attempt, response.headers)
+            check_deadline(delay, f"retrying {url}")
+            logging.info(f"JIRA returned {response.status_code} for {url}; retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        logging.debug(f"Response status: {response.status_code}")
+
+        # Handle common error cases
+        if response.status_code == 401:
+            raise Exception("Authentication failed. Please check your credentials.")
+        elif response.status_code == 403:
+            raise Exception(f"Access denied to {resource_name}. Check permissions.")
+        elif response.status_code == 404:
+            if handle_404_as_empty:
+                return []
+            else:
+                raise Exception(f"{resource_name} not found.")
+
+        # Handle any other HTTP errors
+        response.raise_for_status()
+
+        return decode_body(response, paths, self.json_decoder)
+
+    async def _check_circuit(self) -> None:
+        """Fail fast while the breaker is open; the first caller after the reset timeout probes JIRA"""
+        breaker = self.circuit_breaker
+        if breaker.allow():
+            return
+        if not breaker.acquire_probe():
+            raise breaker.open_error()
+        logging.info("Circuit breaker half-open; probing JIRA with test_connection")
+        with breaker.probing():
+            try:
+                await self.test_connection()
+            except Exception as e:
+                raise breaker.open_error() from e
+
+    async def get_issue(self, issue_key: str, expand: Optional[str] = None,
+                        fields: FieldSpec = None) -> Dict[str, Any]:
+        """
+        Fetch a single JIRA issue
+
+        Args:
+            issue_key: JIRA issue key (e.g., 'RFE-7877')
+            expand: Comma-separated list of fields to expand
+            fields: Fields to return (comma-separated string or iterable); all fields when None
+
+        Returns:
+            Issue data as dictionary (served from the issue cache when fresh or recently expired,
+            possibly with more fields than requested, or when stale while the circuit breaker is
+            open; treat as read-only).  A ``"fresh"`` read scope skips the cache lookup.
+
+        Raises:
+            Exception: If API request fails
+        """
+        cache_key = IssueCache.make_key(issue_key, _join_fields(fields), expand)
+        if self.issue_cache.enabled and not fresh_required():
+            # A cached copy fetched with a wider projection answers a narrower request too, and
+            # one that expired recently is served while a background refresh replaces it
+            cached = await self._off_loop(self.issue_cache.lookup_revalidating, issue_key, _join_fields(fields), expand)
+            if cached is not None:
+                issue, expired = cached
+                if expired:
+                    self._revalidate(cache_key)
+                return issue
+
+        try:
+            return await self._fetch_issue(cache_key)
+        except CircuitOpenError:
+            stale = await self._off_loop(self.issue_cache.get_stale, cache_key)
+            if stale is None:
+                raise
+            logging.info(f"JIRA unavailable; serving stale cached copy of {issue_key}")
+            return stale
+
+    async def _fetch_issue(self, cache_key: Tuple[str, str, str]) -> Dict[str, Any]:
+        """Fetch the issue projection named by an issue cache key and store it in the cache"""
+        issue_key, fields, expand = cache_key
+        url = urljoin(self.api_base, f'issue/{issue_key}')
+        params = {}
+        if expand:
+            params['expand'] = expand
+        if fields:
+            params['fields'] = fields
+
+        issue = await self._make_api_request(
+            url,
+            params=params if params else None,
+            resource_name=f"Issue {issue_key}"
+        )
+        await self._off_loop(self.issue_cache.put, cache_key, issue)
+        return issue
+
+    async def _off_loop(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Call an issue cache method, in a worker thread when it may touch the persistent store's SQLite file"""
+        if self.issue_cache.store is None:
+            return func(*args)
+        return await _to_thread(func, *args)
+
+    def _revalidate(self, cache_key: Tuple[str, str, str]) -> None:
+        """Refresh a recently expired cached issue in a background task, once per key at a time"""
+        if cache_key in self._revalidating:
+            return
+        # Started from an empty context: the refresh must not inherit the tool call's deadline
+        task = contextvars.Context().run(asyncio.get_running_loop().create_task, self._refresh_issue(cache_key))
+        self._revalidating[cache_key] = task
+        task.add_done_callback(lambda _: self._revalidating.pop(cache_key, None))
+
+    async def _refresh_issue(self, cache_key: Tuple[str, str, str]) -> None:
+        try:
+            await self._fetch_issue(cache_key)
+        except Exception as e:
+            # The expired copy stays cached; the next lookup past its revalidate window blocks on JIRA
+            logging.debug(f"Background refresh of {cache_key[0]} failed: {e}")
+
+    async def _search(self, jql: str, fields: FieldSpec = None, expand: Optional[str] = None,
+                      start_at: int = 0, max_results: int = 50,
+                      resource_name: str = "search results",
+                      paths: PathSpec = None) -> Dict[str, Any]:
+        """
+        Run a single JQL search page
+
+        See :meth:`jira_extractor.client.JiraClient._search`.
+        """
+        url = urljoin(self.api_base, 'search')
+        params = {
+            'jql': jql,
+            'startAt': start_at,
+            'maxResults': max_results,
+            'validateQuery': 'false',
+        }
+        fields = _join_fields(fields)
+        if fields:
+            params['fields'] = fields
+        if expand:
+            params['expand'] = expand
+
+        if paths:
+            paths = SEARCH_PAGE_PATHS + tuple(paths)
+
+        if len(urlencode(params)) > self.max_get_query_length:
+            return await self._make_api_request(url, resource_name=resource_name, paths=paths,
+                                                json_body=_search_body(params))
+        return await self._make_api_request(url, params=params, resource_name=resource_name, paths=paths)
+
+    async def iter_search(self, jql: str, fields: FieldSpec = None, page_size: int = DEFAULT_SEARCH_PAGE_SIZE,
+                          expand: Optional[str] = None, concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+                          resource_name: str = "search results", on_page: PageCallback = None,
+                          paths: PathSpec = None, keyset: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over every issue matching a JQL search, page by page
+
+        See :meth:`jira_extractor.client.JiraClient.iter_search`.
+        """
+        if keyset:
+            async for issue in self._iter_keyset(jql, fields, page_size, expand, resource_name, on_page, paths):
+                yield issue
+            return
+
+        async def fetch(start_at: int) -> Dict[str, Any]:
+            return await self._search(jql, fields=fields, expand=expand, start_at=start_at, max_results=page_size,
+                                      resource_name=resource_name, paths=paths) or {}
+
+        response = await fetch(0)
+        page = response.get('issues', [])
+        total = response.get('total', 0)
+        fetched = len(page)
+        if on_page:
+            on_page(fetched, max(total, fetched))
+        for issue in page:
+            yield issue
+        if not page or fetched >= total:
+            return
+
+        offsets = iter(range(len(page), total, len(page)))
+        pending = deque()
+        try:
+            while True:
+                # Keep the window full so later pages download while this one is consumed
+                while len(pending) < max(1, concurrency):
+                    start_at = next(offsets, None)
+                    if start_at is None:
+                        break
+                    pending.append(asyncio.ensure_future(fetch(start_at)))
+                if not pending:
+                    return
+                page = (await pending.popleft()).get('issues', [])
+                fetched += len(page)
+                if on_page:
+                    on_page(fetched, max(total, fetched))
+                if not page:
+                    return  # Results shrank while paging
+                for issue in page:
+                    yield issue
+        finally:
+            for future in pending:
+                future.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _iter_keyset(self, jql: str, fields: FieldSpec, page_size: int, expand: Optional[str],
+                           resource_name: str, on_page: PageCallback,
+                           paths: PathSpec) -> AsyncIterator[Dict[str, Any]]:
+        """Keyset-paginated search ordered by issue id (see :meth:`iter_search`)"""
+        base = _strip_order_by(jql)
+        if paths:
+            paths = tuple(paths) + ('issues[].id',)
+
+        async def fetch(after_id: Optional[int]) -> Dict[str, Any]:
+            return await self._search(_keyset_jql(base, after_id), fields=fields, expand=expand,
+                                      max_results=page_size, resource_name=resource_name, paths=paths) or {}
+
+        fetched = 0
+        pending = asyncio.ensure_future(fetch(None))
+        try:
+            while pending is not None:
+                response = await pending
+                pending = None
+                page = response.get('issues', [])
+                remaining = response.get('total', 0)  # Matches from this page onwards
+                if page and remaining > len(page):
+                    last_id = _issue_id(page[-1])
+                    if last_id is None:
+                        logging.warning(f"Stopping keyset search for {resource_name}: issue without a numeric id")
+                    else:
+                        # Fetch the next page while the caller consumes this one
+                        pending = asyncio.ensure_future(fetch(last_id))
+                if on_page:
+                    on_page(fetched + len(page), fetched + max(remaining, len(page)))
+                fetched += len(page)
+                for issue in page:
+                    yield issue
+        finally:
+            if pending is not None:
+                pending.cancel()
+                await asyncio.gather(pending, return_exceptions=True)
+
+    async def _search_all(self, jql: str, fields: FieldSpec = None, expand: Optional[str] = None,
+                          page_size: int = DEFAULT_SEARCH_PAGE_SIZE,
+                          resource_name: str = "search results",
+                          on_page: PageCallback = None,
+                          paths: PathSpec = None, keyset: bool = False) -> List[Dict[str, Any]]:
+        """
+        Run a JQL search and collect every page
+
+        See :meth:`jira_extractor.client.JiraClient._search_all`.
+        """
+        return [issue async for issue in self.iter_search(jql, fields=fields, page_size=page_size, expand=expand,
+                                                          resource_name=resource_name, on_page=on_page,
+                                                          paths=paths, keyset=keyset)]
+
+    async def get_issues(self, issue_keys: Iterable[str], fields: FieldSpec = None,
+                         expand: Optional[str] = None, on_batch: BatchCallback = None) -> Dict[str, Any]:
+        """
+        Fetch many JIRA issues using batched `key in (...)` searches
+
+        See :meth:`jira_extractor.client.JiraClient.get_issues`.
+        """
+        keys = list(dict.fromkeys(key for key in issue_keys if key))
+        batches = _batched_in_clauses('key', keys)
+        semaphore = asyncio.Semaphore(DEFAULT_BATCH_CONCURRENCY)
+
+        async def fetch(batch: Tuple[List[str], str]) -> List[Dict[str, Any]]:
+            batch_keys, jql = batch
+            async with semaphore:
+                issues = await self._search_all(jql, fields=fields, expand=expand, page_size=len(batch_keys),
+                                                resource_name=f"issues {batch_keys[0]}..{batch_keys[-1]}")
+            if on_batch:
+                on_batch(len(batch_keys))
+            return issues
+
+        pages = await asyncio.gather(*(fetch(batch) for batch in batches))
+        return _collect_batched_issues(keys, list(pages))
+
+    async def test_connection(self) -> Dict[str, Any]:
+        """Test JIRA connection and authentication"""
+        url = urljoin(self.api_base, 'myself')
+        return await self._make_api_request(url, resource_name="User information")
+
+    async def get_remote_links(self, issue_key: str) -> List[Dict[str, Any]]:
+        """
+        Fetch remote links for a JIRA issue
+
+        Args:
+            issue_key: JIRA issue key (e.g., 'RFE-7877')
+
+        Returns:
+            List of remote link data
+
+        Raises:
+            Exception: If API request fails
+        """
+        url = urljoin(self.api_base, f'issue/{issue_key}/remotelink')
+
+        return await self._make_api_request(
+            url,
+            resource_name=f"remote links for issue {issue_key}",
+            handle_404_as_empty=True
+        )
+
+    async def get_parent_link_child_issues(self, issue_key: str, parent_link_field: str = "Parent Link",
+                                           fields: FieldSpec = CHILD_SUMMARY_FIELDS,
+                                           on_page: PageCallback = None) -> List[Dict[str, Any]]:
+        """
+        Search for issues that have the given issue as their parent using a parent link field
+
+        See :meth:`jira_extractor.client.JiraClient.get_parent_link_child_issues`.
+        """
+        if not issue_key or not parent_link_field:
+            logging.warning("Invalid parameters for get_parent_link_child_issues")
+            return []
+
+        jql = f'{_quote_jql_value(parent_link_field)} = {_quote_jql_value(issue_key)}'
+
+        try:
+            issues = await self._search_all(
+                jql,
+                fields=fields,
+                resource_name=f"children of issue {issue_key} via {parent_link_field}",
+                on_page=on_page
+            )
+            logging.debug(f"Found {len(issues)} children via {parent_link_field} for {issue_key}")
+            return issues
+
+        except Exception as e:
+            logging.debug(f"Could not search for {parent_link_field} children of {issue_key}: {e}")
+            return []
+
+    async def get_parent_link_children(self, issue_key: str, parent_link_field: str = "Parent Link") -> List[str]:
+        """
+        Search for issues that have the given issue as their parent using a parent link field
+
+        Args:
+            issue_key: JIRA issue key to search for children
+            parent_link_field: Name of the parent link field (default: "Parent Link")
+
+        Returns:
+            List of child issue keys
+        """
+        issues = await self.get_parent_link_child_issues(issue_key, parent_link_field, fields='key')
+        return [issue.get('key') for issue in issues if issue.get('key')]
+
+    async def get_field_by_name(self, field_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up field metadata by name to get field ID
+
+        Args:
+            field_name: Display name of the field (e.g., "Parent Link")
+
+        Returns:
+            Field metadata dictionary or None if not found (or the field list cannot be fetched)
+        """
+        try:
+            index = await self.field_index()
+        except Exception as e:
+            logging.debug(f"Could not fetch field metadata: {e}")
+            return None
+
+        field = index.by_name(field_name)
+        if field is None:
+            logging.debug(f"Field '{field_name}' not found")
+        else:
+            logging.debug(f"Found field '{field_name}' with ID: {field.get('id')}")
+        return field
+
+    async def field_index(self) -> FieldIndex:
+        """
+        The instance's field metadata indexed by name, ID, clause name and custom type
+
+        Served from :attr:`fields` until its TTL runs out; then the persistent store,
+        when a fresh copy is there, or ``/field`` reloads it.
+
+        Raises:
+            Exception: If the field list cannot be fetched
+        """
+        index = self.fields.current()
+        if index is not None:
+            return index
+        if self.store is not None:
+            stored = await _to_thread(self.store.get, FIELD_STORE_NAMESPACE, "all", max_age=self.fields.ttl)
+            if stored is not None:
+                return self.fields.update(stored.value, age=self.store.now() - stored.stored_at)
+        fields = await self._make_api_request(urljoin(self.api_base, 'field'), resource_name="field metadata")
+        if not isinstance(fields, list):
+            raise ValueError(f"Unexpected field metadata response: {type(fields).__name__}")
+        if self.store is not None:
+            await _to_thread(self.store.put, FIELD_STORE_NAMESPACE, "all", fields)
+        return self.fields.update(fields)
+
+    async def get_parent_link_children_batch(self, issue_keys: Iterable[str],
+                                             parent_link_field: str = "Parent Link") -> List[str]:
+        """
+        Find the parent-link children of many issues at once
+
+        See :meth:`jira_extractor.client.JiraClient.get_parent_link_children_batch`.
+        """
+        keys = list(dict.fromkeys(key for key in issue_keys if key))
+        batches = _batched_in_clauses(parent_link_field, keys)
+        semaphore = asyncio.Semaphore(DEFAULT_BATCH_CONCURRENCY)
+
+        async def fetch(batch: Tuple[List[str], str]) -> List[str]:
+            batch_keys, jql = batch
+            try:
+                async with semaphore:
+                    issues = await self._search_all(
+                        jql, fields='key', paths=('issues[].key',),
+                        resource_name=f"children of {len(batch_keys)} issues via {parent_link_field}"
+                    )
+            except (DeadlineExceeded, CircuitOpenError):
+                raise  # The caller must not mistake an interrupted search for "no children"
+            except Exception as e:
+                logging.debug(f"Could not search for {parent_link_field} children of {batch_keys}: {e}")
+                return []
+            return [issue.get('key') for issue in issues if issue.get('key')]
+
+        pages = await asyncio.gather(*(fetch(batch) for batch in batches))
+        return [key for page in pages for key in page]
+
+    async def get_descendants(self, issue_key: str, depth: int = 0,
+                              include_subtasks: bool = False, include_links: bool = False,
+                              include_remote_links: bool = False, include_parent_links: bool = False,
+                              parent_link_field: str = "Parent Link", expand: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch an issue and its descendants based on specified relationship types and depth
+
+        See :meth:`jira_extractor.client.JiraClient.get_descendants` for argument details.
+
+        Returns:
+            Dictionary mapping issue keys to issue data
+        """
+        traversal = DescendantTraversal(
+            issue_key, depth, include_subtasks, include_links,
+            include_remote_links, include_parent_links, parent_link_field, expand
+        )
+        await self.run_traversal(traversal)
+        return traversal.result()
+
+    async def run_traversal(self, traversal: DescendantTraversal, max_nodes: Optional[int] = None,
+                            max_seconds: Optional[float] = None, progress: TraversalCallback = None) -> bool:
+        """
+        Drive a :class:`DescendantTraversal` until its frontier is empty or a budget runs out
+
+        Budgets are checked between batches, so a single level may overrun
+        *max_seconds* by the duration of one batched fetch.  The deadline of the
+        current call is a hard stop: a level interrupted by it, by an open circuit breaker
+        or by a failed fetch goes back to the frontier, so a continuation token still covers it.
+
+        Args:
+            traversal: Traversal state to advance (new or restored from a token)
+            max_nodes: Maximum number of issues to fetch in this run (None for unlimited)
+            max_seconds: Wall-clock budget for this run in seconds (None for unlimited)
+            progress: Called with a :meth:`DescendantTraversal.progress` snapshot as each
+                batch completes and after each level is expanded
+
+        Returns:
+            True if the traversal completed, False if it stopped on a budget or an interrupted level
+        """
+        started = time.monotonic()
+        deadline = started + max_seconds if max_seconds is not None else None
+        fetched_nodes = 0  # Keys taken from the frontier in this run
+        completed_nodes = 0  # Keys whose batch has returned
+
+        def report() -> None:
+            if progress:
+                budget = max_nodes - completed_nodes if max_nodes is not None else None
+                progress(traversal.progress(completed_nodes, fetched_nodes - completed_nodes,
+                                            self.in_flight_requests, time.monotonic() - started, budget))
+
+        def batch_done(batch_size: int) -> None:
+            nonlocal completed_nodes
+            completed_nodes += batch_size
+            report()
+
+        parent_link_field_id = None
+        if traversal.include_parent_links and traversal.direction != DIRECTION_DOWN:
+            # Only a related walk follows the parent link value, which is read from each issue
+            field_metadata = await self.get_field_by_name(traversal.parent_link_field)
+            parent_link_field_id = field_metadata.get('id') if field_metadata else None
+
+        fields = traversal.fields or '*all'
+        if traversal.fields and parent_link_field_id:
+            fields = f"{fields},{parent_link_field_id}"
+
+        while not traversal.done:
+            if max_nodes is not None and fetched_nodes >= max_nodes:
+                return False
+            if (deadline is not None and time.monotonic() >= deadline) or deadline_expired():
+                return False
+
+            limit = max_nodes - fetched_nodes if max_nodes is not None else None
+            keys, level_depth = traversal.take_level(limit)
+            fetched_nodes += len(keys)
+            logging.info(f"Fetching {len(keys)} issues at depth {level_depth}")
+
+            try:
+                fetched = await self.get_issues(keys, fields=fields, expand=traversal.expand, on_batch=batch_done)
+                found = [key for key in keys if fetched.get(key) is not None]
+                expand = bool(found) and traversal.should_expand(level_depth)
+                children = None
+                if expand:
+                    # Remote links and parent-link children of the level are fetched concurrently
+                    remote_links = self._fetch_remote_links(found) if traversal.include_remote_links else _no_result()
+                    children = (self.get_parent_link_children_batch(found, traversal.parent_link_field)
+                                if traversal.include_parent_links else _no_result())
+                    _, children = await asyncio.gather(remote_links, children)
+            except Exception as e:
+                # Nothing of the level is recorded yet; resuming fetches it again
+                logging.warning(f"Fetching issues at depth {level_depth} was interrupted: {e}; stopping")
+                traversal.requeue(keys, level_depth)
+                return False
+            completed_nodes = fetched_nodes
+            traversal.record_level(keys, level_depth, fetched)
+
+            if not expand:
+                continue
+
+            traversal.expand_level(found, level_depth, children or [], parent_link_field_id)
+            report()
+
+        return True
+
+    async def _fetch_remote_links(self, issue_keys: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch remote links for many issues with bounded concurrency"""
+        semaphore = asyncio.Semaphore(DEFAULT_BATCH_CONCURRENCY)
+
+        async def fetch(key: str) -> List[Dict[str, Any]]:
+            try:
+                async with semaphore:
+                    remote_links = await self.get_remote_links(key)
+                logging.debug(f"Found {len(remote_links)} remote links for {key}")
+                return remote_links
+            except Exception as e:
+                logging.debug(f"Could not fetch remote links for {key}: {e}")
+                return []
+
+        results = await asyncio.gather(*(fetch(key) for key in issue_keys))
+        return dict(zip(issue_keys, results))
+
+
+async def _no_result() -> None:
+    """Placeholder awaitable for optional steps skipped in a traversal level"""
+    return None
+
+
+async def _to_thread(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking call on the default executor with the caller's context (``asyncio.to_thread`` needs 3.9)"""
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(None, call)
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Circuit breaker for the JIRA backend
+
+After ``failure_threshold`` consecutive failed or too-slow responses the
+breaker opens and requests fail fast with :class:`CircuitOpenError` instead of
+piling more load onto a degraded JIRA.  Once ``reset_timeout`` has passed, the
+next caller becomes the single half-open probe (``test_connection``): success
+closes the breaker, failure opens it for another ``reset_timeout``.
+"""
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Callable, Iterator
+
+# Default consecutive failures (or latency SLO breaches) that open the breaker
+DEFAULT_BREAKER_FAILURE_THRESHOLD = 5
+
+# Default seconds the breaker stays open before a half-open probe
+DEFAULT_BREAKER_RESET_TIMEOUT = 30.0
+
+# Default response time in seconds above which a response counts as a failure
+DEFAULT_BREAKER_LATENCY_SLO = 10.0
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Set while the current call is the half-open probe, so its own request is let through
+_probing: contextvars.ContextVar = contextvars.ContextVar("jira_breaker_probe", default=False)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the breaker is open"""
+
+
+class CircuitBreaker:
+    """Thread-safe consecutive-failure circuit breaker with a single half-open probe"""
+
+    def __init__(self, failure_threshold: int = DEFAULT_BREAKER_FAILURE_THRESHOLD,
+                 reset_timeout: float = DEFAULT_BREAKER_RESET_TIMEOUT,
+                 latency_slo: float = DEFAULT_BREAKER_LATENCY_SLO,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize circuit breaker
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker (0 disables it)
+            reset_timeout: Seconds to stay open before probing
+            latency_slo: Responses slower than this many seconds count as failures (0 disables the SLO)
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.failure_threshold = max(0, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.latency_slo = latency_slo
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+
+        # Metrics
+        self._failures = 0
+        self._slow_responses = 0
+        self._trips = 0
+        self._rejected = 0
+        self._probes = 0
+
+    @property
+    def state(self) -> str:
+        """Current state: ``closed``, ``open`` or ``half_open``"""
+        return self._state
+
+    @property
+    def is_open(self) -> bool:
+        """True while requests are being failed fast (open or probing)"""
+        return self._state != CLOSED
+
+    def allow(self) -> bool:
+        """True when a request may be sent (closed, or this call is the probe)"""
+        return self._state == CLOSED or _probing.get()
+
+    def acquire_probe(self) -> bool:
+        """Claim the half-open probe if the breaker is open and its reset timeout has passed"""
+        with self._lock:
+            if self._state == OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                self._state = HALF_OPEN
+                self._probes += 1
+                return True
+            self._rejected += 1
+            return False
+
+    @contextmanager
+    def probing(self) -> Iterator[None]:
+        """Run the probe request; the breaker reopens unless the probe recorded a success"""
+        token = _probing.set(True)
+        try:
+            yield
+        finally:
+            _probing.reset(token)
+            with self._lock:
+                if self._state == HALF_OPEN:
+                    self._open()
+
+    def open_error(self) -> CircuitOpenError:
+        """Build the fast-fail error for the current state"""
+        retry_in = max(0.0, self.reset_timeout - (self._clock() - self._opened_at))
+        return CircuitOpenError(
+            f"JIRA appears unavailable ({self._consecutive_failures} consecutive failed or slow responses); "
+            f"failing fast, next connection check in {retry_in:.0f}s."
+        )
+
+    def record_response(self, status_code: int, latency: float) -> None:
+        """Record a response: 5xx and latency SLO breaches are failures, anything else a success"""
+        server_error = isinstance(status_code, int) and status_code >= 500
+        slow = bool(self.latency_slo) and latency > self.latency_slo
+        if server_error or slow:
+            self.record_failure(slow=not server_error)
+        else:
+            self.record_success()
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state == CLOSED:
+                self._consecutive_failures = 0
+            elif self._state == HALF_OPEN and _probing.get():
+                # Only the probe closes the breaker; requests already in flight when it opened do not
+                self._consecutive_failures = 0
+                self._state = CLOSED
+
+    def record_failure(self, slow: bool = False) -> None:
+        with self._lock:
+            self._failures += 1
+            if slow:
+                self._slow_responses += 1
+            self._consecutive_failures += 1
+            if self._state == HALF_OPEN or (
+                    self.failure_threshold and self._state == CLOSED
+                    and self._consecutive_failures >= self.failure_threshold):
+                self._open()
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._trips += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of breaker metrics"""
+        with self._lock:
+            return {
+                "state": self._state,
+                "consecutive_failures": self._consecutive_failures,
+                "failures": self._failures,
+                "slow_responses": self._slow_responses,
+                "trips": self._trips,
+                "rejected": self._rejected,
+                "probes": self._probes,
+            }
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+Issue cache - byte-bounded LRU with per-entry TTL
+
+:class:`IssueCache` keeps recently fetched issue payloads keyed by
+(issue key, fields projection, expand) so repeated ``get_issue`` calls within
+a conversation do not go back to JIRA.  Capacity is bounded by the approximate
+serialized size of the cached payloads rather than by entry count, because a
+single issue with a long changelog can outweigh hundreds of summaries.
+
+A request can also be answered from a cached copy of the same issue fetched
+with a wider projection (see :meth:`IssueCache.lookup`).
+
+Expired entries can be retained for a further ``stale_ttl`` seconds; they are
+never returned by :meth:`IssueCache.get`, but :meth:`IssueCache.get_stale`
+serves them when JIRA itself cannot be reached.
+
+Within ``revalidate_ttl`` seconds of expiry, :meth:`IssueCache.lookup_revalidating`
+still answers from the expired entry and tells the caller to refresh it in the
+background (stale-while-revalidate); past that window a lookup misses and the
+caller has to wait for JIRA.  Every hit reports the age of the payload it
+served to :func:`jira_extractor.freshness.observe`.
+
+With a :class:`~jira_extractor.store.PersistentStore` attached, every stored
+issue is also written to disk, and requests the memory tier cannot answer are
+looked up there, so a restarted server starts warm.  Disk reads run outside the
+cache lock, so a slow or busy database only delays the lookups that need it.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Callable, Hashable, Set, Tuple
+
+from .freshness import observe
+from .projection import covers
+from .store import PersistentStore
+
+# Persistent store namespace holding issue payloads
+STORE_NAMESPACE = "issue"
+
+# Default cache budget (approximate bytes of cached JSON)
+DEFAULT_ISSUE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Default time-to-live for cached issues in seconds
+DEFAULT_ISSUE_CACHE_TTL = 300
+
+# Default seconds an expired issue is kept to be served while JIRA is unavailable
+DEFAULT_ISSUE_CACHE_STALE_TTL = 3600
+
+# Default seconds past its TTL an issue is still served while it is refreshed in the background
+DEFAULT_ISSUE_CACHE_REVALIDATE_TTL = 300
+
+
+def _store_key(key: Tuple[str, str, str]) -> str:
+    return json.dumps(list(key), separators=(",", ":"))
+
+
+def _updated(value: Any) -> Optional[str]:
+    """JIRA's ``updated`` timestamp of an issue payload, when it carries one"""
+    if isinstance(value, dict):
+        updated = (value.get("fields") or {}).get("updated")
+        return updated if isinstance(updated, str) else None
+    return None
+
+
+def _approximate_size(value: Any) -> int:
+    """Approximate the memory held by a JSON payload by its compact serialized length"""
+    try:
+        return len(json.dumps(value, separators=(",", ":"), default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+class IssueCache:
+    """Thread-safe LRU cache bounded by approximate bytes with per-entry TTL
+
+    Cached payloads are shared with callers, who must treat them as read-only.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_ISSUE_CACHE_MAX_BYTES, ttl: float = DEFAULT_ISSUE_CACHE_TTL,
+                 clock: Callable[[], float] = time.monotonic, stale_ttl: float = 0,
+                 store: Optional[PersistentStore] = None, revalidate_ttl: float = 0):
+        """
+        Initialize issue cache
+
+        Args:
+            max_bytes: Approximate byte budget for cached payloads (0 disables the cache)
+            ttl: Seconds an entry stays fresh after it is stored
+            clock: Monotonic time source (injectable for tests)
+            stale_ttl: Seconds an expired entry is retained for :meth:`get_stale` (0 drops it on expiry)
+            store: Optional on-disk second tier shared across restarts and processes
+            revalidate_ttl: Seconds past expiry :meth:`lookup_revalidating` still serves an entry
+        """
+        self.max_bytes = max(0, max_bytes)
+        self.ttl = ttl
+        self.stale_ttl = max(0, stale_ttl)
+        self.revalidate_ttl = max(0, revalidate_ttl)
+        self.store = store
+        self._clock = clock
+        self._entries = OrderedDict()  # key -> (value, size, expires_at, fetched_at)
+        self._keys_by_issue: Dict[str, Set[Tuple[str, str, str]]] = {}  # issue key -> cached projections
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        # Metrics
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._stale_hits = 0
+        self._superset_hits = 0
+        self._persistent_hits = 0
+        self._revalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """True when the cache can hold entries"""
+        return self.max_bytes > 0 and self.ttl > 0
+
+    @property
+    def retention(self) -> float:
+        """Seconds after it is stored that an entry can still be served in any mode"""
+        return self.ttl + max(self.stale_ttl, self.revalidate_ttl)
+
+    @staticmethod
+    def make_key(issue_key: str, fields: Optional[str] = None, expand: Optional[str] = None) -> Tuple[str, str, str]:
+        """Build the cache key for an issue request"""
+        return issue_key, fields or "", expand or ""
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for *key*, or None on a miss or expired entry"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            value, _, expires_at, fetched_at = entry
+            now = self._clock()
+            if now >= expires_at:
+                if now >= expires_at + max(self.stale_ttl, self.revalidate_ttl):
+                    self._remove(key)
+                    self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            self._observe(fetched_at, now)
+            return value
+
+    def lookup(self, issue_key: str, fields: Optional[str] = None, expand: Optional[str] = None) -> Optional[Any]:
+        """
+        Return a fresh cached copy of an issue request, or None
+
+        An exact entry is preferred; otherwise any fresh entry for the issue whose
+        projection is a superset of *fields* and *expand* answers the request.
+        The returned payload may therefore carry more fields than were asked for.
+        When memory has no fresh answer, the persistent store is consulted and a
+        fresh stored entry is promoted into memory for the rest of its TTL.
+        """
+        found = self._lookup(issue_key, fields, expand, 0)
+        return None if found is None else found[0]
+
+    def lookup_revalidating(self, issue_key: str, fields: Optional[str] = None,
+                            expand: Optional[str] = None) -> Optional[Tuple[Any, bool]]:
+        """
+        Like :meth:`lookup`, but also answer from entries expired less than ``revalidate_ttl`` ago
+
+        Fresh entries are always preferred.  Returns ``(value, expired)`` or None;
+        when *expired* is True the caller should refresh the issue in the background.
+        """
+        found = self._lookup(issue_key, fields, expand, self.revalidate_ttl)
+        if found is None:
+            return None
+        value, expired = found
+        if expired:
+            with self._lock:
+                self._revalidations += 1
+        return value, expired
+
+    def _lookup(self, issue_key: str, fields: Optional[str], expand: Optional[str],
+                grace: float) -> Optional[Tuple[Any, bool]]:
+        key = self.make_key(issue_key, fields, expand)
+        allowances = (0, grace) if grace > 0 else (0,)
+        with self._lock:
+            found = self._serve(key, fields, expand, allowances)
+            if found is not None or self.store is None or not self.enabled:
+                if found is None:
+                    self._miss(key)
+                return found
+
+        # Read the disk tier without the lock: SQLite may wait on another process's write lock
+        stored = self.store.get_item(STORE_NAMESPACE, issue_key, max_age=self.ttl + allowances[-1])
+        with self._lock:
+            # Another thread may have cached a newer copy meanwhile; it wins over the stored one
+            found = self._serve(key, fields, expand, allowances, stored)
+            if found is None:
+                self._miss(key)
+            return found
+
+    def _serve(self, key: Tuple[str, str, str], fields: Optional[str], expand: Optional[str],
+               allowances: Tuple[float, ...], stored: Optional[list] = None) -> Optional[Tuple[Any, bool]]:
+        """
+        Answer a request from memory, then from *stored* entries, one allowance past expiry at a time (lock held)
+
+        A stored entry that answers is promoted into memory.  Returns ``(value, expired)`` or None.
+        """
+        now = self._clock()
+        for allowance in allowances:
+            entry = self._find(key, fields, expand, now - allowance)
+            if entry is None and stored:
+                restored = self._restore(stored, key[0], fields, expand, self.ttl + allowance)
+                if restored is not None:
+                    entry_key, entry = restored
+                    self._insert(entry_key, *entry)
+                    self._persistent_hits += 1
+            if entry is not None:
+                value, _, expires_at, fetched_at = entry
+                self._hits += 1
+                self._observe(fetched_at, now)
+                return value, now >= expires_at
+        return None
+
+    def _miss(self, key: Tuple[str, str, str]) -> None:
+        """Count a miss and drop the exact entry once no mode can serve it any more (lock held)"""
+        entry = self._entries.get(key)
+        if entry is not None and self._clock() >= entry[2] + max(self.stale_ttl, self.revalidate_ttl):
+            self._remove(key)
+            self._expirations += 1
+        self._misses += 1
+
+    def _find(self, key: Tuple[str, str, str], fields: Optional[str], expand: Optional[str],
+              cutoff: float) -> Optional[tuple]:
+        """Find an entry expiring after *cutoff* answering the request, preferring the exact key (lock held)"""
+        entry = self._entries.get(key)
+        if entry is not None and cutoff < entry[2]:
+            self._entries.move_to_end(key)
+            return entry
+        for candidate in self._keys_by_issue.get(key[0], ()):
+            entry = self._entries[candidate]
+            if cutoff < entry[2] and covers(candidate[1], fields, candidate[2], expand):
+                self._entries.move_to_end(candidate)
+                self._superset_hits += 1
+                return entry
+        return None
+
+    def _observe(self, fetched_at: float, now: float) -> None:
+        """Report the wall-clock fetch time of a served entry to the current read scope"""
+        observe(time.time() - (now - fetched_at))
+
+    def _restore(self, stored: list, issue_key: str, fields: Optional[str], expand: Optional[str],
+                 max_age: float) -> Optional[Tuple[Tuple[str, str, str], tuple]]:
+        """
+        Pick the stored entry younger than *max_age* answering the request, preferring an exact projection
+
+        *stored* holds the issue's entries as read by ``PersistentStore.get_item``.  Returns the
+        cache key and an in-memory entry tuple built from it, or None.
+        """
+        exact = _store_key(self.make_key(issue_key, fields, expand))
+        now = self.store.now()
+        best = None
+        for candidate in stored:
+            if now - candidate.stored_at >= max_age:
+                continue
+            try:
+                _, cached_fields, cached_expand = json.loads(candidate.key)
+            except ValueError:
+                continue
+            if candidate.key == exact:
+                best = candidate
+                break
+            if best is None and covers(cached_fields, fields, cached_expand, expand):
+                best = candidate
+        if best is None:
+            return None
+        # Keep the remaining lifetime rather than restarting the TTL on every restart
+        fetched_at = self._clock() - (now - best.stored_at)
+        entry = (best.value, _approximate_size(best.value), fetched_at + self.ttl, fetched_at)
+        return tuple(json.loads(best.key)), entry
+
+    def get_stale(self, key: Hashable) -> Optional[Any]:
+        """Return the value for *key* even if expired but within ``stale_ttl``, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                return self._serve_stale(entry)
+        if self.store is None or not isinstance(key, tuple):
+            return None
+
+        # After a restart during an outage, the stored copy is the only one left
+        max_age = self.ttl + self.stale_ttl
+        stored = self.store.get_item(STORE_NAMESPACE, key[0], max_age=max_age)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                restored = self._restore(stored, key[0], key[1], key[2], max_age)
+                if restored is None:
+                    return None
+                entry = restored[1]
+            return self._serve_stale(entry)
+
+    def _serve_stale(self, entry: tuple) -> Optional[Any]:
+        """Return an entry's value while it is within ``stale_ttl`` of expiry (lock held)"""
+        value, _, expires_at, fetched_at = entry
+        now = self._clock()
+        if now >= expires_at + self.stale_ttl:
+            return None
+
+        self._stale_hits += 1
+        self._observe(fetched_at, now)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store *value* under *key*, evicting least recently used entries to stay in budget"""
+        if not self.enabled:
+            return
+
+        size = _approximate_size(value)
+        if size > self.max_bytes:
+            # Larger than the whole budget; caching it would flush everything else
+            return
+
+        with self._lock:
+            now = self._clock()
+            self._insert(key, value, size, now + self.ttl, now)
+        if self.store is not None and isinstance(key, tuple):
+            self.store.put(STORE_NAMESPACE, _store_key(key), value, item=key[0], updated=_updated(value))
+
+    def _insert(self, key: Hashable, value: Any, size: int, expires_at: float, fetched_at: float) -> None:
+        """Add an entry and evict least recently used ones to stay in budget (lock held)"""
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (value, size, expires_at, fetched_at)
+        self._bytes += size
+        if isinstance(key, tuple):
+            self._keys_by_issue.setdefault(key[0], set()).add(key)
+        while self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._evictions += 1
+
+    def invalidate(self, issue_key: str) -> int:
+        """Drop every cached projection of *issue_key*, in memory and on disk
+
+        Returns the number of in-memory entries removed.
+        """
+        if self.store is not None:
+            self.store.delete_item(STORE_NAMESPACE, issue_key)
+        with self._lock:
+            keys = list(self._keys_by_issue.get(issue_key, ()))
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def invalidate_if_changed(self, issue_key: str, updated: Optional[str]) -> bool:
+        """
+        Drop the cached copies of *issue_key* unless they all match JIRA's *updated* value
+
+        Copies whose projection left out ``updated`` cannot be checked and count as
+        changed.  Returns True when anything was cached and has been invalidated.
+        """
+        with self._lock:
+            versions = {_updated(self._entries[key][0]) for key in self._keys_by_issue.get(issue_key, ())}
+        if self.store is not None:
+            versions |= {entry.updated for entry in self.store.get_item(STORE_NAMESPACE, issue_key)}
+        if not versions or versions == {updated}:
+            return False
+        self.invalidate(issue_key)
+        return True
+
+    def clear(self) -> None:
+        """Drop every in-memory entry (metrics and the persistent store are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_issue.clear()
+            self._bytes = 0
+
+    def _remove(self, key: Hashable) -> None:
+        size = self._entries.pop(key)[1]
+        self._bytes -= size
+        if isinstance(key, tuple):
+            projections = self._keys_by_issue.get(key[0])
+            if projections is not None:
+                projections.discard(key)
+                if not projections:
+                    del self._keys_by_issue[key[0]]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of cache metrics"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "stale_hits": self._stale_hits,
+                "superset_hits": self._superset_hits,
+                "persistent_hits": self._persistent_hits,
+                "revalidations": self._revalidations,
+                "hit_ratio": round(self._hits / lookups, 3) if lookups else 0.0,
+            }
@@ -4,19 +4,231 @@
 JIRA Client - REST API client for JIRA interactions
 """
 
+import functools
 import logging
-from urllib.parse import urljoin
-from typing import Optional, Dict, Any, Set, List
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, quote_plus, urlencode
+from typing import Optional, Dict, Any, List, Iterable, Iterator, Tuple, Callable
 
 import requests
 from requests.auth import HTTPBasicAuth
 
+from .breaker import CircuitBreaker, CircuitOpenError
+from .cache import (
+    IssueCache,
+    DEFAULT_ISSUE_CACHE_MAX_BYTES,
+    DEFAULT_ISSUE_CACHE_REVALIDATE_TTL,
+    DEFAULT_ISSUE_CACHE_STALE_TTL,
+    DEFAULT_ISSUE_CACHE_TTL,
+)
+from .deadline import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    DeadlineExceeded,
+    bind_context,
+    check_deadline,
+    deadline_expired,
+    request_timeout,
+)
+from .decoding import PathSpec, decode_body, decode_json
+from .fields import FieldIndex, FieldRegistry
+from .freshness import fresh_required
+from .pool import PooledHTTPAdapter
+from .projection import FieldSpec
+from .retry import RetryPolicy
+from .singleflight import SingleFlight, request_key
+from .store import PersistentStore
+from .traversal import DescendantTraversal, DIRECTION_DOWN
+
+# Maximum number of keys placed in a single batched `in (...)` JQL clause.  Long clauses are
+# sent with POST /search, so this only has to fit one search page (JIRA's default maximum
+# maxResults) and JIRA's clause limit (jira.search.maxclauses, 65,000 by default)
+DEFAULT_BATCH_SIZE = 1000
+
+# Searches whose URL-encoded query string is longer than this are sent with POST /search
+DEFAULT_MAX_GET_QUERY_LENGTH = 2000
+
+# Number of batched searches issued concurrently
+DEFAULT_BATCH_CONCURRENCY = 4
+
+# Page size requested when walking every page of a search (JIRA may cap it lower)
+DEFAULT_SEARCH_PAGE_SIZE = 1000
+
+# Search pages fetched ahead of the consumer once the result total is known
+DEFAULT_PAGE_CONCURRENCY = 4
+
+# Fields needed to summarize a child issue without fetching its full payload
+CHILD_SUMMARY_FIELDS = "key,summary,status,issuetype"
+
+# Threads refreshing recently expired cached issues in the background
+DEFAULT_REVALIDATE_WORKERS = 2
+
+# Persistent store namespace holding the instance's /field list
+FIELD_STORE_NAMESPACE = "field"
+
+# Search response paths kept whenever a search is decoded with a path projection
+SEARCH_PAGE_PATHS = ("startAt", "maxResults", "total")
+
+# Progress callbacks: page callbacks get (fetched, total), batch callbacks get the batch size,
+# traversal callbacks get a snapshot dict from DescendantTraversal.progress()
+PageCallback = Optional[Callable[[int, int], None]]
+BatchCallback = Optional[Callable[[int], None]]
+TraversalCallback = Optional[Callable[[Dict[str, Any]], None]]
+
+
+def _join_fields(fields: FieldSpec) -> Optional[str]:
+    """Normalize a field projection (comma-separated string or iterable) to a comma-separated string"""
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        return fields
+    return ",".join(fields)
+
+
+def _quote_jql_value(value: str) -> str:
+    """Quote a value for use inside a JQL clause"""
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+# Start of a trailing ORDER BY clause (matched outside quoted strings only)
+_ORDER_BY = re.compile(r'\border\s+by\b', re.IGNORECASE)
+
+
+def _strip_order_by(jql: str) -> str:
+    """Remove a trailing ORDER BY clause from a JQL query, ignoring quoted text"""
+    quote = None
+    escaped = False
+    for index, char in enumerate(jql):
+        if escaped:
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif quote:
+            if char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif _ORDER_BY.match(jql, index):
+            return jql[:index].strip()
+    return jql.strip()
+
+
+def _keyset_jql(jql: str, after_id: Optional[int] = None) -> str:
+    """Build a keyset page query: *jql* restricted to ids after *after_id*, ordered by id"""
+    clauses = [f"({jql})"] if jql else []
+    if after_id is not None:
+        clauses.append(f"id > {after_id}")
+    return f"{' AND '.join(clauses)} ORDER BY id ASC".lstrip()
+
+
+def _issue_id(issue: Dict[str, Any]) -> Optional[int]:
+    """Numeric id of an issue payload, or None when missing"""
+    try:
+        return int(issue.get('id'))
+    except (TypeError, ValueError):
+        return None
+
+
+def _batched_in_clauses(field: str, values: List[str], max_values: int = DEFAULT_BATCH_SIZE,
+                        max_jql_length: Optional[int] = None) -> List[Tuple[List[str], str]]:
+    """
+    Split values into `<field> in (...)` JQL clauses
+
+    Each clause holds at most *max_values* values and, when *max_jql_length* is
+    given, its URL-encoded form stays under that many characters.
+
+    Args:
+        field: JQL field name, quoted automatically when it contains spaces
+        values: Values to place in the clauses
+        max_values: Maximum number of values per clause
+        max_jql_length: Maximum URL-encoded length of a clause; unlimited when None
+
+    Returns:
+        List of (values, jql) tuples
+    """
+    field_ref = _quote_jql_value(field) if " " in field else field
+    prefix = f"{field_ref} in ("
+    base_length = len(quote_plus(prefix + ")"))
+
+    batches = []
+    current = []
+    current_length = base_length
+    for value in values:
+        quoted = _quote_jql_value(value)
+        # Account for the separating comma of every value after the first
+        value_length = len(quote_plus(quoted)) + (len(quote_plus(",")) if current else 0)
+        too_long = max_jql_length is not None and current_length + value_length > max_jql_length
+        if current and (len(current) >= max_values or too_long):
+            batches.append(current)
+            current = []
+            current_length = base_length
+            value_length = len(quote_plus(quoted))
+        current.append(value)
+        current_length += value_length
+    if current:
+        batches.append(current)
+
+    return [(batch, prefix + ",".join(_quote_jql_value(v) for v in batch) + ")") for batch in batches]
+
+
+def _search_body(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Translate GET /search query parameters into the JSON body of POST /search"""
+    body = {
+        'jql': params['jql'],
+        'startAt': params['startAt'],
+        'maxResults': params['maxResults'],
+        'validateQuery': params.get('validateQuery') != 'false',
+    }
+    for name in ('fields', 'expand'):
+        if params.get(name):
+            body[name] = [value for value in params[name].split(',') if value]
+    return body
+
+
+def _collect_batched_issues(requested_keys: List[str], pages: List[List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Merge batched search pages into a dict keyed by issue key
+
+    Returns:
+        Dictionary mapping issue keys to issue data, plus a ``_fetch_metadata`` entry
+        reporting requested keys that were not returned (deleted, moved or not visible)
+    """
+    found = {}
+    for page in pages:
+        for issue in page:
+            key = issue.get('key')
+            if key:
+                found[key] = issue
+
+    result = {key: found[key] for key in requested_keys if key in found}
+    # Moved issues come back under their new key; keep them rather than dropping the data
+    for key, issue in found.items():
+        result.setdefault(key, issue)
+
+    missing_keys = [key for key in requested_keys if key not in found]
+    if missing_keys:
+        logging.debug(f"Batched fetch did not return {len(missing_keys)} keys: {missing_keys}")
+
+    result["_fetch_metadata"] = {
+        "requested": len(requested_keys),
+        "found": len(requested_keys) - len(missing_keys),
+        "missing_keys": missing_keys,
+        "requests": len(pages),
+    }
+    return result
+
 
 class JiraClient:
     """JIRA API client for extracting issues and relationships"""
 
     def __init__(self, base_url: str, username: Optional[str] = None, password: Optional[str] = None,
-                 token: Optional[str] = None, bearer_token: Optional[str] = None):
+                 token: Optional[str] = None, bearer_token: Optional[str] = None,
+                 issue_cache_max_bytes: int = DEFAULT_ISSUE_CACHE_MAX_BYTES,
+                 issue_cache_ttl: float = DEFAULT_ISSUE_CACHE_TTL):
         """
         Initialize JIRA client
 
@@ -26,6 +238,8 @@ class JiraClient:
             password: Password for Basic Auth
             token: API token for Basic Auth (used with username)
             bearer_token: Personal Access Token for Bearer Auth
+            issue_cache_max_bytes: Approximate byte budget of the issue cache (0 disables it)
+            issue_cache_ttl: Seconds a cached issue stays fresh
 
         Raises:
             ValueError: If authentication parameters are invalid
@@ -33,7 +247,22 @@ class JiraClient:
         self.base_url = base_url.rstrip('/')
         self.api_base = urljoin(self.base_url, '/rest/api/2/')
         self.session = requests.Session()
-        self._field_cache = {}  # Cache for field metadata lookups
+        self.store: Optional[PersistentStore] = None  # On-disk cache shared across restarts, when configured
+        self.fields = FieldRegistry()  # Indexed /field metadata, also used by JiraTools
+        self.issue_cache = IssueCache(issue_cache_max_bytes, issue_cache_ttl, stale_ttl=DEFAULT_ISSUE_CACHE_STALE_TTL,
+                                      revalidate_ttl=DEFAULT_ISSUE_CACHE_REVALIDATE_TTL)
+        self.json_decoder = decode_json  # Full-document JSON decoder (orjson when installed)
+        self.single_flight = SingleFlight()  # Coalesces concurrent identical requests
+        self.max_get_query_length = DEFAULT_MAX_GET_QUERY_LENGTH  # Longer searches use POST
+        self.retry_policy = RetryPolicy()  # Backoff on 429/5xx and shared rate limiting
+        self.circuit_breaker = CircuitBreaker()  # Fails fast while JIRA is degraded
+        self.connect_timeout = DEFAULT_CONNECT_TIMEOUT  # Clipped to the current deadline per request
+        self.read_timeout = DEFAULT_READ_TIMEOUT
+        self._in_flight = 0  # Requests currently awaiting a response
+        self._in_flight_lock = threading.Lock()
+        self._revalidator: Optional[ThreadPoolExecutor] = None  # Created on the first background refresh
+        self._revalidating = set()  # Issue cache keys being refreshed in the background
+        self._revalidate_lock = threading.Lock()
 
         # Set up authentication
         self._setup_auth(username, password, token, bearer_token)
@@ -44,6 +273,76 @@ class JiraClient:
             'Accept': 'application/json'
         })
 
+        self.configure_pool()
+
+    def configure_pool(self, pool_maxsize: Optional[int] = None, pool_block: Optional[bool] = None,
+                       keepalive: Optional[bool] = None) -> PooledHTTPAdapter:
+        """
+        Mount a :class:`PooledHTTPAdapter` for http and https on the session
+
+        Args:
+            pool_maxsize: Maximum pooled connections per host (adapter default when None)
+            pool_block: Wait for a free connection when the pool is exhausted
+            keepalive: Enable TCP keep-alive probes on pooled connections
+
+        Returns:
+            The mounted adapter
+        """
+        options = {'pool_maxsize': pool_maxsize, 'pool_block': pool_block, 'keepalive': keepalive}
+        self.http_adapter = PooledHTTPAdapter(**{name: value for name, value in options.items() if value is not None})
+        self.session.mount('https://', self.http_adapter)
+        self.session.mount('http://', self.http_adapter)
+        return self.http_adapter
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Return connection pool metrics (connections opened, reused, idle)"""
+        return self.http_adapter.stats()
+
+    def prewarm(self, connections: int) -> int:
+        """
+        Open pooled connections ahead of the first burst of tool calls
+
+        Sends *connections* concurrent ``/myself`` requests (the :meth:`test_connection`
+        endpoint) past the single-flight layer, so each one checks out its own
+        connection and completes a TLS handshake in parallel.
+
+        Args:
+            connections: Number of connections to open (capped at the pool size)
+
+        Returns:
+            Number of new connections opened
+
+        Raises:
+            Exception: If a warm-up request fails
+        """
+        connections = min(connections, self.http_adapter.stats()['max_size'])
+        if connections < 1:
+            return 0
+
+        url = urljoin(self.api_base, 'myself')
+        opened_before = self.http_adapter.stats()['connections_opened']
+        barrier = threading.Barrier(connections)
+
+        def warm(_: int) -> None:
+            try:
+                # Release all requests together so none can reuse another's connection
+                barrier.wait(timeout=self.connect_timeout)
+            except threading.BrokenBarrierError:
+                pass
+            self._request(url, None, "User information", False)
+
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            list(executor.map(bind_context(warm), range(connections)))
+
+        opened = self.http_adapter.stats()['connections_opened'] - opened_before
+        logging.info(f"Prewarmed {opened} JIRA connections")
+        return opened
+
+    @property
+    def in_flight_requests(self) -> int:
+        """Number of HTTP requests currently awaiting a response"""
+        return self._in_flight
+
     def _setup_auth(self, username: Optional[str] = None, password: Optional[str] = None,
                     token: Optional[str] = None, bearer_token: Optional[str] = None):
         """Setup authentication for the session"""
@@ -63,27 +362,86 @@ class JiraClient:
 
     def _make_api_request(self, url: str, params: Optional[Dict[str, Any]] = None,
                           resource_name: str = "resource",
-                          handle_404_as_empty: bool = False) -> Any:
+                          handle_404_as_empty: bool = False, paths: PathSpec = None,
+                          json_body: Optional[Dict[str, Any]] = None) -> Any:
         """
         Make an API request with centralized error handling
 
+        Concurrent identical requests (same URL, parameters, body and 404 handling)
+        share one in-flight request and its parsed JSON.
+
         Args:
             url: API endpoint URL
             params: Query parameters
             resource_name: Name of resource for error messages
             handle_404_as_empty: If True, return empty list for 404 errors
+            paths: Keep only these JSON paths (e.g. ``issues[].key``); see :mod:`jira_extractor.decoding`
+            json_body: Send a read-only POST with this JSON body instead of a GET
 
         Returns:
             JSON response data or empty list for 404 when handle_404_as_empty=True
 
         Raises:
+            CircuitOpenError: If the circuit breaker is open
             Exception: For authentication, permission, or HTTP errors
         """
+        paths = tuple(paths) if paths else None
+        body_key = request_key('POST', json_body) if json_body is not None else None
+        key = request_key(url, params, handle_404_as_empty, paths, body_key)
+        return self.single_flight.do(
+            key, lambda: self._request(url, params, resource_name, handle_404_as_empty, paths, json_body)
+        )
+
+    def _request(self, url: str, params: Optional[Dict[str, Any]],
+                 resource_name: str, handle_404_as_empty: bool,
+                 paths: PathSpec = None, json_body: Optional[Dict[str, Any]] = None) -> Any:
+        """Perform one GET (or body-carrying POST) request with retries and map error statuses
+
+        See :meth:`_make_api_request`.
+        """
         logging.debug(f"Making API request to: {url}")
         if params:
             logging.debug(f"Query parameters: {params}")
-
-        response = self.session.get(url, params=params or {})
+        if json_body is not None:
+            logging.debug(f"Request body: {json_body}")
+
+        self._check_circuit()
+        attempt = 0
+        while True:
+            wait = self.retry_policy.before_request()
+            if wait:
+                check_deadline(wait, f"rate-limited request to {url}")
+                logging.debug(f"Rate limited; waiting {wait:.2f}s before request")
+                time.sleep(wait)
+
+            timeout = request_timeout(self.connect_timeout, self.read_timeout, f"request to {url}")
+            with self._in_flight_lock:
+                self._in_flight += 1
+            sent_at = time.monotonic()
+            try:
+                if json_body is not None:
+                    response = self.session.post(url, params=params or {}, json=json_body, timeout=timeout)
+                else:
+                    response = self.session.get(url, params=params or {}, timeout=timeout)
+            except requests.RequestException as e:
+                if isinstance(e, requests.Timeout) and deadline_expired():
+                    # Clipped by the caller's own deadline, not a sign that JIRA is failing
+                    raise DeadlineExceeded(f"Deadline exceeded waiting for {resource_name}") from e
+                self.circuit_breaker.record_failure()
+                raise
+            finally:
+                with self._in_flight_lock:
+                    self._in_flight -= 1
+
+            self.circuit_breaker.record_response(response.status_code, time.monotonic() - sent_at)
+            self.retry_policy.after_response(response.headers)
+            if self.circuit_breaker.is_open or not self.retry_policy.should_retry(response.status_code, attempt):
+                break
+            delay = self.retry_policy.backoff(response.status_code, attempt, response.headers)
+            check_deadline(delay, f"retrying {url}")
+            logging.info(f"JIRA returned {response.status_code} for {url}; retrying in {delay:.2f}s")
+            time.sleep(delay)
+            attempt += 1
 
         # Log response details for debugging
         logging.debug(f"Response status: {response.status_code}")
@@ -107,32 +465,329 @@ class JiraClient:
         # Handle any other HTTP errors
         response.raise_for_status()
 
-        return response.json()
+        return decode_body(response, paths, self.json_decoder)
+
+    def _check_circuit(self) -> None:
+        """Fail fast while the breaker is open; the first caller after the reset timeout probes JIRA"""
+        breaker = self.circuit_breaker
+        if breaker.allow():
+            return
+        if not breaker.acquire_probe():
+            raise breaker.open_error()
+        logging.info("Circuit breaker half-open; probing JIRA with test_connection")
+        with breaker.probing():
+            try:
+                self.test_connection()
+            except Exception as e:
+                raise breaker.open_error() from e
 
-    def get_issue(self, issue_key: str, expand: Optional[str] = None) -> Dict[str, Any]:
+    def get_issue(self, issue_key: str, expand: Optional[str] = None,
+                  fields: FieldSpec = None) -> Dict[str, Any]:
         """
         Fetch a single JIRA issue
 
         Args:
             issue_key: JIRA issue key (e.g., 'RFE-7877')
             expand: Comma-separated list of fields to expand
+            fields: Fields to return (comma-separated string or iterable); all fields when None
 
         Returns:
-            Issue data as dictionary
+            Issue data as dictionary (served from the issue cache when fresh or recently expired,
+            possibly with more fields than requested, or when stale while the circuit breaker is
+            open; treat as read-only).  A ``"fresh"`` read scope skips the cache lookup.
 
         Raises:
             Exception: If API request fails
         """
+        cache_key = IssueCache.make_key(issue_key, _join_fields(fields), expand)
+        if self.issue_cache.enabled and not fresh_required():
+            # A cached copy fetched with a wider projection answers a narrower request too, and
+            # one that expired recently is served while a background refresh replaces it
+            cached = self.issue_cache.lookup_revalidating(issue_key, _join_fields(fields), expand)
+            if cached is not None:
+                issue, expired = cached
+                if expired:
+                    self._revalidate(cache_key)
+                return issue
+
+        try:
+            return self._fetch_issue(cache_key)
+        except CircuitOpenError:
+            stale = self.issue_cache.get_stale(cache_key)
+            if stale is None:
+                raise
+            logging.info(f"JIRA unavailable; serving stale cached copy of {issue_key}")
+            return stale
+
+    def _fetch_issue(self, cache_key: Tuple[str, str, str]) -> Dict[str, Any]:
+        """Fetch the issue projection named by an issue cache key and store it in the cache"""
+        issue_key, fields, expand = cache_key
         url = urljoin(self.api_base, f'issue/{issue_key}')
         params = {}
         if expand:
             params['expand'] = expand
+        if fields:
+            params['fields'] = fields
 
-        return self._make_api_request(
+        issue = self._make_api_request(
             url,
             params=params if params else None,
             resource_name=f"Issue {issue_key}"
         )
+        self.issue_cache.put(cache_key, issue)
+        return issue
+
+    def _revalidate(self, cache_key: Tuple[str, str, str]) -> None:
+        """Refresh a recently expired cached issue on a background thread, once per key at a time"""
+        with self._revalidate_lock:
+            if cache_key in self._revalidating:
+                return
+            self._revalidating.add(cache_key)
+            if self._revalidator is None:
+                self._revalidator = ThreadPoolExecutor(max_workers=DEFAULT_REVALIDATE_WORKERS,
+                                                       thread_name_prefix="jira-revalidate")
+        # Submitted without bind_context: the refresh must not inherit the tool call's deadline
+        self._revalidator.submit(self._refresh_issue, cache_key)
+
+    def _refresh_issue(self, cache_key: Tuple[str, str, str]) -> None:
+        try:
+            self._fetch_issue(cache_key)
+        except Exception as e:
+            # The expired copy stays cached; the next lookup past its revalidate window blocks on JIRA
+            logging.debug(f"Background refresh of {cache_key[0]} failed: {e}")
+        finally:
+            with self._revalidate_lock:
+                self._revalidating.discard(cache_key)
+
+    def _search(self, jql: str, fields: FieldSpec = None, expand: Optional[str] = None,
+                start_at: int = 0, max_results: int = 50,
+                resource_name: str = "search results",
+                paths: PathSpec = None) -> Dict[str, Any]:
+        """
+        Run a single JQL search page
+
+        Searches whose encoded query string exceeds ``max_get_query_length`` (long
+        ``key in (...)`` batches, for example) are sent with POST /search instead.
+
+        Args:
+            jql: JQL query
+            fields: Fields to return (comma-separated string or iterable)
+            expand: Comma-separated list of fields to expand
+            start_at: Index of the first result
+            max_results: Page size
+            resource_name: Name of resource for error messages
+            paths: Keep only these JSON paths (e.g. ``issues[].key``) plus the paging fields
+
+        Returns:
+            Raw search response (``issues``, ``total``, ``startAt``, ``maxResults``)
+        """
+        url = urljoin(self.api_base, 'search')
+        params = {
+            'jql': jql,
+            'startAt': start_at,
+            'maxResults': max_results,
+            # Do not fail the whole query when a key in `key in (...)` no longer exists
+            'validateQuery': 'false',
+        }
+        fields = _join_fields(fields)
+        if fields:
+            params['fields'] = fields
+        if expand:
+            params['expand'] = expand
+
+        if paths:
+            paths = SEARCH_PAGE_PATHS + tuple(paths)
+
+        if len(urlencode(params)) > self.max_get_query_length:
+            return self._make_api_request(url, resource_name=resource_name, paths=paths,
+                                          json_body=_search_body(params))
+        return self._make_api_request(url, params=params, resource_name=resource_name, paths=paths)
+
+    def iter_search(self, jql: str, fields: FieldSpec = None, page_size: int = DEFAULT_SEARCH_PAGE_SIZE,
+                    expand: Optional[str] = None, concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+                    resource_name: str = "search results", on_page: PageCallback = None,
+                    paths: PathSpec = None, keyset: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every issue matching a JQL search, page by page
+
+        The first page is fetched on the first ``next()``.  Its ``total`` and actual
+        page size (JIRA may cap ``page_size``) fix the remaining ``startAt`` offsets,
+        which are then fetched in parallel, up to *concurrency* pages ahead of the
+        caller, while the current page is being consumed.  Issues are yielded in
+        result order; closing the iterator early cancels pages not yet started.
+
+        With *keyset* the query's ORDER BY is replaced by ``ORDER BY id`` and each
+        page continues with an ``id > <last id>`` predicate instead of an offset.
+        Page cost stays constant however deep the export goes, and issues added or
+        removed mid-walk cannot shift results between pages.  Pages are then
+        sequential, with the next one fetched while the current one is consumed.
+
+        Args:
+            jql: JQL query
+            fields: Fields to return (comma-separated string or iterable)
+            page_size: Requested page size; JIRA may return smaller pages
+            expand: Comma-separated list of fields to expand
+            concurrency: Maximum pages fetched ahead of the consumer
+            resource_name: Name of resource for error messages
+            on_page: Called with (issues fetched so far, total) after each page
+            paths: Keep only these JSON paths of each page (see :meth:`_search`)
+            keyset: Page by issue id instead of ``startAt`` (for large exports)
+
+        Yields:
+            Issue data in result order (id order with *keyset*)
+        """
+        if keyset:
+            yield from self._iter_keyset(jql, fields, page_size, expand, resource_name, on_page, paths)
+            return
+
+        def fetch(start_at: int) -> Dict[str, Any]:
+            return self._search(jql, fields=fields, expand=expand, start_at=start_at, max_results=page_size,
+                                resource_name=resource_name, paths=paths) or {}
+
+        response = fetch(0)
+        page = response.get('issues', [])
+        total = response.get('total', 0)
+        fetched = len(page)
+        if on_page:
+            on_page(fetched, max(total, fetched))
+        yield from page
+        if not page or fetched >= total:
+            return
+
+        offsets = iter(range(len(page), total, len(page)))
+        pending = deque()
+        task = bind_context(fetch)
+        executor = ThreadPoolExecutor(max_workers=max(1, concurrency))
+        try:
+            while True:
+                # Keep the window full so later pages download while this one is consumed
+                while len(pending) < max(1, concurrency):
+                    start_at = next(offsets, None)
+                    if start_at is None:
+                        break
+                    pending.append(executor.submit(task, start_at))
+                if not pending:
+                    return
+                page = pending.popleft().result().get('issues', [])
+                fetched += len(page)
+                if on_page:
+                    on_page(fetched, max(total, fetched))
+                if not page:
+                    return  # Results shrank while paging
+                yield from page
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _iter_keyset(self, jql: str, fields: FieldSpec, page_size: int, expand: Optional[str],
+                     resource_name: str, on_page: PageCallback, paths: PathSpec) -> Iterator[Dict[str, Any]]:
+        """Keyset-paginated search ordered by issue id (see :meth:`iter_search`)"""
+        base = _strip_order_by(jql)
+        if paths:
+            paths = tuple(paths) + ('issues[].id',)
+
+        def fetch(after_id: Optional[int]) -> Dict[str, Any]:
+            return self._search(_keyset_jql(base, after_id), fields=fields, expand=expand, max_results=page_size,
+                                resource_name=resource_name, paths=paths) or {}
+
+        fetched = 0
+        executor = ThreadPoolExecutor(max_workers=1)
+        pending = executor.submit(bind_context(fetch), None)
+        try:
+            while pending is not None:
+                response = pending.result()
+                pending = None
+                page = response.get('issues', [])
+                remaining = response.get('total', 0)  # Matches from this page onwards
+                if page and remaining > len(page):
+                    last_id = _issue_id(page[-1])
+                    if last_id is None:
+                        logging.warning(f"Stopping keyset search for {resource_name}: issue without a numeric id")
+                    else:
+                        # Fetch the next page while the caller consumes this one
+                        pending = executor.submit(bind_context(fetch), last_id)
+                if on_page:
+                    on_page(fetched + len(page), fetched + max(remaining, len(page)))
+                fetched += len(page)
+                yield from page
+        finally:
+            if pending is not None:
+                pending.cancel()
+            executor.shutdown(wait=False)
+
+    def _search_all(self, jql: str, fields: FieldSpec = None, expand: Optional[str] = None,
+                    page_size: int = DEFAULT_SEARCH_PAGE_SIZE,
+                    resource_name: str = "search results",
+                    on_page: PageCallback = None,
+                    paths: PathSpec = None, keyset: bool = False) -> List[Dict[str, Any]]:
+        """
+        Run a JQL search and collect every page (see :meth:`iter_search`)
+
+        Args:
+            jql: JQL query
+            fields: Fields to return (comma-separated string or iterable)
+            expand: Comma-separated list of fields to expand
+            page_size: Requested page size; JIRA may return smaller pages
+            resource_name: Name of resource for error messages
+            on_page: Called with (issues fetched so far, total) after each page
+            paths: Keep only these JSON paths of each page (see :meth:`_search`)
+            keyset: Page by issue id instead of ``startAt`` (see :meth:`iter_search`)
+
+        Returns:
+            List of issue data from every page
+        """
+        return list(self.iter_search(jql, fields=fields, page_size=page_size, expand=expand,
+                                     resource_name=resource_name, on_page=on_page, paths=paths, keyset=keyset))
+
+    def get_issues(self, issue_keys: Iterable[str], fields: FieldSpec = None,
+                   expand: Optional[str] = None, on_batch: BatchCallback = None) -> Dict[str, Any]:
+        """
+        Fetch many JIRA issues using batched `key in (...)` searches
+
+        Keys are split into chunks of up to ``DEFAULT_BATCH_SIZE`` keys (sent with
+        POST /search once the JQL is too long for a URL), and the chunks are fetched
+        concurrently.
+
+        Args:
+            issue_keys: JIRA issue keys to fetch
+            fields: Fields to return (comma-separated string or iterable); all fields when None
+            expand: Comma-separated list of fields to expand
+            on_batch: Called with the number of keys in each batch as it completes
+
+        Returns:
+            Dictionary mapping issue keys to issue data, plus a ``_fetch_metadata`` entry
+            with ``missing_keys`` listing requested keys JIRA did not return
+
+        Raises:
+            Exception: If any batched search fails
+        """
+        keys = list(dict.fromkeys(key for key in issue_keys if key))
+        batches = _batched_in_clauses('key', keys)
+
+        def fetch(batch: Tuple[List[str], str]) -> List[Dict[str, Any]]:
+            batch_keys, jql = batch
+            # A batch may be larger than the page size this JIRA allows, so follow its pages
+            return self._search_all(jql, fields=fields, expand=expand, page_size=len(batch_keys),
+                                    resource_name=f"issues {batch_keys[0]}..{batch_keys[-1]}")
+
+        if len(batches) <= 1:
+            results = map(fetch, batches)
+            return self._collect_pages(keys, batches, results, on_batch)
+
+        with ThreadPoolExecutor(max_workers=min(DEFAULT_BATCH_CONCURRENCY, len(batches))) as executor:
+            return self._collect_pages(keys, batches, executor.map(bind_context(fetch), batches), on_batch)
+
+    @staticmethod
+    def _collect_pages(keys: List[str], batches: List[Tuple[List[str], str]],
+                       results: Iterable[List[Dict[str, Any]]], on_batch: BatchCallback) -> Dict[str, Any]:
+        """Consume batch results in order, reporting each to *on_batch* from the calling thread"""
+        pages = []
+        for (batch_keys, _), page in zip(batches, results):
+            pages.append(page)
+            if on_batch:
+                on_batch(len(batch_keys))
+        return _collect_batched_issues(keys, pages)
 
     def test_connection(self) -> Dict[str, Any]:
         """Test JIRA connection and authentication"""
@@ -160,52 +815,62 @@ class JiraClient:
             handle_404_as_empty=True
         )
 
-    def get_parent_link_children(self, issue_key: str, parent_link_field: str = "Parent Link") -> List[str]:
+    def get_parent_link_child_issues(self, issue_key: str, parent_link_field: str = "Parent Link",
+                                     fields: FieldSpec = CHILD_SUMMARY_FIELDS,
+                                     on_page: PageCallback = None) -> List[Dict[str, Any]]:
         """
         Search for issues that have the given issue as their parent using a parent link field
 
+        Every page of results is fetched, and only the projected *fields* are returned,
+        so callers can summarize children straight from the search results.
+
         Args:
             issue_key: JIRA issue key to search for children
             parent_link_field: Name of the parent link field (default: "Parent Link")
+            fields: Fields to return for each child (default: key, summary, status, issue type)
+            on_page: Called with (children fetched so far, total) after each page
 
         Returns:
-            List of child issue keys
-
-        Raises:
-            Exception: If API request fails
+            List of child issue data
         """
         if not issue_key or not parent_link_field:
-            logging.warning("Invalid parameters for get_parent_link_children")
+            logging.warning("Invalid parameters for get_parent_link_child_issues")
             return []
-            
-        url = urljoin(self.api_base, 'search')
+
         # Search using JQL for issues where the parent link field equals the given issue key
         # Escape the field name and issue key to handle special characters
-        jql = f'"{parent_link_field}" = "{issue_key}"'
-        params = {
-            'jql': jql,
-            'fields': 'key',  # Only need the key field
-            'maxResults': 1000  # Reasonable limit for children
-        }
+        jql = f'{_quote_jql_value(parent_link_field)} = {_quote_jql_value(issue_key)}'
 
         try:
-            response = self._make_api_request(
-                url,
-                params=params,
+            issues = self._search_all(
+                jql,
+                fields=fields,
                 resource_name=f"children of issue {issue_key} via {parent_link_field}",
-                handle_404_as_empty=True
+                on_page=on_page
             )
-
-            # Extract issue keys from the response
-            issues = response.get('issues', [])
-            child_keys = [issue.get('key') for issue in issues if issue.get('key')]
-            logging.debug(f"Found {len(child_keys)} children via {parent_link_field} for {issue_key}: {child_keys}")
-            return child_keys
+            logging.debug(f"Found {len(issues)} children via {parent_link_field} for {issue_key}")
+            return issues
 
         except Exception as e:
             logging.debug(f"Could not search for {parent_link_field} children of {issue_key}: {e}")
             return []
 
+    def get_parent_link_children(self, issue_key: str, parent_link_field: str = "Parent Link") -> List[str]:
+        """
+        Search for issues that have the given issue as their parent using a parent link field
+
+        Args:
+            issue_key: JIRA issue key to search for children
+            parent_link_field: Name of the parent link field (default: "Parent Link")
+
+        Returns:
+            List of child issue keys
+        """
+        issues = self.get_parent_link_child_issues(issue_key, parent_link_field, fields='key')
+        child_keys = [issue.get('key') for issue in issues if issue.get('key')]
+        logging.debug(f"Found {len(child_keys)} children via {parent_link_field} for {issue_key}: {child_keys}")
+        return child_keys
+
     def get_field_by_name(self, field_name: str) -> Optional[Dict[str, Any]]:
         """
         Look up field metadata by name to get field ID
@@ -214,35 +879,90 @@ class JiraClient:
             field_name: Display name of the field (e.g., "Parent Link")
 
         Returns:
-            Field metadata dictionary or None if not found
+            Field metadata dictionary or None if not found (or the field list cannot be fetched)
+        """
+        try:
+            index = self.field_index()
+        except Exception as e:
+            logging.debug(f"Could not fetch field metadata: {e}")
+            return None
 
-        Raises:
-            Exception: If API request fails
+        field = index.by_name(field_name)
+        if field is None:
+            logging.debug(f"Field '{field_name}' not found")
+        else:
+            logging.debug(f"Found field '{field_name}' with ID: {field.get('id')}")
+        return field
+
+    def field_index(self) -> FieldIndex:
         """
-        # Check cache first
-        if field_name in self._field_cache:
-            return self._field_cache[field_name]
+        The instance's field metadata indexed by name, ID, clause name and custom type
 
-        url = urljoin(self.api_base, 'field')
+        Served from :attr:`fields` until its TTL runs out; then the persistent store,
+        when a fresh copy is there, or ``/field`` reloads it.
 
-        try:
-            fields = self._make_api_request(url, resource_name="field metadata")
+        Raises:
+            Exception: If the field list cannot be fetched
+        """
+        index = self.fields.current()
+        if index is not None:
+            return index
+        if self.store is not None:
+            stored = self.store.get(FIELD_STORE_NAMESPACE, "all", max_age=self.fields.ttl)
+            if stored is not None:
+                return self.fields.update(stored.value, age=self.store.now() - stored.stored_at)
+        fields = self._make_api_request(urljoin(self.api_base, 'field'), resource_name="field metadata")
+        if not isinstance(fields, list):
+            raise ValueError(f"Unexpected field metadata response: {type(fields).__name__}")
+        if self.store is not None:
+            self.store.put(FIELD_STORE_NAMESPACE, "all", fields)
+        return self.fields.update(fields)
+
+    def get_parent_link_children_batch(self, issue_keys: Iterable[str],
+                                       parent_link_field: str = "Parent Link") -> List[str]:
+        """
+        Find the parent-link children of many issues at once
 
-            # Find field by name
-            for field in fields:
-                if field.get('name') == field_name:
-                    self._field_cache[field_name] = field
-                    logging.debug(f"Found field '{field_name}' with ID: {field.get('id')}")
-                    return field
+        Uses batched `"<parent_link_field>" in (...)` searches instead of one search per issue.
 
-            # Field not found
-            logging.debug(f"Field '{field_name}' not found")
-            self._field_cache[field_name] = None
-            return None
+        Args:
+            issue_keys: Parent issue keys
+            parent_link_field: Name of the parent link field (default: "Parent Link")
 
+        Returns:
+            List of child issue keys (unordered across parents)
+
+        Raises:
+            DeadlineExceeded: If the call's deadline ran out before every batch was searched
+            CircuitOpenError: If the circuit breaker opened before every batch was searched
+        """
+        keys = list(dict.fromkeys(key for key in issue_keys if key))
+        jobs = [functools.partial(self._search_parent_link_children, batch, parent_link_field)
+                for batch in _batched_in_clauses(parent_link_field, keys)]
+        return [key for page in self._run_concurrently(jobs) for key in page]
+
+    def _search_parent_link_children(self, batch: Tuple[List[str], str], parent_link_field: str) -> List[str]:
+        """Run one batched parent-link children search; other failures count as no children"""
+        batch_keys, jql = batch
+        try:
+            issues = self._search_all(
+                jql, fields='key', paths=('issues[].key',),
+                resource_name=f"children of {len(batch_keys)} issues via {parent_link_field}"
+            )
+        except (DeadlineExceeded, CircuitOpenError):
+            raise  # The caller must not mistake an interrupted search for "no children"
         except Exception as e:
-            logging.debug(f"Could not fetch field metadata: {e}")
-            return None
+            logging.debug(f"Could not search for {parent_link_field} children of {batch_keys}: {e}")
+            return []
+        return [issue.get('key') for issue in issues if issue.get('key')]
+
+    def _run_concurrently(self, jobs: List[Callable[[], Any]]) -> List[Any]:
+        """Run independent request jobs with bounded concurrency; results keep the order of *jobs*"""
+        if len(jobs) <= 1:
+            return [job() for job in jobs]
+        with ThreadPoolExecutor(max_workers=min(DEFAULT_BATCH_CONCURRENCY, len(jobs))) as executor:
+            futures = [executor.submit(bind_context(job)) for job in jobs]
+            return [future.result() for future in futures]
 
     def get_descendants(self, issue_key: str, depth: int = 0,
                         include_subtasks: bool = False, include_links: bool = False,
@@ -251,6 +971,11 @@ class JiraClient:
         """
         Fetch an issue and its descendants based on specified relationship types and depth
 
+        The traversal is level-synchronous: every issue of a BFS level is fetched with
+        batched `key in (...)` searches, and the parent-link children of the whole level
+        are found with batched `"Parent Link" in (...)` searches, so the request count
+        grows with the depth of the hierarchy rather than with the number of issues.
+
         Args:
             issue_key: Starting JIRA issue key
             depth: Maximum traversal depth (-1 for unlimited, 0 for issue only)
@@ -267,155 +992,119 @@ class JiraClient:
         Raises:
             Exception: If traversal encounters errors
         """
-        issues = {}  # Dict[str, Dict[str, Any]]
-        visited = set()  # Set[str]
-        to_process = [(issue_key, 0)]  # List[(str, int)] - (issue_key, current_depth)
-
-        extraction_metadata = {
-            "start_issue": issue_key,
-            "max_depth": depth,
-            "include_subtasks": include_subtasks,
-            "include_links": include_links,
-            "include_remote_links": include_remote_links,
-            "include_parent_links": include_parent_links,
-            "parent_link_field": parent_link_field,
-            "traversal_order": []
-        }
+        traversal = DescendantTraversal(
+            issue_key, depth, include_subtasks, include_links,
+            include_remote_links, include_parent_links, parent_link_field, expand
+        )
+        self.run_traversal(traversal)
+        return traversal.result()
 
-        while to_process:
-            current_key, current_depth = to_process.pop(0)
+    def run_traversal(self, traversal: DescendantTraversal, max_nodes: Optional[int] = None,
+                      max_seconds: Optional[float] = None, progress: TraversalCallback = None) -> bool:
+        """
+        Drive a :class:`DescendantTraversal` until its frontier is empty or a budget runs out
 
-            # Skip if already processed
-            if current_key in visited:
-                continue
+        Budgets are checked between batches, so a single level may overrun
+        *max_seconds* by the duration of one batched fetch.  The deadline of the
+        current call (see :mod:`jira_extractor.deadline`) is a hard stop: a level
+        interrupted by it, by an open circuit breaker or by a failed fetch goes
+        back to the frontier, so a continuation token still covers it.
 
-            visited.add(current_key)
-            extraction_metadata["traversal_order"].append({
-                "issue_key": current_key,
-                "depth": current_depth
-            })
+        Args:
+            traversal: Traversal state to advance (new or restored from a token)
+            max_nodes: Maximum number of issues to fetch in this run (None for unlimited)
+            max_seconds: Wall-clock budget for this run in seconds (None for unlimited)
+            progress: Called with a :meth:`DescendantTraversal.progress` snapshot as each
+                batch completes and after each level is expanded
 
-            logging.info(f"Processing issue {current_key} at depth {current_depth}")
+        Returns:
+            True if the traversal completed, False if it stopped on a budget or an interrupted level
+        """
+        started = time.monotonic()
+        deadline = started + max_seconds if max_seconds is not None else None
+        fetched_nodes = 0  # Keys taken from the frontier in this run
+        completed_nodes = 0  # Keys whose batch has returned
+
+        def report() -> None:
+            if progress:
+                budget = max_nodes - completed_nodes if max_nodes is not None else None
+                progress(traversal.progress(completed_nodes, fetched_nodes - completed_nodes,
+                                            self.in_flight_requests, time.monotonic() - started, budget))
+
+        def batch_done(batch_size: int) -> None:
+            nonlocal completed_nodes
+            completed_nodes += batch_size
+            report()
+
+        parent_link_field_id = None
+        if traversal.include_parent_links and traversal.direction != DIRECTION_DOWN:
+            # Only a related walk follows the parent link value, which is read from each issue
+            field_metadata = self.get_field_by_name(traversal.parent_link_field)
+            parent_link_field_id = field_metadata.get('id') if field_metadata else None
+
+        fields = traversal.fields or '*all'
+        if traversal.fields and parent_link_field_id:
+            fields = f"{fields},{parent_link_field_id}"
+
+        while not traversal.done:
+            if max_nodes is not None and fetched_nodes >= max_nodes:
+                return False
+            if (deadline is not None and time.monotonic() >= deadline) or deadline_expired():
+                return False
+
+            limit = max_nodes - fetched_nodes if max_nodes is not None else None
+            keys, level_depth = traversal.take_level(limit)
+            fetched_nodes += len(keys)
+            logging.info(f"Fetching {len(keys)} issues at depth {level_depth}")
 
             try:
-                # Fetch the issue
-                issue_data = self.get_issue(current_key, expand=expand)
-                issues[current_key] = issue_data
-
+                fetched = self.get_issues(keys, fields=fields, expand=traversal.expand, on_batch=batch_done)
+                found = [key for key in keys if fetched.get(key) is not None]
                 # Stop traversing deeper if we've reached the depth limit
-                if depth != -1 and current_depth >= depth:
-                    continue
-
-                # Collect related issues to process next
-                related_issues = self._get_related_issue_keys(
-                    issue_data, current_key, include_subtasks, include_links, include_remote_links, include_parent_links, parent_link_field
-                )
-
-                # Add related issues to processing queue
-                for related_key in related_issues:
-                    if related_key not in visited:
-                        to_process.append((related_key, current_depth + 1))
-
+                expand = bool(found) and traversal.should_expand(level_depth)
+                children = []
+                if expand:
+                    children = self._fetch_level_relations(traversal, found)
             except Exception as e:
-                logging.warning(f"Failed to process issue {current_key}: {e}")
-                # Continue processing other issues
+                # Nothing of the level is recorded yet; resuming fetches it again
+                logging.warning(f"Fetching issues at depth {level_depth} was interrupted: {e}; stopping")
+                traversal.requeue(keys, level_depth)
+                return False
+            completed_nodes = fetched_nodes
+            traversal.record_level(keys, level_depth, fetched)
+
+            if not expand:
                 continue
 
-        # Store extraction metadata in the result
-        issues["_extraction_metadata"] = extraction_metadata
+            traversal.expand_level(found, level_depth, children, parent_link_field_id)
+            report()
 
-        return issues
+        return True
 
-    def _get_related_issue_keys(self, issue_data: Dict[str, Any], current_key: str,
-                                include_subtasks: bool, include_links: bool,
-                                include_remote_links: bool, include_parent_links: bool,
-                                parent_link_field: str) -> Set[str]:
+    def _fetch_level_relations(self, traversal: DescendantTraversal, keys: List[str]) -> List[str]:
         """
-        Extract related issue keys from issue data based on relationship types
-
-        Args:
-            issue_data: Issue data from JIRA API
-            current_key: Current issue key (for logging)
-            include_subtasks: Include subtask relationships
-            include_links: Include issue links
-            include_remote_links: Include remote links
-            include_parent_links: Include parent link custom field relationships
-            parent_link_field: Name of the parent link field
+        Search the parent-link children and fetch the remote links of a level in one executor batch
 
         Returns:
-            Set of related issue keys
-        """
-        related_keys = set()
-        fields = issue_data.get('fields', {})
-
-        # Process subtasks
-        if include_subtasks:
-            # Get subtasks (children)
-            subtasks = fields.get('subtasks', [])
-            for subtask in subtasks:
-                subtask_key = subtask.get('key')
-                if subtask_key:
-                    related_keys.add(subtask_key)
-                    logging.debug(f"Found subtask: {subtask_key}")
-
-            # Get parent issue
-            parent = fields.get('parent')
-            if parent:
-                parent_key = parent.get('key')
-                if parent_key:
-                    related_keys.add(parent_key)
-                    logging.debug(f"Found parent: {parent_key}")
-
-        # Process issue links
-        if include_links:
-            issue_links = fields.get('issuelinks', [])
-            for link in issue_links:
-                # Links can have inwardIssue or outwardIssue
-                inward_issue = link.get('inwardIssue')
-                if inward_issue:
-                    inward_key = inward_issue.get('key')
-                    if inward_key:
-                        related_keys.add(inward_key)
-                        link_type = link.get('type', {}).get('inward', 'related')
-                        logging.debug(f"Found inward link ({link_type}): {inward_key}")
-
-                outward_issue = link.get('outwardIssue')
-                if outward_issue:
-                    outward_key = outward_issue.get('key')
-                    if outward_key:
-                        related_keys.add(outward_key)
-                        link_type = link.get('type', {}).get('outward', 'related')
-                        logging.debug(f"Found outward link ({link_type}): {outward_key}")
-
-        # Process remote links (these don't lead to other JIRA issues, but we can fetch them for completeness)
-        if include_remote_links:
-            try:
-                remote_links = self.get_remote_links(current_key)
-                logging.debug(f"Found {len(remote_links)} remote links for {current_key}")
-                # Note: Remote links don't contribute to related_keys since they're external
-            except Exception as e:
-                logging.debug(f"Could not fetch remote links for {current_key}: {e}")
-
-        # Process parent links (custom field)
-        if include_parent_links:
-            # Look up the field metadata to get the field ID
-            field_metadata = self.get_field_by_name(parent_link_field)
-            if field_metadata:
-                field_id = field_metadata.get('id')
-                if field_id:
-                    # Get parent from the custom field
-                    parent_link = fields.get(field_id)
-                    if parent_link:
-                        related_keys.add(parent_link)
-                        logging.debug(f"Found parent link via {parent_link_field}: {parent_link}")
-
-            # Search for children that have this issue as their parent
-            try:
-                children = self.get_parent_link_children(current_key, parent_link_field)
-                for child_key in children:
-                    related_keys.add(child_key)
-                    logging.debug(f"Found parent link child: {child_key}")
-            except Exception as e:
-                logging.debug(f"Could not fetch parent link children for {current_key}: {e}")
-
-        return related_keys
\ No newline at end of file
+            Parent-link children of *keys*
+        """
+        batches = []
+        if traversal.include_parent_links:
+            batches = _batched_in_clauses(traversal.parent_link_field, keys)
+        jobs = [functools.partial(self._search_parent_link_children, batch, traversal.parent_link_field)
+                for batch in batches]
+        # Remote links don't lead to other JIRA issues, but are fetched for completeness
+        if traversal.include_remote_links:
+            jobs.extend(functools.partial(self._fetch_issue_remote_links, key) for key in keys)
+        pages = self._run_concurrently(jobs)[:len(batches)]
+        return [key for page in pages for key in page]
+
+    def _fetch_issue_remote_links(self, key: str) -> List[Dict[str, Any]]:
+        """Fetch one issue's remote links; failures count as none"""
+        try:
+            remote_links = self.get_remote_links(key)
+            logging.debug(f"Found {len(remote_links)} remote links for {key}")
+            return remote_links
+        except Exception as e:
+            logging.debug(f"Could not fetch remote links for {key}: {e}")
+            return []
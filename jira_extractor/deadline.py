@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Per-call deadlines
+
+A deadline is an absolute point on the monotonic clock stored in a context
+variable, so it follows a tool invocation through ``await`` chains, asyncio
+tasks and (when the context is copied) worker threads without being passed
+explicitly.  Every HTTP request derives its connect/read timeouts from the
+time left, so the budget shrinks as calls go by and a hung JIRA node cannot
+hold a tool call past its deadline.
+"""
+
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Optional, Tuple, Callable, Any, Iterator
+
+# Default socket timeouts for a single HTTP request in seconds
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 30.0
+
+_deadline: contextvars.ContextVar = contextvars.ContextVar("jira_deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when the deadline of the current call has passed"""
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[None]:
+    """
+    Bound everything inside the block by a deadline *seconds* from now
+
+    Nested scopes can only shorten the deadline.  None or a non-positive value
+    leaves the current deadline (if any) in place.
+    """
+    if seconds is None or seconds <= 0:
+        yield
+        return
+
+    at = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(at if current is None else min(current, at))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def time_remaining() -> Optional[float]:
+    """Seconds left before the current deadline, or None when there is no deadline"""
+    at = _deadline.get()
+    return None if at is None else at - time.monotonic()
+
+
+def deadline_expired() -> bool:
+    """True when a deadline is set and has passed"""
+    left = time_remaining()
+    return left is not None and left <= 0
+
+
+def check_deadline(wait: float = 0.0, what: str = "request") -> None:
+    """
+    Raise :class:`DeadlineExceeded` unless *wait* seconds still fit before the deadline
+
+    Args:
+        wait: Seconds the caller is about to sleep before doing *what*
+        what: Description used in the error message
+    """
+    left = time_remaining()
+    if left is not None and left <= wait:
+        raise DeadlineExceeded(f"Deadline exceeded before {what}")
+
+
+def request_timeout(connect: float, read: float, what: str = "request") -> Tuple[float, float]:
+    """
+    Clip the (connect, read) socket timeouts of a request to the time left
+
+    Raises:
+        DeadlineExceeded: If the deadline has already passed
+    """
+    check_deadline(what=what)
+    left = time_remaining()
+    if left is None:
+        return connect, read
+    return min(connect, left), min(read, left)
+
+
+def bind_context(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap *func* so it runs in a copy of the caller's context (for executor threads)"""
+    context = contextvars.copy_context()
+
+    def run(*args: Any, **kwargs: Any) -> Any:
+        # Each call gets its own copy: one Context cannot be entered by two threads at once
+        return context.copy().run(func, *args, **kwargs)
+    return run
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+JSON decoding for JIRA responses
+
+:func:`decode_json` uses ``orjson`` when it is installed and falls back to the
+standard library otherwise.  :func:`decode_response` can additionally keep only
+a set of paths such as ``issues[].key`` or ``issues[].fields.summary``.  The
+body is already buffered by the HTTP client, so it is decoded in full with the
+fast decoder and then projected; callers hold on to the requested values only.
+
+Path syntax: dot-separated object keys, with ``[]`` after a key selecting every
+element of that array (``issues[].fields.status.name``).  A path selects the
+whole value it ends on.
+"""
+
+import json
+from typing import Any, Callable, Dict, Iterable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+PathSpec = Optional[Iterable[str]]
+
+# Nested selection tree: object keys map to sub-trees, ARRAY_ITEMS selects every
+# element of an array, and an empty tree selects the whole value
+_ARRAY_ITEMS = "[]"
+
+# Marker for values whose shape does not match the requested path
+_MISSING = object()
+
+
+def decode_json(content: bytes) -> Any:
+    """Decode a JSON document with orjson when available, otherwise the json module"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def parse_paths(paths: Iterable[str]) -> Dict[str, Any]:
+    """
+    Parse path expressions into a nested selection tree
+
+    Args:
+        paths: Paths such as ``total`` or ``issues[].fields.summary``
+
+    Returns:
+        Selection tree; ``{}`` selects the whole value
+
+    Raises:
+        ValueError: If a path is empty or has an empty segment
+    """
+    tree: Dict[str, Any] = {}
+    for path in paths:
+        if not path or not path.strip():
+            raise ValueError("Empty JSON path")
+        steps = []
+        for segment in path.strip().split("."):
+            name = segment
+            arrays = 0
+            while name.endswith(_ARRAY_ITEMS):
+                name = name[:-len(_ARRAY_ITEMS)]
+                arrays += 1
+            if not name and not (arrays and not steps):
+                raise ValueError(f"Invalid JSON path: {path!r}")
+            if name:
+                steps.append(name)
+            steps.extend([_ARRAY_ITEMS] * arrays)
+
+        node = tree
+        for step in steps:
+            node = node.setdefault(step, {})
+    return tree
+
+
+def _project(value: Any, tree: Dict[str, Any]) -> Any:
+    if not tree:
+        return value
+    if isinstance(value, dict):
+        projected = {}
+        for key, subtree in tree.items():
+            if key != _ARRAY_ITEMS and key in value:
+                item = _project(value[key], subtree)
+                if item is not _MISSING:
+                    projected[key] = item
+        return projected
+    if isinstance(value, list):
+        subtree = tree.get(_ARRAY_ITEMS)
+        if subtree is None:
+            return []
+        return [item for item in (_project(v, subtree) for v in value) if item is not _MISSING]
+    return _MISSING
+
+
+def project(document: Any, paths: Iterable[str]) -> Any:
+    """Keep only the requested paths of an already decoded document (``None`` if nothing matches)"""
+    projected = _project(document, parse_paths(paths))
+    return None if projected is _MISSING else projected
+
+
+def decode_response(content: bytes, paths: PathSpec = None,
+                    decoder: Callable[[bytes], Any] = decode_json) -> Any:
+    """
+    Decode a response body, optionally keeping only the requested paths
+
+    Args:
+        content: Raw response body
+        paths: Paths to keep (see module docstring); None decodes the whole document
+        decoder: Full-document decoder
+
+    Returns:
+        Decoded document or its projection onto ``paths``
+    """
+    if not paths:
+        return decoder(content)
+    return project(decoder(content), paths)
+
+
+def decode_body(response: Any, paths: PathSpec = None, decoder: Callable[[bytes], Any] = decode_json) -> Any:
+    """Decode the body of a requests or httpx response (see :func:`decode_response`)"""
+    return decode_response(response.content, paths, decoder)
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Field metadata registry
+
+``/rest/api/2/field`` lists every field of the instance (often several hundred
+KB).  :class:`FieldRegistry` keeps one :class:`FieldIndex` built from that list
+for ``ttl`` seconds, so resolving a field by display name, ID, JQL clause name
+or ``schema.custom`` type is a dictionary lookup instead of a download and a
+linear scan.  Loading is left to the clients, which fetch the list with their
+own (sync or async) transport and hand it to :meth:`FieldRegistry.update`.
+"""
+
+import threading
+import time
+from typing import Optional, Dict, Any, Callable, List
+
+# Default seconds a loaded field list is trusted before it is fetched again
+DEFAULT_FIELD_METADATA_TTL = 3600
+
+
+class FieldIndex:
+    """Immutable lookup tables over one ``/field`` response"""
+
+    def __init__(self, fields: List[Dict[str, Any]]):
+        self.fields = [field for field in fields if isinstance(field, dict)]
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._by_name: Dict[str, Dict[str, Any]] = {}
+        self._by_clause_name: Dict[str, Dict[str, Any]] = {}
+        self._by_custom_type: Dict[str, List[Dict[str, Any]]] = {}
+        for field in self.fields:
+            # Names and clause names are not unique; the first field listed wins, as with a linear scan
+            if field.get("id"):
+                self._by_id.setdefault(field["id"], field)
+            if field.get("name"):
+                self._by_name.setdefault(field["name"], field)
+            for clause_name in field.get("clauseNames") or ():
+                self._by_clause_name.setdefault(clause_name, field)
+            custom_type = (field.get("schema") or {}).get("custom")
+            if custom_type:
+                self._by_custom_type.setdefault(custom_type, []).append(field)
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def by_id(self, field_id: str) -> Optional[Dict[str, Any]]:
+        """Field with ID *field_id* (e.g. ``customfield_12311140``), or None"""
+        return self._by_id.get(field_id)
+
+    def by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """First field whose display name is *name* (e.g. ``Parent Link``), or None"""
+        return self._by_name.get(name)
+
+    def by_clause_name(self, clause_name: str) -> Optional[Dict[str, Any]]:
+        """First field usable in JQL as *clause_name* (e.g. ``cf[12311140]``), or None"""
+        return self._by_clause_name.get(clause_name)
+
+    def by_custom_type(self, custom_type: str) -> List[Dict[str, Any]]:
+        """Every custom field whose ``schema.custom`` is *custom_type*, in /field order"""
+        return list(self._by_custom_type.get(custom_type, ()))
+
+
+class FieldRegistry:
+    """The instance's field metadata, indexed once and refreshed every ``ttl`` seconds"""
+
+    def __init__(self, ttl: float = DEFAULT_FIELD_METADATA_TTL, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            ttl: Seconds a loaded field list answers lookups before :meth:`current` asks for a reload
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.ttl = ttl
+        self._clock = clock
+        self._index: Optional[FieldIndex] = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+        # Metrics
+        self._loads = 0
+        self._hits = 0
+        self._misses = 0
+
+    def current(self) -> Optional[FieldIndex]:
+        """The loaded index while it is younger than ``ttl``, otherwise None (the caller reloads)"""
+        with self._lock:
+            if self._index is not None and self._clock() - self._loaded_at < self.ttl:
+                self._hits += 1
+                return self._index
+            self._misses += 1
+            return None
+
+    def update(self, fields: List[Dict[str, Any]], age: float = 0) -> FieldIndex:
+        """
+        Replace the index with one built from a ``/field`` response
+
+        Args:
+            fields: The field list
+            age: Seconds since the list was fetched (for copies read back from a persistent store)
+
+        Returns:
+            The new index
+        """
+        index = FieldIndex(fields)
+        with self._lock:
+            self._index = index
+            self._loaded_at = self._clock() - age
+            self._loads += 1
+        return index
+
+    def invalidate(self) -> None:
+        """Forget the loaded index so the next lookup fetches the field list again"""
+        with self._lock:
+            self._index = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of registry metrics"""
+        with self._lock:
+            return {
+                "fields": len(self._index) if self._index is not None else 0,
+                "ttl": self.ttl,
+                "loads": self._loads,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
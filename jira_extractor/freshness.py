@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Read consistency and data age
+
+A tool call runs inside a :func:`read_scope` held in a context variable, like
+the deadline in :mod:`jira_extractor.deadline`.  The scope carries the
+consistency the caller asked for and records how old the data it was served
+is:
+
+* ``"default"`` - caches may answer, including entries past their soft TTL
+  that are being refreshed in the background (stale-while-revalidate).
+* ``"fresh"`` - caches are bypassed and every read goes to JIRA; what is read
+  still refreshes the caches.
+
+Caches call :func:`observe` with the wall-clock time a served payload was
+fetched from JIRA, and the scope keeps the oldest one as the call's ``as_of``.
+"""
+
+import contextvars
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Iterator, Optional
+
+CONSISTENCY_DEFAULT = "default"
+CONSISTENCY_FRESH = "fresh"
+CONSISTENCY_LEVELS = (CONSISTENCY_DEFAULT, CONSISTENCY_FRESH)
+
+
+class ReadScope:
+    """Consistency requested by, and oldest data served to, one tool call"""
+
+    __slots__ = ("consistency", "started_at", "oldest")
+
+    def __init__(self, consistency: str):
+        self.consistency = consistency
+        self.started_at = time.time()
+        self.oldest: Optional[float] = None
+
+    @property
+    def as_of(self) -> float:
+        """Wall-clock time of the oldest data served; the start of the call when all reads were live"""
+        return self.started_at if self.oldest is None else min(self.oldest, self.started_at)
+
+    def as_of_iso(self) -> str:
+        """:attr:`as_of` as an ISO 8601 UTC timestamp"""
+        return datetime.fromtimestamp(self.as_of, timezone.utc).isoformat(timespec="seconds")
+
+
+_scope: contextvars.ContextVar = contextvars.ContextVar("jira_read_scope", default=None)
+
+
+@contextmanager
+def read_scope(consistency: Optional[str] = None) -> Iterator[ReadScope]:
+    """
+    Run the block with the given read consistency and collect the age of what it reads
+
+    Raises:
+        ValueError: If *consistency* is not one of :data:`CONSISTENCY_LEVELS`
+    """
+    consistency = consistency or CONSISTENCY_DEFAULT
+    if consistency not in CONSISTENCY_LEVELS:
+        raise ValueError(f"consistency must be one of {', '.join(CONSISTENCY_LEVELS)}, not {consistency!r}")
+    scope = ReadScope(consistency)
+    token = _scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _scope.reset(token)
+
+
+def fresh_required() -> bool:
+    """True when the current call asked for live reads only"""
+    scope = _scope.get()
+    return scope is not None and scope.consistency == CONSISTENCY_FRESH
+
+
+def observe(fetched_at: float) -> None:
+    """Record that the current call was served data fetched from JIRA at *fetched_at* (wall clock)"""
+    scope = _scope.get()
+    if scope is not None and (scope.oldest is None or fetched_at < scope.oldest):
+        scope.oldest = fetched_at
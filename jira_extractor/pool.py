@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Connection pool tuning for the requests-based client
+
+:class:`PooledHTTPAdapter` is an ``HTTPAdapter`` with a configurable pool size,
+block-on-exhaustion behaviour and TCP keep-alive probes, so idle pooled
+connections survive NAT/load-balancer idle timeouts instead of failing on
+first reuse.  It also reports how many connections were opened versus reused,
+which is what tells you whether the pool is sized right.
+"""
+
+import socket
+from typing import Dict, Any, List, Tuple
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+# Default maximum connections kept per host (matches the async client's pool)
+DEFAULT_POOL_MAXSIZE = 20
+
+# Default behaviour when every pooled connection is busy: False opens an extra,
+# unpooled connection; True waits for a connection to be returned
+DEFAULT_POOL_BLOCK = False
+
+# Enable TCP keep-alive probes on pooled connections by default
+DEFAULT_POOL_KEEPALIVE = True
+
+# Connections opened at startup (0 disables prewarming)
+DEFAULT_POOL_PREWARM = 0
+
+# TCP keep-alive timing in seconds: idle time before probing, probe interval, probe count
+_KEEPALIVE_OPTIONS = (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 15), ("TCP_KEEPCNT", 4))
+
+
+def _keepalive_socket_options() -> List[Tuple[int, int, int]]:
+    """urllib3's default socket options plus TCP keep-alive where the platform supports it"""
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    for name, value in _KEEPALIVE_OPTIONS:
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter with tunable pooling, TCP keep-alive and connection reuse metrics"""
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["keepalive"]
+
+    def __init__(self, pool_maxsize: int = DEFAULT_POOL_MAXSIZE, pool_block: bool = DEFAULT_POOL_BLOCK,
+                 keepalive: bool = DEFAULT_POOL_KEEPALIVE):
+        """
+        Initialize adapter
+
+        Args:
+            pool_maxsize: Maximum connections kept per host
+            pool_block: Wait for a free connection instead of opening an unpooled one
+            keepalive: Enable TCP keep-alive probes on pooled connections
+        """
+        self.keepalive = keepalive
+        super().__init__(pool_maxsize=max(1, pool_maxsize), pool_block=pool_block)
+
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = DEFAULT_POOL_BLOCK,
+                         **pool_kwargs: Any) -> None:
+        if self.keepalive:
+            pool_kwargs.setdefault("socket_options", _keepalive_socket_options())
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of pool metrics summed over every host pool"""
+        pools = self.poolmanager.pools
+        opened = requests = idle = host_pools = 0
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host_pools += 1
+            opened += pool.num_connections
+            requests += pool.num_requests
+            if pool.pool is not None:
+                # The queue is pre-filled with None placeholders for connections not yet opened
+                idle += sum(1 for conn in list(pool.pool.queue) if conn is not None)
+        return {
+            "max_size": self._pool_maxsize,
+            "block": self._pool_block,
+            "keepalive": self.keepalive,
+            "host_pools": host_pools,
+            "connections_opened": opened,
+            "connections_reused": max(0, requests - opened),
+            "requests": requests,
+            "idle_connections": idle,
+        }
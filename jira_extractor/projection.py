@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Field projection planning
+
+Callers declare the issue fields they read (as comma-separated strings or
+iterables, including custom field IDs discovered at runtime) and
+:func:`plan_fields` merges those declarations into the minimal ``fields=``
+value for a request.  :func:`covers` tells whether a payload fetched with one
+projection already contains everything another projection asks for, so the
+issue cache can answer a narrow request from a wider cached copy.
+"""
+
+from typing import Iterable, Optional, FrozenSet, Union
+
+FieldSpec = Optional[Union[str, Iterable[str]]]
+
+# Projection values JIRA expands to more than the listed fields; only an identical
+# request is known to be covered by them
+_SPECIAL_PREFIXES = ("*", "-")
+
+# Projection equivalent to requesting no projection at all
+_ALL_FIELDS = frozenset({"*all"})
+
+
+def field_set(spec: FieldSpec) -> FrozenSet[str]:
+    """Split a comma-separated string or iterable of field IDs into a set (empty for None)"""
+    if spec is None:
+        return frozenset()
+    parts = spec.split(",") if isinstance(spec, str) else spec
+    return frozenset(part.strip() for part in parts if part and part.strip())
+
+
+def plan_fields(*declarations: FieldSpec) -> str:
+    """
+    Merge field declarations into one sorted, de-duplicated ``fields=`` value
+
+    Args:
+        declarations: Field specs (comma-separated strings or iterables); None entries are skipped
+
+    Returns:
+        Comma-separated field IDs, empty when nothing was declared
+    """
+    planned = set()
+    for declaration in declarations:
+        planned |= field_set(declaration)
+    return ",".join(sorted(planned))
+
+
+def covers(cached_fields: FieldSpec, requested_fields: FieldSpec,
+           cached_expand: FieldSpec = None, requested_expand: FieldSpec = None) -> bool:
+    """
+    True when a payload fetched with the cached projection contains everything requested
+
+    An empty field projection means "all fields", so it covers any request.  The
+    cached payload must also have been fetched with every requested ``expand``.
+    """
+    if not field_set(requested_expand) <= field_set(cached_expand):
+        return False
+
+    cached = field_set(cached_fields)
+    requested = field_set(requested_fields)
+    if not cached or cached == _ALL_FIELDS:
+        return True
+    if not requested:
+        return False
+    if any(field.startswith(_SPECIAL_PREFIXES) for field in cached | requested):
+        return cached == requested
+    return requested <= cached
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Rate-limit-aware retries
+
+:class:`RetryPolicy` decides whether a JIRA response should be retried and for
+how long to back off: capped exponential backoff with full jitter, overridden
+by ``Retry-After`` when JIRA sends one.  Every response's ``X-RateLimit-*``
+headers feed a shared :class:`TokenBucket`, and a 429 pauses the bucket, so
+all tool calls sharing a client slow down together instead of stampeding.
+
+The policy only computes delays; the sync and async clients do the sleeping.
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Dict, Any, Callable, Iterable
+
+# Default number of retries after the first attempt
+DEFAULT_MAX_RETRIES = 3
+
+# Default first backoff step and backoff cap in seconds
+DEFAULT_RETRY_BASE_DELAY = 0.5
+DEFAULT_RETRY_MAX_DELAY = 30.0
+
+# Statuses that signal a transient condition worth retrying
+RETRY_STATUSES = (429, 502, 503, 504)
+
+
+def _header(headers: Any, name: str) -> Optional[str]:
+    """Read a header as a string, tolerating missing or non-mapping header objects"""
+    try:
+        value = headers.get(name)
+    except Exception:
+        return None
+    return str(value) if isinstance(value, (str, int, float)) else None
+
+
+def _number(headers: Any, name: str) -> Optional[float]:
+    value = _header(headers, name)
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _seconds_until(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """Seconds until a header value that is either delta-seconds, epoch seconds, or a date"""
+    if value is None:
+        return None
+    now = now or datetime.now(timezone.utc)
+    try:
+        number = float(value)
+    except ValueError:
+        number = None
+    if number is not None:
+        # Large values are epoch timestamps (X-RateLimit-Reset on some servers)
+        return max(0.0, number - now.timestamp()) if number > 1e9 else max(0.0, number)
+
+    for parse in (parsedate_to_datetime, lambda v: datetime.fromisoformat(v.replace("Z", "+00:00"))):
+        try:
+            moment = parse(value)
+        except (TypeError, ValueError, IndexError):
+            continue
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        return max(0.0, (moment - now).total_seconds())
+    return None
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by every request of a client
+
+    Unlimited until JIRA advertises a rate through ``X-RateLimit-FillRate`` and
+    ``X-RateLimit-Interval-Seconds``; can also be paused outright after a 429.
+    """
+
+    def __init__(self, rate: Optional[float] = None, capacity: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.rate = rate  # Tokens per second; None means unlimited
+        self.capacity = capacity or (rate or 1.0)
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+
+    def configure(self, rate: float, capacity: Optional[float] = None) -> None:
+        """Set the refill rate (tokens per second) and burst capacity"""
+        with self._lock:
+            self._refill(self._clock())
+            # A bucket that was unlimited starts full at the advertised capacity
+            was_unlimited = not self.rate
+            self.rate = rate
+            self.capacity = capacity or max(rate, 1.0)
+            self._tokens = self.capacity if was_unlimited else min(self._tokens, self.capacity)
+
+    def pause_for(self, seconds: float) -> None:
+        """Hold every caller back for *seconds* (extends, never shortens, a pause)"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds the caller must wait before using it"""
+        with self._lock:
+            now = self._clock()
+            wait = max(0.0, self._paused_until - now)
+            if self.rate:
+                self._refill(now)
+                self._tokens -= 1
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens / self.rate)
+            return wait
+
+    def update_from_headers(self, headers: Any) -> None:
+        """Adopt the rate advertised by ``X-RateLimit-*`` headers and pause when exhausted"""
+        fill_rate = _number(headers, "X-RateLimit-FillRate")
+        interval = _number(headers, "X-RateLimit-Interval-Seconds")
+        limit = _number(headers, "X-RateLimit-Limit")
+        if fill_rate and interval:
+            self.configure(fill_rate / interval, limit)
+
+        remaining = _number(headers, "X-RateLimit-Remaining")
+        if remaining is not None:
+            with self._lock:
+                if self.rate:
+                    self._refill(self._clock())
+                    self._tokens = min(self._tokens, remaining)
+            if remaining <= 0:
+                reset = _seconds_until(_header(headers, "X-RateLimit-Reset"))
+                if reset:
+                    self.pause_for(reset)
+
+    def _refill(self, now: float) -> None:
+        if self.rate:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class RetryPolicy:
+    """Retry decisions, backoff delays and retry metrics for one client"""
+
+    def __init__(self, max_retries: int = DEFAULT_MAX_RETRIES, base_delay: float = DEFAULT_RETRY_BASE_DELAY,
+                 max_delay: float = DEFAULT_RETRY_MAX_DELAY, retry_statuses: Iterable[int] = RETRY_STATUSES,
+                 bucket: Optional[TokenBucket] = None, jitter: Callable[[], float] = random.random):
+        """
+        Initialize retry policy
+
+        Args:
+            max_retries: Retries after the first attempt (0 disables retrying)
+            base_delay: First backoff step in seconds; doubles per attempt
+            max_delay: Cap on any single backoff, including ``Retry-After``
+            retry_statuses: HTTP statuses that are retried
+            bucket: Token bucket shared by every request of the client
+            jitter: Source of uniform [0, 1) values (injectable for tests)
+        """
+        self.max_retries = max(0, max_retries)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+        self.bucket = bucket or TokenBucket()
+        self._jitter = jitter
+        self._lock = threading.Lock()
+
+        # Metrics
+        self._retries = 0
+        self._retries_by_status = {}
+        self._retry_sleep = 0.0
+        self._throttled = 0
+        self._throttle_sleep = 0.0
+        self._exhausted = 0
+
+    def should_retry(self, status_code: int, attempt: int) -> bool:
+        """True if a response with *status_code* on zero-based *attempt* should be retried"""
+        retryable = status_code in self.retry_statuses
+        if retryable and attempt >= self.max_retries:
+            with self._lock:
+                self._exhausted += 1
+            return False
+        return retryable
+
+    def backoff(self, status_code: int, attempt: int, headers: Any) -> float:
+        """
+        Compute the delay before the next attempt and record it
+
+        ``Retry-After`` wins over the computed backoff; a 429 also pauses the
+        shared bucket so concurrent callers wait out the same window.
+        """
+        retry_after = _seconds_until(_header(headers, "Retry-After"))
+        if retry_after is not None:
+            delay = min(retry_after, self.max_delay)
+        else:
+            # Full jitter: uniform between 0 and the capped exponential step
+            delay = self._jitter() * min(self.max_delay, self.base_delay * (2 ** attempt))
+
+        if status_code == 429:
+            self.bucket.pause_for(delay)
+
+        with self._lock:
+            self._retries += 1
+            self._retries_by_status[status_code] = self._retries_by_status.get(status_code, 0) + 1
+            self._retry_sleep += delay
+        return delay
+
+    def before_request(self) -> float:
+        """Reserve a token from the shared bucket; returns seconds to wait before sending"""
+        wait = self.bucket.reserve()
+        if wait > 0:
+            with self._lock:
+                self._throttled += 1
+                self._throttle_sleep += wait
+        return wait
+
+    def after_response(self, headers: Any) -> None:
+        """Feed rate limit headers from any response into the shared bucket"""
+        self.bucket.update_from_headers(headers)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of retry and throttling metrics"""
+        with self._lock:
+            return {
+                "retries": self._retries,
+                "retries_by_status": dict(self._retries_by_status),
+                "retry_sleep_seconds": round(self._retry_sleep, 3),
+                "throttled": self._throttled,
+                "throttle_sleep_seconds": round(self._throttle_sleep, 3),
+                "exhausted": self._exhausted,
+                "rate_per_second": self.bucket.rate,
+            }
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Single-flight request coalescing
+
+When several tool calls ask JIRA for the same resource at the same time (for
+example ``get_parent``, ``get_ancestors`` and ``get_issue_relationships`` for
+one issue), only the first caller performs the request; the others wait for it
+and share its parsed JSON (or its exception).  Nothing is cached once the
+request completes - that is the issue cache's job.
+"""
+
+import asyncio
+import threading
+from typing import Optional, Dict, Any, Callable, Awaitable, Hashable, Tuple
+
+
+def request_key(url: str, params: Optional[Dict[str, Any]] = None, *extra: Hashable) -> Tuple[Hashable, ...]:
+    """Build a hashable key for a GET request from its URL and query parameters"""
+    items = tuple(sorted((str(name), str(value)) for name, value in (params or {}).items()))
+    return (url, items) + extra
+
+
+class _FlightStats:
+    """Counters shared by the sync and async implementations"""
+
+    def __init__(self):
+        self._calls = 0
+        self._shared = 0
+        self._max_waiters = 0
+
+    def _snapshot(self, in_flight: int, waiting: int) -> Dict[str, Any]:
+        return {
+            "calls": self._calls,
+            "shared": self._shared,
+            "in_flight": in_flight,
+            "waiting": waiting,
+            "max_waiters": self._max_waiters,
+        }
+
+
+class _Call:
+    """A request in flight and the callers waiting on it"""
+
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight(_FlightStats):
+    """Coalesce concurrent identical calls made from multiple threads"""
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._calls_in_flight = {}  # key -> _Call
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Run *func* unless an identical call is already in flight, then share its outcome
+
+        Args:
+            key: Identity of the call (see :func:`request_key`)
+            func: Zero-argument callable performing the request
+
+        Returns:
+            Result of *func* from whichever caller ran it
+
+        Raises:
+            Exception: Whatever *func* raised, re-raised in every waiting caller
+        """
+        with self._lock:
+            call = self._calls_in_flight.get(key)
+            if call is not None:
+                call.waiters += 1
+                self._shared += 1
+                self._max_waiters = max(self._max_waiters, call.waiters)
+                leader = False
+            else:
+                call = self._calls_in_flight[key] = _Call()
+                self._calls += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls_in_flight[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of coalescing metrics"""
+        with self._lock:
+            waiting = sum(call.waiters for call in self._calls_in_flight.values())
+            return self._snapshot(len(self._calls_in_flight), waiting)
+
+
+class AsyncSingleFlight(_FlightStats):
+    """Coalesce concurrent identical calls made from coroutines on one event loop"""
+
+    def __init__(self):
+        super().__init__()
+        self._calls_in_flight = {}  # key -> (asyncio.Future, [waiters])
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await *func* unless an identical call is already in flight, then share its outcome
+
+        See :meth:`SingleFlight.do`.
+        """
+        entry = self._calls_in_flight.get(key)
+        if entry is not None:
+            future, waiters = entry
+            waiters[0] += 1
+            self._shared += 1
+            self._max_waiters = max(self._max_waiters, waiters[0])
+            # Shield so a cancelled waiter does not cancel the shared request
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls_in_flight[key] = (future, [0])
+        self._calls += 1
+        try:
+            result = await func()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Mark retrieved so an unwaited failure is not logged as "never retrieved"
+                future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls_in_flight[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of coalescing metrics"""
+        waiting = sum(waiters[0] for _, waiters in self._calls_in_flight.values())
+        return self._snapshot(len(self._calls_in_flight), waiting)
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Persistent cache store - SQLite in WAL mode
+
+MCP clients restart stdio servers often, and every restart used to throw away
+the in-process caches.  :class:`PersistentStore` keeps cached JSON payloads
+(issues, search pages, field metadata, discovered parent fields) in one SQLite
+file so a restarted server begins warm.
+
+Entries live in namespaces and carry the wall-clock time they were stored plus,
+for issues, JIRA's ``updated`` value.  Freshness is decided by the reader (each
+namespace has its own TTL), so the store itself only drops entries older than
+``max_age`` when it is opened.
+
+The database runs in WAL mode with a busy timeout, so several server processes
+on the same machine can read and write it at once.  Each thread uses its own
+connection.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Dict, Any, List, NamedTuple
+
+# No persistent cache unless a path is configured
+DEFAULT_CACHE_PATH = None
+
+# Entries older than this many seconds are deleted when the store is opened
+DEFAULT_CACHE_MAX_AGE = 7 * 24 * 3600
+
+# Seconds a connection waits for another process's write lock before failing
+DEFAULT_BUSY_TIMEOUT = 5.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    item TEXT,
+    value TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    updated TEXT,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS entries_item ON entries (namespace, item);
+CREATE INDEX IF NOT EXISTS entries_stored_at ON entries (stored_at);
+"""
+
+
+class StoredEntry(NamedTuple):
+    """A payload read back from the store"""
+    key: str
+    value: Any
+    stored_at: float
+    updated: Optional[str]
+
+
+class PersistentStore:
+    """SQLite-backed key/value store shared by server processes on one machine"""
+
+    def __init__(self, path: str, max_age: float = DEFAULT_CACHE_MAX_AGE,
+                 busy_timeout: float = DEFAULT_BUSY_TIMEOUT, clock=time.time):
+        """
+        Open (creating if needed) the store at *path*
+
+        Args:
+            path: SQLite database file; ``~`` is expanded and parent directories are created
+            max_age: Entries stored more than this many seconds ago are deleted on open (0 keeps all)
+            busy_timeout: Seconds to wait for a concurrent writer before giving up
+            clock: Wall-clock time source (injectable for tests); ages must survive restarts
+        """
+        self.path = os.path.expanduser(path)
+        self.busy_timeout = busy_timeout
+        self._clock = clock
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[sqlite3.Connection] = []
+
+        # Metrics
+        self._reads = 0
+        self._hits = 0
+        self._writes = 0
+        self._errors = 0
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        if max_age:
+            self.prune(max_age)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None,
+                                   check_same_thread=False)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def now(self) -> float:
+        """Current wall-clock time as used for ``stored_at``"""
+        return self._clock()
+
+    def get(self, namespace: str, key: str, max_age: Optional[float] = None) -> Optional[StoredEntry]:
+        """
+        Read one entry
+
+        Args:
+            namespace: Entry namespace (e.g. ``"issue"``)
+            key: Entry key within the namespace
+            max_age: Ignore entries stored more than this many seconds ago
+
+        Returns:
+            The stored entry, or None when missing, too old or unreadable
+        """
+        rows = self._select("SELECT key, value, stored_at, updated FROM entries WHERE namespace = ? AND key = ?",
+                            (namespace, key))
+        return self._first_fresh(rows, max_age)
+
+    def get_item(self, namespace: str, item: str, max_age: Optional[float] = None) -> List[StoredEntry]:
+        """Read every entry of *namespace* grouped under *item* (e.g. all projections of one issue)"""
+        rows = self._select("SELECT key, value, stored_at, updated FROM entries WHERE namespace = ? AND item = ?",
+                            (namespace, item))
+        entries = [self._entry(row) for row in rows]
+        return [entry for entry in entries if entry is not None and self._is_fresh(entry, max_age)]
+
+    def put(self, namespace: str, key: str, value: Any, item: Optional[str] = None,
+            updated: Optional[str] = None) -> None:
+        """Store *value* (JSON-serializable) under *key*, replacing any previous entry"""
+        try:
+            payload = json.dumps(value, separators=(",", ":"), default=str)
+        except (TypeError, ValueError) as e:
+            logging.debug(f"Not persisting {namespace}:{key}: {e}")
+            return
+        self._execute("INSERT OR REPLACE INTO entries (namespace, key, item, value, stored_at, updated) "
+                      "VALUES (?, ?, ?, ?, ?, ?)", (namespace, key, item, payload, self._clock(), updated))
+        with self._lock:
+            self._writes += 1
+
+    def delete(self, namespace: str, key: str) -> None:
+        """Remove one entry"""
+        self._execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+
+    def delete_item(self, namespace: str, item: str) -> int:
+        """Remove every entry of *namespace* grouped under *item*; returns the number removed"""
+        return self._execute("DELETE FROM entries WHERE namespace = ? AND item = ?", (namespace, item))
+
+    def clear(self, namespace: str) -> int:
+        """Remove every entry of *namespace*; returns the number removed"""
+        return self._execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+
+    def prune(self, max_age: float) -> int:
+        """Delete entries stored more than *max_age* seconds ago; returns the number removed"""
+        return self._execute("DELETE FROM entries WHERE stored_at < ?", (self._clock() - max_age,))
+
+    def close(self) -> None:
+        """Close every connection opened by this store"""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of store metrics"""
+        rows = self._select("SELECT namespace, COUNT(*) FROM entries GROUP BY namespace", ())
+        with self._lock:
+            return {
+                "path": self.path,
+                "entries": {namespace: count for namespace, count in rows},
+                "reads": self._reads,
+                "hits": self._hits,
+                "writes": self._writes,
+                "errors": self._errors,
+            }
+
+    def _is_fresh(self, entry: StoredEntry, max_age: Optional[float]) -> bool:
+        return max_age is None or self._clock() - entry.stored_at < max_age
+
+    def _first_fresh(self, rows: List[tuple], max_age: Optional[float]) -> Optional[StoredEntry]:
+        with self._lock:
+            self._reads += 1
+        for row in rows:
+            entry = self._entry(row)
+            if entry is not None and self._is_fresh(entry, max_age):
+                with self._lock:
+                    self._hits += 1
+                return entry
+        return None
+
+    @staticmethod
+    def _entry(row: tuple) -> Optional[StoredEntry]:
+        key, payload, stored_at, updated = row
+        try:
+            return StoredEntry(key, json.loads(payload), stored_at, updated)
+        except ValueError:
+            return None
+
+    def _select(self, sql: str, args: tuple) -> List[tuple]:
+        try:
+            return self._connection().execute(sql, args).fetchall()
+        except sqlite3.Error as e:
+            # A broken or locked cache must never fail a tool call; treat it as a miss
+            self._record_error(e)
+            return []
+
+    def _execute(self, sql: str, args: tuple) -> int:
+        try:
+            return self._connection().execute(sql, args).rowcount
+        except sqlite3.Error as e:
+            self._record_error(e)
+            return 0
+
+    def _record_error(self, error: Exception) -> None:
+        with self._lock:
+            self._errors += 1
+        logging.warning(f"Persistent cache {self.path} unavailable: {error}")
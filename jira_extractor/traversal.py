@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Descendant traversal state - frontier bookkeeping for level-synchronous BFS
+
+:class:`DescendantTraversal` holds the frontier, visited set and collected
+issues of a ``get_descendants`` walk but performs no I/O itself.  The clients
+drive it one BFS level at a time: they fetch every issue of the level with
+batched ``key in (...)`` searches, find the parent-link children of the whole
+level with batched ``"Parent Link" in (...)`` searches, and hand the results
+back here.  Keeping the state free of I/O lets the sync and async clients
+share it.
+
+A traversal can be suspended when a node or time budget runs out and resumed
+later from an opaque continuation token (see :meth:`DescendantTraversal.to_token`).
+"""
+
+import base64
+import json
+import logging
+import zlib
+from collections import deque
+from typing import Optional, Dict, Any, Set, List, Iterable, Tuple
+
+# Bump when the continuation token layout changes so stale tokens fail loudly
+TOKEN_VERSION = 2
+
+# Which relationships a traversal follows: every one in the payload, or only those leading to children
+DIRECTION_RELATED = "related"
+DIRECTION_DOWN = "down"
+
+# Link types whose outward side is the child when walking down ("A blocks B": B depends on A)
+DEFAULT_CHILD_LINK_TYPES = ("Blocks",)
+
+
+class DescendantTraversal:
+    """Frontier, visited set and results of a breadth-first descendant walk"""
+
+    def __init__(self, issue_key: str, depth: int = 0,
+                 include_subtasks: bool = False, include_links: bool = False,
+                 include_remote_links: bool = False, include_parent_links: bool = False,
+                 parent_link_field: str = "Parent Link", expand: Optional[str] = None,
+                 fields: Optional[str] = None, direction: str = DIRECTION_RELATED,
+                 child_link_types: Iterable[str] = DEFAULT_CHILD_LINK_TYPES):
+        """
+        Initialize traversal state
+
+        Args:
+            issue_key: Starting JIRA issue key
+            depth: Maximum traversal depth (-1 for unlimited, 0 for issue only)
+            include_subtasks: Include subtask relationships
+            include_links: Include issue links
+            include_remote_links: Include remote links
+            include_parent_links: Include parent link custom field relationships
+            parent_link_field: Name of the parent link field
+            expand: Comma-separated fields to expand for each issue
+            fields: Comma-separated fields to fetch for each issue (None for all fields)
+            direction: DIRECTION_RELATED follows every relationship, including parents and both
+                sides of links; DIRECTION_DOWN follows subtasks, parent-link children and the
+                outward side of *child_link_types* links only
+            child_link_types: Names of the link types followed when walking down
+
+        Raises:
+            ValueError: If *direction* is unknown
+        """
+        if direction not in (DIRECTION_RELATED, DIRECTION_DOWN):
+            raise ValueError(f"Unknown traversal direction {direction!r}")
+        self.depth = depth
+        self.include_subtasks = include_subtasks
+        self.include_links = include_links
+        self.include_remote_links = include_remote_links
+        self.include_parent_links = include_parent_links
+        self.parent_link_field = parent_link_field
+        self.expand = expand
+        self.fields = fields
+        self.direction = direction
+        self.child_link_types = tuple(child_link_types)
+
+        self.frontier = deque([(issue_key, 0)])  # Deque[(issue_key, depth)]
+        self.visited = {issue_key}  # Keys already scheduled; never scheduled twice
+        self.issues = {}  # Dict[str, Dict[str, Any]]
+        self.missing_keys = []  # Keys JIRA did not return or that failed to fetch
+
+        self.extraction_metadata = {
+            "start_issue": issue_key,
+            "max_depth": depth,
+            "include_subtasks": include_subtasks,
+            "include_links": include_links,
+            "include_remote_links": include_remote_links,
+            "include_parent_links": include_parent_links,
+            "parent_link_field": parent_link_field,
+            "direction": direction,
+            "traversal_order": []
+        }
+
+    @property
+    def done(self) -> bool:
+        """True when the frontier is empty"""
+        return not self.frontier
+
+    def take_level(self, limit: Optional[int] = None) -> Tuple[List[str], int]:
+        """
+        Pop the frontier entries that share the depth of the frontier head
+
+        Args:
+            limit: Maximum number of keys to pop (None for the whole level)
+
+        Returns:
+            Tuple of (issue keys, depth)
+        """
+        if not self.frontier:
+            return [], 0
+
+        level_depth = self.frontier[0][1]
+        keys = []
+        while self.frontier and self.frontier[0][1] == level_depth and (limit is None or len(keys) < limit):
+            keys.append(self.frontier.popleft()[0])
+        return keys, level_depth
+
+    def requeue(self, keys: List[str], level_depth: int) -> None:
+        """Put keys taken by :meth:`take_level` back at the head of the frontier"""
+        self.frontier.extendleft((key, level_depth) for key in reversed(keys))
+
+    def should_expand(self, level_depth: int) -> bool:
+        """True when issues at *level_depth* may contribute children to the frontier"""
+        return self.depth == -1 or level_depth < self.depth
+
+    def record_level(self, keys: List[str], level_depth: int, fetched: Dict[str, Any]) -> List[str]:
+        """
+        Store the fetched issues of a level
+
+        Args:
+            keys: Keys requested for the level
+            level_depth: Depth of the level
+            fetched: Issues keyed by issue key (extra ``_``-prefixed entries are ignored)
+
+        Returns:
+            Keys of the level that were fetched successfully
+        """
+        found = []
+        for key in keys:
+            issue_data = fetched.get(key)
+            if issue_data is None:
+                logging.warning(f"Failed to process issue {key}: not returned by JIRA")
+                self.missing_keys.append(key)
+                continue
+
+            logging.info(f"Processing issue {key} at depth {level_depth}")
+            self.issues[key] = issue_data
+            self.extraction_metadata["traversal_order"].append({
+                "issue_key": key,
+                "depth": level_depth
+            })
+            found.append(key)
+        return found
+
+    def related_issue_keys(self, issue_data: Dict[str, Any], parent_link_field_id: Optional[str] = None) -> Set[str]:
+        """
+        Extract related issue keys that are present in the issue payload itself
+
+        Parent-link *children* are not part of the payload; the clients search
+        for them per level and pass them to :meth:`schedule`.  Walking down,
+        the subtask parent, the parent link value and inward links are skipped,
+        and only the outward side of ``child_link_types`` links is followed.
+
+        Args:
+            issue_data: Issue data from JIRA API
+            parent_link_field_id: Custom field ID of the parent link field, if known
+
+        Returns:
+            Set of related issue keys
+        """
+        related_keys = set()
+        fields = issue_data.get('fields', {})
+        down = self.direction == DIRECTION_DOWN
+
+        # Process subtasks (children) and the subtask parent
+        if self.include_subtasks:
+            for subtask in fields.get('subtasks', []):
+                subtask_key = subtask.get('key')
+                if subtask_key:
+                    related_keys.add(subtask_key)
+
+            parent = fields.get('parent')
+            if not down and parent and parent.get('key'):
+                related_keys.add(parent.get('key'))
+
+        # Process issue links - they can have inwardIssue or outwardIssue
+        if self.include_links:
+            child_types = {name.lower() for name in self.child_link_types}
+            for link in fields.get('issuelinks', []):
+                if down:
+                    if (link.get('type') or {}).get('name', '').lower() not in child_types:
+                        continue
+                    directions = ('outwardIssue',)
+                else:
+                    directions = ('inwardIssue', 'outwardIssue')
+                for direction in directions:
+                    linked = link.get(direction)
+                    if linked and linked.get('key'):
+                        related_keys.add(linked.get('key'))
+
+        # Process the parent link custom field value
+        if self.include_parent_links and parent_link_field_id and not down:
+            parent_link = fields.get(parent_link_field_id)
+            if parent_link:
+                related_keys.add(parent_link)
+
+        return related_keys
+
+    def schedule(self, keys: Iterable[str], depth: int) -> List[str]:
+        """
+        Add unvisited keys to the frontier
+
+        Returns:
+            Keys that were newly scheduled
+        """
+        scheduled = []
+        for key in keys:
+            if key and key not in self.visited:
+                self.visited.add(key)
+                self.frontier.append((key, depth))
+                scheduled.append(key)
+        return scheduled
+
+    def expand_level(self, keys: List[str], level_depth: int, parent_link_children: Iterable[str] = (),
+                     parent_link_field_id: Optional[str] = None) -> List[str]:
+        """
+        Schedule the next level from the issues of this level
+
+        Args:
+            keys: Fetched keys of the level
+            level_depth: Depth of the level
+            parent_link_children: Keys found by the batched parent-link children search
+            parent_link_field_id: Custom field ID of the parent link field, if known
+
+        Returns:
+            Keys that were newly scheduled
+        """
+        related = []
+        for key in keys:
+            related.extend(sorted(self.related_issue_keys(self.issues[key], parent_link_field_id)))
+        related.extend(parent_link_children)
+        return self.schedule(related, level_depth + 1)
+
+    def result(self) -> Dict[str, Any]:
+        """Return collected issues with ``_extraction_metadata`` attached"""
+        issues = dict(self.issues)
+        self.extraction_metadata["missing_keys"] = list(self.missing_keys)
+        # Keys left in the frontier when the walk was interrupted
+        self.extraction_metadata["unexplored_keys"] = [key for key, _ in self.frontier]
+        issues["_extraction_metadata"] = self.extraction_metadata
+        return issues
+
+    def progress(self, fetched: int, in_progress: int, in_flight: int, elapsed: float,
+                 budget: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Snapshot of traversal progress for reporting to a caller
+
+        Args:
+            fetched: Issues whose batch has returned in the current run
+            in_progress: Issues taken from the frontier whose batch has not returned yet
+            in_flight: HTTP requests currently awaiting a response
+            elapsed: Seconds since the current run started
+            budget: Issues the current run may still fetch (None for unlimited)
+
+        Returns:
+            Dictionary with ``fetched``, ``frontier``, ``pending``, ``in_flight``,
+            ``elapsed_seconds`` and ``eta_seconds`` (None until a rate is known)
+        """
+        pending = len(self.frontier) + in_progress
+        if budget is not None:
+            pending = min(pending, budget)
+        eta = elapsed / fetched * pending if fetched else None
+        return {
+            "fetched": fetched,
+            "frontier": len(self.frontier),
+            "pending": pending,
+            "in_flight": in_flight,
+            "elapsed_seconds": round(elapsed, 3),
+            "eta_seconds": round(eta, 1) if eta is not None else None,
+        }
+
+    def to_token(self) -> str:
+        """
+        Serialize the unexplored part of the traversal into a continuation token
+
+        Only the options, the frontier and the visited set are kept; issues
+        already returned to the caller are not repeated on resume.
+
+        Returns:
+            URL-safe opaque token string
+        """
+        state = {
+            "v": TOKEN_VERSION,
+            "start_issue": self.extraction_metadata["start_issue"],
+            "depth": self.depth,
+            "include_subtasks": self.include_subtasks,
+            "include_links": self.include_links,
+            "include_remote_links": self.include_remote_links,
+            "include_parent_links": self.include_parent_links,
+            "parent_link_field": self.parent_link_field,
+            "expand": self.expand,
+            "fields": self.fields,
+            "direction": self.direction,
+            "child_link_types": list(self.child_link_types),
+            "frontier": [[key, depth] for key, depth in self.frontier],
+            "visited": sorted(self.visited),
+        }
+        payload = zlib.compress(json.dumps(state, separators=(",", ":")).encode("utf-8"))
+        return base64.urlsafe_b64encode(payload).decode("ascii")
+
+    @classmethod
+    def from_token(cls, token: str) -> "DescendantTraversal":
+        """
+        Restore a traversal from a token produced by :meth:`to_token`
+
+        Raises:
+            ValueError: If the token is malformed or from an incompatible version
+        """
+        try:
+            state = json.loads(zlib.decompress(base64.urlsafe_b64decode(token.encode("ascii"))))
+            if state.get("v") != TOKEN_VERSION:
+                raise ValueError(f"unsupported token version {state.get('v')!r}")
+            traversal = cls(
+                state["start_issue"], state["depth"], state["include_subtasks"], state["include_links"],
+                state["include_remote_links"], state["include_parent_links"], state["parent_link_field"],
+                state["expand"], state["fields"], state["direction"], state["child_link_types"]
+            )
+            traversal.frontier = deque((key, depth) for key, depth in state["frontier"])
+            traversal.visited = set(state["visited"])
+        except (ValueError, KeyError, TypeError, zlib.error, UnicodeError) as e:
+            raise ValueError(f"Invalid continuation token: {e}") from e
+        return traversal
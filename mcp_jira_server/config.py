@@ -18,7 +18,29 @@ username: myuser            # for password or token auth
 password: mypass            # basic auth
 token: myapitoken           # basic auth (with username)
 bearer_token: abc123        # Personal Access Token (no username needed)
-field_cache_ttl: 3600       # TTL for field discovery cache in seconds (default: 3600 = 1 hour)
+field_cache_ttl: 3600       # TTL for field metadata and field discovery caches in seconds (default: 3600 = 1 hour)
+async_client: false         # Use the non-blocking httpx-based client (default: false)
+worker_pool_size: 8         # Threads running blocking JiraClient calls off the event loop (default: 8)
+issue_cache_max_bytes: 33554432  # Approximate byte budget of the in-process issue cache, 0 disables it (default: 32 MiB)
+issue_cache_ttl: 300         # Seconds a cached issue stays fresh (default: 300)
+max_retries: 3              # Retries for 429/502/503/504 responses with backoff, 0 disables them (default: 3)
+retry_max_delay: 30         # Cap in seconds on any single retry backoff, including Retry-After (default: 30)
+tool_timeout: 60            # Deadline in seconds for one tool call, shared by all its JIRA requests, 0 disables it (default: 60)
+connect_timeout: 5          # Connect timeout in seconds for each JIRA request (default: 5)
+read_timeout: 30            # Read timeout in seconds for each JIRA request (default: 30)
+issue_cache_stale_ttl: 3600  # Seconds an expired issue is kept to be served while JIRA is unavailable (default: 3600)
+breaker_failure_threshold: 5 # Consecutive failed or slow responses that open the circuit breaker, 0 disables it (default: 5)
+breaker_reset_timeout: 30   # Seconds the breaker fails fast before probing JIRA again (default: 30)
+breaker_latency_slo: 10     # Responses slower than this many seconds count as breaker failures, 0 disables it (default: 10)
+pool_maxsize: 20            # Pooled HTTP connections kept per host by the default client (default: 20)
+pool_block: false           # Wait for a free pooled connection instead of opening an extra one (default: false)
+pool_keepalive: true        # TCP keep-alive probes on pooled connections (default: true)
+pool_prewarm: 0             # Connections opened in parallel at startup, 0 disables prewarming (default: 0)
+cache_path: ~/.cache/mcp-jira/cache.sqlite  # SQLite cache kept across restarts and shared by processes (default: unset = disabled)
+sync_interval: 0            # Seconds between 'updated >=' polls that invalidate changed cached issues, 0 disables them (default: 0)
+sync_projects: [ABC, XYZ]   # Project keys the delta poll is scoped to (default: all projects)
+issue_cache_revalidate_ttl: 300  # Seconds past issue_cache_ttl a cached issue is served while refreshed in the background, 0 disables (default: 300)
+parent_field_overrides: {ABC: [customfield_12313140]}  # Parent field IDs or names per project, replacing those found in /field (default: none)
 ```
 """
 
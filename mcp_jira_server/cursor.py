@@ -0,0 +1,63 @@
+"""Opaque cursors for paging through ``search_issues`` results.
+
+A cursor records which query it belongs to (a hash of the JQL), where the next
+page starts, the page size, the ``total`` JIRA reported with the first page and
+the key of the last issue already returned.  Follow-up calls therefore never
+re-run a count query, and the last key lets the next page skip issues that were
+pushed forward when new matches appeared between calls.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import json
+from typing import Optional
+
+# Bumped whenever the cursor layout changes; older cursors are rejected
+CURSOR_VERSION = 1
+
+
+def query_hash(jql: str) -> str:
+    """Short stable hash identifying a JQL query."""
+    return hashlib.sha256(jql.encode("utf-8")).hexdigest()[:16]
+
+
+class SearchCursor:
+    """Position of the next page of a JQL search."""
+
+    def __init__(self, query: str, start_at: int, page_size: int, total: int, last_key: Optional[str] = None):
+        self.query = query
+        self.start_at = start_at
+        self.page_size = page_size
+        self.total = total
+        self.last_key = last_key
+
+    def to_token(self) -> str:
+        """Serialize the cursor into a URL-safe opaque string."""
+        state = {
+            "v": CURSOR_VERSION,
+            "q": self.query,
+            "s": self.start_at,
+            "n": self.page_size,
+            "t": self.total,
+            "k": self.last_key,
+        }
+        payload = json.dumps(state, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(payload).decode("ascii")
+
+    @classmethod
+    def from_token(cls, token: str) -> "SearchCursor":
+        """Restore a cursor produced by :meth:`to_token`.
+
+        Raises:
+            ValueError: If the cursor is malformed or from an incompatible version
+        """
+        try:
+            state = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+            if state.get("v") != CURSOR_VERSION:
+                raise ValueError(f"unsupported cursor version {state.get('v')!r}")
+            return cls(state["q"], int(state["s"]), int(state["n"]), int(state["t"]), state.get("k"))
+        except (ValueError, KeyError, TypeError, AttributeError, binascii.Error, UnicodeError) as e:
+            raise ValueError(f"Invalid search cursor: {e}") from e
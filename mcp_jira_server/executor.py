@@ -0,0 +1,107 @@
+"""Bounded worker pool for blocking JIRA client calls.
+
+The requests-based :class:`jira_extractor.client.JiraClient` performs blocking
+I/O.  Calling it directly from an ``async def`` tool freezes the FastMCP event
+loop until JIRA answers, so every other queued tool call waits behind it.
+:class:`WorkerPool` runs those calls on a fixed-size thread pool instead and
+keeps simple queue-depth and wait-time metrics so pool sizing can be tuned
+from ``mcp_jira_server.yaml``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+# Default number of worker threads used for blocking client calls
+DEFAULT_WORKER_POOL_SIZE = 8
+
+
+class WorkerPool:
+    """Thread pool that runs blocking callables off the event loop."""
+
+    def __init__(self, max_workers: int = DEFAULT_WORKER_POOL_SIZE, name: str = "jira"):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.name = name
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"{name}-worker")
+        self._logger = logging.getLogger(__name__).getChild(name)
+        self._lock = threading.Lock()
+
+        # Metrics
+        self._queued = 0
+        self._active = 0
+        self._submitted = 0
+        self._started = 0
+        self._completed = 0
+        self._max_queue_depth = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run *func* on the pool and await its result.
+
+        Context variables of the calling task are propagated to the worker thread.
+        """
+        submitted_at = time.monotonic()
+        context = contextvars.copy_context()
+
+        with self._lock:
+            self._queued += 1
+            self._submitted += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queued)
+
+        def invoke() -> Any:
+            waited = time.monotonic() - submitted_at
+            with self._lock:
+                self._queued -= 1
+                self._active += 1
+                self._started += 1
+                self._total_wait += waited
+                self._max_wait = max(self._max_wait, waited)
+            if waited > 1.0:
+                self._logger.debug(f"{getattr(func, '__name__', func)} waited {waited:.2f}s for a worker")
+            try:
+                return context.run(func, *args, **kwargs)
+            finally:
+                with self._lock:
+                    self._active -= 1
+                    self._completed += 1
+
+        future = self._executor.submit(invoke)
+        future.add_done_callback(self._on_done)
+        return await asyncio.wrap_future(future)
+
+    def _on_done(self, future: Future) -> None:
+        # A job cancelled before a worker picked it up never decrements the queue itself
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of pool metrics."""
+        with self._lock:
+            return {
+                "name": self.name,
+                "max_workers": self.max_workers,
+                "queue_depth": self._queued,
+                "active": self._active,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "max_queue_depth": self._max_queue_depth,
+                "avg_wait_seconds": self._total_wait / self._started if self._started else 0.0,
+                "max_wait_seconds": self._max_wait,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work and release the worker threads."""
+        self._executor.shutdown(wait=wait)
+
+# EOF
@@ -0,0 +1,83 @@
+"""MCP progress notifications for long-running tools.
+
+Traversal tools such as ``get_descendants`` can run for many seconds while the
+client sees nothing and may cancel and retry, doubling the load on JIRA.
+:class:`ProgressReporter` forwards progress updates to the FastMCP request
+context so clients can keep the call alive and show what is happening.
+
+Updates may come from the event loop (async client) or from worker threads
+(blocking client on the :class:`~mcp_jira_server.executor.WorkerPool`); both are
+marshalled onto the loop and sent in order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+from mcp.server.fastmcp import Context
+
+
+class ProgressReporter:
+    """Thread-safe, fire-and-forget sender of MCP progress notifications."""
+
+    def __init__(self, ctx: Optional[Context] = None):
+        self._ctx = ctx
+        # Only pay for notifications when the client asked for them with a progress token
+        self._loop = asyncio.get_running_loop() if _wants_progress(ctx) else None
+        self._logger = logging.getLogger(__name__).getChild("ProgressReporter")
+        self._last: Optional[asyncio.Task] = None
+
+    def __call__(self, progress: float, total: Optional[float] = None, message: Optional[str] = None) -> None:
+        """Queue a progress notification; safe to call from any thread."""
+        if self._loop is None:
+            return
+        self._loop.call_soon_threadsafe(self._schedule, progress, total, message)
+
+    def traversal(self, snapshot: Dict[str, Any]) -> None:
+        """Report a :meth:`DescendantTraversal.progress` snapshot."""
+        self(snapshot["fetched"], snapshot["fetched"] + snapshot["pending"], describe_traversal(snapshot))
+
+    def _schedule(self, progress: float, total: Optional[float], message: Optional[str]) -> None:
+        previous = self._last
+
+        async def send() -> None:
+            # Chain on the previous notification so clients see them in order
+            if previous is not None:
+                await previous
+            try:
+                await self._ctx.report_progress(progress, total, message)
+            except Exception as exc:  # Progress is best effort; never fail the tool
+                self._logger.debug(f"Could not send progress notification: {exc}")
+
+        self._last = self._loop.create_task(send())
+
+    async def flush(self) -> None:
+        """Wait until every queued notification has been sent."""
+        # Let callbacks queued by worker threads create their tasks first
+        await asyncio.sleep(0)
+        if self._last is not None:
+            await self._last
+
+
+def _wants_progress(ctx: Optional[Context]) -> bool:
+    """True when the current request carries an MCP progress token."""
+    if ctx is None:
+        return False
+    try:
+        meta = ctx.request_context.meta
+    except (ValueError, AttributeError):  # Outside of a request
+        return False
+    return meta is not None and getattr(meta, "progressToken", None) is not None
+
+
+def describe_traversal(snapshot: Dict[str, Any]) -> str:
+    """Human-readable message for a traversal progress snapshot."""
+    message = (
+        f"Fetched {snapshot['fetched']} issues, {snapshot['frontier']} queued, "
+        f"{snapshot['in_flight']} requests in flight"
+    )
+    if snapshot.get("eta_seconds") is not None:
+        message += f", ETA {snapshot['eta_seconds']:.0f}s"
+    return message
@@ -1,6 +1,4 @@
 # flake8: noqa: E501
-from __future__ import annotations
-
 """MCP JIRA Server
 
 A read-only Model Context Protocol server that provides tools for:
@@ -20,21 +18,84 @@ Dependencies:
 Generated by: Cursor (Claude)
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Union, Tuple, Set, AsyncIterator, NamedTuple, Iterable
 import asyncio
+import contextlib
+import contextvars
+import functools
+import inspect
 import logging
+import sqlite3
+import threading
+import time
 from urllib.parse import urljoin
 
 from pydantic import BaseModel, Field
 from cachetools import TTLCache
 
 from .config import load_config, ConfigError
+from .cursor import SearchCursor, query_hash
+from .executor import WorkerPool, DEFAULT_WORKER_POOL_SIZE
+from .progress import ProgressReporter
+from .sync import DeltaSync, DEFAULT_SYNC_INTERVAL, DEFAULT_SYNC_PROJECTS
 
 # Default TTL for field discovery cache (1 hour)
 DEFAULT_FIELD_CACHE_TTL = 3600
 
+# Use the blocking requests-based client unless the async backend is enabled
+DEFAULT_ASYNC_CLIENT = False
+
+# Deadline for one tool invocation; every JIRA request made by the tool shares it
+DEFAULT_TOOL_TIMEOUT = 60.0
+
+# search_issues pages kept so revisiting a page with its cursor does not reach JIRA; for
+# SEARCH_PAGE_REVALIDATE_TTL seconds past their TTL pages are served while refreshed in the background
+SEARCH_PAGE_CACHE_SIZE = 200
+SEARCH_PAGE_CACHE_TTL = 300
+SEARCH_PAGE_REVALIDATE_TTL = 300
+
+# Persistent store namespace used by JiraTools (issues and /field live in the client's namespaces)
+SEARCH_PAGE_NAMESPACE = "search_page"
+
+# Custom field types that hold an issue's parent key, in the order they are tried
+PARENT_FIELD_TYPES = (
+    "com.pyxis.greenhopper.jira:gh-epic-link",   # Epic Link
+    "com.atlassian.jpo:jpo-custom-field-parent",  # Parent Link (Advanced Roadmaps)
+)
+
+# Per-project parent field IDs or names replacing the instance-wide ones (None: no overrides)
+DEFAULT_PARENT_FIELD_OVERRIDES = None
+
+# Per-call budgets for get_descendants; larger hierarchies continue via token
+DEFAULT_DESCENDANTS_MAX_NODES = 200
+DEFAULT_DESCENDANTS_MAX_SECONDS = 20.0
+
+# Fields fetched per issue during descendant traversal (summary + child relationships)
+DESCENDANT_FIELDS = "summary,status,issuetype,subtasks,issuelinks"
+
+# Fields fetched per issue during ancestor resolution; parent link fields are added per instance
+ANCESTOR_FIELDS = "summary,status,issuetype,project,parent"
+
+# Fields the other relationship tools read from the issue they fetch; parent-finding
+# tools add the parent field IDs discovered at runtime to PARENT_FIELDS
+RELATIONSHIP_FIELDS = "parent,subtasks,issuelinks"
+CHILDREN_FIELDS = "subtasks"
+LINKED_ISSUE_FIELDS = "issuelinks"
+PARENT_FIELDS = "parent,project"
+PARENT_SUMMARY_FIELDS = "summary"
+
+# Fields search_issues requests, and the parts of the response it reads; the rest is never decoded
+SEARCH_SUMMARY_FIELDS = "key,summary,status,issuetype"
+SEARCH_SUMMARY_PATHS = (
+    "total",
+    "issues[].key",
+    "issues[].fields.summary",
+    "issues[].fields.status.name",
+    "issues[].fields.issuetype.name",
+)
+
 try:
-    from mcp.server.fastmcp import FastMCP
+    from mcp.server.fastmcp import FastMCP, Context
     from mcp.types import ToolAnnotations
 except ImportError as exc:  # pragma: no cover – avoids breaking tests when mcp missing
     raise SystemExit(
@@ -43,6 +104,37 @@ except ImportError as exc:  # pragma: no cover – avoids breaking tests when mc
     ) from exc
 
 from jira_extractor.client import JiraClient
+from jira_extractor.async_client import AsyncJiraClient
+from jira_extractor.breaker import (
+    CircuitBreaker,
+    DEFAULT_BREAKER_FAILURE_THRESHOLD,
+    DEFAULT_BREAKER_LATENCY_SLO,
+    DEFAULT_BREAKER_RESET_TIMEOUT,
+)
+from jira_extractor.cache import (
+    IssueCache,
+    DEFAULT_ISSUE_CACHE_MAX_BYTES,
+    DEFAULT_ISSUE_CACHE_REVALIDATE_TTL,
+    DEFAULT_ISSUE_CACHE_STALE_TTL,
+    DEFAULT_ISSUE_CACHE_TTL,
+)
+from jira_extractor.deadline import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    DeadlineExceeded,
+    deadline_scope,
+)
+from jira_extractor.freshness import CONSISTENCY_DEFAULT, fresh_required, observe, read_scope
+from jira_extractor.pool import (
+    DEFAULT_POOL_BLOCK,
+    DEFAULT_POOL_KEEPALIVE,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_POOL_PREWARM,
+)
+from jira_extractor.projection import field_set, plan_fields
+from jira_extractor.retry import RetryPolicy, DEFAULT_MAX_RETRIES, DEFAULT_RETRY_MAX_DELAY
+from jira_extractor.store import PersistentStore, DEFAULT_CACHE_PATH
+from jira_extractor.traversal import DescendantTraversal, DEFAULT_CHILD_LINK_TYPES, DIRECTION_DOWN
 
 
 ###############################################################################
@@ -56,6 +148,10 @@ class IssueSummary(BaseModel):
     summary: str = Field(..., title="Issue summary/title")
     status: str = Field(..., title="Status name", examples=["In Progress"])
     url: str = Field(..., title="Direct URL to the issue in the browser")
+    issue_type: Optional[str] = Field(None, title="Issue type name", examples=["Story"])
+    as_of: Optional[str] = Field(
+        None, title="When the returned JIRA data was read (UTC, ISO 8601); earlier than the call when served from cache"
+    )
 
     model_config = {
         "title": "IssueSummary",
@@ -63,6 +159,25 @@ class IssueSummary(BaseModel):
     }
 
 
+class SearchResults(BaseModel):
+    """One page of search results."""
+
+    issues: List[IssueSummary] = Field(..., title="Issues on this page")
+    total: int = Field(..., title="Total number of issues matching the query")
+    start_at: int = Field(0, title="Offset of this page within the results")
+    next_cursor: Optional[str] = Field(
+        None, title="Opaque cursor for the next page (None on the last page)"
+    )
+    as_of: Optional[str] = Field(
+        None, title="When the returned JIRA data was read (UTC, ISO 8601); earlier than the call when served from cache"
+    )
+
+    model_config = {
+        "title": "SearchResults",
+        "extra": "ignore",
+    }
+
+
 class IssueDetails(BaseModel):
     """Subset of fields from the full JIRA issue useful for conversational use.
 
@@ -75,6 +190,9 @@ class IssueDetails(BaseModel):
     description: Optional[str] = Field(None, title="Issue description")
     status: str = Field(..., title="Workflow status name")
     raw: Dict[str, Any] = Field(..., title="Full unmodified JIRA API response")
+    as_of: Optional[str] = Field(
+        None, title="When the returned JIRA data was read (UTC, ISO 8601); earlier than the call when served from cache"
+    )
 
     model_config = {
         "title": "IssueDetails",
@@ -218,6 +336,9 @@ class IssueLink(BaseModel):
     link_type: str = Field(..., title="Link type name")
     direction: str = Field(..., title="Link direction", examples=["inward", "outward"])
     relationship: str = Field(..., title="Relationship description", examples=["blocks", "is blocked by"])
+    as_of: Optional[str] = Field(
+        None, title="When the returned JIRA data was read (UTC, ISO 8601); earlier than the call when served from cache"
+    )
     
     model_config = {
         "title": "IssueLink",
@@ -233,6 +354,9 @@ class IssueRelationships(BaseModel):
     subtasks: List[str] = Field(default_factory=list, title="List of subtask keys")
     issue_links: List[IssueLink] = Field(default_factory=list, title="Issue links")
     remote_links_count: int = Field(0, title="Number of remote links")
+    as_of: Optional[str] = Field(
+        None, title="When the returned JIRA data was read (UTC, ISO 8601); earlier than the call when served from cache"
+    )
     
     model_config = {
         "title": "IssueRelationships",
@@ -249,6 +373,9 @@ class ParentInfo(BaseModel):
     parent_key: Optional[str] = Field(None, title="Parent issue key (None if no parent)")
     parent_summary: Optional[str] = Field(None, title="Parent issue summary")
     parent_type: Optional[str] = Field(None, title="Type of parent relationship")
+    as_of: Optional[str] = Field(
+        None, title="When the returned JIRA data was read (UTC, ISO 8601); earlier than the call when served from cache"
+    )
     
     model_config = {
         "title": "ParentInfo",
@@ -264,6 +391,10 @@ class AncestorTree(BaseModel):
     total_ancestors: int = Field(..., title="Total number of ancestors found")
     ancestors: List[IssueSummary] = Field(..., title="All ancestor issues")
     traversal_order: List[Dict[str, Any]] = Field(..., title="Order ancestors were discovered")
+    complete: bool = Field(True, title="False when the call deadline stopped the walk before the root")
+    as_of: Optional[str] = Field(
+        None, title="When the returned JIRA data was read (UTC, ISO 8601); earlier than the call when served from cache"
+    )
     
     model_config = {
         "title": "AncestorTree",
@@ -271,27 +402,152 @@ class AncestorTree(BaseModel):
     }
 
 
+class DescendantTree(BaseModel):
+    """Descendants of an issue found within one budgeted traversal call."""
+
+    root_issue: str = Field(..., title="Starting issue key")
+    max_depth: int = Field(..., title="Maximum traversal depth")
+    total_descendants: int = Field(..., title="Number of descendants returned by this call")
+    descendants: List[IssueSummary] = Field(..., title="Descendant issues found by this call")
+    traversal_order: List[Dict[str, Any]] = Field(..., title="Order descendants were discovered")
+    missing_keys: List[str] = Field(default_factory=list, title="Related keys JIRA did not return")
+    complete: bool = Field(..., title="True when the whole hierarchy has been traversed")
+    continuation_token: Optional[str] = Field(
+        None, title="Opaque token to resume the traversal (None when complete)"
+    )
+    as_of: Optional[str] = Field(
+        None, title="When the returned JIRA data was read (UTC, ISO 8601); earlier than the call when served from cache"
+    )
+
+    model_config = {
+        "title": "DescendantTree",
+        "extra": "ignore",
+    }
+
+
+class ServerStats(BaseModel):
+    """Snapshot of the server's caches, pools and fault-tolerance state."""
+
+    in_flight_requests: int = Field(..., title="HTTP requests to JIRA currently awaiting a response")
+    connection_pool: Optional[Dict[str, Any]] = Field(
+        None, title="HTTP connection pool metrics (blocking client only)"
+    )
+    issue_cache: Dict[str, Any] = Field(..., title="Issue cache size, hits and revalidations")
+    single_flight: Dict[str, Any] = Field(..., title="Coalesced identical requests")
+    retry: Dict[str, Any] = Field(..., title="Retries and rate-limit throttling")
+    circuit_breaker: Dict[str, Any] = Field(..., title="Circuit breaker state and trips")
+    fields: Dict[str, Any] = Field(..., title="Field metadata registry loads and hits")
+    worker_pool: Dict[str, Any] = Field(..., title="Worker pool queue depth and waits")
+    search_pages: int = Field(..., title="Search result pages held in memory")
+    store: Optional[Dict[str, Any]] = Field(None, title="Persistent cache metrics, when configured")
+    delta_sync: Optional[Dict[str, Any]] = Field(None, title="Background delta sync metrics, when configured")
+
+    model_config = {
+        "title": "ServerStats",
+        "extra": "ignore",
+    }
+
+
 ###############################################################################
 # Tools implementation                                                         #
 ###############################################################################
 
+class ParentFieldPlan(NamedTuple):
+    """Custom fields that may hold an issue's parent key: instance-wide and per project."""
+
+    instance: List[str]
+    overrides: Dict[str, List[str]]
+
+    def for_project(self, project: Optional[str]) -> List[str]:
+        """Parent field IDs to read, in order, for issues of *project*."""
+        return self.overrides.get(project, self.instance) if project else self.instance
+
+    def all_fields(self) -> Set[str]:
+        """Every field ID any project may need."""
+        fields = set(self.instance)
+        for field_ids in self.overrides.values():
+            fields.update(field_ids)
+        return fields
+
+
 class JiraTools:
-    """Collection of MCP *tools* backed by :class:`JiraClient`."""
+    """Collection of MCP *tools* backed by :class:`JiraClient` or :class:`AsyncJiraClient`."""
 
-    def __init__(self, client: JiraClient, field_cache_ttl: int = DEFAULT_FIELD_CACHE_TTL):
+    def __init__(self, client: Union[JiraClient, AsyncJiraClient],
+                 parent_field_overrides: Optional[Dict[str, List[str]]] = DEFAULT_PARENT_FIELD_OVERRIDES,
+                 worker_pool: Optional[WorkerPool] = None, store: Optional[PersistentStore] = None):
         self._client = client
         self._logger = logging.getLogger(__name__).getChild("JiraTools")
-        self._field_cache = TTLCache(maxsize=100, ttl=field_cache_ttl)
+        self._parent_field_overrides = dict(parent_field_overrides or {})  # project key -> field IDs or names
+        # page key -> (SearchResults, wall-clock fetch time); kept until the end of the revalidate window
+        self._search_pages = TTLCache(maxsize=SEARCH_PAGE_CACHE_SIZE,
+                                      ttl=SEARCH_PAGE_CACHE_TTL + SEARCH_PAGE_REVALIDATE_TTL)
+        self._search_pages_lock = threading.Lock()  # forget_search_pages runs on a worker thread
+        self._refreshing: Dict[Tuple[str, int, int], asyncio.Task] = {}  # Background search page refreshes
+        self._clock = time.time  # Wall clock for search page ages (injectable for tests)
+        self._worker_pool = worker_pool or WorkerPool(DEFAULT_WORKER_POOL_SIZE)
+        self._store = store  # Backs the caches above across restarts, when configured
+        self.delta_sync: Optional[DeltaSync] = None  # Background freshness polling, when configured
+
+    async def _persist(self, namespace: str, key: str, value: Any) -> None:
+        """Write *value* through to the persistent store, if there is one, on the worker pool."""
+        if self._store is not None:
+            await self._worker_pool.run(self._store.put, namespace, key, value)
+
+    def forget_search_pages(self, changed_keys: Iterable[str]) -> int:
+        """Drop the cached search pages listing any of *changed_keys*, in memory and on disk.
+
+        Only pages this process holds in memory are checked; persisted pages of other processes
+        sharing the store are left to their own delta sync.  Returns the number of pages dropped.
+        Deleting from the store blocks, so delta sync calls this on the worker pool.
+        """
+        changed = set(changed_keys)
+        with self._search_pages_lock:
+            stale = [page_key for page_key, (result, _) in list(self._search_pages.items())
+                     if any(issue.key in changed for issue in result.issues)]
+            for page_key in stale:
+                self._search_pages.pop(page_key, None)
+        if self._store is not None:
+            for page_key in stale:
+                self._store.delete(SEARCH_PAGE_NAMESPACE, "%s:%d:%d" % page_key)
+        return len(stale)
+
+    async def _call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Invoke a client method without blocking the event loop.
+
+        Async client methods are awaited directly; blocking ones run on the worker pool.
+        """
+        if asyncio.iscoroutinefunction(func):
+            return await func(*args, **kwargs)
+        return await self._worker_pool.run(func, *args, **kwargs)
+
+    def _issue_summary(self, issue: Dict[str, Any]) -> IssueSummary:
+        """Build an :class:`IssueSummary` from an issue or search result payload."""
+        key = issue.get("key")
+        fields = issue.get("fields", {})
+        return IssueSummary(
+            key=key,
+            summary=fields.get("summary", ""),
+            status=fields.get("status", {}).get("name", ""),
+            url=f"{self._client.base_url}/browse/{key}",
+            issue_type=(fields.get("issuetype") or {}).get("name"),
+        )
 
     # ---------------------------------------------------------------------
     # Search
     # ---------------------------------------------------------------------
-    async def search_issues(self, query: str, max_results: int = 25) -> List[IssueSummary]:
+    async def search_issues(self, query: str, max_results: int = 25,
+                            cursor: Optional[str] = None) -> SearchResults:
         """Search the JIRA instance for issues.
 
         The *query* parameter accepts either full JQL (e.g. `project = ABC AND text ~ "foo"`) or a
         free-text term (e.g. `RFE-7877`).  If the query does **not** contain a space or an `=` sign
         we treat it as a simple free-text search using the *summary* field.
+
+        Results are paged.  When more issues match, ``next_cursor`` is set; passing it back with
+        the same *query* returns the next page without another count query.  Pages are cached
+        by query hash and offset, so revisiting one shortly afterwards does not reach JIRA; a page
+        past its TTL is still returned once more while it is refreshed in the background.
         """
 
         # Heuristic – detect if the user likely provided JQL. Very naive but good enough for hinting.
@@ -304,39 +560,106 @@ class JiraTools:
             term = query.replace("\"", "\\\"")
             jql = f'summary ~ "{term}"'
 
-        url = urljoin(self._client.api_base, "search")
-        params = {
-            "jql": jql,
-            "fields": "key,summary,status",
-            "maxResults": max(1, min(max_results, 100)),
-        }
-
-        self._logger.info("JIRA search: %s", jql)
-        response = self._client._make_api_request(url, params=params, resource_name="search results")
-
-        summaries: List[IssueSummary] = []
-        for issue in response.get("issues", []):
-            key = issue.get("key")
-            fields = issue.get("fields", {})
-            summary = fields.get("summary", "")
-            status = fields.get("status", {}).get("name", "")
-            summaries.append(
-                IssueSummary(
-                    key=key,
-                    summary=summary,
-                    status=status,
-                    url=f"{self._client.base_url}/browse/{key}",
-                )
-            )
-
-        return summaries
+        digest = query_hash(jql)
+        position = None
+        page_size = max(1, min(max_results, 100))
+        if cursor:
+            position = SearchCursor.from_token(cursor)
+            if position.query != digest:
+                raise ValueError("Cursor does not belong to this query")
+            page_size = position.page_size
+        start_at = position.start_at if position else 0
+
+        page_key = (digest, start_at, page_size)
+        if not fresh_required():
+            with self._search_pages_lock:
+                cached = self._search_pages.get(page_key)
+            cached = cached or await self._restore_search_page(page_key)
+            if cached is not None:
+                result, fetched_at = cached
+                age = self._clock() - fetched_at
+                if age < SEARCH_PAGE_CACHE_TTL + SEARCH_PAGE_REVALIDATE_TTL:
+                    observe(fetched_at)
+                    if age >= SEARCH_PAGE_CACHE_TTL:
+                        self._refresh_search_page(jql, position, page_key)
+                    return result
+
+        return await self._fetch_search_page(jql, position, page_key)
+
+    async def _restore_search_page(self, page_key: Tuple[str, int, int]) -> Optional[Tuple[SearchResults, float]]:
+        """Load a persisted search page into memory, with the time it was fetched.
+
+        SQLite may wait on another process's write lock, so the read runs on the worker pool.
+        """
+        if self._store is None:
+            return None
+        entry = await self._worker_pool.run(self._store.get, SEARCH_PAGE_NAMESPACE, "%s:%d:%d" % page_key,
+                                            max_age=SEARCH_PAGE_CACHE_TTL + SEARCH_PAGE_REVALIDATE_TTL)
+        if entry is None:
+            return None
+        cached = (SearchResults.model_validate(entry.value), entry.stored_at)
+        with self._search_pages_lock:
+            self._search_pages[page_key] = cached
+        return cached
+
+    async def _fetch_search_page(self, jql: str, position: Optional[SearchCursor],
+                                 page_key: Tuple[str, int, int]) -> SearchResults:
+        """Run the search for one page and cache the result."""
+        digest, start_at, page_size = page_key
+        self._logger.info("JIRA search: %s (startAt=%d)", jql, start_at)
+        # The client switches to POST /search when a long query would not fit in the URL
+        response = await self._call(self._client._search, jql, fields=SEARCH_SUMMARY_FIELDS, start_at=start_at,
+                                    max_results=page_size, resource_name="search results",
+                                    paths=SEARCH_SUMMARY_PATHS)
+
+        page = response.get("issues", [])
+        total = response.get("total", position.total if position else start_at + len(page))
+        issues = page
+        if position and position.last_key:
+            keys = [issue.get("key") for issue in page]
+            if position.last_key in keys:
+                # Matches added since the previous page pushed already-returned issues onto this one
+                issues = page[keys.index(position.last_key) + 1:]
+
+        next_start = start_at + len(page)
+        next_cursor = None
+        if page and next_start < total:
+            next_cursor = SearchCursor(digest, next_start, page_size, total, page[-1].get("key")).to_token()
+
+        result = SearchResults(
+            issues=[self._issue_summary(issue) for issue in issues],
+            total=total,
+            start_at=start_at,
+            next_cursor=next_cursor,
+        )
+        with self._search_pages_lock:
+            self._search_pages[page_key] = (result, self._clock())
+        await self._persist(SEARCH_PAGE_NAMESPACE, "%s:%d:%d" % page_key, result.model_dump())
+        return result
+
+    def _refresh_search_page(self, jql: str, position: Optional[SearchCursor],
+                             page_key: Tuple[str, int, int]) -> None:
+        """Re-run an expired page's search in a background task, once per page at a time."""
+        if page_key in self._refreshing:
+            return
+
+        async def refresh() -> None:
+            try:
+                await self._fetch_search_page(jql, position, page_key)
+            except Exception as e:
+                self._logger.debug("Background refresh of search page %s failed: %s", page_key, e)
+
+        # Started from an empty context: the refresh must not inherit the tool call's deadline
+        task = contextvars.Context().run(asyncio.get_running_loop().create_task, refresh())
+        self._refreshing[page_key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(page_key, None))
 
     # ------------------------------------------------------------------
     # Get single issue
     # ------------------------------------------------------------------
     async def get_issue(self, key: str, expand: Optional[str] = None) -> IssueDetails:
         """Fetch a single JIRA issue by key."""
-        issue = self._client.get_issue(key, expand=expand)
+        issue = await self._call(self._client.get_issue, key, expand=expand)
         fields = issue.get("fields", {})
         details = IssueDetails(
             key=issue.get("key"),
@@ -358,57 +681,60 @@ class JiraTools:
             "a positive integer (e.g., `7877`).  Example: `RFE-7877`."
         )
 
+    async def server_stats(self) -> ServerStats:
+        """Collect the metrics of the client's and the tools' caches, pools and breaker."""
+        client = self._client
+        pool_stats = getattr(client, "pool_stats", None)  # AsyncJiraClient leaves pooling to httpx
+        with self._search_pages_lock:
+            search_pages = len(self._search_pages)
+        return ServerStats(
+            in_flight_requests=client.in_flight_requests,
+            connection_pool=pool_stats() if pool_stats else None,
+            issue_cache=client.issue_cache.stats(),
+            single_flight=client.single_flight.stats(),
+            retry=client.retry_policy.stats(),
+            circuit_breaker=client.circuit_breaker.stats(),
+            fields=client.fields.stats(),
+            worker_pool=self._worker_pool.stats(),
+            search_pages=search_pages,
+            # Counting entries queries the database, so it runs off the event loop
+            store=await self._worker_pool.run(self._store.stats) if self._store is not None else None,
+            delta_sync=self.delta_sync.stats() if self.delta_sync is not None else None,
+        )
+
     # ------------------------------------------------------------------
     # Field discovery for parent relationships
     # ------------------------------------------------------------------
-    def _get_parent_fields_for_issue(self, issue_key: str, project: str, issue_type: str) -> List[str]:
-        """Discover parent fields for a specific project:issue_type combination."""
-        cache_key = f"{project}::{issue_type}"
-        
-        # Check cache first
-        try:
-            cached_fields = self._field_cache[cache_key]
-            self._logger.debug(f"Using cached parent fields for {cache_key}: {cached_fields}")
-            return cached_fields
-        except KeyError:
-            pass  # Cache miss
-        
-        # Query editmeta for this issue to discover parent fields
-        parent_fields = []
+    async def _parent_field_plan(self) -> ParentFieldPlan:
+        """Find the instance's parent fields and resolve the per-project overrides.
+
+        Both come from the client's field registry: parent fields are the custom fields of a
+        :data:`PARENT_FIELD_TYPES` type, and override names are resolved to IDs.  Without
+        field metadata there are no instance-wide fields, and overrides are used as given.
+        """
         try:
-            url = urljoin(self._client.api_base, f"issue/{issue_key}/editmeta")
-            response = self._client._make_api_request(url, resource_name="editmeta")
-            
-            fields = response.get("fields", {})
-            for field_id, field_info in fields.items():
-                schema = field_info.get("schema", {})
-                custom_type = schema.get("custom", "")
-                
-                # Identify parent-type fields by their schema custom type
-                if custom_type in [
-                    "com.pyxis.greenhopper.jira:gh-epic-link",      # Epic Link fields
-                    "com.atlassian.jpo:jpo-custom-field-parent"     # Parent Link fields
-                ]:
-                    parent_fields.append(field_id)
-                    self._logger.debug(f"Found parent field {field_id} ({field_info.get('name', 'Unknown')}) for {cache_key}")
-            
-            # Cache the discovered fields
-            self._field_cache[cache_key] = parent_fields
-            self._logger.debug(f"Cached parent fields for {cache_key}: {parent_fields}")
-            
+            index = await self._call(self._client.field_index)
+            instance_fields = [field["id"] for custom_type in PARENT_FIELD_TYPES
+                               for field in index.by_custom_type(custom_type)]
         except Exception as e:
-            self._logger.warning(f"Failed to discover parent fields for {cache_key}: {e}")
-            # Return fallback field IDs based on our known patterns
-            parent_fields = ["customfield_12311140", "customfield_12313140"]
-            
-        return parent_fields
+            self._logger.warning(f"Failed to discover parent fields from field metadata: {e}")
+            index, instance_fields = None, []
+
+        def resolve(field: str) -> str:
+            known = (index.by_id(field) or index.by_name(field)) if index is not None else None
+            return known["id"] if known else field
+
+        overrides = {project: [resolve(field) for field in fields]
+                     for project, fields in self._parent_field_overrides.items()}
+        return ParentFieldPlan(instance_fields, overrides)
 
     # ------------------------------------------------------------------
     # Issue relationships
     # ------------------------------------------------------------------
     async def get_issue_relationships(self, issue_key: str) -> IssueRelationships:
         """Get all relationships for a specific JIRA issue."""
-        issue_data = self._client.get_issue(issue_key, expand="issuelinks")
+        issue_data = await self._call(self._client.get_issue, issue_key, expand="issuelinks",
+                                      fields=RELATIONSHIP_FIELDS)
         fields = issue_data.get("fields", {})
         
         # Extract parent (for subtasks)
@@ -453,7 +779,7 @@ class JiraTools:
                 ))
         
         # Count remote links
-        remote_links = self._client.get_remote_links(issue_key)
+        remote_links = await self._call(self._client.get_remote_links, issue_key)
         remote_links_count = len(remote_links)
         
         return IssueRelationships(
@@ -466,49 +792,43 @@ class JiraTools:
 
 
     async def get_children(self, issue_key: str, include_parent_links: bool = True,
-                          parent_link_field: str = "Parent Link") -> List[IssueSummary]:
+                          parent_link_field: str = "Parent Link",
+                          progress: Optional[ProgressReporter] = None) -> List[IssueSummary]:
         """Get direct children of an issue (subtasks and optionally parent-link children)."""
         children = []
         
         try:
             # Get the issue to extract subtasks
-            issue_data = self._client.get_issue(issue_key)
+            issue_data = await self._call(self._client.get_issue, issue_key, fields=CHILDREN_FIELDS)
             fields = issue_data.get("fields", {})
             
             # Add subtasks (these are always included as they're standard JIRA relationships)
             subtasks = fields.get("subtasks", [])
             for subtask in subtasks:
-                subtask_key = subtask.get("key")
-                if subtask_key:
-                    subtask_fields = subtask.get("fields", {})
-                    children.append(IssueSummary(
-                        key=subtask_key,
-                        summary=subtask_fields.get("summary", ""),
-                        status=subtask_fields.get("status", {}).get("name", ""),
-                        url=f"{self._client.base_url}/browse/{subtask_key}"
-                    ))
+                if subtask.get("key"):
+                    children.append(self._issue_summary(subtask))
+            subtask_count = len(children)
+            if progress:
+                progress(subtask_count, message=f"Found {subtask_count} subtasks of {issue_key}")
             
-            # Add parent-link children if requested
+            # Add parent-link children if requested. The search is projected to the summary
+            # fields and paginated, so no per-child issue fetch is needed.
             if include_parent_links:
+                def on_page(fetched: int, total: int) -> None:
+                    progress(subtask_count + fetched, subtask_count + total,
+                             f"Fetched {fetched} of {total} parent-link children of {issue_key}")
+
                 try:
-                    parent_link_children = self._client.get_parent_link_children(issue_key, parent_link_field)
+                    parent_link_children = await self._call(
+                        self._client.get_parent_link_child_issues, issue_key, parent_link_field,
+                        on_page=on_page if progress else None
+                    )
                     self._logger.debug(f"Found {len(parent_link_children)} parent-link children for {issue_key}")
-                    
-                    for child_key in parent_link_children:
-                        # Fetch details for each child
-                        try:
-                            child_data = self._client.get_issue(child_key)
-                            child_fields = child_data.get("fields", {})
-                            children.append(IssueSummary(
-                                key=child_key,
-                                summary=child_fields.get("summary", ""),
-                                status=child_fields.get("status", {}).get("name", ""),
-                                url=f"{self._client.base_url}/browse/{child_key}"
-                            ))
-                        except Exception as e:
-                            self._logger.warning(f"Could not fetch details for parent-link child {child_key}: {e}")
-                            continue
-                            
+
+                    for child in parent_link_children:
+                        if child.get("key"):
+                            children.append(self._issue_summary(child))
+
                 except Exception as e:
                     self._logger.warning(f"Could not search for parent-link children using field '{parent_link_field}': {e}")
                     # Continue without parent-link children rather than failing completely
@@ -521,7 +841,8 @@ class JiraTools:
 
     async def get_linked_issues(self, issue_key: str, link_type: Optional[str] = None) -> List[IssueLink]:
         """Get issues linked to the specified issue via JIRA issue links."""
-        issue_data = self._client.get_issue(issue_key, expand="issuelinks")
+        issue_data = await self._call(self._client.get_issue, issue_key, expand="issuelinks",
+                                      fields=LINKED_ISSUE_FIELDS)
         fields = issue_data.get("fields", {})
         
         issue_links = []
@@ -557,68 +878,77 @@ class JiraTools:
         
         return issue_links
 
+    async def _parent_link_field_id(self, parent_link_field: str) -> Optional[str]:
+        """Resolve a parent link field name to its field ID (None if unknown)."""
+        field_metadata = await self._call(self._client.get_field_by_name, parent_link_field)
+        return field_metadata.get("id") if field_metadata else None
+
+    async def _parent_projection(self, plan: Optional[ParentFieldPlan], parent_link_field: str,
+                                 *declarations: Union[str, List[str]]) -> Set[str]:
+        """Plan the fields needed to find an issue's parent.
+
+        With a parent field *plan*, the declared fields are extended with every field the plan may
+        read and the ID of *parent_link_field*, so each issue is read with one projected fetch.
+        """
+        projection = set(field_set(plan_fields(*declarations)))
+        if plan is not None:
+            projection.update(plan.all_fields())
+            link_field_id = await self._parent_link_field_id(parent_link_field)
+            if link_field_id:
+                projection.add(link_field_id)
+        return projection
+
+    async def _find_parent(self, issue_key: str, fields: Dict[str, Any], plan: Optional[ParentFieldPlan],
+                           parent_link_field: str) -> Tuple[Optional[str], Optional[str]]:
+        """Read the parent key and relationship type from an issue's fields without fetching the parent.
+
+        Subtask parents win; with a parent field *plan*, the parent fields of the issue's project
+        are tried in order, then the field named *parent_link_field*.
+        """
+        # Check for subtask parent first
+        parent = fields.get("parent")
+        if parent:
+            return parent.get("key"), "subtask"
+
+        if plan is None:
+            return None, None
+
+        # Try each parent field of the project until we find one with a value
+        project = (fields.get("project") or {}).get("key")
+        for field_id in plan.for_project(project):
+            parent_link = fields.get(field_id)
+            if parent_link:
+                return parent_link, f"parent_field({field_id})"
+
+        # Fallback to field name lookup if no parent field of the project is set
+        self._logger.debug(f"No parent field set for {issue_key}, trying field name lookup")
+        field_id = await self._parent_link_field_id(parent_link_field)
+        if field_id and fields.get(field_id):
+            return fields.get(field_id), f"parent_link({parent_link_field})"
+
+        return None, None
+
     async def get_parent(self, issue_key: str, include_parent_links: bool = True,
                         parent_link_field: str = "Parent Link") -> ParentInfo:
-        """Get the immediate parent of an issue using dynamic field discovery."""
-        issue_data = self._client.get_issue(issue_key, expand="parent")
+        """Get the immediate parent of an issue using the instance's parent fields."""
+        plan = await self._parent_field_plan() if include_parent_links else None
+        projection = await self._parent_projection(plan, parent_link_field, PARENT_FIELDS)
+        issue_data = await self._call(self._client.get_issue, issue_key, fields=plan_fields(projection))
         fields = issue_data.get("fields", {})
-        
-        parent_key = None
+
+        parent_key, parent_type = await self._find_parent(issue_key, fields, plan, parent_link_field)
+
         parent_summary = None
-        parent_type = None
-        
-        # Check for subtask parent first
-        parent = fields.get("parent")
-        if parent:
-            parent_key = parent.get("key")
-            parent_summary = parent.get("fields", {}).get("summary", "")
-            parent_type = "subtask"
-        
-        # Check for custom parent link fields if no subtask parent found and enabled
-        elif include_parent_links:
-            # Extract project and issue type for field discovery
-            project = fields.get("project", {}).get("key", "")
-            issue_type = fields.get("issuetype", {}).get("name", "")
-            
-            if project and issue_type:
-                # Get potential parent fields for this issue type
-                parent_field_ids = self._get_parent_fields_for_issue(issue_key, project, issue_type)
-                
-                # Try each discovered parent field until we find one with a value
-                for field_id in parent_field_ids:
-                    parent_link = fields.get(field_id)
-                    if parent_link:
-                        parent_key = parent_link
-                        parent_type = f"parent_field({field_id})"
-                        
-                        # Fetch parent summary
-                        try:
-                            parent_data = self._client.get_issue(parent_key)
-                            parent_summary = parent_data.get("fields", {}).get("summary", "")
-                        except Exception as e:
-                            self._logger.warning(f"Could not fetch parent {parent_key} details: {e}")
-                        
-                        break  # Found a parent, stop looking
-                
-            # Fallback to old field name lookup if dynamic discovery failed or was skipped
-            if not parent_key:
-                self._logger.debug(f"Dynamic field discovery found no parent for {issue_key}, trying field name lookup")
-                field_metadata = self._client.get_field_by_name(parent_link_field)
-                if field_metadata:
-                    field_id = field_metadata.get("id")
-                    if field_id:
-                        parent_link = fields.get(field_id)
-                        if parent_link:
-                            parent_key = parent_link
-                            parent_type = f"parent_link({parent_link_field})"
-                            
-                            # Fetch parent summary
-                            try:
-                                parent_data = self._client.get_issue(parent_key)
-                                parent_summary = parent_data.get("fields", {}).get("summary", "")
-                            except Exception as e:
-                                self._logger.warning(f"Could not fetch parent {parent_key} details: {e}")
-        
+        if parent_type == "subtask":
+            parent_summary = fields.get("parent", {}).get("fields", {}).get("summary", "")
+        elif parent_key:
+            # Fetch parent summary
+            try:
+                parent_data = await self._call(self._client.get_issue, parent_key, fields=PARENT_SUMMARY_FIELDS)
+                parent_summary = parent_data.get("fields", {}).get("summary", "")
+            except Exception as e:
+                self._logger.warning(f"Could not fetch parent {parent_key} details: {e}")
+
         return ParentInfo(
             issue_key=issue_key,
             parent_key=parent_key,
@@ -628,62 +958,134 @@ class JiraTools:
 
     async def get_ancestors(self, issue_key: str, max_depth: int = 5,
                            include_parent_links: bool = True,
-                           parent_link_field: str = "Parent Link") -> AncestorTree:
-        """Get all ancestors of an issue by following parent relationships recursively."""
+                           parent_link_field: str = "Parent Link",
+                           progress: Optional[ProgressReporter] = None) -> AncestorTree:
+        """Get all ancestors of an issue by following parent relationships recursively.
+
+        Each issue in the chain is fetched once with a projection of the summary and parent
+        fields; the parent payload is reused as the next level's input.  When the call
+        deadline passes mid-walk the ancestors found so far are returned with
+        ``complete=False``.
+        """
         ancestors = []
         traversal_order = []
         visited = set()
+
+        # Project to summary fields plus every field that may hold the parent key
+        plan = await self._parent_field_plan() if include_parent_links else None
+        projection = await self._parent_projection(plan, parent_link_field, ANCESTOR_FIELDS)
+
+        async def fetch(key: str) -> Dict[str, Any]:
+            return await self._call(self._client.get_issue, key, fields=plan_fields(projection))
+
         current_key = issue_key
+        current_data = await fetch(issue_key)
         current_depth = 0
-        
-        while current_key and current_key not in visited and (max_depth == -1 or current_depth < max_depth):
-            visited.add(current_key)
-            
-            # Get parent of current issue
-            parent_info = await self.get_parent(current_key, include_parent_links, parent_link_field)
-            
-            if parent_info.parent_key:
+        complete = True
+
+        try:
+            while current_key not in visited and (max_depth == -1 or current_depth < max_depth):
+                visited.add(current_key)
+                fields = current_data.get("fields", {})
+
+                parent_key, parent_type = await self._find_parent(current_key, fields, plan, parent_link_field)
+                if not parent_key:
+                    # No parent found, stop traversal
+                    break
+
                 # Check if parent is already visited (cycle detection)
-                if parent_info.parent_key in visited:
-                    self._logger.debug(f"Cycle detected: {parent_info.parent_key} already visited")
+                if parent_key in visited:
+                    self._logger.debug(f"Cycle detected: {parent_key} already visited")
                     break
-                
-                # Fetch full parent details
+
                 try:
-                    parent_data = self._client.get_issue(parent_info.parent_key)
-                    parent_fields = parent_data.get("fields", {})
-                    
-                    ancestor_summary = IssueSummary(
-                        key=parent_info.parent_key,
-                        summary=parent_fields.get("summary", ""),
-                        status=parent_fields.get("status", {}).get("name", ""),
-                        url=f"{self._client.base_url}/browse/{parent_info.parent_key}"
-                    )
-                    
-                    ancestors.append(ancestor_summary)
-                    traversal_order.append({
-                        "issue_key": parent_info.parent_key,
-                        "depth": current_depth,
-                        "parent_type": parent_info.parent_type
-                    })
-                    
-                    # Move to parent for next iteration
-                    current_key = parent_info.parent_key
-                    current_depth += 1
-                    
+                    parent_data = await fetch(parent_key)
+                except DeadlineExceeded:
+                    raise
                 except Exception as e:
-                    self._logger.warning(f"Could not fetch ancestor {parent_info.parent_key}: {e}")
+                    self._logger.warning(f"Could not fetch ancestor {parent_key}: {e}")
                     break
-            else:
-                # No parent found, stop traversal
-                break
-        
+
+                ancestors.append(self._issue_summary(dict(parent_data, key=parent_key)))
+                traversal_order.append({
+                    "issue_key": parent_key,
+                    "depth": current_depth,
+                    "parent_type": parent_type
+                })
+                if progress:
+                    progress(current_depth + 1, max_depth if max_depth != -1 else None,
+                             f"Found ancestor {parent_key} at depth {current_depth}")
+
+                # Move to parent for next iteration, reusing its payload
+                current_key = parent_key
+                current_data = parent_data
+                current_depth += 1
+        except DeadlineExceeded as e:
+            # Return the chain resolved so far rather than failing the whole call
+            self._logger.warning(f"Stopped ancestor walk of {issue_key} at {current_key}: {e}")
+            complete = False
+
         return AncestorTree(
             root_issue=issue_key,
             max_depth=max_depth,
             total_ancestors=len(ancestors),
             ancestors=ancestors,
-            traversal_order=traversal_order
+            traversal_order=traversal_order,
+            complete=complete,
+        )
+
+    async def get_descendants(self, issue_key: str, max_depth: int = 3,
+                              include_subtasks: bool = True, include_links: bool = True,
+                              include_parent_links: bool = False,
+                              parent_link_field: str = "Parent Link",
+                              max_nodes: int = DEFAULT_DESCENDANTS_MAX_NODES,
+                              max_seconds: float = DEFAULT_DESCENDANTS_MAX_SECONDS,
+                              continuation_token: Optional[str] = None,
+                              child_link_types: Optional[List[str]] = None,
+                              progress: Optional[ProgressReporter] = None) -> DescendantTree:
+        """Traverse down the issue hierarchy within node and time budgets.
+
+        Only relationships leading to children are followed: subtasks, parent-link children and
+        the outward side of *child_link_types* links (default :data:`DEFAULT_CHILD_LINK_TYPES`).
+        When a budget runs out the partial result carries a continuation token; passing it
+        back resumes from the saved frontier with the options of the original call.
+        """
+        if max_nodes < 1:
+            raise ValueError("max_nodes must be at least 1")
+
+        if continuation_token:
+            traversal = DescendantTraversal.from_token(continuation_token)
+            if traversal.extraction_metadata["start_issue"] != issue_key:
+                raise ValueError(f"Continuation token does not belong to a traversal of {issue_key}")
+        else:
+            traversal = DescendantTraversal(
+                issue_key, max_depth, include_subtasks, include_links,
+                include_parent_links=include_parent_links,
+                parent_link_field=parent_link_field,
+                fields=DESCENDANT_FIELDS,
+                direction=DIRECTION_DOWN,
+                child_link_types=DEFAULT_CHILD_LINK_TYPES if child_link_types is None else child_link_types,
+            )
+
+        complete = await self._call(self._client.run_traversal, traversal, max_nodes, max_seconds,
+                                    progress=progress.traversal if progress else None)
+
+        descendants = [
+            self._issue_summary(issue) for key, issue in traversal.issues.items() if key != issue_key
+        ]
+        traversal_order = [
+            entry for entry in traversal.extraction_metadata["traversal_order"] if entry["issue_key"] != issue_key
+        ]
+
+        return DescendantTree(
+            root_issue=issue_key,
+            max_depth=traversal.depth,
+            total_descendants=len(descendants),
+            descendants=descendants,
+            traversal_order=traversal_order,
+            missing_keys=traversal.missing_keys,
+            complete=complete,
+            continuation_token=None if complete else traversal.to_token(),
         )
 
 
@@ -691,6 +1093,18 @@ class JiraTools:
 # Server factory                                                               #
 ###############################################################################
 
+def _stamp_as_of(result: Any, as_of: str) -> Any:
+    """Return *result* with ``as_of`` set on it, or on each item of a list result.
+
+    Models are copied, so responses cached by :class:`JiraTools` are never modified.
+    """
+    if isinstance(result, list):
+        return [_stamp_as_of(item, as_of) for item in result]
+    if isinstance(result, BaseModel) and "as_of" in type(result).model_fields:
+        return result.model_copy(update={"as_of": as_of})
+    return result
+
+
 def create_server(
     *,
     url: str,
@@ -699,21 +1113,85 @@ def create_server(
     token: Optional[str] = None,
     bearer_token: Optional[str] = None,
     field_cache_ttl: int = DEFAULT_FIELD_CACHE_TTL,
+    async_client: bool = DEFAULT_ASYNC_CLIENT,
+    worker_pool_size: int = DEFAULT_WORKER_POOL_SIZE,
+    issue_cache_max_bytes: int = DEFAULT_ISSUE_CACHE_MAX_BYTES,
+    issue_cache_ttl: int = DEFAULT_ISSUE_CACHE_TTL,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    retry_max_delay: float = DEFAULT_RETRY_MAX_DELAY,
+    tool_timeout: float = DEFAULT_TOOL_TIMEOUT,
+    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+    read_timeout: float = DEFAULT_READ_TIMEOUT,
+    issue_cache_stale_ttl: int = DEFAULT_ISSUE_CACHE_STALE_TTL,
+    breaker_failure_threshold: int = DEFAULT_BREAKER_FAILURE_THRESHOLD,
+    breaker_reset_timeout: float = DEFAULT_BREAKER_RESET_TIMEOUT,
+    breaker_latency_slo: float = DEFAULT_BREAKER_LATENCY_SLO,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    pool_block: bool = DEFAULT_POOL_BLOCK,
+    pool_keepalive: bool = DEFAULT_POOL_KEEPALIVE,
+    pool_prewarm: int = DEFAULT_POOL_PREWARM,
+    cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+    sync_interval: float = DEFAULT_SYNC_INTERVAL,
+    sync_projects: Optional[List[str]] = DEFAULT_SYNC_PROJECTS,
+    issue_cache_revalidate_ttl: int = DEFAULT_ISSUE_CACHE_REVALIDATE_TTL,
+    parent_field_overrides: Optional[Dict[str, List[str]]] = DEFAULT_PARENT_FIELD_OVERRIDES,
 ) -> FastMCP:
     """Create and configure a FastMCP server instance."""
 
     logging.basicConfig(level=logging.INFO)
 
-    client = JiraClient(
+    client_class = AsyncJiraClient if async_client else JiraClient
+    client = client_class(
         base_url=url,
         username=username,
         password=password,
         token=token,
         bearer_token=bearer_token,
     )
+    store = None
+    if cache_path:
+        try:
+            store = PersistentStore(cache_path)
+        except (sqlite3.Error, OSError) as e:
+            logging.warning(f"Persistent cache {cache_path} unavailable, continuing without it: {e}")
+    client.store = store
+    client.fields.ttl = field_cache_ttl
+    client.issue_cache = IssueCache(issue_cache_max_bytes, issue_cache_ttl, stale_ttl=issue_cache_stale_ttl,
+                                    store=store, revalidate_ttl=issue_cache_revalidate_ttl)
+    client.retry_policy = RetryPolicy(max_retries=max_retries, max_delay=retry_max_delay)
+    client.circuit_breaker = CircuitBreaker(breaker_failure_threshold, breaker_reset_timeout, breaker_latency_slo)
+    client.connect_timeout = connect_timeout
+    client.read_timeout = read_timeout
+    if not async_client:
+        client.configure_pool(pool_maxsize, pool_block, pool_keepalive)
+        if pool_prewarm:
+            try:
+                client.prewarm(pool_prewarm)
+            except Exception as e:
+                logging.warning(f"Connection prewarm failed, continuing without it: {e}")
+
+    @contextlib.asynccontextmanager
+    async def lifespan(_app: FastMCP) -> AsyncIterator[Dict[str, Any]]:
+        """Keep the background delta sync, when configured, running while the server is up.
+
+        On shutdown, pending search page refreshes are cancelled and an async client is closed
+        with its connection pool and background issue refreshes.
+        """
+        try:
+            if tools.delta_sync is None:
+                yield {}
+            else:
+                async with tools.delta_sync.running():
+                    yield {}
+        finally:
+            for task in list(tools._refreshing.values()):
+                task.cancel()
+            if async_client:
+                await client.aclose()
 
     mcp = FastMCP(
         name="JIRA Read-Only MCP Server",
+        lifespan=lifespan,
         instructions=(
             "You are a JIRA expert assistant with comprehensive read-only access to JIRA data. "
             "WORKFLOW GUIDANCE: "
@@ -727,11 +1205,50 @@ def create_server(
             "   - get_parent() for immediate parent only "
             "   - get_linked_issues() for horizontal relationships (blocks, depends) "
             "4. Use identifier_hint() when users provide invalid issue keys "
+            "FRESHNESS: Results may come from a short-lived cache; as_of tells when the data was read "
+            "from JIRA. Pass consistency='fresh' when the user needs changes made moments ago. "
             "CHOOSE TOOLS WISELY: Use specific relationship tools based on user needs rather than always using the broadest option."
         ),
     )
 
-    tools = JiraTools(client, field_cache_ttl)
+    tools = JiraTools(client, parent_field_overrides, worker_pool=WorkerPool(worker_pool_size), store=store)
+    if sync_interval > 0:
+        tools.delta_sync = DeltaSync(client, tools._call, sync_interval, sync_projects, store=store,
+                                     on_change=tools.forget_search_pages)
+
+    def with_deadline(tool: Callable[..., Any]) -> Callable[..., Any]:
+        """Bound a tool invocation, and every JIRA request it makes, by ``tool_timeout``."""
+        @functools.wraps(tool)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with deadline_scope(tool_timeout):
+                return await tool(*args, **kwargs)
+        return wrapper
+
+    def with_freshness(tool: Callable[..., Any]) -> Callable[..., Any]:
+        """Give a tool a ``consistency`` argument and stamp its response with ``as_of``.
+
+        ``consistency="fresh"`` bypasses the issue and search page caches for the call.
+        """
+        signature = inspect.signature(tool)
+        consistency_param = inspect.Parameter("consistency", inspect.Parameter.KEYWORD_ONLY,
+                                              default=CONSISTENCY_DEFAULT, annotation=str)
+
+        @functools.wraps(tool)
+        async def wrapper(*args: Any, consistency: str = CONSISTENCY_DEFAULT, **kwargs: Any) -> Any:
+            with read_scope(consistency) as scope:
+                result = await tool(*args, **kwargs)
+            return _stamp_as_of(result, scope.as_of_iso())
+        # FastMCP builds the tool's input schema from this signature
+        wrapper.__signature__ = signature.replace(parameters=[*signature.parameters.values(), consistency_param])
+        return wrapper
+
+    async def with_progress(ctx: Optional[Context], method: Callable[..., Any], *args: Any) -> Any:
+        """Run a long-running tool method, streaming progress notifications to *ctx*."""
+        progress = ProgressReporter(ctx)
+        try:
+            return await method(*args, progress=progress)
+        finally:
+            await progress.flush()
 
     # ------------------------------------------------------------------
     # Register tools                                                    #
@@ -744,6 +1261,8 @@ def create_server(
             "to find issues by project, status, assignee, text content, or any JIRA field. "
             "Automatically detects JQL (if contains =, AND, OR) vs simple text search. "
             "Returns basic issue info - use get_issue() for full details of specific issues. "
+            "Results are paged with the total match count; when next_cursor is returned, call again "
+            "with the same query and that cursor to get the next page. "
             "Example: 'project = PROJ AND status = Open' or 'authentication bug'"
         ),
         annotations=ToolAnnotations(
@@ -753,8 +1272,11 @@ def create_server(
             openWorldHint=False,
         ),
     )
-    async def search_issues_tool(query: str, max_results: int = 25) -> List[IssueSummary]:
-        return await tools.search_issues(query, max_results)
+    @with_deadline
+    @with_freshness
+    async def search_issues_tool(query: str, max_results: int = 25,
+                                 cursor: Optional[str] = None) -> SearchResults:
+        return await tools.search_issues(query, max_results, cursor)
 
     @mcp.tool(
         name="get_issue",
@@ -771,6 +1293,8 @@ def create_server(
             openWorldHint=False,
         ),
     )
+    @with_deadline
+    @with_freshness
     async def get_issue_tool(key: str, expand: Optional[str] = None) -> IssueDetails:
         return await tools.get_issue(key, expand)
 
@@ -791,6 +1315,24 @@ def create_server(
     async def identifier_hint_tool() -> str:
         return await tools.identifier_hint()
 
+    @mcp.tool(
+        name="get_server_stats",
+        description=(
+            "Report the server's own health: issue cache hit ratio and size, connection pool and worker "
+            "pool usage, coalesced requests, retries and rate limiting, circuit breaker state, and the "
+            "persistent cache and delta sync when configured. Use this to diagnose slow or failing calls; "
+            "it does not contact JIRA."
+        ),
+        annotations=ToolAnnotations(
+            readOnlyHint=True,
+            destructiveHint=False,
+            idempotentHint=True,
+            openWorldHint=False,
+        ),
+    )
+    async def get_server_stats_tool() -> ServerStats:
+        return await tools.server_stats()
+
     @mcp.tool(
         name="get_issue_relationships",
         description=(
@@ -806,6 +1348,8 @@ def create_server(
             openWorldHint=False,
         ),
     )
+    @with_deadline
+    @with_freshness
     async def get_issue_relationships_tool(issue_key: str) -> IssueRelationships:
         return await tools.get_issue_relationships(issue_key)
 
@@ -825,12 +1369,15 @@ def create_server(
             openWorldHint=False,
         ),
     )
+    @with_deadline
+    @with_freshness
     async def get_children_tool(
         issue_key: str,
         include_parent_links: bool = True,
-        parent_link_field: str = "Parent Link"
+        parent_link_field: str = "Parent Link",
+        ctx: Context = None
     ) -> List[IssueSummary]:
-        return await tools.get_children(issue_key, include_parent_links, parent_link_field)
+        return await with_progress(ctx, tools.get_children, issue_key, include_parent_links, parent_link_field)
 
     @mcp.tool(
         name="get_linked_issues",
@@ -847,6 +1394,8 @@ def create_server(
             openWorldHint=False,
         ),
     )
+    @with_deadline
+    @with_freshness
     async def get_linked_issues_tool(issue_key: str, link_type: Optional[str] = None) -> List[IssueLink]:
         return await tools.get_linked_issues(issue_key, link_type)
 
@@ -865,6 +1414,8 @@ def create_server(
             openWorldHint=False,
         ),
     )
+    @with_deadline
+    @with_freshness
     async def get_parent_tool(
         issue_key: str,
         include_parent_links: bool = True,
@@ -888,13 +1439,57 @@ def create_server(
             openWorldHint=False,
         ),
     )
+    @with_deadline
+    @with_freshness
     async def get_ancestors_tool(
         issue_key: str,
         max_depth: int = 5,
         include_parent_links: bool = True,
-        parent_link_field: str = "Parent Link"
+        parent_link_field: str = "Parent Link",
+        ctx: Context = None
     ) -> AncestorTree:
-        return await tools.get_ancestors(issue_key, max_depth, include_parent_links, parent_link_field)
+        return await with_progress(
+            ctx, tools.get_ancestors, issue_key, max_depth, include_parent_links, parent_link_field
+        )
+
+    @mcp.tool(
+        name="get_descendants",
+        description=(
+            "Traverse DOWN the issue hierarchy to find children, grandchildren, etc. through "
+            "subtasks, the outward side of child_link_types links (default 'Blocks': issues this one blocks) "
+            "and optionally custom parent-link children; parents, inward links and other link types are "
+            "never followed. Use for impact analysis: "
+            "'What work depends on this Initiative/Epic?' Default depth=3 levels; max_depth=-1 for unlimited. "
+            "Each call is bounded by max_nodes and max_seconds. If the result has complete=false, call "
+            "again with the same issue_key and the returned continuation_token to fetch the next chunk."
+        ),
+        annotations=ToolAnnotations(
+            readOnlyHint=True,
+            destructiveHint=False,
+            idempotentHint=True,
+            openWorldHint=False,
+        ),
+    )
+    @with_deadline
+    @with_freshness
+    async def get_descendants_tool(
+        issue_key: str,
+        max_depth: int = 3,
+        include_subtasks: bool = True,
+        include_links: bool = True,
+        include_parent_links: bool = False,
+        parent_link_field: str = "Parent Link",
+        max_nodes: int = DEFAULT_DESCENDANTS_MAX_NODES,
+        max_seconds: float = DEFAULT_DESCENDANTS_MAX_SECONDS,
+        continuation_token: Optional[str] = None,
+        child_link_types: Optional[List[str]] = None,
+        ctx: Context = None
+    ) -> DescendantTree:
+        return await with_progress(
+            ctx, tools.get_descendants, issue_key, max_depth, include_subtasks, include_links,
+            include_parent_links, parent_link_field, max_nodes, max_seconds, continuation_token,
+            child_link_types
+        )
 
     return mcp
 
@@ -934,6 +1529,28 @@ async def _async_main() -> None:
     token = args.token or cfg.get("token")
     bearer_token = args.bearer_token or cfg.get("bearer_token")
     field_cache_ttl = cfg.get("field_cache_ttl", DEFAULT_FIELD_CACHE_TTL)  # Default: 1 hour
+    async_client = cfg.get("async_client", DEFAULT_ASYNC_CLIENT)
+    worker_pool_size = cfg.get("worker_pool_size", DEFAULT_WORKER_POOL_SIZE)
+    issue_cache_max_bytes = cfg.get("issue_cache_max_bytes", DEFAULT_ISSUE_CACHE_MAX_BYTES)
+    issue_cache_ttl = cfg.get("issue_cache_ttl", DEFAULT_ISSUE_CACHE_TTL)
+    max_retries = cfg.get("max_retries", DEFAULT_MAX_RETRIES)
+    retry_max_delay = cfg.get("retry_max_delay", DEFAULT_RETRY_MAX_DELAY)
+    tool_timeout = cfg.get("tool_timeout", DEFAULT_TOOL_TIMEOUT)
+    connect_timeout = cfg.get("connect_timeout", DEFAULT_CONNECT_TIMEOUT)
+    read_timeout = cfg.get("read_timeout", DEFAULT_READ_TIMEOUT)
+    issue_cache_stale_ttl = cfg.get("issue_cache_stale_ttl", DEFAULT_ISSUE_CACHE_STALE_TTL)
+    breaker_failure_threshold = cfg.get("breaker_failure_threshold", DEFAULT_BREAKER_FAILURE_THRESHOLD)
+    breaker_reset_timeout = cfg.get("breaker_reset_timeout", DEFAULT_BREAKER_RESET_TIMEOUT)
+    breaker_latency_slo = cfg.get("breaker_latency_slo", DEFAULT_BREAKER_LATENCY_SLO)
+    pool_maxsize = cfg.get("pool_maxsize", DEFAULT_POOL_MAXSIZE)
+    pool_block = cfg.get("pool_block", DEFAULT_POOL_BLOCK)
+    pool_keepalive = cfg.get("pool_keepalive", DEFAULT_POOL_KEEPALIVE)
+    pool_prewarm = cfg.get("pool_prewarm", DEFAULT_POOL_PREWARM)
+    cache_path = cfg.get("cache_path", DEFAULT_CACHE_PATH)
+    sync_interval = cfg.get("sync_interval", DEFAULT_SYNC_INTERVAL)
+    sync_projects = cfg.get("sync_projects", DEFAULT_SYNC_PROJECTS)
+    issue_cache_revalidate_ttl = cfg.get("issue_cache_revalidate_ttl", DEFAULT_ISSUE_CACHE_REVALIDATE_TTL)
+    parent_field_overrides = cfg.get("parent_field_overrides", DEFAULT_PARENT_FIELD_OVERRIDES)
 
     if not url:
         raise ConfigError(
@@ -947,6 +1564,28 @@ async def _async_main() -> None:
         token=token,
         bearer_token=bearer_token,
         field_cache_ttl=field_cache_ttl,
+        async_client=async_client,
+        worker_pool_size=worker_pool_size,
+        issue_cache_max_bytes=issue_cache_max_bytes,
+        issue_cache_ttl=issue_cache_ttl,
+        max_retries=max_retries,
+        retry_max_delay=retry_max_delay,
+        tool_timeout=tool_timeout,
+        connect_timeout=connect_timeout,
+        read_timeout=read_timeout,
+        issue_cache_stale_ttl=issue_cache_stale_ttl,
+        breaker_failure_threshold=breaker_failure_threshold,
+        breaker_reset_timeout=breaker_reset_timeout,
+        breaker_latency_slo=breaker_latency_slo,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        pool_keepalive=pool_keepalive,
+        pool_prewarm=pool_prewarm,
+        cache_path=cache_path,
+        sync_interval=sync_interval,
+        sync_projects=sync_projects,
+        issue_cache_revalidate_ttl=issue_cache_revalidate_ttl,
+        parent_field_overrides=parent_field_overrides,
     )
 
     await server.run_async()  # Use the async version
@@ -987,6 +1626,28 @@ def main() -> None:  # pragma: no cover
         token = args.token or cfg.get("token")
         bearer_token = args.bearer_token or cfg.get("bearer_token")
         field_cache_ttl = cfg.get("field_cache_ttl", DEFAULT_FIELD_CACHE_TTL)  # Default: 1 hour
+        async_client = cfg.get("async_client", DEFAULT_ASYNC_CLIENT)
+        worker_pool_size = cfg.get("worker_pool_size", DEFAULT_WORKER_POOL_SIZE)
+        issue_cache_max_bytes = cfg.get("issue_cache_max_bytes", DEFAULT_ISSUE_CACHE_MAX_BYTES)
+        issue_cache_ttl = cfg.get("issue_cache_ttl", DEFAULT_ISSUE_CACHE_TTL)
+        max_retries = cfg.get("max_retries", DEFAULT_MAX_RETRIES)
+        retry_max_delay = cfg.get("retry_max_delay", DEFAULT_RETRY_MAX_DELAY)
+        tool_timeout = cfg.get("tool_timeout", DEFAULT_TOOL_TIMEOUT)
+        connect_timeout = cfg.get("connect_timeout", DEFAULT_CONNECT_TIMEOUT)
+        read_timeout = cfg.get("read_timeout", DEFAULT_READ_TIMEOUT)
+        issue_cache_stale_ttl = cfg.get("issue_cache_stale_ttl", DEFAULT_ISSUE_CACHE_STALE_TTL)
+        breaker_failure_threshold = cfg.get("breaker_failure_threshold", DEFAULT_BREAKER_FAILURE_THRESHOLD)
+        breaker_reset_timeout = cfg.get("breaker_reset_timeout", DEFAULT_BREAKER_RESET_TIMEOUT)
+        breaker_latency_slo = cfg.get("breaker_latency_slo", DEFAULT_BREAKER_LATENCY_SLO)
+        pool_maxsize = cfg.get("pool_maxsize", DEFAULT_POOL_MAXSIZE)
+        pool_block = cfg.get("pool_block", DEFAULT_POOL_BLOCK)
+        pool_keepalive = cfg.get("pool_keepalive", DEFAULT_POOL_KEEPALIVE)
+        pool_prewarm = cfg.get("pool_prewarm", DEFAULT_POOL_PREWARM)
+        cache_path = cfg.get("cache_path", DEFAULT_CACHE_PATH)
+        sync_interval = cfg.get("sync_interval", DEFAULT_SYNC_INTERVAL)
+        sync_projects = cfg.get("sync_projects", DEFAULT_SYNC_PROJECTS)
+        issue_cache_revalidate_ttl = cfg.get("issue_cache_revalidate_ttl", DEFAULT_ISSUE_CACHE_REVALIDATE_TTL)
+        parent_field_overrides = cfg.get("parent_field_overrides", DEFAULT_PARENT_FIELD_OVERRIDES)
 
         if not url:
             raise ConfigError(
@@ -1000,6 +1661,28 @@ def main() -> None:  # pragma: no cover
             token=token,
             bearer_token=bearer_token,
             field_cache_ttl=field_cache_ttl,
+            async_client=async_client,
+            worker_pool_size=worker_pool_size,
+            issue_cache_max_bytes=issue_cache_max_bytes,
+            issue_cache_ttl=issue_cache_ttl,
+            max_retries=max_retries,
+            retry_max_delay=retry_max_delay,
+            tool_timeout=tool_timeout,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            issue_cache_stale_ttl=issue_cache_stale_ttl,
+            breaker_failure_threshold=breaker_failure_threshold,
+            breaker_reset_timeout=breaker_reset_timeout,
+            breaker_latency_slo=breaker_latency_slo,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            pool_keepalive=pool_keepalive,
+            pool_prewarm=pool_prewarm,
+            cache_path=cache_path,
+            sync_interval=sync_interval,
+            sync_projects=sync_projects,
+            issue_cache_revalidate_ttl=issue_cache_revalidate_ttl,
+            parent_field_overrides=parent_field_overrides,
         )
 
         # Run synchronously
@@ -0,0 +1,174 @@
+"""Incremental cache freshness by polling JIRA for recently updated issues.
+
+Instead of letting every cached issue expire on its own TTL, :class:`DeltaSync`
+periodically runs one paginated ``updated >= -<N>m`` search (optionally scoped to
+configured projects) and invalidates only the cached issues whose ``updated``
+value changed.  Cache TTLs can therefore be long while answers stay fresh, and
+one search per interval replaces hundreds of per-issue refetches.
+
+The window is expressed in minutes relative to JIRA's own clock, which avoids
+time-zone and clock-skew surprises with absolute JQL dates; every window also
+overlaps the previous one by ``overlap`` seconds.  The time of the last sync is
+kept in the persistent store, when one is configured, so a restarted server
+only asks for what changed while it was down.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import math
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from jira_extractor.client import _quote_jql_value
+from jira_extractor.store import PersistentStore
+
+# Seconds between delta polls (0 disables background sync)
+DEFAULT_SYNC_INTERVAL = 0
+
+# Project keys the delta query is scoped to (None polls every project)
+DEFAULT_SYNC_PROJECTS = None
+
+# Seconds each window overlaps the previous one, covering clock skew and slow indexing
+DEFAULT_SYNC_OVERLAP = 60
+
+# Persistent store namespace holding the time of the last completed sync
+SYNC_NAMESPACE = "sync"
+
+# The delta query only needs each changed issue's key and new `updated` value
+SYNC_PATHS = ("issues[].key", "issues[].fields.updated")
+
+
+def delta_jql(minutes: int, projects: Optional[Iterable[str]] = None) -> str:
+    """JQL matching issues updated in the last *minutes* minutes, oldest change first."""
+    clauses = []
+    projects = sorted(set(projects or ()))
+    if projects:
+        clauses.append(f"project in ({', '.join(_quote_jql_value(p) for p in projects)})")
+    clauses.append(f'updated >= "-{minutes}m"')
+    return " AND ".join(clauses) + " ORDER BY updated ASC"
+
+
+class DeltaSync:
+    """Poll JIRA for changed issues and invalidate their cached copies."""
+
+    def __init__(self, client: Any, call: Callable[..., Awaitable[Any]], interval: float,
+                 projects: Optional[Iterable[str]] = DEFAULT_SYNC_PROJECTS,
+                 store: Optional[PersistentStore] = None, overlap: float = DEFAULT_SYNC_OVERLAP,
+                 on_change: Optional[Callable[[List[str]], None]] = None,
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            client: :class:`JiraClient` or :class:`AsyncJiraClient` whose ``issue_cache`` is kept fresh
+            call: Awaitable runner for client methods (``JiraTools._call``)
+            interval: Seconds between polls
+            projects: Project keys to scope the query to; every project when empty
+            store: Persistent store remembering the last sync across restarts
+            overlap: Seconds each window reaches back past the previous sync
+            on_change: Called with the keys of every changed issue after each poll that found any,
+                cached in the issue cache or not; runs on a worker thread
+            clock: Wall-clock time source (injectable for tests)
+        """
+        self._client = client
+        self._call = call
+        self.interval = interval
+        self.projects = sorted(set(projects or ()))
+        self._store = store
+        self.overlap = overlap
+        self._on_change = on_change
+        self._clock = clock
+        self._logger = logging.getLogger(__name__)
+        self._state_key = "last_sync:" + ",".join(self.projects)
+        self.last_sync: Optional[float] = None
+        if store is not None:
+            stored = store.get(SYNC_NAMESPACE, self._state_key)
+            if stored is not None:
+                self.last_sync = stored.value
+
+        # Metrics
+        self._polls = 0
+        self._failures = 0
+        self._changed = 0
+        self._invalidated = 0
+
+    @property
+    def lookback(self) -> float:
+        """Oldest change that can matter: anything older has left the issue cache anyway."""
+        return self._client.issue_cache.retention
+
+    def window_minutes(self, now: float) -> int:
+        """Minutes the next delta query has to look back."""
+        since = now - self.lookback
+        if self.last_sync is not None:
+            since = max(since, self.last_sync)
+        return max(1, math.ceil((now - since + self.overlap) / 60))
+
+    async def poll(self) -> List[str]:
+        """Run one delta query and invalidate changed issues; returns the invalidated keys."""
+        started = self._clock()
+        jql = delta_jql(self.window_minutes(started), self.projects)
+        issues = await self._call(self._client._search_all, jql, fields="updated", paths=SYNC_PATHS,
+                                  resource_name="recently updated issues")
+
+        # The cache and store work and the callback touch SQLite per changed issue, so the
+        # whole batch runs in one worker-pool call instead of on the event loop
+        return await self._call(self._apply, issues, started)
+
+    def _apply(self, issues: List[Dict[str, Any]], started: float) -> List[str]:
+        """Invalidate changed issues, advance the watermark and notify ``on_change``; blocking."""
+        cache = self._client.issue_cache
+        invalidated = []
+        for issue in issues:
+            key = issue.get("key")
+            if key and cache.invalidate_if_changed(key, (issue.get("fields") or {}).get("updated")):
+                invalidated.append(key)
+
+        # Only advance once the whole window has been processed
+        self.last_sync = started
+        if self._store is not None:
+            self._store.put(SYNC_NAMESPACE, self._state_key, started)
+        self._polls += 1
+        self._changed += len(issues)
+        self._invalidated += len(invalidated)
+        self._logger.debug("Delta sync: %d changed, %d cached copies invalidated", len(issues), len(invalidated))
+        changed = [issue.get("key") for issue in issues if issue.get("key")]
+        if changed and self._on_change:
+            self._on_change(changed)
+        return invalidated
+
+    async def run(self) -> None:
+        """Poll every ``interval`` seconds until cancelled; failed polls are retried next interval."""
+        while True:
+            try:
+                await self.poll()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._failures += 1
+                self._logger.warning(f"Delta sync failed, retrying in {self.interval}s: {e}")
+            await asyncio.sleep(self.interval)
+
+    @contextlib.asynccontextmanager
+    async def running(self) -> AsyncIterator["DeltaSync"]:
+        """Run :meth:`run` in the background for the duration of the context."""
+        task = asyncio.create_task(self.run())
+        try:
+            yield self
+        finally:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of sync metrics."""
+        return {
+            "interval": self.interval,
+            "projects": self.projects,
+            "last_sync": self.last_sync,
+            "polls": self._polls,
+            "failures": self._failures,
+            "changed": self._changed,
+            "invalidated": self._invalidated,
+        }
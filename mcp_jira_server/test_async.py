@@ -4,15 +4,18 @@
 This test module provides comprehensive coverage for asynchronous
 operations in the MCP JIRA server.
 
-Test IDs: ASYNC-01 through ASYNC-04
+Test IDs: ASYNC-01 through ASYNC-10
 """
 
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, AsyncMock, patch
 import asyncio
 
+import httpx
+
 # Import modules under test
-from mcp_jira_server.server import JiraTools, _async_main
+from mcp_jira_server.server import JiraTools, _async_main, create_server
+from jira_extractor.async_client import AsyncJiraClient
 
 
 class TestAsync(unittest.TestCase):
@@ -22,7 +25,7 @@ class TestAsync(unittest.TestCase):
         """ASYNC-01: Async search_issues method."""
         mock_client = Mock()
         mock_client.api_base = "https://test.jira.com/rest/api/2"
-        mock_client._make_api_request.return_value = {"issues": []}
+        mock_client._search.return_value = {"issues": []}
         
         tools = JiraTools(mock_client)
         
@@ -122,6 +125,103 @@ class TestAsync(unittest.TestCase):
         mock_create.assert_called_once()
         self.assertIsNone(result)  # _async_main returns None after successful run
 
+    def test_async_06_tools_await_async_client_directly(self):
+        """ASYNC-06: JiraTools awaits AsyncJiraClient methods directly."""
+        mock_client = Mock(spec=AsyncJiraClient)
+        mock_client.base_url = "https://test.jira.com"
+        mock_client.get_issue = AsyncMock(return_value={
+            "key": "ASYNC-6",
+            "fields": {"summary": "Awaited", "status": {"name": "Open"}}
+        })
+
+        tools = JiraTools(mock_client)
+        result = asyncio.run(tools.get_issue("ASYNC-6"))
+
+        mock_client.get_issue.assert_awaited_once_with("ASYNC-6", expand=None)
+        self.assertEqual(result.summary, "Awaited")
+
+    def test_async_07_async_client_requests_overlap(self):
+        """ASYNC-07: Concurrent AsyncJiraClient requests overlap on the network."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            key = request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(200, json={"key": key, "fields": {}})
+
+        async def run():
+            client = AsyncJiraClient("https://test.jira.com")
+            client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            results = await asyncio.gather(*(client.get_issue(f"OVL-{i}") for i in range(5)))
+            await client.aclose()
+            return results
+
+        results = asyncio.run(run())
+
+        self.assertEqual([r["key"] for r in results], [f"OVL-{i}" for i in range(5)])
+        self.assertEqual(peak, 5)
+
+    def test_async_08_async_client_error_handling(self):
+        """ASYNC-08: AsyncJiraClient maps HTTP errors like JiraClient."""
+        async def handler(request):
+            if request.url.path.endswith("remotelink"):
+                return httpx.Response(404)
+            return httpx.Response(401)
+
+        async def run():
+            client = AsyncJiraClient("https://test.jira.com", bearer_token="abc")
+            client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            links = await client.get_remote_links("ERR-1")
+            with self.assertRaises(Exception) as cm:
+                await client.get_issue("ERR-1")
+            await client.aclose()
+            return links, cm.exception
+
+        links, error = asyncio.run(run())
+
+        self.assertEqual(links, [])
+        self.assertIn("Authentication failed", str(error))
+
+    @patch("mcp_jira_server.server.AsyncJiraClient")
+    @patch("mcp_jira_server.server.JiraClient")
+    @patch("mcp_jira_server.server.FastMCP")
+    def test_async_09_create_server_selects_async_client(self, mock_fastmcp, mock_client, mock_async_client):
+        """ASYNC-09: create_server uses AsyncJiraClient when async_client is enabled."""
+        create_server(url="https://test.jira.com", async_client=True)
+
+        mock_client.assert_not_called()
+        mock_async_client.assert_called_once_with(
+            base_url="https://test.jira.com",
+            username=None,
+            password=None,
+            token=None,
+            bearer_token=None
+        )
+
+    @patch("mcp_jira_server.server.FastMCP")
+    def test_async_10_lifespan_closes_async_client(self, mock_fastmcp):
+        """ASYNC-10: Leaving the server lifespan closes the async client; the sync client is left alone."""
+        with patch("mcp_jira_server.server.AsyncJiraClient") as mock_async_client:
+            mock_async_client.return_value.aclose = AsyncMock()
+            create_server(url="https://test.jira.com", async_client=True)
+        with patch("mcp_jira_server.server.JiraClient") as mock_client:
+            create_server(url="https://test.jira.com")
+        async_lifespan, sync_lifespan = (call[1]["lifespan"] for call in mock_fastmcp.call_args_list)
+
+        async def serve(lifespan):
+            async with lifespan(None):
+                pass
+        asyncio.run(serve(async_lifespan))
+        asyncio.run(serve(sync_lifespan))
+
+        mock_async_client.return_value.aclose.assert_awaited_once()
+        mock_client.return_value.aclose.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2) 
\ No newline at end of file
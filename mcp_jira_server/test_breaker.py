@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""Unit tests for the JIRA circuit breaker
+
+This test module provides coverage for the circuit breaker state machine,
+fast-fail and half-open probing in JiraClient and AsyncJiraClient, and
+serving stale cached issues while the breaker is open.
+
+Test IDs: BREAKER-01 through BREAKER-12
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+import asyncio
+import time
+
+import httpx
+import requests
+
+# Import modules under test
+from jira_extractor.breaker import CircuitBreaker, CircuitOpenError, CLOSED, OPEN, HALF_OPEN
+from jira_extractor.cache import IssueCache
+from jira_extractor.deadline import DeadlineExceeded, deadline_scope
+from jira_extractor.client import JiraClient
+from jira_extractor.async_client import AsyncJiraClient
+from mcp_jira_server.server import create_server
+from mcp_jira_server.testutils import FakeClock, json_response
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test the breaker state machine."""
+
+    def test_breaker_01_opens_after_consecutive_failures(self):
+        """BREAKER-01: The breaker opens after threshold consecutive failures only."""
+        breaker = CircuitBreaker(failure_threshold=3)
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_response(200, 0.1)  # A success resets the streak
+        breaker.record_failure()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CLOSED)
+
+        breaker.record_response(503, 0.1)
+        self.assertEqual(breaker.state, OPEN)
+        self.assertFalse(breaker.allow())
+        self.assertEqual(breaker.stats()["trips"], 1)
+
+    def test_breaker_02_latency_slo_breaches_count_as_failures(self):
+        """BREAKER-02: Responses slower than the latency SLO count toward opening."""
+        breaker = CircuitBreaker(failure_threshold=2, latency_slo=1.0)
+        breaker.record_response(200, 1.5)
+        breaker.record_response(404, 2.0)
+
+        self.assertEqual(breaker.state, OPEN)
+        self.assertEqual(breaker.stats()["slow_responses"], 2)
+
+    def test_breaker_03_single_probe_after_reset_timeout(self):
+        """BREAKER-03: Exactly one caller may probe, and only after the reset timeout."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 29.0
+        self.assertFalse(breaker.acquire_probe())
+        clock.now = 30.0
+        self.assertTrue(breaker.acquire_probe())
+        self.assertEqual(breaker.state, HALF_OPEN)
+        self.assertFalse(breaker.acquire_probe())
+
+        stats = breaker.stats()
+        self.assertEqual((stats["probes"], stats["rejected"]), (1, 2))
+
+    def test_breaker_04_probe_outcome_closes_or_reopens(self):
+        """BREAKER-04: A successful probe closes the breaker; anything else reopens it."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 10.0
+        breaker.acquire_probe()
+        with breaker.probing():
+            self.assertTrue(breaker.allow())
+        self.assertEqual(breaker.state, OPEN)  # Probe recorded nothing
+        self.assertFalse(breaker.acquire_probe())  # Reset timeout restarted
+
+        clock.now = 20.0
+        breaker.acquire_probe()
+        with breaker.probing():
+            breaker.record_response(200, 0.1)
+        self.assertEqual(breaker.state, CLOSED)
+        self.assertTrue(breaker.allow())
+
+
+class TestClientCircuitBreaker(unittest.TestCase):
+    """Test fast-fail, probing and stale serving in JiraClient."""
+
+    def setUp(self):
+        """Set up a client with a mocked HTTP session and a controllable breaker."""
+        self.clock = FakeClock()
+        self.client = JiraClient("https://test.jira.com")
+        self.client.session = Mock()
+        self.client.retry_policy.max_retries = 0
+        self.client.circuit_breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=self.clock)
+
+    def test_breaker_05_fails_fast_after_connection_errors(self):
+        """BREAKER-05: Connection errors open the breaker and later calls never reach JIRA."""
+        self.client.session.get.side_effect = requests.ConnectionError("connection refused")
+        for _ in range(2):
+            with self.assertRaises(requests.ConnectionError):
+                self.client.get_remote_links("EPIC-1")
+
+        with self.assertRaisesRegex(CircuitOpenError, "failing fast"):
+            self.client.get_remote_links("EPIC-1")
+        self.assertEqual(self.client.session.get.call_count, 2)
+
+    def test_breaker_06_half_open_probe_uses_test_connection(self):
+        """BREAKER-06: After the reset timeout /myself is probed before the real request."""
+        self.client.session.get.return_value = json_response({}, 503)
+        for _ in range(2):
+            with self.assertRaises(Exception):
+                self.client.get_remote_links("EPIC-1")
+
+        self.clock.now = 30.0
+        self.client.session.get.reset_mock()
+        self.client.session.get.side_effect = [json_response({"name": "probe"}), json_response([])]
+
+        self.assertEqual(self.client.get_remote_links("EPIC-1"), [])
+        urls = [call.args[0] for call in self.client.session.get.call_args_list]
+        self.assertTrue(urls[0].endswith("/myself"))
+        self.assertTrue(urls[1].endswith("/issue/EPIC-1/remotelink"))
+        self.assertEqual(self.client.circuit_breaker.state, CLOSED)
+
+    def test_breaker_07_failed_probe_reopens(self):
+        """BREAKER-07: A failing probe reopens the breaker and the caller fails fast."""
+        self.client.session.get.return_value = json_response({}, 503)
+        for _ in range(2):
+            with self.assertRaises(Exception):
+                self.client.get_remote_links("EPIC-1")
+
+        self.clock.now = 30.0
+        with self.assertRaises(CircuitOpenError):
+            self.client.get_remote_links("EPIC-1")
+
+        self.assertEqual(self.client.session.get.call_count, 3)  # Two failures and one probe
+        self.assertEqual(self.client.circuit_breaker.state, OPEN)
+
+    def test_breaker_08_open_breaker_serves_stale_cached_issues(self):
+        """BREAKER-08: get_issue serves an expired cached copy while the breaker is open."""
+        self.client.issue_cache = IssueCache(max_bytes=10_000, ttl=60, clock=self.clock, stale_ttl=3600)
+        self.client.session.get.return_value = json_response({"key": "EPIC-1", "fields": {}})
+        self.client.get_issue("EPIC-1")
+
+        self.clock.now = 120.0  # Cached copy has expired
+        self.client.circuit_breaker.record_failure()
+        self.client.circuit_breaker.record_failure()
+
+        self.assertEqual(self.client.get_issue("EPIC-1")["key"], "EPIC-1")
+        self.assertEqual(self.client.issue_cache.stats()["stale_hits"], 1)
+        with self.assertRaises(CircuitOpenError):
+            self.client.get_issue("EPIC-2")
+        self.assertEqual(self.client.session.get.call_count, 1)
+
+
+class TestAsyncClientCircuitBreaker(unittest.TestCase):
+    """Test the breaker in AsyncJiraClient."""
+
+    def test_breaker_09_async_client_fails_fast_and_probes(self):
+        """BREAKER-09: AsyncJiraClient opens on transport errors and probes /myself."""
+        clock = FakeClock()
+        paths = []
+        healthy = {"up": False}
+
+        async def handler(request):
+            paths.append(request.url.path)
+            if not healthy["up"]:
+                raise httpx.ConnectError("connection refused")
+            return httpx.Response(200, json=[] if "remotelink" in request.url.path else {"name": "probe"})
+
+        async def run():
+            client = AsyncJiraClient("https://test.jira.com")
+            client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            client.circuit_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5, clock=clock)
+
+            with self.assertRaises(httpx.ConnectError):
+                await client.get_remote_links("EPIC-1")
+            with self.assertRaises(CircuitOpenError):
+                await client.get_remote_links("EPIC-1")
+
+            clock.now = 5.0
+            healthy["up"] = True
+            result = await client.get_remote_links("EPIC-1")
+            await client.aclose()
+            return result, client.circuit_breaker.state
+
+        result, state = asyncio.run(run())
+
+        self.assertEqual(result, [])
+        self.assertEqual(state, CLOSED)
+        self.assertEqual(paths, ["/rest/api/2/issue/EPIC-1/remotelink", "/rest/api/2/myself",
+                                 "/rest/api/2/issue/EPIC-1/remotelink"])
+
+    @patch("mcp_jira_server.server.FastMCP")
+    def test_breaker_10_create_server_configures_breaker(self, mock_fastmcp):
+        """BREAKER-10: create_server configures the breaker and stale cache window from settings."""
+        with patch("mcp_jira_server.server.JiraClient") as mock_client:
+            create_server(url="https://test.jira.com", breaker_failure_threshold=7, breaker_reset_timeout=12.0,
+                          breaker_latency_slo=3.0, issue_cache_stale_ttl=600)
+
+        breaker = mock_client.return_value.circuit_breaker
+        self.assertEqual((breaker.failure_threshold, breaker.reset_timeout, breaker.latency_slo), (7, 12.0, 3.0))
+        self.assertEqual(mock_client.return_value.issue_cache.stale_ttl, 600)
+
+    def test_breaker_11_deadline_clipped_timeouts_leave_breaker_closed(self):
+        """BREAKER-11: Timeouts caused by the caller's deadline raise DeadlineExceeded without opening the breaker."""
+        def slow_get(url, params=None, timeout=None):
+            time.sleep(0.03)
+            raise requests.ReadTimeout("read timed out")
+
+        client = JiraClient("https://test.jira.com")
+        client.session = Mock()
+        client.session.get.side_effect = slow_get
+        client.retry_policy.max_retries = 0
+        client.circuit_breaker = CircuitBreaker(failure_threshold=2)
+
+        async def async_handler(request):
+            await asyncio.sleep(0.03)
+            raise httpx.ReadTimeout("read timed out", request=request)
+
+        async def run_async():
+            async_client = AsyncJiraClient("https://test.jira.com")
+            async_client.session = httpx.AsyncClient(transport=httpx.MockTransport(async_handler))
+            async_client.retry_policy.max_retries = 0
+            async_client.circuit_breaker = CircuitBreaker(failure_threshold=2)
+            for _ in range(3):
+                with deadline_scope(0.02):
+                    with self.assertRaises(DeadlineExceeded):
+                        await async_client.get_remote_links("EPIC-1")
+            await async_client.aclose()
+            return async_client.circuit_breaker
+
+        for _ in range(3):
+            with deadline_scope(0.02):
+                with self.assertRaises(DeadlineExceeded):
+                    client.get_remote_links("EPIC-1")
+
+        for breaker in (client.circuit_breaker, asyncio.run(run_async())):
+            self.assertEqual(breaker.state, CLOSED)
+            self.assertEqual(breaker.stats()["consecutive_failures"], 0)
+
+    def test_breaker_12_stray_successes_do_not_close_the_breaker(self):
+        """BREAKER-12: Successes of requests in flight when the breaker opened leave it open until the probe."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+
+        breaker.record_success()
+        self.assertEqual(breaker.state, OPEN)
+        self.assertFalse(breaker.allow())
+        self.assertFalse(breaker.acquire_probe())  # Still cooling down
+
+        clock.now = 10.0
+        self.assertTrue(breaker.acquire_probe())
+        breaker.record_success()  # Not the probe
+        self.assertEqual(breaker.state, HALF_OPEN)
+        self.assertFalse(breaker.allow())
+        with breaker.probing():
+            breaker.record_success()
+        self.assertEqual(breaker.state, CLOSED)
+        self.assertTrue(breaker.allow())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Unit tests for the in-process issue cache
+
+This test module provides coverage for the byte-bounded LRU+TTL issue cache
+and its use by JiraClient.get_issue.
+
+Test IDs: CACHE-01 through CACHE-09
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+
+# Import modules under test
+from jira_extractor.cache import IssueCache, _approximate_size
+from jira_extractor.client import JiraClient
+from mcp_jira_server.server import create_server
+from mcp_jira_server.testutils import FakeClock, json_response
+
+
+def _issue(key, padding=0):
+    return {"key": key, "fields": {"summary": "x" * padding}}
+
+
+class TestIssueCache(unittest.TestCase):
+    """Test issue cache behaviour and metrics."""
+
+    def test_cache_01_hit_after_put(self):
+        """CACHE-01: Stored entries are served until they expire."""
+        cache = IssueCache(max_bytes=10_000, ttl=60)
+        key = IssueCache.make_key("EPIC-1", "summary", None)
+
+        self.assertIsNone(cache.get(key))
+        cache.put(key, _issue("EPIC-1"))
+
+        self.assertEqual(cache.get(key)["key"], "EPIC-1")
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (1, 1, 1))
+        self.assertEqual(stats["hit_ratio"], 0.5)
+
+    def test_cache_02_entries_expire_after_ttl(self):
+        """CACHE-02: Entries expire after the configured TTL."""
+        clock = FakeClock()
+        cache = IssueCache(max_bytes=10_000, ttl=30, clock=clock)
+        cache.put("k", _issue("EPIC-1"))
+
+        clock.now = 29.9
+        self.assertIsNotNone(cache.get("k"))
+        clock.now = 30.0
+        self.assertIsNone(cache.get("k"))
+
+        stats = cache.stats()
+        self.assertEqual(stats["expirations"], 1)
+        self.assertEqual(stats["entries"], 0)
+        self.assertEqual(stats["bytes"], 0)
+
+    def test_cache_03_evicts_least_recently_used_by_bytes(self):
+        """CACHE-03: The byte budget evicts least recently used entries first."""
+        entry_size = _approximate_size(_issue("A-1", padding=100))
+        cache = IssueCache(max_bytes=entry_size * 3, ttl=60)
+        for key in ("A-1", "A-2", "A-3"):
+            cache.put(key, _issue(key, padding=100))
+
+        cache.get("A-1")  # A-2 is now least recently used
+        cache.put("A-4", _issue("A-4", padding=100))
+
+        self.assertIsNone(cache.get("A-2"))
+        self.assertIsNotNone(cache.get("A-1"))
+        self.assertIsNotNone(cache.get("A-4"))
+        stats = cache.stats()
+        self.assertEqual(stats["evictions"], 1)
+        self.assertLessEqual(stats["bytes"], stats["max_bytes"])
+
+    def test_cache_04_skips_entries_larger_than_budget(self):
+        """CACHE-04: A payload larger than the whole budget is not cached."""
+        cache = IssueCache(max_bytes=200, ttl=60)
+        cache.put("small", _issue("S-1"))
+        cache.put("huge", _issue("H-1", padding=1000))
+
+        self.assertIsNone(cache.get("huge"))
+        self.assertIsNotNone(cache.get("small"))
+        self.assertEqual(cache.stats()["evictions"], 0)
+
+    def test_cache_05_invalidate_drops_every_projection(self):
+        """CACHE-05: invalidate removes every cached projection of an issue."""
+        cache = IssueCache(max_bytes=10_000, ttl=60)
+        cache.put(IssueCache.make_key("EPIC-1", "summary"), _issue("EPIC-1"))
+        cache.put(IssueCache.make_key("EPIC-1", None, "changelog"), _issue("EPIC-1"))
+        cache.put(IssueCache.make_key("EPIC-2"), _issue("EPIC-2"))
+
+        self.assertEqual(cache.invalidate("EPIC-1"), 2)
+        self.assertEqual(cache.stats()["entries"], 1)
+
+    def test_cache_09_expired_entries_kept_for_stale_reads(self):
+        """CACHE-09: Expired entries miss on get but are served by get_stale within stale_ttl."""
+        clock = FakeClock()
+        cache = IssueCache(max_bytes=10_000, ttl=30, clock=clock, stale_ttl=60)
+        cache.put("k", _issue("EPIC-1"))
+
+        clock.now = 45.0
+        self.assertIsNone(cache.get("k"))
+        self.assertEqual(cache.get_stale("k")["key"], "EPIC-1")
+
+        clock.now = 90.0
+        self.assertIsNone(cache.get_stale("k"))
+        self.assertIsNone(cache.get("k"))
+        stats = cache.stats()
+        self.assertEqual((stats["stale_hits"], stats["expirations"], stats["entries"]), (1, 1, 0))
+
+
+class TestClientIssueCache(unittest.TestCase):
+    """Test JiraClient.get_issue caching."""
+
+    def setUp(self):
+        """Set up a client with a mocked HTTP session."""
+        self.client = JiraClient("https://test.jira.com")
+        self.client.session = Mock()
+        self.client.session.get.return_value = json_response(_issue("EPIC-1"))
+
+    def test_cache_06_get_issue_keyed_by_fields_and_expand(self):
+        """CACHE-06: get_issue reuses cached payloads per (key, fields, expand)."""
+        self.client.get_issue("EPIC-1", fields="summary")
+        self.client.get_issue("EPIC-1", fields=["summary"])
+        self.assertEqual(self.client.session.get.call_count, 1)
+
+        self.client.get_issue("EPIC-1", fields="summary,status")
+        self.client.get_issue("EPIC-1", expand="changelog", fields="summary")
+        self.assertEqual(self.client.session.get.call_count, 3)
+        self.assertEqual(self.client.issue_cache.stats()["hits"], 1)
+
+    def test_cache_07_disabled_cache_always_fetches(self):
+        """CACHE-07: A zero byte budget disables caching."""
+        self.client.issue_cache = IssueCache(max_bytes=0)
+
+        self.client.get_issue("EPIC-1")
+        self.client.get_issue("EPIC-1")
+
+        self.assertEqual(self.client.session.get.call_count, 2)
+        self.assertEqual(self.client.issue_cache.stats()["entries"], 0)
+
+    @patch("mcp_jira_server.server.FastMCP")
+    def test_cache_08_create_server_configures_issue_cache(self, mock_fastmcp):
+        """CACHE-08: create_server sizes the client issue cache from settings."""
+        with patch("mcp_jira_server.server.JiraClient") as mock_client:
+            create_server(url="https://test.jira.com", issue_cache_max_bytes=1024, issue_cache_ttl=5)
+
+        cache = mock_client.return_value.issue_cache
+        self.assertEqual(cache.max_bytes, 1024)
+        self.assertEqual(cache.ttl, 5)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -65,7 +65,29 @@ class TestCLI(unittest.TestCase):
             password="clipass",
             token="clitoken",
             bearer_token="clibearer",
-            field_cache_ttl=3600
+            field_cache_ttl=3600,
+            async_client=False,
+            worker_pool_size=8,
+            issue_cache_max_bytes=33554432,
+            issue_cache_ttl=300,
+            max_retries=3,
+            retry_max_delay=30.0,
+            tool_timeout=60.0,
+            connect_timeout=5.0,
+            read_timeout=30.0,
+            issue_cache_stale_ttl=3600,
+            breaker_failure_threshold=5,
+            breaker_reset_timeout=30.0,
+            breaker_latency_slo=10.0,
+            pool_maxsize=20,
+            pool_block=False,
+            pool_keepalive=True,
+            pool_prewarm=0,
+            cache_path=None,
+            sync_interval=0,
+            sync_projects=None,
+            issue_cache_revalidate_ttl=300,
+            parent_field_overrides=None
         )
 
     @patch("mcp_jira_server.server.load_config")
@@ -138,7 +160,29 @@ class TestCLI(unittest.TestCase):
             password=None,
             token="configtoken",             # Config value used
             bearer_token=None,
-            field_cache_ttl=3600
+            field_cache_ttl=3600,
+            async_client=False,
+            worker_pool_size=8,
+            issue_cache_max_bytes=33554432,
+            issue_cache_ttl=300,
+            max_retries=3,
+            retry_max_delay=30.0,
+            tool_timeout=60.0,
+            connect_timeout=5.0,
+            read_timeout=30.0,
+            issue_cache_stale_ttl=3600,
+            breaker_failure_threshold=5,
+            breaker_reset_timeout=30.0,
+            breaker_latency_slo=10.0,
+            pool_maxsize=20,
+            pool_block=False,
+            pool_keepalive=True,
+            pool_prewarm=0,
+            cache_path=None,
+            sync_interval=0,
+            sync_projects=None,
+            issue_cache_revalidate_ttl=300,
+            parent_field_overrides=None
         )
 
     @patch("mcp_jira_server.server.load_config")
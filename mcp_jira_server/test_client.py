@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""Unit tests for the JIRA REST clients
+
+This test module provides coverage for JiraClient and AsyncJiraClient
+request behaviour, using mocked HTTP sessions instead of a JIRA instance.
+
+Test IDs: CLIENT-01 through CLIENT-17
+"""
+
+import unittest
+from unittest.mock import Mock
+from urllib.parse import quote_plus
+import asyncio
+import json
+import re
+import threading
+import time
+
+import httpx
+
+# Import modules under test
+from jira_extractor.client import JiraClient, _batched_in_clauses
+from jira_extractor.async_client import AsyncJiraClient
+from jira_extractor.traversal import DescendantTraversal, DIRECTION_DOWN
+from mcp_jira_server.server import JiraTools
+from mcp_jira_server.testutils import json_response
+
+
+def _keys_from_jql(jql):
+    """Extract the quoted keys from a `key in (...)` clause."""
+    return re.findall(r'"([^"]+)"', jql)
+
+
+def _request_jql(request):
+    """Read the JQL of an httpx search request sent with GET or POST."""
+    if request.method == "POST":
+        return json.loads(request.content)["jql"]
+    return request.url.params["jql"]
+
+
+class TestClient(unittest.TestCase):
+    """Test JIRA client request behaviour."""
+
+    def setUp(self):
+        """Set up a client with a mocked HTTP session."""
+        self.client = JiraClient("https://test.jira.com")
+        self.client.session = Mock()
+
+    def _serve_search(self, known_keys):
+        """Answer batched GET and POST searches with the subset of keys JIRA knows about."""
+        def search(jql):
+            requested = _keys_from_jql(jql)
+            issues = [{"key": key, "fields": {"summary": f"Summary {key}"}}
+                      for key in requested if key in known_keys]
+            return json_response({"issues": issues, "total": len(issues)})
+        self.client.session.get.side_effect = lambda url, params=None, **kwargs: search(params["jql"])
+        self.client.session.post.side_effect = lambda url, json=None, **kwargs: search(json["jql"])
+
+    def test_client_01_get_issues_batches_keys(self):
+        """CLIENT-01: get_issues fetches 2,500 keys in three batched POST searches."""
+        keys = [f"EPIC-{i}" for i in range(2500)]
+        self._serve_search(set(keys))
+
+        result = self.client.get_issues(keys, fields="summary,status")
+
+        self.assertEqual(self.client.session.post.call_count, 3)
+        self.client.session.get.assert_not_called()
+        self.assertEqual(len([k for k in result if not k.startswith("_")]), 2500)
+        self.assertEqual(result["EPIC-7"]["fields"]["summary"], "Summary EPIC-7")
+        self.assertEqual(result["_fetch_metadata"]["requests"], 3)
+        for call in self.client.session.post.call_args_list:
+            body = call[1]["json"]
+            self.assertEqual(body["fields"], ["summary", "status"])
+            self.assertIs(body["validateQuery"], False)
+
+    def test_client_02_get_issues_reports_missing_keys(self):
+        """CLIENT-02: get_issues reports keys JIRA did not return."""
+        self._serve_search({"OK-1", "OK-2"})
+
+        result = self.client.get_issues(["OK-1", "GONE-1", "OK-2", "OK-1"])
+
+        self.assertEqual(list(k for k in result if not k.startswith("_")), ["OK-1", "OK-2"])
+        self.assertEqual(result["_fetch_metadata"]["missing_keys"], ["GONE-1"])
+        self.assertEqual(result["_fetch_metadata"]["requested"], 3)
+        self.assertEqual(result["_fetch_metadata"]["found"], 2)
+
+    def test_client_03_batched_clauses_respect_url_budget(self):
+        """CLIENT-03: Batched JQL clauses stay under the encoded length budget."""
+        keys = [f"VERYLONGPROJECTKEY-{i}" for i in range(100)]
+
+        batches = _batched_in_clauses("key", keys, max_values=100, max_jql_length=500)
+
+        self.assertGreater(len(batches), 1)
+        self.assertEqual([key for batch, _ in batches for key in batch], keys)
+        for _, jql in batches:
+            self.assertLessEqual(len(quote_plus(jql)), 500)
+
+    def test_client_04_get_issues_with_no_keys(self):
+        """CLIENT-04: get_issues with no keys makes no requests."""
+        result = self.client.get_issues([])
+
+        self.client.session.get.assert_not_called()
+        self.assertEqual(result["_fetch_metadata"]["missing_keys"], [])
+
+    def test_client_05_async_get_issues_batches_concurrently(self):
+        """CLIENT-05: AsyncJiraClient.get_issues runs batches concurrently."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            requested = _keys_from_jql(_request_jql(request))
+            return httpx.Response(200, json={"issues": [{"key": key, "fields": {}} for key in requested]})
+
+        async def run():
+            client = AsyncJiraClient("https://test.jira.com")
+            client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            result = await client.get_issues([f"ASYNC-{i}" for i in range(3000)])
+            await client.aclose()
+            return result
+
+        result = asyncio.run(run())
+
+        self.assertEqual(result["_fetch_metadata"]["found"], 3000)
+        self.assertEqual(result["_fetch_metadata"]["requests"], 3)
+        self.assertEqual(peak, 3)
+
+    def test_client_06_parent_link_child_issues_paginates(self):
+        """CLIENT-06: Parent-link child search pages past JIRA's page cap with projected fields."""
+        children = [{"key": f"CHILD-{i}", "fields": {"summary": f"Child {i}"}} for i in range(2500)]
+
+        def get(url, params=None, **kwargs):
+            start, size = params["startAt"], min(params["maxResults"], 1000)
+            return json_response({"issues": children[start:start + size], "total": len(children)})
+        self.client.session.get.side_effect = get
+
+        result = self.client.get_parent_link_child_issues("EPIC-1")
+
+        self.assertEqual(len(result), 2500)
+        self.assertEqual(self.client.session.get.call_count, 3)
+        params = self.client.session.get.call_args_list[0][1]["params"]
+        self.assertEqual(params["jql"], '"Parent Link" = "EPIC-1"')
+        self.assertEqual(params["fields"], "key,summary,status,issuetype")
+
+    def test_client_07_parent_link_children_returns_keys(self):
+        """CLIENT-07: get_parent_link_children returns only keys and swallows search errors."""
+        self.client.session.get.return_value = json_response({"issues": [{"key": "C-1"}, {"key": "C-2"}], "total": 2})
+
+        self.assertEqual(self.client.get_parent_link_children("P-1"), ["C-1", "C-2"])
+        self.assertEqual(self.client.session.get.call_args[1]["params"]["fields"], "key")
+
+        self.client.session.get.side_effect = ConnectionError("down")
+        self.assertEqual(self.client.get_parent_link_children("P-1"), [])
+
+    def _serve_hierarchy(self, children_of):
+        """Answer key and parent-link searches from a parent -> children map."""
+        parents = {child: parent for parent, kids in children_of.items() for child in kids}
+        known = set(children_of) | set(parents)
+
+        def get(url, params=None, **kwargs):
+            if url.endswith("/field"):
+                return json_response([{"id": "customfield_100", "name": "Parent Link"}])
+            requested = _keys_from_jql(params["jql"])
+            if params["jql"].startswith('"Parent Link"'):
+                issues = [{"key": child} for key in requested for child in children_of.get(key, [])]
+            else:
+                issues = [{"key": key, "fields": {"customfield_100": parents.get(key)}}
+                          for key in requested if key in known]
+            return json_response({"issues": issues, "total": len(issues)})
+        self.client.session.get.side_effect = get
+
+    def test_client_08_descendants_fetch_one_level_at_a_time(self):
+        """CLIENT-08: get_descendants issues a constant number of searches per BFS level."""
+        children_of = {"ROOT-1": [f"EPIC-{i}" for i in range(5)]}
+        for i in range(5):
+            children_of[f"EPIC-{i}"] = [f"STORY-{i}-{j}" for j in range(10)]
+        self._serve_hierarchy(children_of)
+
+        result = self.client.get_descendants("ROOT-1", depth=-1, include_parent_links=True)
+
+        issues = [k for k in result if not k.startswith("_")]
+        self.assertEqual(len(issues), 56)
+        # 1 field lookup + 3 levels x (key search + parent-link search)
+        self.assertEqual(self.client.session.get.call_count, 7)
+        order = result["_extraction_metadata"]["traversal_order"]
+        self.assertEqual([entry["depth"] for entry in order], [0] + [1] * 5 + [2] * 50)
+
+    def test_client_09_descendants_respect_depth_limit(self):
+        """CLIENT-09: get_descendants stops expanding at the requested depth."""
+        self._serve_hierarchy({"ROOT-1": ["EPIC-1"], "EPIC-1": ["STORY-1"]})
+
+        result = self.client.get_descendants("ROOT-1", depth=1, include_parent_links=True)
+
+        self.assertEqual(sorted(k for k in result if not k.startswith("_")), ["EPIC-1", "ROOT-1"])
+        self.assertEqual(result["_extraction_metadata"]["max_depth"], 1)
+
+    def test_client_10_descendants_report_missing_keys(self):
+        """CLIENT-10: Linked issues JIRA does not return are reported, not fatal."""
+        def get(url, params=None, **kwargs):
+            requested = _keys_from_jql(params["jql"])
+            issues = []
+            if "ROOT-1" in requested:
+                issues.append({"key": "ROOT-1", "fields": {
+                    "subtasks": [{"key": "SUB-1"}, {"key": "GONE-1"}],
+                    "issuelinks": [{"outwardIssue": {"key": "ROOT-1"}}]
+                }})
+            if "SUB-1" in requested:
+                issues.append({"key": "SUB-1", "fields": {"parent": {"key": "ROOT-1"}}})
+            return json_response({"issues": issues, "total": len(issues)})
+        self.client.session.get.side_effect = get
+
+        result = self.client.get_descendants("ROOT-1", depth=-1, include_subtasks=True, include_links=True)
+
+        self.assertEqual(sorted(k for k in result if not k.startswith("_")), ["ROOT-1", "SUB-1"])
+        self.assertEqual(result["_extraction_metadata"]["missing_keys"], ["GONE-1"])
+        self.assertEqual(self.client.session.get.call_count, 2)
+
+    def test_client_11_async_descendants_match_sync(self):
+        """CLIENT-11: AsyncJiraClient.get_descendants walks the hierarchy level by level."""
+        children_of = {"ROOT-1": ["EPIC-1", "EPIC-2"], "EPIC-1": ["STORY-1"], "EPIC-2": ["STORY-2"]}
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request.url.path)
+            if request.url.path.endswith("/field"):
+                return httpx.Response(200, json=[{"id": "customfield_100", "name": "Parent Link"}])
+            jql = request.url.params["jql"]
+            requested = _keys_from_jql(jql)
+            if jql.startswith('"Parent Link"'):
+                issues = [{"key": child} for key in requested for child in children_of.get(key, [])]
+            else:
+                issues = [{"key": key, "fields": {}} for key in requested]
+            return httpx.Response(200, json={"issues": issues, "total": len(issues)})
+
+        async def run():
+            client = AsyncJiraClient("https://test.jira.com")
+            client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            result = await client.get_descendants("ROOT-1", depth=-1, include_parent_links=True)
+            await client.aclose()
+            return result
+
+        result = asyncio.run(run())
+
+        self.assertEqual(sorted(k for k in result if not k.startswith("_")),
+                         ["EPIC-1", "EPIC-2", "ROOT-1", "STORY-1", "STORY-2"])
+        self.assertEqual(len(requests_seen), 7)
+
+    def test_client_16_descendant_directions(self):
+        """CLIENT-16: Library walks follow every relationship; a "down" traversal only reaches children."""
+        def get(url, params=None, **kwargs):
+            issues = []
+            if "ROOT-1" in _keys_from_jql(params["jql"]):
+                issues.append({"key": "ROOT-1", "fields": {
+                    "parent": {"key": "EPIC-1"},
+                    "subtasks": [{"key": "SUB-1"}],
+                    "issuelinks": [{"type": {"name": "Blocks"}, "outwardIssue": {"key": "BLOCKED-1"}},
+                                   {"type": {"name": "Blocks"}, "inwardIssue": {"key": "BLOCKER-1"}},
+                                   {"type": {"name": "Relates"}, "outwardIssue": {"key": "REL-1"}}]
+                }})
+            return json_response({"issues": issues, "total": len(issues)})
+        self.client.session.get.side_effect = get
+
+        related = self.client.get_descendants("ROOT-1", depth=1, include_subtasks=True, include_links=True)
+        down = DescendantTraversal("ROOT-1", 1, include_subtasks=True, include_links=True, direction=DIRECTION_DOWN)
+        resumed = DescendantTraversal.from_token(down.to_token())
+        self.client.run_traversal(resumed)
+
+        self.assertEqual(sorted(related["_extraction_metadata"]["missing_keys"]),
+                         ["BLOCKED-1", "BLOCKER-1", "EPIC-1", "REL-1", "SUB-1"])
+        self.assertEqual(resumed.extraction_metadata["direction"], DIRECTION_DOWN)
+        self.assertEqual(sorted(resumed.missing_keys), ["BLOCKED-1", "SUB-1"])
+        with self.assertRaises(ValueError):
+            DescendantTraversal("ROOT-1", direction="up")
+
+    def test_client_17_remote_links_overlap_child_searches(self):
+        """CLIENT-17: The sync client fetches a level's remote links alongside its parent-link child searches."""
+        self._serve_hierarchy({"ROOT-1": ["EPIC-1", "EPIC-2"]})
+        serve = self.client.session.get.side_effect
+        lock = threading.Lock()
+        active, overlapped = set(), []
+
+        def get(url, params=None, **kwargs):
+            kind = "remote" if url.endswith("/remotelink") else "children" if (
+                params and params["jql"].startswith('"Parent Link"')) else None
+            if kind is None:
+                return serve(url, params=params, **kwargs)
+            with lock:
+                active.add(kind)
+                overlapped.append(active == {"remote", "children"})
+            time.sleep(0.05)
+            with lock:
+                active.discard(kind)
+            return json_response([]) if kind == "remote" else serve(url, params=params, **kwargs)
+        self.client.session.get.side_effect = get
+
+        result = self.client.get_descendants("ROOT-1", depth=1, include_parent_links=True, include_remote_links=True)
+
+        self.assertEqual(sorted(k for k in result if not k.startswith("_")), ["EPIC-1", "EPIC-2", "ROOT-1"])
+        self.assertTrue(any(overlapped))
+
+
+class TestPostSearch(unittest.TestCase):
+    """Test switching long searches from GET to POST /search."""
+
+    def test_client_12_long_searches_use_post(self):
+        """CLIENT-12: Short searches stay GET; long ones POST the same query as a JSON body."""
+        client = JiraClient("https://test.jira.com")
+        client.session = Mock()
+        client.session.get.return_value = json_response({"issues": [], "total": 0})
+        client.session.post.return_value = json_response({"issues": [], "total": 0})
+
+        client._search("project = EPIC", fields="summary", max_results=10)
+        long_jql = "key in (" + ",".join(f'"EPIC-{i}"' for i in range(500)) + ")"
+        client._search(long_jql, fields=["summary", "status"], expand="names", start_at=20, max_results=10)
+
+        self.assertEqual(client.session.get.call_count, 1)
+        url, body = client.session.post.call_args[0][0], client.session.post.call_args[1]["json"]
+        self.assertTrue(url.endswith("/rest/api/2/search"))
+        self.assertEqual(body, {"jql": long_jql, "startAt": 20, "maxResults": 10, "validateQuery": False,
+                                "fields": ["summary", "status"], "expand": ["names"]})
+
+    def test_client_13_batches_are_not_limited_by_url_length(self):
+        """CLIENT-13: Batched clauses are limited by key count only, not by encoded length."""
+        keys = [f"VERYLONGPROJECTKEY-{i}" for i in range(2500)]
+
+        batches = _batched_in_clauses("key", keys)
+
+        self.assertEqual([len(batch) for batch, _ in batches], [1000, 1000, 500])
+        self.assertGreater(len(quote_plus(batches[0][1])), 20000)
+
+    def test_client_14_async_long_searches_use_post(self):
+        """CLIENT-14: AsyncJiraClient sends long searches with POST and short ones with GET."""
+        methods = []
+
+        async def handler(request):
+            methods.append(request.method)
+            return httpx.Response(200, json={"issues": [{"key": key} for key in _keys_from_jql(_request_jql(request))],
+                                             "total": 0})
+
+        async def run():
+            client = AsyncJiraClient("https://test.jira.com")
+            client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            short = await client._search('key in ("A-1")')
+            long = await client._search("key in (" + ",".join(f'"A-{i}"' for i in range(500)) + ")")
+            await client.aclose()
+            return short, long
+
+        short, long = asyncio.run(run())
+
+        self.assertEqual(methods, ["GET", "POST"])
+        self.assertEqual((len(short["issues"]), len(long["issues"])), (1, 500))
+
+    def test_client_15_search_issues_tool_posts_long_queries(self):
+        """CLIENT-15: The search_issues tool goes through the client's search, so long JQL is POSTed."""
+        client = JiraClient("https://test.jira.com")
+        client.session = Mock()
+        client.session.post.return_value = json_response(
+            {"issues": [{"key": "EPIC-1", "fields": {"summary": "Epic", "status": {"name": "Open"}}}], "total": 1})
+        long_jql = " OR ".join(f"key = EPIC-{i}" for i in range(500))
+
+        result = asyncio.run(JiraTools(client).search_issues(long_jql, max_results=10))
+
+        client.session.get.assert_not_called()
+        body = client.session.post.call_args[1]["json"]
+        self.assertEqual((body["jql"], body["maxResults"]), (long_jql, 10))
+        self.assertEqual([issue.key for issue in result.issues], ["EPIC-1"])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Unit tests for HTTP connection pool tuning
+
+This test module provides coverage for the pooled requests adapter, its
+connection reuse metrics and startup prewarming, using a local keep-alive
+HTTP server.
+
+Test IDs: CONN-01 through CONN-06
+"""
+
+import unittest
+from unittest.mock import patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import socket
+import threading
+import time
+
+# Import modules under test
+from jira_extractor.client import JiraClient
+from jira_extractor.pool import PooledHTTPAdapter, _keepalive_socket_options
+from mcp_jira_server.server import create_server
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Answers every GET with an empty JSON list over a persistent connection."""
+
+    protocol_version = "HTTP/1.1"
+    delay = 0.0
+
+    def do_GET(self):
+        time.sleep(self.delay)
+        body = b"[]"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestConnectionPool(unittest.TestCase):
+    """Test pool configuration, metrics and prewarming."""
+
+    def setUp(self):
+        """Start a local keep-alive server and point a client at it."""
+        KeepAliveHandler.delay = 0.0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+        self.client = JiraClient(f"http://127.0.0.1:{self.server.server_address[1]}")
+
+    def tearDown(self):
+        """Stop the local server."""
+        self.client.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_conn_01_client_mounts_tuned_adapter(self):
+        """CONN-01: The session uses a PooledHTTPAdapter that configure_pool can resize."""
+        adapter = self.client.session.get_adapter("https://jira.example.com")
+        self.assertIsInstance(adapter, PooledHTTPAdapter)
+        self.assertEqual(adapter.stats()["max_size"], 20)
+
+        self.client.configure_pool(pool_maxsize=4, pool_block=True, keepalive=False)
+        stats = self.client.pool_stats()
+        self.assertEqual((stats["max_size"], stats["block"], stats["keepalive"]), (4, True, False))
+        self.assertIs(self.client.session.get_adapter("http://jira.example.com"), self.client.http_adapter)
+
+    def test_conn_02_keepalive_socket_options(self):
+        """CONN-02: Keep-alive adds SO_KEEPALIVE to urllib3's default socket options."""
+        options = _keepalive_socket_options()
+        self.assertIn((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), options)
+        self.assertIn((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1), options)
+
+    def test_conn_03_metrics_count_reused_connections(self):
+        """CONN-03: Sequential requests reuse one pooled connection."""
+        for key in ("EPIC-1", "EPIC-2", "EPIC-3"):
+            self.assertEqual(self.client.get_remote_links(key), [])
+
+        stats = self.client.pool_stats()
+        self.assertEqual(stats["connections_opened"], 1)
+        self.assertEqual(stats["connections_reused"], 2)
+        self.assertEqual(stats["idle_connections"], 1)
+
+    def test_conn_04_prewarm_opens_connections_in_parallel(self):
+        """CONN-04: prewarm opens N connections that later requests reuse."""
+        KeepAliveHandler.delay = 0.05
+
+        self.assertEqual(self.client.prewarm(3), 3)
+        self.assertEqual(self.client.pool_stats()["idle_connections"], 3)
+
+        self.client.get_remote_links("EPIC-1")
+        self.assertEqual(self.client.pool_stats()["connections_opened"], 3)
+
+    def test_conn_05_prewarm_is_capped_by_pool_size(self):
+        """CONN-05: prewarm never opens more connections than the pool keeps."""
+        self.client.configure_pool(pool_maxsize=2)
+        KeepAliveHandler.delay = 0.05
+
+        self.assertEqual(self.client.prewarm(0), 0)
+        self.assertEqual(self.client.prewarm(5), 2)
+
+    @patch("mcp_jira_server.server.FastMCP")
+    def test_conn_06_create_server_configures_pool_and_prewarms(self, mock_fastmcp):
+        """CONN-06: create_server applies pool settings; a failed prewarm is only logged."""
+        with patch("mcp_jira_server.server.JiraClient") as mock_client:
+            mock_client.return_value.prewarm.side_effect = Exception("JIRA unreachable")
+            create_server(url="https://test.jira.com", pool_maxsize=8, pool_block=True,
+                          pool_keepalive=False, pool_prewarm=3)
+
+        mock_client.return_value.configure_pool.assert_called_once_with(8, True, False)
+        mock_client.return_value.prewarm.assert_called_once_with(3)
+
+        with patch("mcp_jira_server.server.AsyncJiraClient") as mock_async_client:
+            create_server(url="https://test.jira.com", async_client=True, pool_prewarm=3)
+        mock_async_client.return_value.configure_pool.assert_not_called()
+        mock_async_client.return_value.prewarm.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""Unit tests for per-call deadlines
+
+This test module provides coverage for deadline scopes, request timeouts
+derived from the remaining budget, and clean partial results when a tool's
+deadline passes.
+
+Test IDs: DEADLINE-01 through DEADLINE-12
+"""
+
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import time
+
+import httpx
+import requests
+
+# Import modules under test
+from jira_extractor.deadline import (
+    DeadlineExceeded,
+    bind_context,
+    deadline_scope,
+    request_timeout,
+    time_remaining,
+)
+from jira_extractor.client import JiraClient
+from jira_extractor.async_client import AsyncJiraClient
+from jira_extractor.breaker import CircuitOpenError
+from jira_extractor.traversal import DescendantTraversal
+from mcp_jira_server.server import JiraTools, create_server
+from mcp_jira_server.testutils import json_response
+
+
+class TestDeadlineScope(unittest.TestCase):
+    """Test deadline bookkeeping."""
+
+    def test_deadline_01_nested_scopes_only_shorten(self):
+        """DEADLINE-01: Nested scopes can shorten but never extend the deadline."""
+        self.assertIsNone(time_remaining())
+        with deadline_scope(10):
+            with deadline_scope(60):
+                self.assertLessEqual(time_remaining(), 10)
+            with deadline_scope(1):
+                self.assertLessEqual(time_remaining(), 1)
+            with deadline_scope(None):
+                self.assertGreater(time_remaining(), 1)
+        self.assertIsNone(time_remaining())
+
+    def test_deadline_02_request_timeout_clips_to_remaining_budget(self):
+        """DEADLINE-02: Socket timeouts shrink with the budget and fail once it is spent."""
+        self.assertEqual(request_timeout(5.0, 30.0), (5.0, 30.0))
+        with deadline_scope(2):
+            connect, read = request_timeout(5.0, 30.0)
+            self.assertLessEqual(connect, 2.0)
+            self.assertLessEqual(read, 2.0)
+        with deadline_scope(0.01):
+            time.sleep(0.02)
+            with self.assertRaises(DeadlineExceeded):
+                request_timeout(5.0, 30.0)
+
+    def test_deadline_03_bind_context_carries_deadline_to_threads(self):
+        """DEADLINE-03: Batch worker threads see the caller's deadline."""
+        with deadline_scope(5):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                seen = list(executor.map(bind_context(lambda _: time_remaining()), range(2)))
+        self.assertTrue(all(left is not None and left <= 5 for left in seen))
+
+
+class TestClientDeadlines(unittest.TestCase):
+    """Test deadline propagation into JIRA requests."""
+
+    def setUp(self):
+        """Set up a client with a mocked HTTP session."""
+        self.client = JiraClient("https://test.jira.com")
+        self.client.session = Mock()
+
+    def test_deadline_04_requests_carry_timeouts(self):
+        """DEADLINE-04: Every GET carries (connect, read) timeouts clipped by the deadline."""
+        self.client.session.get.return_value = json_response([])
+
+        self.client.get_remote_links("EPIC-1")
+        self.assertEqual(self.client.session.get.call_args[1]["timeout"], (5.0, 30.0))
+
+        with deadline_scope(3):
+            self.client.get_remote_links("EPIC-2")
+        connect, read = self.client.session.get.call_args[1]["timeout"]
+        self.assertLessEqual(connect, 3.0)
+        self.assertLessEqual(read, 3.0)
+
+    @patch("jira_extractor.client.time.sleep")
+    def test_deadline_05_retry_backoff_past_deadline_is_not_slept(self, mock_sleep):
+        """DEADLINE-05: A retry that would outlive the deadline raises instead of sleeping."""
+        throttled = json_response({})
+        throttled.status_code = 429
+        throttled.headers = {"Retry-After": "20"}
+        self.client.session.get.return_value = throttled
+
+        with deadline_scope(1):
+            with self.assertRaises(DeadlineExceeded):
+                self.client.get_issue("EPIC-1")
+
+        mock_sleep.assert_not_called()
+        self.assertEqual(self.client.session.get.call_count, 1)
+
+    def test_deadline_06_socket_timeout_after_deadline_is_reported_as_deadline(self):
+        """DEADLINE-06: A socket timeout past the deadline surfaces as DeadlineExceeded."""
+        def hang(url, params=None, timeout=None):
+            time.sleep(0.05)
+            raise requests.ReadTimeout("read timed out")
+        self.client.session.get.side_effect = hang
+
+        with deadline_scope(0.02):
+            with self.assertRaises(DeadlineExceeded):
+                self.client.get_issue("EPIC-1")
+
+        self.client.session.get.side_effect = requests.ReadTimeout("read timed out")
+        with self.assertRaises(requests.ReadTimeout):
+            self.client.get_issue("EPIC-1")
+
+    def test_deadline_07_traversal_requeues_level_interrupted_by_deadline(self):
+        """DEADLINE-07: run_traversal stops cleanly and keeps the interrupted level for resuming."""
+        traversal = DescendantTraversal("EPIC-1", depth=2, include_subtasks=True, fields="summary,subtasks")
+
+        with patch.object(self.client, "get_issues", side_effect=DeadlineExceeded("deadline")):
+            complete = self.client.run_traversal(traversal)
+
+        self.assertFalse(complete)
+        self.assertEqual(list(traversal.frontier), [("EPIC-1", 0)])
+        self.assertEqual(traversal.missing_keys, [])
+        restored = DescendantTraversal.from_token(traversal.to_token())
+        self.assertEqual(list(restored.frontier), [("EPIC-1", 0)])
+
+    def test_deadline_08_async_client_requests_carry_timeouts(self):
+        """DEADLINE-08: AsyncJiraClient passes clipped timeouts and refuses spent budgets."""
+        timeouts = []
+
+        async def handler(request):
+            timeouts.append(request.extensions["timeout"])
+            return httpx.Response(200, json=[])
+
+        async def run():
+            client = AsyncJiraClient("https://test.jira.com")
+            client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            with deadline_scope(2):
+                await client.get_remote_links("EPIC-1")
+            with deadline_scope(0.01):
+                await asyncio.sleep(0.02)
+                with self.assertRaises(DeadlineExceeded):
+                    await client.get_remote_links("EPIC-2")
+            await client.aclose()
+
+        asyncio.run(run())
+
+        self.assertEqual(len(timeouts), 1)
+        self.assertLessEqual(timeouts[0]["read"], 2.0)
+        self.assertLessEqual(timeouts[0]["connect"], 2.0)
+
+
+class TestToolDeadlines(unittest.TestCase):
+    """Test tool-level deadlines."""
+
+    def test_deadline_09_get_ancestors_returns_partial_chain(self):
+        """DEADLINE-09: get_ancestors returns the ancestors found before the deadline."""
+        client = Mock()
+        client.base_url = "https://test.jira.com"
+        client.get_field_by_name.return_value = None
+        chain = {
+            "TASK-1": {"parent": {"key": "STORY-1"}},
+            "STORY-1": {"summary": "Story", "parent": {"key": "EPIC-1"}},
+        }
+
+        def get_issue(key, expand=None, fields=None):
+            if key not in chain:
+                raise DeadlineExceeded("Deadline exceeded before request")
+            return {"key": key, "fields": chain[key]}
+        client.get_issue.side_effect = get_issue
+
+        result = asyncio.run(JiraTools(client).get_ancestors("TASK-1"))
+
+        self.assertFalse(result.complete)
+        self.assertEqual([a.key for a in result.ancestors], ["STORY-1"])
+
+    @patch("mcp_jira_server.server.FastMCP")
+    def test_deadline_10_create_server_configures_timeouts(self, mock_fastmcp):
+        """DEADLINE-10: create_server sets client timeouts and bounds each tool call."""
+        registered = {}
+
+        def tool(name, **kwargs):
+            def register(func):
+                registered[name] = func
+                return func
+            return register
+        mock_fastmcp.return_value.tool.side_effect = tool
+
+        with patch("mcp_jira_server.server.JiraClient") as mock_client, \
+                patch.object(JiraTools, "get_issue_relationships", side_effect=lambda key: time_remaining()):
+            create_server(url="https://test.jira.com", tool_timeout=7.5, connect_timeout=2.0, read_timeout=9.0)
+            remaining = asyncio.run(registered["get_issue_relationships"]("EPIC-1"))
+
+        self.assertEqual(mock_client.return_value.connect_timeout, 2.0)
+        self.assertEqual(mock_client.return_value.read_timeout, 9.0)
+        self.assertIsNotNone(remaining)
+        self.assertLessEqual(remaining, 7.5)
+
+
+class TestTraversalInterruptions(unittest.TestCase):
+    """Test that interrupted traversal levels stay in the frontier."""
+
+    EPIC = {"EPIC-1": {"key": "EPIC-1", "fields": {"summary": "Epic"}}}
+
+    def _assert_level_requeued(self, traversal, complete):
+        self.assertFalse(complete)
+        self.assertEqual(list(traversal.frontier), [("EPIC-1", 0)])
+        self.assertEqual(traversal.issues, {})
+        self.assertEqual(traversal.missing_keys, [])
+        self.assertEqual(traversal.result()["_extraction_metadata"]["unexplored_keys"], ["EPIC-1"])
+
+    def test_deadline_11_interrupted_child_search_requeues_level(self):
+        """DEADLINE-11: A deadline or open breaker during the parent-link child search keeps the level for resuming."""
+        client = JiraClient("https://test.jira.com")
+        client.get_field_by_name = Mock(return_value={"id": "customfield_100"})
+        client.get_issues = Mock(return_value=dict(self.EPIC))
+        client._search_all = Mock(side_effect=DeadlineExceeded("deadline"))
+        traversal = DescendantTraversal("EPIC-1", depth=2, include_parent_links=True)
+
+        self._assert_level_requeued(traversal, client.run_traversal(traversal))
+
+        with patch("jira_extractor.async_client.httpx.AsyncClient"):
+            async_client = AsyncJiraClient("https://test.jira.com")
+        async_client.get_field_by_name = AsyncMock(return_value={"id": "customfield_100"})
+        async_client.get_issues = AsyncMock(return_value=dict(self.EPIC))
+        async_client._search_all = AsyncMock(side_effect=CircuitOpenError("open"))
+        traversal = DescendantTraversal("EPIC-1", depth=2, include_parent_links=True)
+
+        self._assert_level_requeued(traversal, asyncio.run(async_client.run_traversal(traversal)))
+
+    def test_deadline_12_failed_issue_fetch_reports_incomplete(self):
+        """DEADLINE-12: A level whose issue fetch fails is requeued and the walk reports itself incomplete."""
+        client = JiraClient("https://test.jira.com")
+        client.get_issues = Mock(side_effect=Exception("500 Server Error"))
+        traversal = DescendantTraversal("EPIC-1", depth=2, include_subtasks=True)
+
+        self._assert_level_requeued(traversal, client.run_traversal(traversal))
+        restored = DescendantTraversal.from_token(traversal.to_token())
+        self.assertEqual(list(restored.frontier), [("EPIC-1", 0)])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
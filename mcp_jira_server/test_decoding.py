@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Unit tests for JSON decoding and path extraction
+
+This test module provides coverage for the pluggable JSON decoder, path
+projection of decoded documents, and path extraction in JiraClient,
+AsyncJiraClient and the search_issues tool.
+
+Test IDs: DECODE-01 through DECODE-08
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+import asyncio
+import json
+
+import httpx
+
+# Import modules under test
+from jira_extractor import decoding
+from jira_extractor.decoding import decode_body, decode_json, decode_response, parse_paths, project
+from jira_extractor.client import JiraClient
+from jira_extractor.async_client import AsyncJiraClient
+from mcp_jira_server.server import JiraTools, SEARCH_SUMMARY_PATHS
+from mcp_jira_server.testutils import json_response
+
+SEARCH_PAGE = {
+    "startAt": 0,
+    "maxResults": 50,
+    "total": 2,
+    "issues": [
+        {"key": "EPIC-1", "id": "1", "fields": {"summary": "First", "status": {"name": "Open", "id": "1"},
+                                               "description": "x" * 100}},
+        {"key": "EPIC-2", "id": "2", "fields": {"summary": "Second", "status": None}},
+    ],
+}
+
+
+class TestDecoding(unittest.TestCase):
+    """Test decoders and path projection."""
+
+    def test_decode_01_decoder_falls_back_to_json_module(self):
+        """DECODE-01: decode_json works with and without orjson installed."""
+        body = json.dumps(SEARCH_PAGE).encode()
+        self.assertEqual(decode_json(body), SEARCH_PAGE)
+        with patch.object(decoding, "orjson", None):
+            self.assertEqual(decode_json(body), SEARCH_PAGE)
+
+    def test_decode_02_parse_paths_builds_selection_tree(self):
+        """DECODE-02: Paths merge into one selection tree and malformed paths are rejected."""
+        tree = parse_paths(["total", "issues[].key", "issues[].fields.summary"])
+        self.assertEqual(tree, {"total": {}, "issues": {"[]": {"key": {}, "fields": {"summary": {}}}}})
+        self.assertEqual(parse_paths(["[].key"]), {"[]": {"key": {}}})
+        for bad in ("", "issues..key", "issues.[]"):
+            with self.assertRaises(ValueError):
+                parse_paths([bad])
+
+    def test_decode_03_project_keeps_only_requested_paths(self):
+        """DECODE-03: Projection keeps the document's shape and drops everything else."""
+        projected = project(SEARCH_PAGE, ["total", "issues[].key", "issues[].fields.status.name"])
+        self.assertEqual(projected, {
+            "total": 2,
+            "issues": [
+                {"key": "EPIC-1", "fields": {"status": {"name": "Open"}}},
+                {"key": "EPIC-2", "fields": {}},  # null status does not match the path
+            ],
+        })
+        self.assertIsNone(project("scalar", ["key"]))
+
+    def test_decode_04_paths_decode_once_then_project(self):
+        """DECODE-04: Path extraction decodes the body once with the configured decoder, then projects it."""
+        decoder = Mock(side_effect=decode_json)
+        for paths in (["total", "issues[].key", "issues[].fields.summary"],
+                      ["issues[].fields.status"], ["issues[]"], ["missing.path"]):
+            decoder.reset_mock()
+            body = json.dumps(SEARCH_PAGE).encode()
+            self.assertEqual(decode_response(body, paths, decoder), project(SEARCH_PAGE, paths), paths)
+            decoder.assert_called_once_with(body)
+
+    def test_decode_05_decode_body_decodes_raw_content(self):
+        """DECODE-05: decode_body decodes a response's raw content and never calls json()."""
+        self.assertEqual(decode_response(b'{"total": 3, "issues": []}', ["total"]), {"total": 3})
+
+        response = json_response(SEARCH_PAGE)
+        self.assertEqual(decode_body(response, ["total"]), {"total": 2})
+        self.assertEqual(decode_body(response), SEARCH_PAGE)
+        response.json.assert_not_called()
+
+    def test_decode_06_extraction_matches_without_orjson(self):
+        """DECODE-06: Path extraction gives the same result with orjson and with the json module."""
+        paths = ["total", "issues[].key", "issues[].fields.status.name"]
+        body = json.dumps(SEARCH_PAGE).encode()
+        with patch.object(decoding, "orjson", None):
+            fallback = decode_response(body, paths)
+        self.assertEqual(decode_response(body, paths), fallback)
+        self.assertEqual(fallback, project(SEARCH_PAGE, paths))
+
+
+class TestClientPathExtraction(unittest.TestCase):
+    """Test path extraction through the clients and tools."""
+
+    def test_decode_07_clients_extract_paths_from_search_pages(self):
+        """DECODE-07: Both clients decode only requested paths and keep the paging fields."""
+        client = JiraClient("https://test.jira.com")
+        client.session = Mock()
+        client.session.get.return_value = json_response(SEARCH_PAGE)
+        client.json_decoder = Mock(side_effect=decode_json)
+
+        page = client._search("project = EPIC", fields="key", paths=["issues[].key"])
+        self.assertEqual(page, {"startAt": 0, "maxResults": 50, "total": 2,
+                                "issues": [{"key": "EPIC-1"}, {"key": "EPIC-2"}]})
+        client.json_decoder.assert_called_once()
+
+        async def handler(request):
+            return httpx.Response(200, json=SEARCH_PAGE)
+
+        async def run():
+            async_client = AsyncJiraClient("https://test.jira.com")
+            async_client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            issues = await async_client._search_all("project = EPIC", fields="key", paths=["issues[].key"])
+            await async_client.aclose()
+            return issues
+
+        self.assertEqual(asyncio.run(run()), [{"key": "EPIC-1"}, {"key": "EPIC-2"}])
+
+    def test_decode_08_search_issues_requests_summary_paths(self):
+        """DECODE-08: search_issues only asks for the paths its summaries read."""
+        client = Mock()
+        client.api_base = "https://test.jira.com/rest/api/2/"
+        client.base_url = "https://test.jira.com"
+        client._search.return_value = project(SEARCH_PAGE, SEARCH_SUMMARY_PATHS)
+
+        results = asyncio.run(JiraTools(client).search_issues("project = EPIC"))
+
+        self.assertEqual(client._search.call_args[1]["paths"], SEARCH_SUMMARY_PATHS)
+        self.assertEqual([(r.key, r.status) for r in results.issues], [("EPIC-1", "Open"), ("EPIC-2", "")])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
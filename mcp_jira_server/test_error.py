@@ -27,7 +27,7 @@ class TestError(TestCase):
         """ERROR-01: Handle JiraClient exceptions in search."""
         mock_client = Mock()
         mock_client.api_base = "https://test.jira.com/rest/api/2"
-        mock_client._make_api_request.side_effect = Exception("Connection failed")
+        mock_client._search.side_effect = Exception("Connection failed")
         
         tools = JiraTools(mock_client)
         
@@ -93,7 +93,7 @@ class TestError(TestCase):
         """ERROR-06: Handle network timeouts."""
         mock_client = Mock()
         mock_client.api_base = "https://test.jira.com/rest/api/2"
-        mock_client._make_api_request.side_effect = TimeoutError("Request timed out")
+        mock_client._search.side_effect = TimeoutError("Request timed out")
         
         tools = JiraTools(mock_client)
         
@@ -106,7 +106,7 @@ class TestError(TestCase):
         """ERROR-07: Handle HTTP error responses."""
         mock_client = Mock()
         mock_client.api_base = "https://test.jira.com/rest/api/2"
-        mock_client._make_api_request.side_effect = Exception("404 Not Found")
+        mock_client._search.side_effect = Exception("404 Not Found")
         
         tools = JiraTools(mock_client)
         
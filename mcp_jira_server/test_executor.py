@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Unit tests for MCP JIRA Server Worker Pool
+
+This test module provides coverage for the bounded worker pool that runs
+blocking JiraClient calls off the event loop.
+
+Test IDs: POOL-01 through POOL-07
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+import asyncio
+import threading
+import time
+
+# Import modules under test
+from mcp_jira_server.executor import WorkerPool
+from mcp_jira_server.server import JiraTools, create_server
+
+
+class TestWorkerPool(unittest.TestCase):
+    """Test worker pool behaviour and metrics."""
+
+    def test_pool_01_runs_blocking_calls_off_event_loop(self):
+        """POOL-01: Blocking calls run on a worker thread, not the event loop thread."""
+        pool = WorkerPool(max_workers=2)
+
+        async def run():
+            loop_thread = threading.current_thread().name
+            worker_thread = await pool.run(lambda: threading.current_thread().name)
+            return loop_thread, worker_thread
+
+        loop_thread, worker_thread = asyncio.run(run())
+        pool.shutdown()
+
+        self.assertNotEqual(loop_thread, worker_thread)
+        self.assertTrue(worker_thread.startswith("jira-worker"))
+
+    def test_pool_02_overlapping_calls_run_concurrently(self):
+        """POOL-02: Overlapping calls share the pool instead of running serially."""
+        pool = WorkerPool(max_workers=4)
+
+        async def run():
+            start = time.monotonic()
+            await asyncio.gather(*(pool.run(time.sleep, 0.1) for _ in range(4)))
+            return time.monotonic() - start
+
+        elapsed = asyncio.run(run())
+        pool.shutdown()
+
+        self.assertLess(elapsed, 0.3)
+
+    def test_pool_03_queue_depth_and_wait_metrics(self):
+        """POOL-03: Queue depth and wait time are recorded when the pool is saturated."""
+        pool = WorkerPool(max_workers=1, name="metrics")
+
+        async def run():
+            await asyncio.gather(*(pool.run(time.sleep, 0.05) for _ in range(3)))
+
+        asyncio.run(run())
+        stats = pool.stats()
+        pool.shutdown()
+
+        self.assertEqual(stats["name"], "metrics")
+        self.assertEqual(stats["submitted"], 3)
+        self.assertEqual(stats["completed"], 3)
+        self.assertEqual(stats["queue_depth"], 0)
+        self.assertEqual(stats["active"], 0)
+        self.assertGreaterEqual(stats["max_queue_depth"], 2)
+        self.assertGreaterEqual(stats["max_wait_seconds"], 0.05)
+        self.assertGreater(stats["avg_wait_seconds"], 0.0)
+
+    def test_pool_04_exceptions_propagate_to_caller(self):
+        """POOL-04: Exceptions raised on the worker propagate to the awaiting caller."""
+        pool = WorkerPool(max_workers=1)
+
+        def fail():
+            raise ConnectionError("JIRA unreachable")
+
+        with self.assertRaises(ConnectionError):
+            asyncio.run(pool.run(fail))
+        pool.shutdown()
+
+        self.assertEqual(pool.stats()["completed"], 1)
+
+    def test_pool_05_jira_tools_route_sync_client_through_pool(self):
+        """POOL-05: JiraTools sends sync client calls through its worker pool."""
+        mock_client = Mock()
+        calling_threads = []
+
+        def get_issue(key, expand=None):
+            calling_threads.append(threading.current_thread().name)
+            return {"key": key, "fields": {"summary": "Pooled", "status": {"name": "Open"}}}
+
+        mock_client.get_issue.side_effect = get_issue
+        pool = WorkerPool(max_workers=2, name="tools")
+        tools = JiraTools(mock_client, worker_pool=pool)
+
+        result = asyncio.run(tools.get_issue("POOL-5"))
+        pool.shutdown()
+
+        self.assertEqual(result.summary, "Pooled")
+        self.assertTrue(calling_threads[0].startswith("tools-worker"))
+        self.assertEqual(pool.stats()["completed"], 1)
+
+    @patch("mcp_jira_server.server.WorkerPool")
+    @patch("mcp_jira_server.server.JiraClient")
+    @patch("mcp_jira_server.server.FastMCP")
+    def test_pool_06_create_server_sizes_pool_from_config(self, mock_fastmcp, mock_client, mock_pool):
+        """POOL-06: create_server sizes the worker pool from worker_pool_size."""
+        create_server(url="https://test.jira.com", worker_pool_size=3)
+
+        mock_pool.assert_called_once_with(3)
+
+    def test_pool_07_rejects_empty_pool(self):
+        """POOL-07: A pool must have at least one worker."""
+        with self.assertRaises(ValueError):
+            WorkerPool(max_workers=0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Unit tests for the field metadata registry
+
+This test module provides coverage for FieldIndex lookups, FieldRegistry
+expiry, and both clients resolving fields from one indexed /field download.
+
+Test IDs: FIELD-01 through FIELD-06
+"""
+
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+import asyncio
+
+# Import modules under test
+from jira_extractor.async_client import AsyncJiraClient
+from jira_extractor.client import JiraClient
+from jira_extractor.fields import FieldIndex, FieldRegistry
+from mcp_jira_server.server import create_server
+from mcp_jira_server.testutils import FakeClock, json_response
+
+EPIC_LINK = "com.pyxis.greenhopper.jira:gh-epic-link"
+PARENT_LINK = "com.atlassian.jpo:jpo-custom-field-parent"
+
+FIELDS = [
+    {"id": "summary", "name": "Summary", "clauseNames": ["summary"], "schema": {"type": "string"}},
+    {"id": "customfield_100", "name": "Parent Link", "clauseNames": ["cf[100]", "Parent Link"],
+     "schema": {"type": "any", "custom": PARENT_LINK}},
+    {"id": "customfield_200", "name": "Epic Link", "clauseNames": ["cf[200]", "Epic Link"],
+     "schema": {"type": "any", "custom": EPIC_LINK}},
+    {"id": "customfield_300", "name": "Parent Link", "clauseNames": ["cf[300]"],
+     "schema": {"type": "any", "custom": PARENT_LINK}},
+]
+
+
+class TestFieldIndex(unittest.TestCase):
+    """Test the lookup tables."""
+
+    def test_field_01_lookups_by_name_id_clause_and_type(self):
+        """FIELD-01: Fields resolve by ID, name, clause name and custom type; duplicate names keep the first."""
+        index = FieldIndex(FIELDS)
+
+        self.assertEqual(index.by_name("Parent Link")["id"], "customfield_100")
+        self.assertEqual(index.by_id("customfield_300")["clauseNames"], ["cf[300]"])
+        self.assertEqual(index.by_clause_name("Epic Link")["id"], "customfield_200")
+        self.assertEqual([f["id"] for f in index.by_custom_type(PARENT_LINK)], ["customfield_100", "customfield_300"])
+        self.assertIsNone(index.by_name("Sprint"))
+        self.assertEqual(index.by_custom_type("com.example:unknown"), [])
+        self.assertEqual(len(index), 4)
+
+    def test_field_02_registry_expires_after_ttl(self):
+        """FIELD-02: The registry answers until its TTL, counting persisted copies' age, and can be invalidated."""
+        clock = FakeClock(1000.0)
+        registry = FieldRegistry(ttl=60, clock=clock)
+        self.assertIsNone(registry.current())
+
+        registry.update(FIELDS)
+        clock.now += 59
+        self.assertIsNotNone(registry.current())
+        clock.now += 1
+        self.assertIsNone(registry.current())
+
+        registry.update(FIELDS, age=50)
+        clock.now += 10
+        self.assertIsNone(registry.current())
+
+        registry.update(FIELDS)
+        registry.invalidate()
+        self.assertIsNone(registry.current())
+        self.assertEqual(registry.stats()["loads"], 3)
+
+
+class TestClientFieldLookups(unittest.TestCase):
+    """Test field resolution in the clients."""
+
+    def setUp(self):
+        self.clock = FakeClock(1000.0)
+
+    def test_field_03_one_download_answers_every_lookup(self):
+        """FIELD-03: Any number of lookups, including misses, share one /field request until the TTL runs out."""
+        client = JiraClient("https://test.jira.com")
+        client.session = Mock()
+        client.session.get.return_value = json_response(FIELDS)
+        client.fields = FieldRegistry(ttl=60, clock=self.clock)
+
+        self.assertEqual(client.get_field_by_name("Parent Link")["id"], "customfield_100")
+        self.assertEqual(client.get_field_by_name("Epic Link")["id"], "customfield_200")
+        self.assertIsNone(client.get_field_by_name("Sprint"))
+        self.assertEqual(client.field_index().by_id("customfield_300")["name"], "Parent Link")
+        self.assertEqual(client.session.get.call_count, 1)
+
+        self.clock.now += 60
+        client.get_field_by_name("Parent Link")
+        self.assertEqual(client.session.get.call_count, 2)
+
+    def test_field_04_failed_download_is_retried(self):
+        """FIELD-04: A failed /field request reads as not found and is retried on the next lookup."""
+        client = JiraClient("https://test.jira.com")
+        client.session = Mock()
+        client.session.get.side_effect = [ConnectionError("down"), json_response(FIELDS)]
+
+        self.assertIsNone(client.get_field_by_name("Parent Link"))
+        self.assertEqual(client.get_field_by_name("Parent Link")["id"], "customfield_100")
+
+    def test_field_05_async_client_shares_one_download(self):
+        """FIELD-05: The async client resolves every field from one indexed /field response."""
+        with patch("jira_extractor.async_client.httpx.AsyncClient"):
+            client = AsyncJiraClient("https://test.jira.com")
+        client._make_api_request = AsyncMock(return_value=FIELDS)
+
+        async def run():
+            return [await client.get_field_by_name(name) for name in ("Parent Link", "Epic Link", "Sprint")]
+
+        found = asyncio.run(run())
+
+        self.assertEqual([f and f["id"] for f in found], ["customfield_100", "customfield_200", None])
+        client._make_api_request.assert_awaited_once()
+
+    @patch("mcp_jira_server.server.FastMCP")
+    def test_field_06_create_server_applies_field_cache_ttl(self, mock_fastmcp):
+        """FIELD-06: field_cache_ttl sets how long the client's registry trusts the field list."""
+        with patch("mcp_jira_server.server.JiraClient") as client_class:
+            create_server(url="https://test.jira.com", field_cache_ttl=120)
+
+        self.assertEqual(client_class.return_value.fields.ttl, 120)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
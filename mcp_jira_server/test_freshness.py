@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""Unit tests for stale-while-revalidate serving and read consistency
+
+This test module provides coverage for read scopes and as_of tracking, the
+revalidate window of IssueCache, background refreshes in both clients and for
+search_issues pages, and the consistency argument and as_of stamp added to
+every data tool.
+
+Test IDs: FRESH-01 through FRESH-09
+"""
+
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+import asyncio
+import threading
+import time
+
+# Import modules under test
+from jira_extractor.async_client import AsyncJiraClient
+from jira_extractor.cache import IssueCache
+from jira_extractor.client import JiraClient
+from jira_extractor.deadline import deadline_scope, time_remaining
+from jira_extractor.freshness import fresh_required, observe, read_scope
+from mcp_jira_server.server import (
+    SEARCH_PAGE_CACHE_TTL,
+    SEARCH_PAGE_REVALIDATE_TTL,
+    IssueDetails,
+    IssueLink,
+    JiraTools,
+    create_server,
+)
+from mcp_jira_server.testutils import FakeClock, json_response
+
+
+def _issue(version):
+    return {"key": "EPIC-1", "fields": {"summary": f"v{version}"}}
+
+
+class TestReadScope(unittest.TestCase):
+    """Test the per-call consistency and as_of context."""
+
+    def test_fresh_01_scope_tracks_consistency_and_oldest_read(self):
+        """FRESH-01: A scope reports the oldest observed fetch, or its own start when every read was live."""
+        self.assertFalse(fresh_required())
+        with read_scope() as scope:
+            self.assertFalse(fresh_required())
+            self.assertEqual(scope.as_of, scope.started_at)
+            observe(scope.started_at - 30)
+            observe(scope.started_at - 90)
+            observe(scope.started_at - 10)
+            self.assertEqual(scope.as_of, scope.started_at - 90)
+        with read_scope("fresh"):
+            self.assertTrue(fresh_required())
+        self.assertFalse(fresh_required())
+        with self.assertRaises(ValueError):
+            with read_scope("eventual"):
+                pass
+
+
+class TestIssueCacheRevalidation(unittest.TestCase):
+    """Test the revalidate window of IssueCache."""
+
+    def setUp(self):
+        self.clock = FakeClock(1_000_000.0)
+        self.cache = IssueCache(max_bytes=10_000, ttl=60, clock=self.clock, revalidate_ttl=30)
+        self.cache.put(IssueCache.make_key("EPIC-1", "summary,status"), _issue(1))
+
+    def test_fresh_02_expired_entries_served_within_window_only(self):
+        """FRESH-02: Past the TTL an entry answers lookup_revalidating, flagged expired, until the window ends."""
+        self.assertEqual(self.cache.lookup_revalidating("EPIC-1", "summary"), (_issue(1), False))
+
+        self.clock.now += 70
+        self.assertIsNone(self.cache.lookup("EPIC-1", "summary"))
+        self.assertEqual(self.cache.lookup_revalidating("EPIC-1", "summary"), (_issue(1), True))
+
+        self.clock.now += 30  # Past the revalidate window: callers must block on JIRA
+        self.assertIsNone(self.cache.lookup_revalidating("EPIC-1", "summary"))
+        self.assertEqual(self.cache.stats()["revalidations"], 1)
+        self.assertEqual(self.cache.retention, 90)
+
+    def test_fresh_03_hits_report_their_age(self):
+        """FRESH-03: Serving a cached issue moves the scope's as_of back to when it was fetched."""
+        self.clock.now += 45
+        with read_scope() as scope:
+            self.cache.lookup_revalidating("EPIC-1", "summary")
+
+        self.assertAlmostEqual(scope.as_of, time.time() - 45, delta=2)
+
+
+class TestClientRevalidation(unittest.TestCase):
+    """Test background refreshes in JiraClient and AsyncJiraClient."""
+
+    def setUp(self):
+        self.clock = FakeClock(1_000_000.0)
+
+    def _sync_client(self):
+        client = JiraClient("https://test.jira.com")
+        client.session = Mock()
+        client.issue_cache = IssueCache(max_bytes=10_000, ttl=60, clock=self.clock, revalidate_ttl=30)
+        return client
+
+    def test_fresh_04_sync_client_serves_then_refreshes_once(self):
+        """FRESH-04: Recently expired issues return at once while a single background refresh runs."""
+        client = self._sync_client()
+        client.session.get.return_value = json_response(_issue(1))
+        client.get_issue("EPIC-1", fields="summary")
+        self.clock.now += 70
+
+        release = threading.Event()
+
+        def slow_refresh(url, params=None, **kwargs):
+            release.wait(5)
+            return json_response(_issue(2))
+        client.session.get.side_effect = slow_refresh
+
+        with deadline_scope(0.5):
+            first = client.get_issue("EPIC-1", fields="summary")
+            second = client.get_issue("EPIC-1", fields="summary")
+        release.set()
+        client._revalidator.shutdown(wait=True)
+
+        self.assertEqual((first, second), (_issue(1), _issue(1)))
+        self.assertEqual(client.session.get.call_count, 2)  # Initial fetch plus one refresh
+        self.assertEqual(client.get_issue("EPIC-1", fields="summary"), _issue(2))
+        self.assertEqual(client.session.get.call_count, 2)
+
+    def test_fresh_05_past_window_and_fresh_reads_block(self):
+        """FRESH-05: Entries past the revalidate window, and fresh-consistency reads, wait for JIRA."""
+        client = self._sync_client()
+        client.session.get.side_effect = [json_response(_issue(version)) for version in (1, 2, 3)]
+        client.get_issue("EPIC-1")
+
+        with read_scope("fresh"):
+            self.assertEqual(client.get_issue("EPIC-1"), _issue(2))
+        self.assertEqual(client.get_issue("EPIC-1"), _issue(2))  # The fresh read refreshed the cache
+
+        self.clock.now += 100
+        self.assertEqual(client.get_issue("EPIC-1"), _issue(3))
+        self.assertIsNone(client._revalidator)
+
+    def test_fresh_06_async_client_refreshes_outside_the_deadline(self):
+        """FRESH-06: The async refresh runs as a task that does not inherit the tool call's deadline."""
+        with patch("jira_extractor.async_client.httpx.AsyncClient"):
+            client = AsyncJiraClient("https://test.jira.com")
+        client.issue_cache = IssueCache(max_bytes=10_000, ttl=60, clock=self.clock, revalidate_ttl=30)
+        budgets = []
+
+        async def request(url, params=None, resource_name=None):
+            budgets.append(time_remaining())
+            return _issue(len(budgets))
+        client._make_api_request = AsyncMock(side_effect=request)
+
+        async def run():
+            await client.get_issue("EPIC-1")
+            self.clock.now += 70
+            with deadline_scope(30):
+                served = await client.get_issue("EPIC-1")
+            await asyncio.gather(*client._revalidating.values())
+            return served, await client.get_issue("EPIC-1")
+
+        served, refreshed = asyncio.run(run())
+
+        self.assertEqual((served, refreshed), (_issue(1), _issue(2)))
+        self.assertEqual(budgets, [None, None])
+
+
+class TestSearchPageRevalidation(unittest.TestCase):
+    """Test stale-while-revalidate for search_issues pages."""
+
+    def setUp(self):
+        self.client = Mock()
+        self.client.base_url = "https://test.jira.com"
+        self.client.api_base = "https://test.jira.com/rest/api/2/"
+        self.versions = iter(range(1, 10))
+        self.client._search.side_effect = lambda *args, **kwargs: {
+            "total": 1, "issues": [{"key": "EPIC-1", "fields": {"summary": f"v{next(self.versions)}"}}]}
+        self.tools = JiraTools(self.client)
+        self.clock = FakeClock(1_000_000.0)
+        self.tools._clock = self.clock
+
+    def _summary(self):
+        return asyncio.run(self.tools.search_issues("project = EPIC")).issues[0].summary
+
+    def test_fresh_07_expired_page_served_while_refreshed(self):
+        """FRESH-07: A page past its TTL is returned once more and replaced by a background search."""
+        self.assertEqual(self._summary(), "v1")
+        self.clock.now += SEARCH_PAGE_CACHE_TTL + 1
+
+        async def serve_then_refresh():
+            page = await self.tools.search_issues("project = EPIC")
+            await asyncio.gather(*self.tools._refreshing.values())
+            return page.issues[0].summary
+
+        self.assertEqual(asyncio.run(serve_then_refresh()), "v1")
+        self.assertEqual(self._summary(), "v2")
+        self.assertEqual(self.client._search.call_count, 2)
+
+    def test_fresh_08_past_window_and_fresh_reads_search_again(self):
+        """FRESH-08: Pages past the revalidate window, and fresh-consistency calls, run the search inline."""
+        self.assertEqual(self._summary(), "v1")
+        with read_scope("fresh"):
+            self.assertEqual(self._summary(), "v2")
+
+        self.clock.now += SEARCH_PAGE_CACHE_TTL + SEARCH_PAGE_REVALIDATE_TTL
+        self.assertEqual(self._summary(), "v3")
+        self.assertEqual(self.tools._refreshing, {})
+
+
+class TestToolConsistency(unittest.TestCase):
+    """Test the consistency argument and as_of stamp of registered tools."""
+
+    @patch("mcp_jira_server.server.FastMCP")
+    def test_fresh_09_tools_accept_consistency_and_stamp_as_of(self, mock_fastmcp):
+        """FRESH-09: Tools pass consistency to the read scope and report the age of what they served."""
+        registered = {}
+
+        def tool(name, **kwargs):
+            def register(func):
+                registered[name] = func
+                return func
+            return register
+        mock_fastmcp.return_value.tool.side_effect = tool
+        fetched_at = 1_700_000_000.0
+        seen = []
+
+        async def get_issue(key, expand=None):
+            seen.append(fresh_required())
+            observe(fetched_at)
+            return IssueDetails(key=key, summary="s", status="Open", raw={})
+
+        links = [IssueLink(issue_key="EPIC-2", link_type="Blocks", direction="outward", relationship="blocks")]
+        with patch("mcp_jira_server.server.JiraClient"), \
+                patch.object(JiraTools, "get_issue", side_effect=get_issue), \
+                patch.object(JiraTools, "get_linked_issues", return_value=links):
+            create_server(url="https://test.jira.com")
+            cached = asyncio.run(registered["get_issue"]("EPIC-1"))
+            asyncio.run(registered["get_issue"]("EPIC-1", consistency="fresh"))
+            linked = asyncio.run(registered["get_linked_issues"]("EPIC-1"))
+            with self.assertRaises(ValueError):
+                asyncio.run(registered["get_issue"]("EPIC-1", consistency="eventual"))
+
+        self.assertEqual(cached.as_of, "2023-11-14T22:13:20+00:00")
+        self.assertEqual(seen, [False, True])
+        self.assertIsNotNone(linked[0].as_of)
+        self.assertIsNone(links[0].as_of)  # Stamped copies; the tool's own objects are untouched
+        self.assertIn("consistency", registered["get_descendants"].__signature__.parameters)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -31,13 +31,13 @@ class TestIntegration(unittest.TestCase):
         """INTEGRATION-02: Search tool integration with JiraClient."""
         mock_client = Mock()
         mock_client.api_base = "https://test.jira.com/rest/api/2"
-        mock_client._make_api_request.return_value = {"issues": []}
+        mock_client._search.return_value = {"issues": []}
         mock_client_class.return_value = mock_client
         
         tools = JiraTools(mock_client)
         asyncio.run(tools.search_issues("test query"))
         
-        mock_client._make_api_request.assert_called_once()
+        mock_client._search.assert_called_once()
 
     def test_integration_03_get_issue_tool_integration_with_jira_client(self):
         """INTEGRATION-03: Get issue tool integration with JiraClient."""
@@ -60,7 +60,7 @@ class TestIntegration(unittest.TestCase):
         """INTEGRATION-04: Tool error handling for authentication failures."""
         mock_client = Mock()
         mock_client.api_base = "https://test.jira.com/rest/api/2"
-        mock_client._make_api_request.side_effect = Exception("401 Unauthorized")
+        mock_client._search.side_effect = Exception("401 Unauthorized")
         
         tools = JiraTools(mock_client)
         
@@ -85,7 +85,7 @@ class TestIntegration(unittest.TestCase):
         """INTEGRATION-06: Tool error handling for API errors."""
         mock_client = Mock()
         mock_client.api_base = "https://test.jira.com/rest/api/2"
-        mock_client._make_api_request.side_effect = Exception("500 Internal Server Error")
+        mock_client._search.side_effect = Exception("500 Internal Server Error")
         
         tools = JiraTools(mock_client)
         
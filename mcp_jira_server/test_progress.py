@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Unit tests for MCP JIRA Server progress notifications
+
+This test module provides coverage for the progress reporter that streams
+MCP progress notifications from long-running traversal tools.
+
+Test IDs: PROGRESS-01 through PROGRESS-07
+"""
+
+import unittest
+from unittest.mock import Mock, AsyncMock
+import asyncio
+import re
+import threading
+
+# Import modules under test
+from mcp_jira_server.progress import ProgressReporter, describe_traversal
+from mcp_jira_server.server import JiraTools, create_server
+from jira_extractor.client import JiraClient
+from jira_extractor.traversal import DescendantTraversal
+from mcp_jira_server.testutils import json_response
+
+
+def _context(progress_token="token-1"):
+    """Build a mock FastMCP context whose request carries a progress token."""
+    ctx = Mock()
+    ctx.request_context.meta.progressToken = progress_token
+    ctx.report_progress = AsyncMock()
+    return ctx
+
+
+def _sent(ctx):
+    """Return the (progress, total, message) tuples sent through *ctx*."""
+    return [call.args for call in ctx.report_progress.await_args_list]
+
+
+class TestProgress(unittest.TestCase):
+    """Test progress reporting for traversal tools."""
+
+    def _run_with_reporter(self, ctx, work):
+        """Run *work(reporter)* inside an event loop and flush the reporter."""
+        async def run():
+            reporter = ProgressReporter(ctx)
+            result = await work(reporter)
+            await reporter.flush()
+            return result
+        return asyncio.run(run())
+
+    def test_progress_01_reports_in_order_from_worker_threads(self):
+        """PROGRESS-01: Updates from worker threads reach the client in order."""
+        ctx = _context()
+
+        async def work(reporter):
+            def produce():
+                for i in range(5):
+                    reporter(i, 5, f"step {i}")
+            thread = threading.Thread(target=produce)
+            thread.start()
+            await asyncio.get_running_loop().run_in_executor(None, thread.join)
+
+        self._run_with_reporter(ctx, work)
+
+        self.assertEqual(_sent(ctx), [(i, 5, f"step {i}") for i in range(5)])
+
+    def test_progress_02_silent_without_progress_token(self):
+        """PROGRESS-02: Nothing is sent when the client did not ask for progress."""
+        ctx = _context(progress_token=None)
+
+        async def work(reporter):
+            reporter(1, 2, "ignored")
+
+        self._run_with_reporter(ctx, work)
+        ctx.report_progress.assert_not_awaited()
+
+        # A reporter without a context is a no-op as well
+        self._run_with_reporter(None, work)
+
+    def test_progress_03_traversal_snapshot_and_message(self):
+        """PROGRESS-03: Traversal snapshots estimate remaining time from the fetch rate."""
+        traversal = DescendantTraversal("ROOT-1")
+        traversal.schedule([f"SUB-{i}" for i in range(10)], 1)
+
+        snapshot = traversal.progress(fetched=5, in_progress=0, in_flight=2, elapsed=1.0, budget=4)
+
+        self.assertEqual(snapshot["frontier"], 11)
+        self.assertEqual(snapshot["pending"], 4)
+        self.assertEqual(snapshot["eta_seconds"], 0.8)
+        self.assertEqual(describe_traversal(snapshot),
+                         "Fetched 5 issues, 11 queued, 2 requests in flight, ETA 1s")
+        self.assertIsNone(traversal.progress(0, 1, 1, 0.5)["eta_seconds"])
+
+    def test_progress_04_get_descendants_streams_traversal_progress(self):
+        """PROGRESS-04: get_descendants reports each batch and level of the traversal."""
+        client = JiraClient("https://test.jira.com")
+        client.session = Mock()
+        subtasks_of = {"ROOT-1": ["SUB-1", "SUB-2"], "SUB-1": ["SUB-3"]}
+
+        def get(url, params=None, **kwargs):
+            requested = re.findall(r'"([^"]+)"', params["jql"])
+            response = json_response({"issues": [{
+                "key": key,
+                "fields": {"subtasks": [{"key": child} for child in subtasks_of.get(key, [])]}
+            } for key in requested]})
+            return response
+        client.session.get.side_effect = get
+
+        ctx = _context()
+        tools = JiraTools(client)
+        result = self._run_with_reporter(
+            ctx, lambda reporter: tools.get_descendants("ROOT-1", max_depth=-1, progress=reporter)
+        )
+
+        sent = _sent(ctx)
+        self.assertTrue(result.complete)
+        self.assertGreaterEqual(len(sent), 3)
+        self.assertEqual([progress for progress, _, _ in sent], sorted(progress for progress, _, _ in sent))
+        self.assertEqual(sent[-1][0], 4)
+        self.assertEqual(sent[-1][1], 4)
+        self.assertIn("requests in flight", sent[-1][2])
+
+    def test_progress_05_get_children_reports_pages(self):
+        """PROGRESS-05: get_children reports subtasks and each page of parent-link children."""
+        mock_client = Mock()
+        mock_client.base_url = "https://test.jira.com"
+        mock_client.get_issue.return_value = {"key": "EPIC-1", "fields": {"subtasks": [
+            {"key": "SUB-1", "fields": {"summary": "Sub", "status": {"name": "Open"}}}
+        ]}}
+
+        def child_issues(issue_key, parent_link_field, on_page=None):
+            on_page(1000, 1500)
+            on_page(1500, 1500)
+            return [{"key": "STORY-1", "fields": {"summary": "Story", "status": {"name": "Open"}}}]
+        mock_client.get_parent_link_child_issues.side_effect = child_issues
+
+        ctx = _context()
+        tools = JiraTools(mock_client)
+        self._run_with_reporter(ctx, lambda reporter: tools.get_children("EPIC-1", progress=reporter))
+
+        self.assertEqual(_sent(ctx), [
+            (1, None, "Found 1 subtasks of EPIC-1"),
+            (1001, 1501, "Fetched 1000 of 1500 parent-link children of EPIC-1"),
+            (1501, 1501, "Fetched 1500 of 1500 parent-link children of EPIC-1"),
+        ])
+
+    def test_progress_06_get_ancestors_reports_each_ancestor(self):
+        """PROGRESS-06: get_ancestors reports each ancestor as it is found."""
+        mock_client = Mock()
+        mock_client.base_url = "https://test.jira.com"
+        chain = {"TASK-1": "STORY-1", "STORY-1": "EPIC-1"}
+        mock_client.get_issue.side_effect = lambda key, expand=None, fields=None: {
+            "key": key, "fields": {"summary": key, "status": {"name": "Open"},
+                                   "parent": {"key": chain[key]} if key in chain else None}
+        }
+        mock_client.get_field_by_name.return_value = None
+        tools = JiraTools(mock_client)
+
+        ctx = _context()
+        self._run_with_reporter(ctx, lambda reporter: tools.get_ancestors("TASK-1", progress=reporter))
+
+        self.assertEqual(_sent(ctx), [
+            (1, 5, "Found ancestor STORY-1 at depth 0"),
+            (2, 5, "Found ancestor EPIC-1 at depth 1"),
+        ])
+
+    def test_progress_07_context_is_hidden_from_tool_schema(self):
+        """PROGRESS-07: Traversal tools accept a FastMCP context without exposing it as an argument."""
+        mcp = create_server(url="https://test.jira.com")
+
+        tools = {tool.name: tool for tool in asyncio.run(mcp.list_tools())}
+
+        for name in ("get_children", "get_ancestors", "get_descendants"):
+            self.assertNotIn("ctx", tools[name].inputSchema["properties"])
+            self.assertIn("issue_key", tools[name].inputSchema["properties"])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Unit tests for field projection planning
+
+This test module provides coverage for merging field declarations into a
+minimal ``fields=`` projection, serving narrower requests from wider cached
+projections, and the projections requested by the relationship tools.
+
+Test IDs: PROJ-01 through PROJ-08
+"""
+
+import unittest
+from unittest.mock import Mock
+import asyncio
+
+# Import modules under test
+from jira_extractor.cache import IssueCache
+from jira_extractor.client import JiraClient
+from jira_extractor.fields import FieldIndex
+from jira_extractor.projection import covers, field_set, plan_fields
+from mcp_jira_server.server import JiraTools
+from mcp_jira_server.testutils import json_response
+
+
+class TestProjectionPlanning(unittest.TestCase):
+    """Test projection merging and coverage."""
+
+    def test_proj_01_plan_fields_merges_declarations(self):
+        """PROJ-01: Declarations merge into one sorted projection without duplicates."""
+        self.assertEqual(plan_fields("parent,project", ["issuetype", "parent"], None, {"customfield_100"}),
+                         "customfield_100,issuetype,parent,project")
+        self.assertEqual(plan_fields(), "")
+        self.assertEqual(field_set(" summary , ,status"), frozenset({"summary", "status"}))
+
+    def test_proj_02_covers_supersets_only(self):
+        """PROJ-02: A cached projection covers subsets of itself and requests with fewer expands."""
+        self.assertTrue(covers("summary,status,parent", "parent,summary"))
+        self.assertFalse(covers("summary", "summary,status"))
+        self.assertTrue(covers("", "summary"))  # No projection means all fields
+        self.assertTrue(covers("*all", "summary"))
+        self.assertFalse(covers("summary", ""))
+        self.assertFalse(covers("*navigable", "summary"))
+        self.assertTrue(covers("summary", "summary", "changelog,renderedFields", "changelog"))
+        self.assertFalse(covers("summary", "summary", "", "changelog"))
+
+
+class TestCacheSupersetReuse(unittest.TestCase):
+    """Test answering requests from wider cached projections."""
+
+    def setUp(self):
+        """Set up a client with a mocked HTTP session."""
+        self.client = JiraClient("https://test.jira.com")
+        self.client.session = Mock()
+
+    def test_proj_03_lookup_prefers_exact_then_superset(self):
+        """PROJ-03: lookup serves an exact entry first, then any fresh covering projection."""
+        cache = IssueCache(max_bytes=10_000, ttl=60)
+        cache.put(IssueCache.make_key("EPIC-1", "parent,summary,status"), {"wide": True})
+        cache.put(IssueCache.make_key("EPIC-1", "summary"), {"exact": True})
+
+        self.assertEqual(cache.lookup("EPIC-1", "summary"), {"exact": True})
+        self.assertEqual(cache.lookup("EPIC-1", "status,parent"), {"wide": True})
+        self.assertIsNone(cache.lookup("EPIC-1", "description"))
+        self.assertIsNone(cache.lookup("EPIC-2", "summary"))
+
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["superset_hits"], stats["misses"]), (2, 1, 2))
+        self.assertEqual(cache.invalidate("EPIC-1"), 2)
+        self.assertIsNone(cache.lookup("EPIC-1", "summary"))
+
+    def test_proj_04_get_issue_reuses_wider_cached_projection(self):
+        """PROJ-04: A narrower get_issue after a wider one is served without a request."""
+        self.client.session.get.return_value = json_response(
+            {"key": "EPIC-1", "fields": {"summary": "Epic", "parent": None, "status": {"name": "Open"}}}
+        )
+
+        self.client.get_issue("EPIC-1", fields="summary,status,parent")
+        issue = self.client.get_issue("EPIC-1", fields="summary")
+        self.client.get_issue("EPIC-1", fields=["parent", "status"])
+
+        self.assertEqual(issue["fields"]["summary"], "Epic")
+        self.assertEqual(self.client.session.get.call_count, 1)
+
+        self.client.get_issue("EPIC-1", fields="summary", expand="changelog")
+        self.assertEqual(self.client.session.get.call_count, 2)
+
+
+class TestToolProjections(unittest.TestCase):
+    """Test the projections requested by JiraTools methods."""
+
+    def setUp(self):
+        """Set up tools over a mocked client."""
+        self.mock_client = Mock()
+        self.mock_client.base_url = "https://test.jira.com"
+        self.mock_client.api_base = "https://test.jira.com/rest/api/2/"
+        self.mock_client.get_field_by_name.return_value = None
+        self.mock_client.get_remote_links.return_value = []
+        self.mock_client.get_parent_link_child_issues.return_value = []
+        self.mock_client.get_issue.return_value = {"key": "EPIC-1", "fields": {}}
+        self.mock_client.field_index.return_value = FieldIndex([])
+        self.tools = JiraTools(self.mock_client)
+
+    def _requested_fields(self):
+        return [call[1].get("fields") for call in self.mock_client.get_issue.call_args_list]
+
+    def test_proj_05_relationship_tools_request_only_fields_they_read(self):
+        """PROJ-05: Relationship, children and link tools project their issue fetch."""
+        asyncio.run(self.tools.get_issue_relationships("EPIC-1"))
+        asyncio.run(self.tools.get_children("EPIC-1"))
+        asyncio.run(self.tools.get_linked_issues("EPIC-1"))
+
+        self.assertEqual(self._requested_fields(), ["parent,subtasks,issuelinks", "subtasks", "issuelinks"])
+
+    def test_proj_06_get_issue_tool_still_returns_every_field(self):
+        """PROJ-06: The get_issue tool returns the raw issue, so it is not projected."""
+        asyncio.run(self.tools.get_issue("EPIC-1"))
+        self.assertEqual(self._requested_fields(), [None])
+
+    def test_proj_07_get_parent_projects_discovered_parent_fields(self):
+        """PROJ-07: get_parent requests parent, project and the parent-link field ID."""
+        self.mock_client.get_field_by_name.return_value = {"id": "customfield_100"}
+        self.mock_client.get_issue.return_value = {"key": "TASK-1", "fields": {"parent": {"key": "STORY-1"}}}
+
+        asyncio.run(self.tools.get_parent("TASK-1"))
+        asyncio.run(self.tools.get_parent("TASK-1", include_parent_links=False))
+
+        self.assertEqual(self._requested_fields(), ["customfield_100,parent,project", "parent,project"])
+
+    def test_proj_08_discovered_parent_fields_need_one_fetch(self):
+        """PROJ-08: Parent fields found in /field are projected on the first fetch of any project."""
+        self.mock_client.field_index.return_value = FieldIndex([
+            {"id": "customfield_200", "name": "Epic Link", "schema": {"custom": "com.pyxis.greenhopper.jira:gh-epic-link"}}
+        ])
+        self.mock_client.get_issue.return_value = {"fields": {"project": {"key": "TEST"}, "customfield_200": None}}
+
+        asyncio.run(self.tools.get_parent("TEST-1"))
+        asyncio.run(self.tools.get_parent("OTHER-1"))
+
+        self.assertEqual(self._requested_fields(), ["customfield_200,parent,project"] * 2)
+        self.mock_client._make_api_request.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Unit tests for rate-limit-aware retries
+
+This test module provides coverage for the retry policy, the shared token
+bucket, and retrying in JiraClient and AsyncJiraClient.
+
+Test IDs: RETRY-01 through RETRY-10
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+import asyncio
+
+import httpx
+
+# Import modules under test
+from jira_extractor.retry import RetryPolicy, TokenBucket, _seconds_until
+from jira_extractor.client import JiraClient
+from jira_extractor.async_client import AsyncJiraClient
+from mcp_jira_server.server import create_server
+from mcp_jira_server.testutils import FakeClock, json_response
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """Test backoff computation, header parsing and the token bucket."""
+
+    def test_retry_01_backoff_is_capped_exponential_with_jitter(self):
+        """RETRY-01: Backoff doubles per attempt, is scaled by jitter and capped."""
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=lambda: 1.0)
+        delays = [policy.backoff(503, attempt, {}) for attempt in range(5)]
+        self.assertEqual(delays, [1.0, 2.0, 4.0, 5.0, 5.0])
+
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=lambda: 0.25)
+        self.assertEqual(policy.backoff(503, 2, {}), 1.0)
+
+    def test_retry_02_retry_after_overrides_backoff(self):
+        """RETRY-02: Retry-After (seconds or HTTP date) wins, capped by max_delay."""
+        policy = RetryPolicy(base_delay=1.0, max_delay=10.0, jitter=lambda: 1.0)
+        self.assertEqual(policy.backoff(503, 0, {"Retry-After": "7"}), 7.0)
+        self.assertEqual(policy.backoff(503, 0, {"Retry-After": "120"}), 10.0)
+
+        now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        http_date = format_datetime(now + timedelta(seconds=4), usegmt=True)
+        self.assertEqual(_seconds_until(http_date, now), 4.0)
+        self.assertEqual(_seconds_until("2024-01-01T00:00:09Z", now), 9.0)
+        self.assertIsNone(_seconds_until("soon", now))
+
+    def test_retry_03_retries_only_transient_statuses_up_to_limit(self):
+        """RETRY-03: Only 429/502/503/504 are retried, at most max_retries times."""
+        policy = RetryPolicy(max_retries=2)
+        self.assertTrue(policy.should_retry(429, 0))
+        self.assertTrue(policy.should_retry(503, 1))
+        self.assertFalse(policy.should_retry(503, 2))
+        self.assertFalse(policy.should_retry(500, 0))
+        self.assertFalse(policy.should_retry(404, 0))
+        self.assertEqual(policy.stats()["exhausted"], 1)
+
+    def test_retry_04_token_bucket_adopts_advertised_rate(self):
+        """RETRY-04: X-RateLimit headers configure the bucket, which spaces out requests."""
+        clock = FakeClock()
+        bucket = TokenBucket(clock=clock)
+        self.assertEqual(bucket.reserve(), 0.0)  # Unlimited until a rate is advertised
+
+        bucket.update_from_headers({
+            "X-RateLimit-Limit": "2",
+            "X-RateLimit-FillRate": "10",
+            "X-RateLimit-Interval-Seconds": "5",
+        })
+        self.assertEqual(bucket.rate, 2.0)
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0.0, 0.0, 0.5])
+
+        clock.now = 1.0
+        self.assertEqual(bucket.reserve(), 0.0)
+
+    def test_retry_05_exhausted_quota_and_429_pause_every_caller(self):
+        """RETRY-05: Remaining=0 pauses until reset; a 429 pauses for its backoff."""
+        clock = FakeClock()
+        bucket = TokenBucket(clock=clock)
+        bucket.update_from_headers({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3"})
+        self.assertEqual(bucket.reserve(), 3.0)
+
+        policy = RetryPolicy(bucket=TokenBucket(clock=clock))
+        policy.backoff(429, 0, {"Retry-After": "6"})
+        self.assertEqual(policy.before_request(), 6.0)
+        self.assertEqual(policy.before_request(), 6.0)
+
+        stats = policy.stats()
+        self.assertEqual(stats["throttled"], 2)
+        self.assertEqual(stats["throttle_sleep_seconds"], 12.0)
+
+    def test_retry_06_malformed_headers_are_ignored(self):
+        """RETRY-06: Mock or garbage headers leave the bucket unlimited."""
+        bucket = TokenBucket()
+        bucket.update_from_headers(Mock())
+        bucket.update_from_headers({"X-RateLimit-FillRate": "many", "X-RateLimit-Interval-Seconds": "1"})
+        self.assertIsNone(bucket.rate)
+        self.assertEqual(bucket.reserve(), 0.0)
+
+
+class TestClientRetries(unittest.TestCase):
+    """Test retrying in the sync and async clients."""
+
+    @patch("jira_extractor.client.time.sleep")
+    def test_retry_07_jira_client_retries_then_succeeds(self, mock_sleep):
+        """RETRY-07: JiraClient sleeps through 429/503 responses and records metrics."""
+        client = JiraClient("https://test.jira.com")
+        client.session = Mock()
+        client.session.get.side_effect = [
+            json_response({"key": "EPIC-1"}, 429, {"Retry-After": "2"}),
+            json_response({"key": "EPIC-1"}, 503),
+            json_response({"key": "EPIC-1"}, 200),
+        ]
+        client.retry_policy = RetryPolicy(base_delay=1.0, jitter=lambda: 0.5, bucket=TokenBucket(clock=FakeClock()))
+
+        issue = client.get_issue("EPIC-1")
+
+        self.assertEqual(issue["key"], "EPIC-1")
+        self.assertEqual(client.session.get.call_count, 3)
+        # Retry-After, the bucket paused by the 429, jittered backoff for attempt 1, the pause again
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [2.0, 2.0, 1.0, 2.0])
+        stats = client.retry_policy.stats()
+        self.assertEqual(stats["retries"], 2)
+        self.assertEqual(stats["retries_by_status"], {429: 1, 503: 1})
+        self.assertEqual(stats["retry_sleep_seconds"], 3.0)
+
+    @patch("jira_extractor.client.time.sleep")
+    def test_retry_08_jira_client_gives_up_after_max_retries(self, mock_sleep):
+        """RETRY-08: The last error response is raised once retries are exhausted."""
+        client = JiraClient("https://test.jira.com")
+        client.session = Mock()
+        failure = json_response({"key": "EPIC-1"}, 503)
+        failure.raise_for_status.side_effect = Exception("503 Service Unavailable")
+        client.session.get.return_value = failure
+        client.retry_policy = RetryPolicy(max_retries=2, jitter=lambda: 0.0)
+
+        with self.assertRaisesRegex(Exception, "503"):
+            client.get_issue("EPIC-1")
+
+        self.assertEqual(client.session.get.call_count, 3)
+        self.assertEqual(client.retry_policy.stats()["exhausted"], 1)
+
+    def test_retry_09_async_client_retries(self):
+        """RETRY-09: AsyncJiraClient retries with asyncio.sleep and honors Retry-After."""
+        statuses = iter([429, 200])
+        sleeps = []
+
+        async def handler(request):
+            status = next(statuses)
+            if status == 429:
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            return httpx.Response(200, json={"key": "EPIC-1"})
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        async def run():
+            client = AsyncJiraClient("https://test.jira.com")
+            client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            with patch("jira_extractor.async_client.asyncio.sleep", fake_sleep):
+                issue = await client.get_issue("EPIC-1")
+            stats = client.retry_policy.stats()
+            await client.aclose()
+            return issue, stats
+
+        issue, stats = asyncio.run(run())
+
+        self.assertEqual(issue["key"], "EPIC-1")
+        self.assertEqual(sleeps, [0.0])
+        self.assertEqual(stats["retries_by_status"], {429: 1})
+
+    @patch("mcp_jira_server.server.FastMCP")
+    def test_retry_10_create_server_configures_retry_policy(self, mock_fastmcp):
+        """RETRY-10: create_server configures the client retry policy from settings."""
+        with patch("mcp_jira_server.server.JiraClient") as mock_client:
+            create_server(url="https://test.jira.com", max_retries=5, retry_max_delay=2.5)
+
+        policy = mock_client.return_value.retry_policy
+        self.assertEqual(policy.max_retries, 5)
+        self.assertEqual(policy.max_delay, 2.5)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Unit tests for search_issues cursor pagination
+
+This test module provides coverage for opaque search cursors, paging through
+large result sets with search_issues, page caching, and skipping issues that
+shifted onto the next page between calls.
+
+Test IDs: CURSOR-01 through CURSOR-06
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+import asyncio
+
+# Import modules under test
+from mcp_jira_server.cursor import SearchCursor, query_hash
+from mcp_jira_server.server import JiraTools, SearchResults, create_server
+
+
+class TestSearchCursor(unittest.TestCase):
+    """Test cursor encoding."""
+
+    def test_cursor_01_round_trips_and_rejects_garbage(self):
+        """CURSOR-01: Cursors round-trip and malformed or foreign-version cursors are rejected."""
+        cursor = SearchCursor(query_hash("project = A"), 200, 100, 2000, "A-200")
+        restored = SearchCursor.from_token(cursor.to_token())
+
+        self.assertEqual((restored.query, restored.start_at, restored.page_size, restored.total, restored.last_key),
+                         (query_hash("project = A"), 200, 100, 2000, "A-200"))
+        for bad in ("not a cursor", "e30=", "eyJ2Ijo5OX0="):  # junk, {}, {"v":99}
+            with self.assertRaises(ValueError):
+                SearchCursor.from_token(bad)
+
+
+class TestSearchIssuesPaging(unittest.TestCase):
+    """Test paging through search_issues."""
+
+    def setUp(self):
+        """Serve a 2,000-issue result set from a mocked client."""
+        self.matches = [f"BIG-{i}" for i in range(2000)]
+        self.mock_client = Mock()
+        self.mock_client.base_url = "https://test.jira.com"
+        self.mock_client.api_base = "https://test.jira.com/rest/api/2/"
+
+        def search(jql, fields=None, start_at=0, max_results=50, resource_name=None, paths=None):
+            start, size = start_at, max_results
+            return {
+                "total": len(self.matches),
+                "issues": [{"key": key, "fields": {"summary": key, "status": {"name": "Open"}}}
+                           for key in self.matches[start:start + size]],
+            }
+        self.mock_client._search.side_effect = search
+        self.tools = JiraTools(self.mock_client)
+
+    def _search(self, cursor=None, query="project = BIG"):
+        return asyncio.run(self.tools.search_issues(query, max_results=100, cursor=cursor))
+
+    def test_cursor_02_exploring_2000_issues_costs_20_fetches(self):
+        """CURSOR-02: Following cursors through 2,000 issues costs exactly 20 page fetches."""
+        keys, cursor, pages = [], None, 0
+        while True:
+            page = self._search(cursor)
+            pages += 1
+            self.assertEqual(page.total, 2000)
+            keys.extend(issue.key for issue in page.issues)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        self.assertEqual(pages, 20)
+        self.assertEqual(keys, self.matches)
+        self.assertEqual(self.mock_client._search.call_count, 20)
+
+    def test_cursor_03_cursor_must_match_query(self):
+        """CURSOR-03: A cursor is only accepted with the query that produced it."""
+        cursor = self._search().next_cursor
+        with self.assertRaisesRegex(ValueError, "does not belong"):
+            self._search(cursor, query="project = OTHER")
+
+    def test_cursor_04_revisited_pages_are_served_from_cache(self):
+        """CURSOR-04: Replaying a cursor returns the cached page without reaching JIRA."""
+        cursor = self._search().next_cursor
+        second = self._search(cursor)
+        again = self._search(cursor)
+
+        self.assertEqual(again.issues, second.issues)
+        self.assertEqual(again.start_at, 100)
+        self.assertEqual(self.mock_client._search.call_count, 2)
+
+    def test_cursor_05_skips_issues_shifted_onto_the_next_page(self):
+        """CURSOR-05: Issues pushed forward by new matches are not returned twice."""
+        first = self._search()
+        self.matches.insert(0, "BIG-NEW")  # A new match sorts ahead of everything already seen
+
+        second = self._search(first.next_cursor)
+
+        self.assertEqual(first.issues[-1].key, "BIG-99")
+        self.assertEqual(second.issues[0].key, "BIG-100")
+        self.assertEqual(len(second.issues), 99)
+        self.assertEqual(second.total, 2001)
+
+    @patch("mcp_jira_server.server.FastMCP")
+    def test_cursor_06_tool_accepts_cursor(self, mock_fastmcp):
+        """CURSOR-06: The registered search_issues tool passes the cursor through."""
+        registered = {}
+
+        def tool(name, **kwargs):
+            def register(func):
+                registered[name] = func
+                return func
+            return register
+        mock_fastmcp.return_value.tool.side_effect = tool
+
+        page = SearchResults(issues=[], total=0)
+        with patch("mcp_jira_server.server.JiraClient"), \
+                patch.object(JiraTools, "search_issues", return_value=page) as search:
+            create_server(url="https://test.jira.com")
+            result = asyncio.run(registered["search_issues"]("project = BIG", 50, "cursor-token"))
+
+        self.assertEqual(result.model_copy(update={"as_of": None}), page)  # Stamped copy of the page
+        self.assertIsNotNone(result.as_of)
+        search.assert_called_once_with("project = BIG", 50, "cursor-token")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
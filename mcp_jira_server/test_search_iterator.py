@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""Unit tests for the paginated search iterator
+
+This test module provides coverage for JiraClient.iter_search and
+AsyncJiraClient.iter_search: page offsets under JIRA's page cap, concurrent
+prefetch of later pages, progress reporting, early termination, and keyset
+pagination by issue id.
+
+Test IDs: SEARCH-01 through SEARCH-11
+"""
+
+import unittest
+from unittest.mock import Mock
+import asyncio
+import re
+import threading
+import time
+
+import httpx
+
+# Import modules under test
+from jira_extractor.client import JiraClient, _keyset_jql, _strip_order_by
+from jira_extractor.async_client import AsyncJiraClient
+from mcp_jira_server.testutils import json_response
+
+ISSUES = [{"key": f"ISSUE-{i}", "fields": {}} for i in range(2500)]
+
+KEYED_ISSUES = [{"id": str(10000 + i), "key": f"ISSUE-{i}", "fields": {"summary": f"Issue {i}"}}
+                for i in range(2500)]
+
+
+def _page(params, issues=ISSUES, cap=1000):
+    start, size = int(params["startAt"]), min(int(params["maxResults"]), cap)
+    return {"startAt": start, "maxResults": size, "total": len(issues), "issues": issues[start:start + size]}
+
+
+def _keyset_page(params, issues, cap=1000):
+    """Answer a keyset query: issues with id above the `id >` bound, in id order."""
+    bound = re.search(r"id > (\d+)", params["jql"])
+    after = int(bound.group(1)) if bound else -1
+    matches = sorted((issue for issue in issues if int(issue["id"]) > after), key=lambda issue: int(issue["id"]))
+    size = min(int(params["maxResults"]), cap)
+    return {"startAt": 0, "maxResults": size, "total": len(matches), "issues": matches[:size]}
+
+
+class TestSyncSearchIterator(unittest.TestCase):
+    """Test JiraClient.iter_search."""
+
+    def setUp(self):
+        """Set up a client whose session serves ISSUES in capped pages."""
+        self.client = JiraClient("https://test.jira.com")
+        self.client.session = Mock()
+        self.starts = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+        self.delay = 0.0
+
+        def get(url, params=None, **kwargs):
+            with self.lock:
+                self.starts.append(params["startAt"])
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            time.sleep(self.delay)
+            with self.lock:
+                self.active -= 1
+            return json_response(_page(params, cap=self.cap))
+        self.cap = 1000
+        self.client.session.get.side_effect = get
+
+    def test_search_01_walks_capped_pages_in_order(self):
+        """SEARCH-01: Offsets follow the page size JIRA actually returns and order is kept."""
+        self.cap = 300
+
+        keys = [issue["key"] for issue in self.client.iter_search("project = ISSUE", page_size=1000)]
+
+        self.assertEqual(keys, [issue["key"] for issue in ISSUES])
+        self.assertEqual(sorted(self.starts), list(range(0, 2500, 300)))
+
+    def test_search_02_prefetches_pages_in_parallel(self):
+        """SEARCH-02: After the first page, later pages are fetched concurrently up to the limit."""
+        self.cap = 100
+        self.delay = 0.02
+
+        issues = list(self.client.iter_search("project = ISSUE", page_size=100, concurrency=4))
+
+        self.assertEqual(len(issues), 2500)
+        self.assertGreater(self.peak, 1)
+        self.assertLessEqual(self.peak, 4)
+
+    def test_search_03_reports_progress_per_page(self):
+        """SEARCH-03: on_page receives running fetched counts against the total."""
+        progress = []
+        list(self.client.iter_search("project = ISSUE", on_page=lambda done, total: progress.append((done, total))))
+        self.assertEqual(progress, [(1000, 2500), (2000, 2500), (2500, 2500)])
+
+    def test_search_04_closing_early_stops_fetching(self):
+        """SEARCH-04: Abandoning the iterator cancels pages that have not started."""
+        self.cap = 100
+        self.delay = 0.01
+        iterator = self.client.iter_search("project = ISSUE", page_size=100, concurrency=2)
+
+        first = [next(iterator) for _ in range(150)]
+        iterator.close()
+        time.sleep(0.05)
+
+        self.assertEqual(first[-1]["key"], "ISSUE-149")
+        self.assertLessEqual(len(self.starts), 5)  # First page plus at most two prefetch windows
+
+    def test_search_05_stops_when_results_shrink(self):
+        """SEARCH-05: An empty page before the expected total ends the iteration."""
+        def get(url, params=None, **kwargs):
+            page = _page(params)
+            if params["startAt"] >= 1000:
+                page["issues"] = []
+            return json_response(page)
+        self.client.session.get.side_effect = get
+
+        self.assertEqual(len(list(self.client.iter_search("project = ISSUE", concurrency=1))), 1000)
+        self.assertEqual(self.client.session.get.call_count, 2)
+
+    def test_search_08_keyset_query_building(self):
+        """SEARCH-08: Keyset queries drop the caller's ORDER BY and add an id bound."""
+        self.assertEqual(_strip_order_by('project = A ORDER BY created DESC'), 'project = A')
+        self.assertEqual(_strip_order_by('summary ~ "order by" order by key'), 'summary ~ "order by"')
+        self.assertEqual(_keyset_jql('project = A'), '(project = A) ORDER BY id ASC')
+        self.assertEqual(_keyset_jql('project = A OR project = B', 10042),
+                         '(project = A OR project = B) AND id > 10042 ORDER BY id ASC')
+        self.assertEqual(_keyset_jql('', 7), 'id > 7 ORDER BY id ASC')
+
+    def test_search_09_keyset_walks_by_id_without_offsets(self):
+        """SEARCH-09: Keyset mode pages with id predicates at startAt 0 and keeps ids in projections."""
+        requests_seen = []
+
+        def get(url, params=None, **kwargs):
+            requests_seen.append(dict(params))
+            return json_response(_keyset_page(params, KEYED_ISSUES, cap=1000))
+        self.client.session.get.side_effect = get
+        progress = []
+
+        issues = list(self.client.iter_search("project = ISSUE ORDER BY rank", keyset=True, paths=["issues[].key"],
+                                              on_page=lambda done, total: progress.append((done, total))))
+
+        self.assertEqual([issue["key"] for issue in issues], [issue["key"] for issue in KEYED_ISSUES])
+        self.assertEqual([params["jql"] for params in requests_seen], [
+            "(project = ISSUE) ORDER BY id ASC",
+            "(project = ISSUE) AND id > 10999 ORDER BY id ASC",
+            "(project = ISSUE) AND id > 11999 ORDER BY id ASC",
+        ])
+        self.assertTrue(all(params["startAt"] == 0 for params in requests_seen))
+        self.assertEqual(progress, [(1000, 2500), (2000, 2500), (2500, 2500)])
+
+    def test_search_10_keyset_is_stable_while_results_change(self):
+        """SEARCH-10: Issues created mid-walk never shift keyset pages into duplicates."""
+        issues = [dict(issue) for issue in KEYED_ISSUES[:300]]
+
+        def get(url, params=None, **kwargs):
+            page = _keyset_page(params, issues, cap=100)
+            # Each request sees a new issue created ahead of everything in offset order
+            issues.insert(0, {"id": str(20000 + len(issues)), "key": f"NEW-{len(issues)}", "fields": {}})
+            return json_response(page)
+        self.client.session.get.side_effect = get
+
+        keys = [issue["key"] for issue in self.client.iter_search("project = ISSUE", page_size=100, keyset=True)]
+
+        self.assertEqual(len(keys), len(set(keys)))
+        self.assertEqual(keys[:300], [issue["key"] for issue in KEYED_ISSUES[:300]])
+
+
+class TestAsyncSearchIterator(unittest.TestCase):
+    """Test AsyncJiraClient.iter_search."""
+
+    def _run(self, consume, delay=0.0, cap=100):
+        starts = []
+        state = {"active": 0, "peak": 0}
+
+        async def handler(request):
+            starts.append(int(request.url.params["startAt"]))
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(delay)
+            state["active"] -= 1
+            return httpx.Response(200, json=_page(request.url.params, cap=cap))
+
+        async def run():
+            client = AsyncJiraClient("https://test.jira.com")
+            client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            result = await consume(client)
+            await client.aclose()
+            return result
+
+        return asyncio.run(run()), starts, state["peak"]
+
+    def test_search_06_async_iterator_prefetches_in_order(self):
+        """SEARCH-06: The async iterator yields in order while fetching pages concurrently."""
+        async def consume(client):
+            iterator = client.iter_search("project = ISSUE", page_size=100, concurrency=3)
+            return [issue["key"] async for issue in iterator]
+
+        keys, starts, peak = self._run(consume, delay=0.01)
+
+        self.assertEqual(keys, [issue["key"] for issue in ISSUES])
+        self.assertEqual(sorted(starts), list(range(0, 2500, 100)))
+        self.assertEqual(peak, 3)
+
+    def test_search_07_async_iterator_cancels_on_close(self):
+        """SEARCH-07: Closing the async iterator early cancels outstanding page fetches."""
+        async def consume(client):
+            iterator = client.iter_search("project = ISSUE", page_size=100, concurrency=2)
+            keys = []
+            async for issue in iterator:
+                keys.append(issue["key"])
+                if len(keys) == 150:
+                    break
+            await iterator.aclose()
+            return keys
+
+        keys, starts, _ = self._run(consume, delay=0.01)
+
+        self.assertEqual(keys[-1], "ISSUE-149")
+        self.assertLessEqual(len(starts), 4)
+
+    def test_search_11_async_keyset_iteration(self):
+        """SEARCH-11: AsyncJiraClient.iter_search supports keyset pagination."""
+        jqls = []
+
+        async def handler(request):
+            jqls.append(request.url.params["jql"])
+            return httpx.Response(200, json=_keyset_page(request.url.params, KEYED_ISSUES, cap=1000))
+
+        async def run():
+            client = AsyncJiraClient("https://test.jira.com")
+            client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            issues = await client._search_all("project = ISSUE", keyset=True)
+            await client.aclose()
+            return issues
+
+        issues = asyncio.run(run())
+
+        self.assertEqual(len(issues), 2500)
+        self.assertEqual(jqls[-1], "(project = ISSUE) AND id > 11999 ORDER BY id ASC")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Unit tests for single-flight request coalescing
+
+This test module provides coverage for coalescing concurrent identical JIRA
+GET requests in JiraClient and AsyncJiraClient.
+
+Test IDs: FLIGHT-01 through FLIGHT-07
+"""
+
+import unittest
+from unittest.mock import Mock
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import threading
+import time
+
+import httpx
+
+# Import modules under test
+from jira_extractor.singleflight import SingleFlight, AsyncSingleFlight, request_key
+from jira_extractor.client import JiraClient
+from jira_extractor.async_client import AsyncJiraClient
+from mcp_jira_server.testutils import json_response
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Test single-flight coalescing and metrics."""
+
+    def _run_concurrently(self, flight, key, func, callers):
+        """Call flight.do from *callers* threads released at the same moment."""
+        barrier = threading.Barrier(callers)
+
+        def call():
+            barrier.wait()
+            return flight.do(key, func)
+
+        with ThreadPoolExecutor(max_workers=callers) as executor:
+            futures = [executor.submit(call) for _ in range(callers)]
+        return futures
+
+    def test_flight_01_concurrent_calls_share_one_execution(self):
+        """FLIGHT-01: Concurrent identical calls run once and share the result."""
+        flight = SingleFlight()
+        executions = []
+
+        def slow():
+            executions.append(1)
+            time.sleep(0.1)
+            return {"key": "EPIC-1"}
+
+        futures = self._run_concurrently(flight, "k", slow, callers=5)
+
+        self.assertEqual(len(executions), 1)
+        self.assertEqual([f.result() for f in futures], [{"key": "EPIC-1"}] * 5)
+        stats = flight.stats()
+        self.assertEqual(stats["calls"], 1)
+        self.assertEqual(stats["shared"], 4)
+        self.assertEqual(stats["max_waiters"], 4)
+        self.assertEqual(stats["in_flight"], 0)
+
+    def test_flight_02_errors_reach_every_waiter(self):
+        """FLIGHT-02: An exception from the shared call is raised in every caller."""
+        flight = SingleFlight()
+
+        def fail():
+            time.sleep(0.1)
+            raise ConnectionError("JIRA unreachable")
+
+        futures = self._run_concurrently(flight, "k", fail, callers=3)
+
+        for future in futures:
+            self.assertIsInstance(future.exception(), ConnectionError)
+        # The failure is not remembered
+        self.assertEqual(flight.do("k", lambda: "ok"), "ok")
+
+    def test_flight_03_sequential_and_distinct_calls_are_not_coalesced(self):
+        """FLIGHT-03: Only concurrent calls with the same key are coalesced."""
+        flight = SingleFlight()
+        calls = []
+
+        flight.do("a", lambda: calls.append("a"))
+        flight.do("a", lambda: calls.append("a"))
+        flight.do("b", lambda: calls.append("b"))
+
+        self.assertEqual(calls, ["a", "a", "b"])
+        self.assertEqual(flight.stats()["shared"], 0)
+
+    def test_flight_04_request_key_ignores_parameter_order(self):
+        """FLIGHT-04: Request keys depend on URL and parameter values, not their order."""
+        self.assertEqual(request_key("u", {"a": 1, "b": "x"}), request_key("u", {"b": "x", "a": "1"}))
+        self.assertNotEqual(request_key("u", {"a": 1}), request_key("u", {"a": 2}))
+        self.assertNotEqual(request_key("u", None, True), request_key("u", None, False))
+
+    def test_flight_05_jira_client_coalesces_concurrent_gets(self):
+        """FLIGHT-05: Parallel identical JiraClient requests hit JIRA once."""
+        client = JiraClient("https://test.jira.com")
+        client.session = Mock()
+
+        def get(url, params=None, **kwargs):
+            time.sleep(0.1)
+            return json_response([{"id": "link-1"}])
+        client.session.get.side_effect = get
+
+        barrier = threading.Barrier(4)
+
+        def call():
+            barrier.wait()
+            return client.get_remote_links("EPIC-1")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(call) for _ in range(4)]
+
+        self.assertEqual(client.session.get.call_count, 1)
+        self.assertEqual([f.result() for f in futures], [[{"id": "link-1"}]] * 4)
+
+    def test_flight_06_async_client_coalesces_concurrent_gets(self):
+        """FLIGHT-06: Parallel identical AsyncJiraClient requests hit JIRA once."""
+        requests_seen = []
+
+        async def handler(request):
+            requests_seen.append(request.url.path)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json=[{"id": "link-1"}])
+
+        async def run():
+            client = AsyncJiraClient("https://test.jira.com")
+            client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            results = await asyncio.gather(*(client.get_remote_links("EPIC-1") for _ in range(4)))
+            stats = client.single_flight.stats()
+            await client.aclose()
+            return results, stats
+
+        results, stats = asyncio.run(run())
+
+        self.assertEqual(len(requests_seen), 1)
+        self.assertEqual(results, [[{"id": "link-1"}]] * 4)
+        self.assertEqual(stats["shared"], 3)
+
+    def test_flight_07_async_errors_reach_every_waiter(self):
+        """FLIGHT-07: An async failure is raised in every coalesced caller."""
+        flight = AsyncSingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ConnectionError("JIRA unreachable")
+
+        async def run():
+            return await asyncio.gather(*(flight.do("k", fail) for _ in range(3)), return_exceptions=True)
+
+        results = asyncio.run(run())
+
+        self.assertTrue(all(isinstance(result, ConnectionError) for result in results))
+        self.assertEqual(flight.stats()["calls"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""Unit tests for the persistent SQLite cache store
+
+This test module provides coverage for PersistentStore, the on-disk tier of
+IssueCache, persisted field metadata in the clients, and the search page
+cache of JiraTools surviving a server restart.
+
+Test IDs: STORE-01 through STORE-12
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+import asyncio
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+# Import modules under test
+from jira_extractor.cache import IssueCache
+from jira_extractor.client import JiraClient
+from jira_extractor.store import PersistentStore
+from mcp_jira_server.server import JiraTools, create_server
+from mcp_jira_server.testutils import FakeClock, json_response
+
+
+class StoreTestCase(unittest.TestCase):
+    """Provide a fresh database path per test."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "cache", "jira.sqlite")
+        self.stores = []
+
+    def tearDown(self):
+        for store in self.stores:
+            store.close()
+        self._tmp.cleanup()
+
+    def open_store(self, **kwargs):
+        """Open a store on the shared path, as a restarted or second process would."""
+        store = PersistentStore(self.path, **kwargs)
+        self.stores.append(store)
+        return store
+
+
+class TestPersistentStore(StoreTestCase):
+    """Test the SQLite store itself."""
+
+    def test_store_01_round_trips_entries_with_timestamps(self):
+        """STORE-01: Entries keep their value, stored-at time and updated value; old entries read as missing."""
+        clock = FakeClock(1_000_000.0)
+        store = self.open_store(clock=clock)
+        store.put("issue", "EPIC-1", {"key": "EPIC-1"}, item="EPIC-1", updated="2024-05-01T10:00:00.000+0000")
+
+        clock.now += 30
+        entry = store.get("issue", "EPIC-1", max_age=60)
+
+        self.assertEqual(entry.value, {"key": "EPIC-1"})
+        self.assertEqual(entry.stored_at, 1_000_000.0)
+        self.assertEqual(entry.updated, "2024-05-01T10:00:00.000+0000")
+        self.assertIsNone(store.get("issue", "EPIC-1", max_age=10))
+        self.assertIsNone(store.get("issue", "EPIC-2"))
+        mode = sqlite3.connect(self.path).execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    def test_store_02_prunes_old_entries_on_open(self):
+        """STORE-02: Opening the store deletes entries older than max_age."""
+        clock = FakeClock(1_000_000.0)
+        first = self.open_store(clock=clock)
+        first.put("field", "old", [1])
+        clock.now += 100
+        first.put("field", "new", [2])
+
+        self.open_store(clock=clock, max_age=50)
+
+        self.assertIsNone(first.get("field", "old"))
+        self.assertEqual(first.get("field", "new").value, [2])
+
+    def test_store_03_processes_share_one_file(self):
+        """STORE-03: Separate store instances read each other's writes and write concurrently."""
+        stores = [self.open_store() for _ in range(4)]
+        errors = []
+
+        def write(index, store):
+            try:
+                for i in range(50):
+                    store.put("issue", f"W{index}-{i}", {"i": i}, item=f"W{index}")
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(i, store)) for i, store in enumerate(stores)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(self.open_store().stats()["entries"], {"issue": 200})
+        self.assertEqual(len(stores[0].get_item("issue", "W3")), 50)
+        self.assertEqual(sum(store.stats()["errors"] for store in stores), 0)
+
+    def test_store_04_broken_database_degrades_to_misses(self):
+        """STORE-04: A store whose table is gone answers misses instead of raising."""
+        store = self.open_store()
+        sqlite3.connect(self.path).execute("DROP TABLE entries")
+
+        with self.assertLogs(level="WARNING"):
+            self.assertIsNone(store.get("issue", "EPIC-1"))
+        store.put("issue", "EPIC-1", {})
+
+        self.assertEqual(store.stats()["errors"], 3)
+
+
+class TestIssueCacheRestart(StoreTestCase):
+    """Test IssueCache with a persistent second tier."""
+
+    def test_store_05_restarted_cache_starts_warm(self):
+        """STORE-05: A new IssueCache answers exact and narrower requests from disk and promotes them."""
+        before = IssueCache(max_bytes=10_000, ttl=300, store=self.open_store())
+        before.put(IssueCache.make_key("EPIC-1", "parent,summary"), {"key": "EPIC-1", "fields": {"summary": "Epic"}})
+
+        after = IssueCache(max_bytes=10_000, ttl=300, store=self.open_store())
+
+        self.assertEqual(after.lookup("EPIC-1", "summary")["fields"]["summary"], "Epic")
+        self.assertEqual(after.lookup("EPIC-1", "parent,summary")["key"], "EPIC-1")
+        self.assertIsNone(after.lookup("EPIC-1", "description"))
+        stats = after.stats()
+        self.assertEqual((stats["hits"], stats["persistent_hits"], stats["entries"]), (2, 1, 1))
+
+    def test_store_06_expired_disk_entries_only_serve_stale_reads(self):
+        """STORE-06: Entries older than the TTL are not fresh after a restart but still back get_stale."""
+        clock = FakeClock(1_000_000.0)
+        key = IssueCache.make_key("EPIC-1", "summary")
+        IssueCache(max_bytes=10_000, ttl=60, stale_ttl=600, store=self.open_store(clock=clock)).put(key, {"v": 1})
+        clock.now += 120
+
+        after = IssueCache(max_bytes=10_000, ttl=60, stale_ttl=600, store=self.open_store(clock=clock))
+
+        self.assertIsNone(after.lookup("EPIC-1", "summary"))
+        self.assertEqual(after.get_stale(key), {"v": 1})
+        clock.now += 600
+        self.assertIsNone(after.get_stale(key))
+
+    def test_store_07_invalidate_removes_disk_entries(self):
+        """STORE-07: Invalidating an issue also drops its persisted projections."""
+        store = self.open_store()
+        cache = IssueCache(max_bytes=10_000, ttl=300, store=store)
+        cache.put(IssueCache.make_key("EPIC-1", "summary"), {"v": 1})
+        cache.put(IssueCache.make_key("EPIC-1", "status"), {"v": 2})
+
+        cache.invalidate("EPIC-1")
+
+        self.assertEqual(store.get_item("issue", "EPIC-1"), [])
+
+    def test_store_11_disk_reads_do_not_hold_the_cache_lock(self):
+        """STORE-11: Memory hits proceed while another lookup waits on disk, and a newer memory copy wins."""
+        store = self.open_store()
+        IssueCache(max_bytes=10_000, ttl=300, store=store).put(IssueCache.make_key("EPIC-2"), {"v": "disk"})
+        cache = IssueCache(max_bytes=10_000, ttl=300, store=store)
+        cache.put(IssueCache.make_key("EPIC-1"), {"v": "memory"})
+
+        reading, release = threading.Event(), threading.Event()
+        get_item = store.get_item
+
+        def slow_get_item(*args, **kwargs):
+            reading.set()
+            release.wait(5)
+            return get_item(*args, **kwargs)
+        results = []
+        with patch.object(store, "get_item", side_effect=slow_get_item):
+            worker = threading.Thread(target=lambda: results.append(cache.lookup("EPIC-2")))
+            worker.start()
+            self.assertTrue(reading.wait(5))
+            self.assertEqual(cache.lookup("EPIC-1"), {"v": "memory"})  # Would deadlock under the lock
+            cache.put(IssueCache.make_key("EPIC-2"), {"v": "newer"})
+            release.set()
+            worker.join(5)
+
+        self.assertEqual(results, [{"v": "newer"}])
+        self.assertEqual(cache.stats()["persistent_hits"], 0)
+
+
+class TestRestartedServer(StoreTestCase):
+    """Test client and tool caches surviving a restart."""
+
+    def test_store_08_field_metadata_survives_restart(self):
+        """STORE-08: A restarted client finds field IDs without requesting /field again."""
+        fields = [{"id": "customfield_100", "name": "Parent Link"}]
+        first = JiraClient("https://test.jira.com")
+        first.session = Mock()
+        first.session.get.return_value = json_response(fields)
+        first.store = self.open_store()
+        self.assertEqual(first.get_field_by_name("Parent Link")["id"], "customfield_100")
+
+        second = JiraClient("https://test.jira.com")
+        second.session = Mock()
+        second.store = self.open_store()
+
+        self.assertEqual(second.get_field_by_name("Parent Link")["id"], "customfield_100")
+        second.session.get.assert_not_called()
+
+    def test_store_09_tool_caches_survive_restart(self):
+        """STORE-09: Search pages are reused by a new JiraTools."""
+        def tools():
+            client = Mock()
+            client.base_url = "https://test.jira.com"
+            client.api_base = "https://test.jira.com/rest/api/2/"
+            client._search.return_value = {
+                "total": 1, "issues": [{"key": "EPIC-1", "fields": {"summary": "Epic", "status": {"name": "Open"}}}]}
+            return client, JiraTools(client, store=self.open_store())
+
+        client, first = tools()
+        asyncio.run(first.search_issues("project = EPIC"))
+
+        client, second = tools()
+        page = asyncio.run(second.search_issues("project = EPIC"))
+
+        self.assertEqual([issue.key for issue in page.issues], ["EPIC-1"])
+        client._search.assert_not_called()
+
+    @patch("mcp_jira_server.server.FastMCP")
+    def test_store_10_create_server_opens_configured_store(self, mock_fastmcp):
+        """STORE-10: create_server shares one store between the client and the tools."""
+        with patch("mcp_jira_server.server.JiraClient") as client_class, \
+                patch("mcp_jira_server.server.JiraTools") as tools_class:
+            create_server(url="https://test.jira.com", cache_path=self.path)
+
+        client = client_class.return_value
+        self.assertIsInstance(client.store, PersistentStore)
+        self.assertIs(client.issue_cache.store, client.store)
+        self.assertIs(tools_class.call_args[1]["store"], client.store)
+        self.stores.append(client.store)
+
+    def test_store_12_slow_store_does_not_block_the_event_loop(self):
+        """STORE-12: Search page reads and writes wait on the store off the loop, so other tasks keep running."""
+        client = Mock()
+        client.base_url = "https://test.jira.com"
+        client._search.return_value = {"total": 0, "issues": []}
+        store = self.open_store()
+        tools = JiraTools(client, store=store)
+
+        def slow(func):
+            def call(*args, **kwargs):
+                time.sleep(0.2)
+                return func(*args, **kwargs)
+            return call
+
+        async def run():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+            task = asyncio.create_task(ticker())
+            await tools.search_issues("project = EPIC")
+            task.cancel()
+            return ticks
+
+        with patch.object(store, "get", side_effect=slow(store.get)), \
+                patch.object(store, "put", side_effect=slow(store.put)):
+            ticks = asyncio.run(run())
+
+        # The read and the write each sleep 0.2s; a blocked loop would not tick at all
+        self.assertGreater(ticks, 10)
+        self.assertIsNotNone(store.get("search_page", "%s:%d:%d" % next(iter(tools._search_pages))))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
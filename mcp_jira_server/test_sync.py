@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""Unit tests for incremental cache freshness
+
+This test module provides coverage for the delta JQL, the polling window,
+invalidating only changed cached issues, remembering the last sync across
+restarts, and running the sync in the background of the server.
+
+Test IDs: SYNC-01 through SYNC-08
+"""
+
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+import asyncio
+import os
+import tempfile
+import threading
+import time
+
+# Import modules under test
+from jira_extractor.cache import IssueCache
+from jira_extractor.client import JiraClient
+from jira_extractor.store import PersistentStore
+from mcp_jira_server.server import IssueSummary, JiraTools, SearchResults, create_server
+from mcp_jira_server.sync import DeltaSync, delta_jql
+from mcp_jira_server.testutils import FakeClock, json_response
+
+
+def _issue(key, updated, **fields):
+    return {"key": key, "fields": dict(fields, updated=updated)}
+
+
+class TestDeltaSync(unittest.TestCase):
+    """Test polling for changed issues."""
+
+    def setUp(self):
+        """Set up a client with a cache and a session answering delta searches."""
+        self.client = JiraClient("https://test.jira.com")
+        self.client.session = Mock()
+        self.client.issue_cache = IssueCache(max_bytes=100_000, ttl=3600, stale_ttl=600)
+        self.changes = []
+        self.client.session.get.side_effect = lambda url, params=None, **kwargs: json_response(
+            {"startAt": params["startAt"], "total": len(self.changes),
+             "issues": self.changes[params["startAt"]:params["startAt"] + 2]})
+        self.tools = JiraTools(self.client)
+        self.clock = FakeClock(1_000_000.0)
+
+    def _sync(self, **kwargs):
+        kwargs.setdefault("clock", self.clock)
+        return DeltaSync(self.client, self.tools._call, 60, **kwargs)
+
+    def test_sync_01_delta_jql(self):
+        """SYNC-01: The delta query is relative to JIRA's clock and optionally scoped to projects."""
+        self.assertEqual(delta_jql(5), 'updated >= "-5m" ORDER BY updated ASC')
+        self.assertEqual(delta_jql(5, ["XYZ", "ABC"]),
+                         'project in ("ABC", "XYZ") AND updated >= "-5m" ORDER BY updated ASC')
+
+    def test_sync_02_window_follows_last_sync(self):
+        """SYNC-02: The first window covers the cache lifetime; later ones reach back to the last sync."""
+        sync = self._sync()
+        self.assertEqual(sync.window_minutes(self.clock.now), 71)  # (3600 + 600 + 60) / 60
+
+        sync.last_sync = self.clock.now - 120
+        self.assertEqual(sync.window_minutes(self.clock.now), 3)
+
+        sync.last_sync = self.clock.now - 86400  # Down for a day: nothing older than the cache matters
+        self.assertEqual(sync.window_minutes(self.clock.now), 71)
+
+    def test_sync_03_invalidates_only_changed_issues(self):
+        """SYNC-03: Cached issues are dropped only when JIRA's updated value differs from the cached one."""
+        cache = self.client.issue_cache
+        cache.put(IssueCache.make_key("SAME-1", "summary,updated"), _issue("SAME-1", "2024-01-01T00:00:00.000+0000"))
+        cache.put(IssueCache.make_key("EDIT-1", "summary,updated"), _issue("EDIT-1", "2024-01-01T00:00:00.000+0000"))
+        cache.put(IssueCache.make_key("BARE-1", "summary"), {"key": "BARE-1", "fields": {"summary": "x"}})
+        self.changes = [
+            _issue("SAME-1", "2024-01-01T00:00:00.000+0000"),
+            _issue("EDIT-1", "2024-02-01T00:00:00.000+0000"),
+            _issue("BARE-1", "2024-02-01T00:00:00.000+0000"),
+            _issue("UNCACHED-1", "2024-02-01T00:00:00.000+0000"),
+        ]
+        changed = []
+
+        invalidated = asyncio.run(self._sync(on_change=changed.extend).poll())
+
+        self.assertEqual(invalidated, ["EDIT-1", "BARE-1"])
+        self.assertEqual(changed, ["SAME-1", "EDIT-1", "BARE-1", "UNCACHED-1"])
+        self.assertIsNotNone(cache.lookup("SAME-1", "summary"))
+        self.assertIsNone(cache.lookup("EDIT-1", "summary"))
+        self.assertEqual(self.client.session.get.call_count, 2)  # One paginated search, not per-issue fetches
+        params = self.client.session.get.call_args_list[0][1]["params"]
+        self.assertEqual(params["fields"], "updated")
+        self.assertIn('updated >= "-71m"', params["jql"])
+
+    def test_sync_04_changes_drop_only_affected_search_pages(self):
+        """SYNC-04: Changed issues drop the search_issues pages listing them, in memory and on disk."""
+        with tempfile.TemporaryDirectory() as directory:
+            store = PersistentStore(os.path.join(directory, "cache.sqlite"))
+            tools = JiraTools(self.client, store=store)
+
+            def page(*keys):
+                return SearchResults(issues=[IssueSummary(key=key, summary="s", status="Open", url="u")
+                                             for key in keys], total=len(keys))
+            for page_key, keys in ((("q", 0, 25), ["EDIT-1", "SAME-1"]), (("r", 0, 25), ["SAME-1"])):
+                tools._search_pages[page_key] = (page(*keys), self.clock.now)
+                store.put("search_page", "%s:%d:%d" % page_key, page(*keys).model_dump())
+            store.put("search_page", "other:0:25", page("EDIT-1").model_dump())  # Another process's page
+            self.changes = [_issue("EDIT-1", "new")]
+
+            asyncio.run(self._sync(on_change=tools.forget_search_pages).poll())
+
+            self.assertEqual(list(tools._search_pages), [("r", 0, 25)])
+            self.assertIsNone(store.get("search_page", "q:0:25"))
+            self.assertIsNotNone(store.get("search_page", "r:0:25"))
+            self.assertIsNotNone(store.get("search_page", "other:0:25"))
+            store.close()
+
+    def test_sync_05_last_sync_survives_restart(self):
+        """SYNC-05: With a persistent store, a restarted sync only asks for changes since the last poll."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.sqlite")
+            first_store = PersistentStore(path, clock=self.clock)
+            asyncio.run(self._sync(store=first_store, projects=["ABC"]).poll())
+            self.clock.now += 300
+
+            second_store = PersistentStore(path, clock=self.clock)
+            restarted = self._sync(store=second_store, projects=["ABC"])
+            other_scope = self._sync(store=second_store, projects=["XYZ"])
+
+            self.assertEqual(restarted.last_sync, 1_000_000.0)
+            self.assertEqual(restarted.window_minutes(self.clock.now), 6)
+            self.assertIsNone(other_scope.last_sync)
+            first_store.close()
+            second_store.close()
+
+    def test_sync_06_background_loop_survives_failures(self):
+        """SYNC-06: Failed polls are retried on the next interval and the loop stops with its context."""
+        sync = DeltaSync(self.client, self.tools._call, 0.01)
+        failures = [ConnectionError("down")]
+
+        def poll():
+            if failures:
+                raise failures.pop()
+            return []
+        sync.poll = AsyncMock(side_effect=poll)
+
+        async def run():
+            async with sync.running():
+                await asyncio.sleep(0.05)
+            calls = sync.poll.await_count
+            await asyncio.sleep(0.03)
+            return calls
+
+        calls = asyncio.run(run())
+
+        self.assertGreaterEqual(calls, 2)
+        self.assertEqual(sync.poll.await_count, calls)
+        self.assertEqual(sync.stats()["failures"], 1)
+
+    @patch("mcp_jira_server.server.FastMCP")
+    def test_sync_07_server_lifespan_runs_sync(self, mock_fastmcp):
+        """SYNC-07: create_server starts delta polling with the server only when an interval is set."""
+        with patch("mcp_jira_server.server.JiraClient"):
+            create_server(url="https://test.jira.com")
+            create_server(url="https://test.jira.com", sync_interval=30, sync_projects=["ABC"])
+        idle, syncing = (call[1]["lifespan"] for call in mock_fastmcp.call_args_list)
+
+        async def enter(lifespan):
+            async with lifespan(None):
+                await asyncio.sleep(0.01)
+
+        with patch.object(DeltaSync, "poll", new_callable=AsyncMock) as poll:
+            asyncio.run(enter(idle))
+            self.assertEqual(poll.await_count, 0)
+            asyncio.run(enter(syncing))
+            self.assertEqual(poll.await_count, 1)
+
+    def test_sync_08_poll_batch_runs_off_the_event_loop(self):
+        """SYNC-08: Invalidation, the watermark write and on_change run in one worker call, off the loop."""
+        self.changes = [_issue(f"EDIT-{i}", "new") for i in range(4)]
+        threads = []
+
+        def slow_on_change(keys):
+            threads.append(threading.current_thread())
+            time.sleep(0.2)
+
+        async def run():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+            task = asyncio.create_task(ticker())
+            await self._sync(on_change=slow_on_change).poll()
+            task.cancel()
+            return ticks
+
+        ticks = asyncio.run(run())
+
+        self.assertGreater(ticks, 10)
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.main_thread())
+        self.assertEqual(self.tools._worker_pool.stats()["submitted"], 2)  # The search and the batch
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
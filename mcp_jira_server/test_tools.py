@@ -6,14 +6,28 @@ functionality including search_issues, get_issue, and identifier_hint.
 """
 
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 import asyncio
+import json
+import re
 
 # Import modules under test  
 from mcp_jira_server.server import (
     JiraTools, IssueSummary, IssueDetails, IssueRelationships, 
-    IssueLink, ParentInfo, AncestorTree
+    IssueLink, ParentInfo, AncestorTree, DescendantTree
 )
+from jira_extractor.client import JiraClient
+from jira_extractor.fields import FieldIndex, FieldRegistry
+from mcp_jira_server.testutils import json_response
+
+EPIC_LINK_TYPE = "com.pyxis.greenhopper.jira:gh-epic-link"
+PARENT_LINK_TYPE = "com.atlassian.jpo:jpo-custom-field-parent"
+
+
+def _field_index(**custom_types):
+    """Build a FieldIndex of custom fields from field ID -> (name, schema.custom type)."""
+    return FieldIndex([{"id": field_id, "name": name, "schema": {"custom": custom_type}}
+                       for field_id, (name, custom_type) in custom_types.items()])
 
 
 class TestTools(unittest.TestCase):
@@ -24,11 +38,12 @@ class TestTools(unittest.TestCase):
         self.mock_client = Mock()
         self.mock_client.base_url = "https://test.jira.com"
         self.mock_client.api_base = "https://test.jira.com/rest/api/2"
+        self.mock_client.field_index.return_value = FieldIndex([])
         self.tools = JiraTools(self.mock_client)
 
     def test_tools_01_search_issues_with_simple_text_query(self):
         """TOOLS-01: Search issues with simple text query."""
-        self.mock_client._make_api_request.return_value = {
+        self.mock_client._search.return_value = {
             "issues": [{
                 "key": "TEST-123",
                 "fields": {
@@ -38,7 +53,7 @@ class TestTools(unittest.TestCase):
             }]
         }
         
-        result = asyncio.run(self.tools.search_issues("simple search"))
+        result = asyncio.run(self.tools.search_issues("simple search")).issues
         
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0].key, "TEST-123")
@@ -47,58 +62,57 @@ class TestTools(unittest.TestCase):
 
     def test_tools_02_search_issues_with_jql_query(self):
         """TOOLS-02: Search issues with JQL query."""
-        self.mock_client._make_api_request.return_value = {"issues": []}
+        self.mock_client._search.return_value = {"issues": []}
         
         asyncio.run(self.tools.search_issues("project = TEST AND status = Open"))
         
-        args, kwargs = self.mock_client._make_api_request.call_args
-        self.assertIn("jql", kwargs["params"])
-        self.assertEqual(kwargs["params"]["jql"], "project = TEST AND status = Open")
+        args, kwargs = self.mock_client._search.call_args
+        self.assertEqual(args[0], "project = TEST AND status = Open")
 
     def test_tools_03_search_issues_with_jql_detection_equals_sign(self):
         """TOOLS-03: Search issues with JQL detection (equals sign)."""
-        self.mock_client._make_api_request.return_value = {"issues": []}
+        self.mock_client._search.return_value = {"issues": []}
         
         asyncio.run(self.tools.search_issues("project = TEST"))
         
-        args, kwargs = self.mock_client._make_api_request.call_args
-        self.assertEqual(kwargs["params"]["jql"], "project = TEST")
+        args, kwargs = self.mock_client._search.call_args
+        self.assertEqual(args[0], "project = TEST")
 
     def test_tools_04_search_issues_with_jql_detection_and_or_operators(self):
         """TOOLS-04: Search issues with JQL detection (AND/OR operators)."""
-        self.mock_client._make_api_request.return_value = {"issues": []}
+        self.mock_client._search.return_value = {"issues": []}
         
         asyncio.run(self.tools.search_issues("status = Open AND assignee = currentUser()"))
         
-        args, kwargs = self.mock_client._make_api_request.call_args
-        self.assertEqual(kwargs["params"]["jql"], "status = Open AND assignee = currentUser()")
+        args, kwargs = self.mock_client._search.call_args
+        self.assertEqual(args[0], "status = Open AND assignee = currentUser()")
 
     def test_tools_05_search_issues_with_max_results_parameter(self):
         """TOOLS-05: Search issues with max results parameter."""
-        self.mock_client._make_api_request.return_value = {"issues": []}
+        self.mock_client._search.return_value = {"issues": []}
         
         asyncio.run(self.tools.search_issues("test", max_results=50))
         
-        args, kwargs = self.mock_client._make_api_request.call_args
-        self.assertEqual(kwargs["params"]["maxResults"], 50)
+        args, kwargs = self.mock_client._search.call_args
+        self.assertEqual(kwargs["max_results"], 50)
 
     def test_tools_06_search_issues_with_max_results_boundary(self):
         """TOOLS-06: Search issues with max results boundary (1-100)."""
-        self.mock_client._make_api_request.return_value = {"issues": []}
+        self.mock_client._search.return_value = {"issues": []}
         
         # Test lower boundary
         asyncio.run(self.tools.search_issues("test", max_results=0))
-        args, kwargs = self.mock_client._make_api_request.call_args
-        self.assertEqual(kwargs["params"]["maxResults"], 1)
+        args, kwargs = self.mock_client._search.call_args
+        self.assertEqual(kwargs["max_results"], 1)
         
         # Test upper boundary
         asyncio.run(self.tools.search_issues("test", max_results=150))
-        args, kwargs = self.mock_client._make_api_request.call_args
-        self.assertEqual(kwargs["params"]["maxResults"], 100)
+        args, kwargs = self.mock_client._search.call_args
+        self.assertEqual(kwargs["max_results"], 100)
 
     def test_tools_07_search_issues_returns_proper_issue_summary_objects(self):
         """TOOLS-07: Search issues returns proper IssueSummary objects."""
-        self.mock_client._make_api_request.return_value = {
+        self.mock_client._search.return_value = {
             "issues": [{
                 "key": "TEST-456",
                 "fields": {
@@ -108,7 +122,7 @@ class TestTools(unittest.TestCase):
             }]
         }
         
-        result = asyncio.run(self.tools.search_issues("test"))
+        result = asyncio.run(self.tools.search_issues("test")).issues
         
         self.assertIsInstance(result[0], IssueSummary)
         self.assertEqual(result[0].url, "https://test.jira.com/browse/TEST-456")
@@ -286,23 +300,20 @@ class TestTools(unittest.TestCase):
 
     def test_tools_18b_get_children_default_behavior(self):
         """TOOLS-18B: Get children with default behavior (includes both subtasks and parent links)."""
-        self.mock_client.get_issue.side_effect = [
-            # First call for getting subtasks
-            {
-                "key": "TEST-PARENT",
-                "fields": {
-                    "subtasks": [
-                        {
-                            "key": "TEST-SUB1",
-                            "fields": {"summary": "Subtask 1", "status": {"name": "Open"}}
-                        }
-                    ]
-                }
-            },
-            # Second call for parent-link child
+        self.mock_client.get_issue.return_value = {
+            "key": "TEST-PARENT",
+            "fields": {
+                "subtasks": [
+                    {
+                        "key": "TEST-SUB1",
+                        "fields": {"summary": "Subtask 1", "status": {"name": "Open"}}
+                    }
+                ]
+            }
+        }
+        self.mock_client.get_parent_link_child_issues.return_value = [
             {"key": "TEST-PCHILD1", "fields": {"summary": "Parent Child 1", "status": {"name": "Open"}}}
         ]
-        self.mock_client.get_parent_link_children.return_value = ["TEST-PCHILD1"]
         
         result = asyncio.run(self.tools.get_children("TEST-PARENT"))
         
@@ -310,18 +321,17 @@ class TestTools(unittest.TestCase):
         self.assertEqual(len(result), 2)
         self.assertEqual(result[0].key, "TEST-SUB1")
         self.assertEqual(result[1].key, "TEST-PCHILD1")
-        self.mock_client.get_parent_link_children.assert_called_once_with("TEST-PARENT", "Parent Link")
+        self.mock_client.get_parent_link_child_issues.assert_called_once_with("TEST-PARENT", "Parent Link", on_page=None)
 
     def test_tools_19_get_children_with_parent_links(self):
         """TOOLS-19: Get children with parent links enabled."""
-        self.mock_client.get_issue.side_effect = [
-            # First call for getting subtasks
-            {"key": "TEST-PARENT", "fields": {"subtasks": []}},
-            # Subsequent calls for parent-link children
-            {"key": "TEST-PCHILD1", "fields": {"summary": "Parent Child 1", "status": {"name": "Open"}}},
-            {"key": "TEST-PCHILD2", "fields": {"summary": "Parent Child 2", "status": {"name": "In Progress"}}}
+        self.mock_client.get_issue.return_value = {"key": "TEST-PARENT", "fields": {"subtasks": []}}
+        self.mock_client.get_parent_link_child_issues.return_value = [
+            {"key": "TEST-PCHILD1", "fields": {"summary": "Parent Child 1", "status": {"name": "Open"},
+                                               "issuetype": {"name": "Epic"}}},
+            {"key": "TEST-PCHILD2", "fields": {"summary": "Parent Child 2", "status": {"name": "In Progress"},
+                                               "issuetype": {"name": "Story"}}}
         ]
-        self.mock_client.get_parent_link_children.return_value = ["TEST-PCHILD1", "TEST-PCHILD2"]
         
         result = asyncio.run(self.tools.get_children(
             "TEST-PARENT", 
@@ -329,22 +339,23 @@ class TestTools(unittest.TestCase):
             parent_link_field="Custom Parent"
         ))
         
-        self.mock_client.get_parent_link_children.assert_called_once_with("TEST-PARENT", "Custom Parent")
+        self.mock_client.get_parent_link_child_issues.assert_called_once_with("TEST-PARENT", "Custom Parent", on_page=None)
         self.assertEqual(len(result), 2)
         self.assertEqual(result[0].key, "TEST-PCHILD1")
+        self.assertEqual(result[0].issue_type, "Epic")
         self.assertEqual(result[1].key, "TEST-PCHILD2")
+        self.assertEqual(result[1].status, "In Progress")
+        # Summaries come straight from the search page - only the parent issue is fetched
+        self.assertEqual(self.mock_client.get_issue.call_count, 1)
 
     def test_tools_20_get_children_handles_parent_link_errors(self):
         """TOOLS-20: Get children handles parent link fetch errors gracefully."""
-        self.mock_client.get_issue.side_effect = [
-            {"key": "TEST-PARENT", "fields": {"subtasks": []}},
-            Exception("Network error")  # Second call fails
-        ]
-        self.mock_client.get_parent_link_children.return_value = ["TEST-FAIL"]
+        self.mock_client.get_issue.return_value = {"key": "TEST-PARENT", "fields": {"subtasks": []}}
+        self.mock_client.get_parent_link_child_issues.side_effect = Exception("Network error")
         
         result = asyncio.run(self.tools.get_children("TEST-PARENT", include_parent_links=True))
         
-        # Should return empty list since subtasks were empty and parent-link child failed
+        # Should return empty list since subtasks were empty and parent-link search failed
         self.assertEqual(len(result), 0)
 
     def test_tools_21_get_linked_issues_all_links(self):
@@ -476,6 +487,7 @@ class TestTools(unittest.TestCase):
                 }
             }
         }
+        self.mock_client.get_field_by_name.return_value = None
         
         result = asyncio.run(self.tools.get_parent("TEST-CHILD"))
         
@@ -526,32 +538,23 @@ class TestTools(unittest.TestCase):
         self.assertEqual(result.parent_summary, "Epic Summary")
         self.assertEqual(result.parent_type, "parent_link(Epic Link)")
 
+    def _serve_chain(self, issues):
+        """Serve get_issue from a key -> fields map; unknown keys fail like JIRA."""
+        self.mock_client.get_field_by_name.return_value = None
+
+        def get_issue(key, expand=None, fields=None):
+            if key not in issues:
+                raise Exception(f"Issue {key} not found.")
+            return {"key": key, "fields": issues[key]}
+
+        self.mock_client.get_issue.side_effect = get_issue
+
     def test_tools_30_get_ancestors_single_level(self):
         """TOOLS-30: Get ancestors with single level hierarchy."""
-        # Mock get_parent calls
-        async def mock_get_parent(issue_key, include_parent_links=True, parent_link_field="Parent Link"):
-            if issue_key == "TEST-CHILD":
-                return ParentInfo(
-                    issue_key="TEST-CHILD",
-                    parent_key="TEST-PARENT", 
-                    parent_summary="Parent Summary",
-                    parent_type="subtask"
-                )
-            else:
-                return ParentInfo(
-                    issue_key="TEST-PARENT",
-                    parent_key=None,
-                    parent_summary=None,
-                    parent_type=None
-                )
-        
-        self.tools.get_parent = mock_get_parent
-        self.mock_client.get_issue.return_value = {
-            "fields": {
-                "summary": "Parent Summary",
-                "status": {"name": "Open"}
-            }
-        }
+        self._serve_chain({
+            "TEST-CHILD": {"parent": {"key": "TEST-PARENT"}},
+            "TEST-PARENT": {"summary": "Parent Summary", "status": {"name": "Open"}},
+        })
         
         result = asyncio.run(self.tools.get_ancestors("TEST-CHILD"))
         
@@ -560,24 +563,18 @@ class TestTools(unittest.TestCase):
         self.assertEqual(result.total_ancestors, 1)
         self.assertEqual(len(result.ancestors), 1)
         self.assertEqual(result.ancestors[0].key, "TEST-PARENT")
+        self.assertEqual(result.ancestors[0].summary, "Parent Summary")
         self.assertEqual(len(result.traversal_order), 1)
+        self.assertEqual(self.mock_client.get_issue.call_count, 2)
 
     def test_tools_31_get_ancestors_multi_level(self):
         """TOOLS-31: Get ancestors with multi-level hierarchy."""
-        # Mock get_parent calls for 3-level hierarchy
-        async def mock_get_parent(issue_key, include_parent_links=True, parent_link_field="Parent Link"):
-            parent_map = {
-                "TEST-CHILD": ParentInfo(issue_key="TEST-CHILD", parent_key="TEST-PARENT", parent_summary="Parent Summary", parent_type="subtask"),
-                "TEST-PARENT": ParentInfo(issue_key="TEST-PARENT", parent_key="TEST-GRANDPARENT", parent_summary="Grandparent Summary", parent_type="subtask"),
-                "TEST-GRANDPARENT": ParentInfo(issue_key="TEST-GRANDPARENT", parent_key=None, parent_summary=None, parent_type=None)
-            }
-            return parent_map.get(issue_key, ParentInfo(issue_key=issue_key, parent_key=None, parent_summary=None, parent_type=None))
-        
-        self.tools.get_parent = mock_get_parent
-        self.mock_client.get_issue.side_effect = [
-            {"fields": {"summary": "Parent Summary", "status": {"name": "Open"}}},
-            {"fields": {"summary": "Grandparent Summary", "status": {"name": "In Progress"}}}
-        ]
+        self._serve_chain({
+            "TEST-CHILD": {"parent": {"key": "TEST-PARENT"}},
+            "TEST-PARENT": {"summary": "Parent Summary", "status": {"name": "Open"},
+                            "parent": {"key": "TEST-GRANDPARENT"}},
+            "TEST-GRANDPARENT": {"summary": "Grandparent Summary", "status": {"name": "In Progress"}},
+        })
         
         result = asyncio.run(self.tools.get_ancestors("TEST-CHILD"))
         
@@ -585,23 +582,20 @@ class TestTools(unittest.TestCase):
         self.assertEqual(len(result.ancestors), 2)
         self.assertEqual(result.ancestors[0].key, "TEST-PARENT")
         self.assertEqual(result.ancestors[1].key, "TEST-GRANDPARENT")
+        self.assertEqual(result.ancestors[1].status, "In Progress")
         self.assertEqual(len(result.traversal_order), 2)
+        # Each issue in the chain is fetched exactly once
+        fetched = [call[0][0] for call in self.mock_client.get_issue.call_args_list]
+        self.assertEqual(fetched, ["TEST-CHILD", "TEST-PARENT", "TEST-GRANDPARENT"])
 
     def test_tools_32_get_ancestors_with_depth_limit(self):
         """TOOLS-32: Get ancestors with depth limit."""
-        # Mock get_parent calls for 3-level hierarchy
-        async def mock_get_parent(issue_key, include_parent_links=True, parent_link_field="Parent Link"):
-            parent_map = {
-                "TEST-CHILD": ParentInfo(issue_key="TEST-CHILD", parent_key="TEST-PARENT", parent_summary="Parent Summary", parent_type="subtask"),
-                "TEST-PARENT": ParentInfo(issue_key="TEST-PARENT", parent_key="TEST-GRANDPARENT", parent_summary="Grandparent Summary", parent_type="subtask"),
-                "TEST-GRANDPARENT": ParentInfo(issue_key="TEST-GRANDPARENT", parent_key=None, parent_summary=None, parent_type=None)
-            }
-            return parent_map.get(issue_key, ParentInfo(issue_key=issue_key, parent_key=None, parent_summary=None, parent_type=None))
-        
-        self.tools.get_parent = mock_get_parent
-        self.mock_client.get_issue.return_value = {
-            "fields": {"summary": "Parent Summary", "status": {"name": "Open"}}
-        }
+        self._serve_chain({
+            "TEST-CHILD": {"parent": {"key": "TEST-PARENT"}},
+            "TEST-PARENT": {"summary": "Parent Summary", "status": {"name": "Open"},
+                            "parent": {"key": "TEST-GRANDPARENT"}},
+            "TEST-GRANDPARENT": {"summary": "Grandparent Summary", "status": {"name": "Open"}},
+        })
         
         # Limit to depth 1
         result = asyncio.run(self.tools.get_ancestors("TEST-CHILD", max_depth=1))
@@ -609,13 +603,11 @@ class TestTools(unittest.TestCase):
         self.assertEqual(result.max_depth, 1)
         self.assertEqual(result.total_ancestors, 1)
         self.assertEqual(result.ancestors[0].key, "TEST-PARENT")
+        self.assertEqual(self.mock_client.get_issue.call_count, 2)
 
     def test_tools_33_get_ancestors_no_ancestors(self):
         """TOOLS-33: Get ancestors for issue with no parents."""
-        async def mock_get_parent(issue_key, include_parent_links=True, parent_link_field="Parent Link"):
-            return ParentInfo(issue_key=issue_key, parent_key=None, parent_summary=None, parent_type=None)
-        
-        self.tools.get_parent = mock_get_parent
+        self._serve_chain({"TEST-ORPHAN": {"summary": "Orphan"}})
         
         result = asyncio.run(self.tools.get_ancestors("TEST-ORPHAN"))
         
@@ -625,15 +617,8 @@ class TestTools(unittest.TestCase):
 
     def test_tools_34_get_ancestors_handles_fetch_errors(self):
         """TOOLS-34: Get ancestors handles parent fetch errors gracefully."""
-        async def mock_get_parent(issue_key, include_parent_links=True, parent_link_field="Parent Link"):
-            if issue_key == "TEST-CHILD":
-                return ParentInfo(issue_key="TEST-CHILD", parent_key="TEST-PARENT", parent_summary="Parent Summary", parent_type="subtask")
-            else:
-                return ParentInfo(issue_key="TEST-PARENT", parent_key=None, parent_summary=None, parent_type=None)
-        
-        self.tools.get_parent = mock_get_parent
-        # Make get_issue raise an exception
-        self.mock_client.get_issue.side_effect = Exception("JIRA API error")
+        # TEST-PARENT is not served, so fetching it raises
+        self._serve_chain({"TEST-CHILD": {"parent": {"key": "TEST-PARENT"}}})
         
         result = asyncio.run(self.tools.get_ancestors("TEST-CHILD"))
         
@@ -644,17 +629,11 @@ class TestTools(unittest.TestCase):
     def test_tools_35_get_ancestors_prevents_cycles(self):
         """TOOLS-35: Get ancestors prevents infinite loops from cycles."""
         # Create a cycle: CHILD -> PARENT -> CHILD
-        async def mock_get_parent(issue_key, include_parent_links=True, parent_link_field="Parent Link"):
-            cycle_map = {
-                "TEST-CHILD": ParentInfo(issue_key="TEST-CHILD", parent_key="TEST-PARENT", parent_summary="Parent Summary", parent_type="subtask"),
-                "TEST-PARENT": ParentInfo(issue_key="TEST-PARENT", parent_key="TEST-CHILD", parent_summary="Child Summary", parent_type="subtask")
-            }
-            return cycle_map.get(issue_key, ParentInfo(issue_key=issue_key, parent_key=None, parent_summary=None, parent_type=None))
-        
-        self.tools.get_parent = mock_get_parent
-        self.mock_client.get_issue.return_value = {
-            "fields": {"summary": "Parent Summary", "status": {"name": "Open"}}
-        }
+        self._serve_chain({
+            "TEST-CHILD": {"parent": {"key": "TEST-PARENT"}},
+            "TEST-PARENT": {"summary": "Parent Summary", "status": {"name": "Open"},
+                            "parent": {"key": "TEST-CHILD"}},
+        })
         
         result = asyncio.run(self.tools.get_ancestors("TEST-CHILD"))
         
@@ -662,87 +641,54 @@ class TestTools(unittest.TestCase):
         self.assertEqual(result.total_ancestors, 1)
         self.assertEqual(result.ancestors[0].key, "TEST-PARENT")
 
-    def test_tools_36_dynamic_field_discovery_via_editmeta_api(self):
-        """TOOLS-36: Dynamic field discovery via editmeta API."""
-        # Mock editmeta response with Epic Link field
-        editmeta_response = {
-            "fields": {
-                "customfield_12311140": {
-                    "name": "Epic Link",
-                    "schema": {"custom": "com.pyxis.greenhopper.jira:gh-epic-link"}
-                },
-                "customfield_12345": {
-                    "name": "Some Other Field", 
-                    "schema": {"custom": "com.example:other"}
-                }
-            }
-        }
-        
-        self.mock_client._make_api_request.return_value = editmeta_response
-        
-        # Test field discovery
-        parent_fields = self.tools._get_parent_fields_for_issue("TEST-123", "TEST", "Story")
-        
-        # Should find the Epic Link field
-        self.assertEqual(parent_fields, ["customfield_12311140"])
-        
-        # Verify API was called correctly  
-        expected_url = "https://test.jira.com/rest/api/issue/TEST-123/editmeta"
-        self.mock_client._make_api_request.assert_called_with(expected_url, resource_name="editmeta")
+    def test_tools_36_parent_field_discovery_from_field_metadata(self):
+        """TOOLS-36: Parent field discovery from /field schema types."""
+        self.mock_client.field_index.return_value = _field_index(
+            customfield_12345=("Some Other Field", "com.example:other"),
+            customfield_12311140=("Epic Link", EPIC_LINK_TYPE),
+        )
 
-    def test_tools_37_ttl_cache_stores_and_retrieves_field_mappings(self):
-        """TOOLS-37: TTL cache stores and retrieves field mappings."""
-        # Mock editmeta response
-        editmeta_response = {
-            "fields": {
-                "customfield_12311140": {
-                    "name": "Epic Link",
-                    "schema": {"custom": "com.pyxis.greenhopper.jira:gh-epic-link"}
-                }
-            }
-        }
-        self.mock_client._make_api_request.return_value = editmeta_response
-        
-        # First call should hit the API
-        result1 = self.tools._get_parent_fields_for_issue("TEST-123", "TEST", "Story")
-        self.assertEqual(result1, ["customfield_12311140"])
-        self.assertEqual(self.mock_client._make_api_request.call_count, 1)
-        
-        # Second call should use cache
-        result2 = self.tools._get_parent_fields_for_issue("TEST-123", "TEST", "Story")
-        self.assertEqual(result2, ["customfield_12311140"])
-        # Should still be 1 call (cached)
-        self.assertEqual(self.mock_client._make_api_request.call_count, 1)
+        plan = asyncio.run(self.tools._parent_field_plan())
 
-    def test_tools_38_ttl_cache_expires_entries_after_configured_timeout(self):
-        """TOOLS-38: TTL cache expires entries after configured timeout."""
-        import time
-        
-        # Create tools with very short TTL (0.1 seconds)
-        short_ttl_tools = JiraTools(self.mock_client, field_cache_ttl=0.1)
-        
-        editmeta_response = {
-            "fields": {
-                "customfield_12311140": {
-                    "name": "Epic Link", 
-                    "schema": {"custom": "com.pyxis.greenhopper.jira:gh-epic-link"}
-                }
-            }
-        }
-        self.mock_client._make_api_request.return_value = editmeta_response
-        
-        # First call
-        result1 = short_ttl_tools._get_parent_fields_for_issue("TEST-123", "TEST", "Story")
-        self.assertEqual(result1, ["customfield_12311140"])
-        self.assertEqual(self.mock_client._make_api_request.call_count, 1)
-        
-        # Wait for cache to expire
-        time.sleep(0.2)
-        
-        # Cache should be expired, API called again
-        result2 = short_ttl_tools._get_parent_fields_for_issue("TEST-123", "TEST", "Story")
-        self.assertEqual(result2, ["customfield_12311140"])
-        self.assertEqual(self.mock_client._make_api_request.call_count, 2)
+        # Should find the Epic Link field for every project, without an editmeta request
+        self.assertEqual(plan.for_project("TEST"), ["customfield_12311140"])
+        self.assertEqual(plan.for_project(None), ["customfield_12311140"])
+        self.mock_client._make_api_request.assert_not_called()
+
+    def test_tools_37_per_project_overrides_replace_discovered_fields(self):
+        """TOOLS-37: Per-project overrides replace the instance-wide parent fields."""
+        self.mock_client.field_index.return_value = _field_index(
+            customfield_12311140=("Epic Link", EPIC_LINK_TYPE),
+            customfield_12313140=("Parent Link", PARENT_LINK_TYPE),
+        )
+        tools = JiraTools(self.mock_client, parent_field_overrides={"RFE": ["Parent Link", "customfield_999"]})
+
+        plan = asyncio.run(tools._parent_field_plan())
+
+        # Names are resolved to IDs; IDs missing from /field are used as given
+        self.assertEqual(plan.for_project("RFE"), ["customfield_12313140", "customfield_999"])
+        self.assertEqual(plan.for_project("OTHER"), ["customfield_12311140", "customfield_12313140"])
+        self.assertEqual(plan.all_fields(), {"customfield_12311140", "customfield_12313140", "customfield_999"})
+
+    def test_tools_38_parent_fields_follow_field_registry_ttl(self):
+        """TOOLS-38: Parent fields are re-read from /field only when the shared field registry expires."""
+        now = [1000.0]
+        client = JiraClient("https://test.jira.com")
+        client.session = Mock()
+        client.fields = FieldRegistry(ttl=60, clock=lambda: now[0])
+        client.session.get.return_value = json_response([{"id": "customfield_12311140", "name": "Epic Link",
+                                                          "schema": {"custom": EPIC_LINK_TYPE}}])
+        tools = JiraTools(client)
+
+        for project in ("TEST", "OTHER", "THIRD"):
+            plan = asyncio.run(tools._parent_field_plan())
+            self.assertEqual(plan.for_project(project), ["customfield_12311140"])
+        self.assertEqual(client.session.get.call_count, 1)
+
+        # Registry expired, /field fetched again
+        now[0] += 60
+        asyncio.run(tools._parent_field_plan())
+        self.assertEqual(client.session.get.call_count, 2)
 
     def test_tools_39_get_parent_uses_discovered_fields_before_fallback(self):
         """TOOLS-39: Get parent uses discovered fields before fallback."""
@@ -755,20 +701,11 @@ class TestTools(unittest.TestCase):
             }
         }
         
-        # Mock editmeta response
-        editmeta_response = {
-            "fields": {
-                "customfield_12311140": {
-                    "name": "Epic Link",
-                    "schema": {"custom": "com.pyxis.greenhopper.jira:gh-epic-link"}
-                }
-            }
-        }
-        
         parent_data = {"fields": {"summary": "Parent Summary"}}
         
         self.mock_client.get_issue.side_effect = [issue_data, parent_data]
-        self.mock_client._make_api_request.return_value = editmeta_response
+        self.mock_client.field_index.return_value = _field_index(customfield_12311140=("Epic Link", EPIC_LINK_TYPE))
+        self.mock_client.get_field_by_name.return_value = None
         
         result = asyncio.run(self.tools.get_parent("TEST-CHILD"))
         
@@ -776,11 +713,12 @@ class TestTools(unittest.TestCase):
         self.assertEqual(result.parent_key, "TEST-PARENT")
         self.assertEqual(result.parent_type, "parent_field(customfield_12311140)")
         
-        # Should NOT call get_field_by_name (fallback)
-        self.mock_client.get_field_by_name.assert_not_called()
+        # The discovered field is part of the first projected fetch
+        fetches = [call[1]["fields"] for call in self.mock_client.get_issue.call_args_list]
+        self.assertEqual(fetches, ["customfield_12311140,parent,project", "summary"])
 
-    def test_tools_40_get_parent_fallback_when_editmeta_fails(self):
-        """TOOLS-40: Get parent fallback when editmeta fails."""
+    def test_tools_40_get_parent_fallback_when_field_metadata_fails(self):
+        """TOOLS-40: Get parent fallback when field metadata is unavailable."""
         # Mock issue data
         issue_data = {
             "fields": {
@@ -792,8 +730,8 @@ class TestTools(unittest.TestCase):
         
         parent_data = {"fields": {"summary": "Parent Summary"}}
         
-        # Make editmeta API fail
-        self.mock_client._make_api_request.side_effect = Exception("API Error")
+        # Make /field fail
+        self.mock_client.field_index.side_effect = Exception("API Error")
         self.mock_client.get_issue.side_effect = [issue_data, parent_data]
         self.mock_client.get_field_by_name.return_value = {"id": "customfield_12345"}
         
@@ -818,28 +756,20 @@ class TestTools(unittest.TestCase):
             }
         }
         
-        # Mock editmeta response with both field types
-        editmeta_response = {
-            "fields": {
-                "customfield_12311140": {
-                    "name": "Epic Link",
-                    "schema": {"custom": "com.pyxis.greenhopper.jira:gh-epic-link"}
-                },
-                "customfield_12313140": {
-                    "name": "Parent Link",
-                    "schema": {"custom": "com.atlassian.jpo:jpo-custom-field-parent"}
-                }
-            }
-        }
+        # /field lists Parent Link first; Epic Link fields are still tried first
+        self.mock_client.field_index.return_value = _field_index(
+            customfield_12313140=("Parent Link", PARENT_LINK_TYPE),
+            customfield_12311140=("Epic Link", EPIC_LINK_TYPE),
+        )
         
         parent_data = {"fields": {"summary": "Epic Summary"}}
         
         self.mock_client.get_issue.side_effect = [issue_data, parent_data]
-        self.mock_client._make_api_request.return_value = editmeta_response
+        self.mock_client.get_field_by_name.return_value = None
         
         result = asyncio.run(self.tools.get_parent("TEST-CHILD"))
         
-        # Should use Epic Link (first discovered) and ignore Parent Link
+        # Should use Epic Link and ignore Parent Link
         self.assertEqual(result.parent_key, "TEST-EPIC")
         self.assertEqual(result.parent_type, "parent_field(customfield_12311140)")
 
@@ -859,101 +789,206 @@ class TestTools(unittest.TestCase):
         
         result = asyncio.run(self.tools.get_parent("TEST-CHILD", parent_link_field="Epic Link"))
         
-        # Should skip dynamic discovery and use fallback
+        # No parent field set, so the named field is used
         self.assertEqual(result.parent_key, "TEST-PARENT")
         self.assertEqual(result.parent_type, "parent_link(Epic Link)")
         
-        # Should not call editmeta API
+        # No request beyond the issue fetches
         self.mock_client._make_api_request.assert_not_called()
 
     def test_tools_43_field_discovery_identifies_epic_link_schema_type(self):
         """TOOLS-43: Field discovery identifies Epic Link schema type."""
-        editmeta_response = {
-            "fields": {
-                "customfield_12311140": {
-                    "name": "Epic Link",
-                    "schema": {"custom": "com.pyxis.greenhopper.jira:gh-epic-link"}
-                },
-                "customfield_99999": {
-                    "name": "Other Field",
-                    "schema": {"custom": "com.example:other-type"}
-                }
-            }
-        }
-        
-        self.mock_client._make_api_request.return_value = editmeta_response
+        self.mock_client.field_index.return_value = _field_index(
+            customfield_12311140=("Epic Link", EPIC_LINK_TYPE),
+            customfield_99999=("Other Field", "com.example:other-type"),
+        )
         
-        result = self.tools._get_parent_fields_for_issue("TEST-123", "TEST", "Story")
+        plan = asyncio.run(self.tools._parent_field_plan())
         
         # Should only find Epic Link field
-        self.assertEqual(result, ["customfield_12311140"])
+        self.assertEqual(plan.for_project("TEST"), ["customfield_12311140"])
 
     def test_tools_44_field_discovery_identifies_parent_link_schema_type(self):
         """TOOLS-44: Field discovery identifies Parent Link schema type."""
-        editmeta_response = {
-            "fields": {
-                "customfield_12313140": {
-                    "name": "Parent Link",
-                    "schema": {"custom": "com.atlassian.jpo:jpo-custom-field-parent"}
-                },
-                "customfield_99999": {
-                    "name": "Other Field",
-                    "schema": {"custom": "com.example:other-type"}
-                }
-            }
-        }
-        
-        self.mock_client._make_api_request.return_value = editmeta_response
+        self.mock_client.field_index.return_value = _field_index(
+            customfield_12313140=("Parent Link", PARENT_LINK_TYPE),
+            customfield_99999=("Other Field", "com.example:other-type"),
+        )
         
-        result = self.tools._get_parent_fields_for_issue("TEST-123", "TEST", "Epic")
+        plan = asyncio.run(self.tools._parent_field_plan())
         
         # Should only find Parent Link field
-        self.assertEqual(result, ["customfield_12313140"])
+        self.assertEqual(plan.for_project("TEST"), ["customfield_12313140"])
 
     def test_tools_45_get_ancestors_with_dynamic_field_discovery(self):
         """TOOLS-45: Get ancestors with dynamic field discovery."""
-        # Mock get_parent calls directly since ancestors just calls get_parent repeatedly
-        async def mock_get_parent(issue_key, include_parent_links=True, parent_link_field="Parent Link"):
-            if issue_key == "TEST-CHILD":
-                return ParentInfo(
-                    issue_key="TEST-CHILD",
-                    parent_key="TEST-PARENT",
-                    parent_summary="Parent Summary",
-                    parent_type="parent_field(customfield_12311140)"
-                )
-            elif issue_key == "TEST-PARENT":
-                return ParentInfo(
-                    issue_key="TEST-PARENT", 
-                    parent_key=None,
-                    parent_summary=None,
-                    parent_type=None
-                )
-            return ParentInfo(issue_key=issue_key, parent_key=None, parent_summary=None, parent_type=None)
-        
-        # Mock the get_issue calls that ancestors uses for creating IssueSummary objects
-        def mock_get_issue(issue_key, expand=None):
-            if issue_key == "TEST-PARENT":
-                return {
-                    "key": "TEST-PARENT",
-                    "fields": {
-                        "summary": "Parent Summary",
-                        "status": {"name": "Open"}
-                    }
-                }
-            return {
-                "key": issue_key,
-                "fields": {"summary": "Default Summary", "status": {"name": "Open"}}
-            }
-        
-        self.mock_client.get_issue.side_effect = mock_get_issue
+        self._serve_chain({
+            "TEST-CHILD": {"project": {"key": "TEST"}, "issuetype": {"name": "Story"},
+                           "customfield_12311140": "TEST-PARENT"},
+            "TEST-PARENT": {"summary": "Parent Summary", "status": {"name": "Open"},
+                            "project": {"key": "TEST"}, "issuetype": {"name": "Story"}},
+        })
+        self.mock_client.field_index.return_value = _field_index(customfield_12311140=("Epic Link", EPIC_LINK_TYPE))
         
-        # Patch get_parent to use our mock
-        with patch.object(self.tools, 'get_parent', side_effect=mock_get_parent):
-            result = asyncio.run(self.tools.get_ancestors("TEST-CHILD"))
+        result = asyncio.run(self.tools.get_ancestors("TEST-CHILD"))
         
         # Should find ancestors using dynamic discovery
         self.assertEqual(result.total_ancestors, 1)
         self.assertEqual(result.ancestors[0].key, "TEST-PARENT")
+        self.assertEqual(result.traversal_order[0]["parent_type"], "parent_field(customfield_12311140)")
+        # The discovered field is part of every fetch's projection
+        for call in self.mock_client.get_issue.call_args_list:
+            self.assertIn("customfield_12311140", call[1]["fields"].split(","))
+
+    def test_tools_50_get_ancestors_fetches_each_issue_once(self):
+        """TOOLS-50: A 5-level parent-link chain costs 6 projected issue fetches."""
+        chain = [f"LEVEL-{i}" for i in range(6)]
+        issues = {}
+        for child, parent in zip(chain, chain[1:] + [None]):
+            issues[child] = {"summary": child, "status": {"name": "Open"},
+                             "project": {"key": "LEVEL"}, "issuetype": {"name": "Feature"},
+                             "customfield_100": parent}
+        self._serve_chain(issues)
+        self.mock_client.get_field_by_name.return_value = {"id": "customfield_100"}
+        self.mock_client.field_index.return_value = _field_index(customfield_100=("Parent Link", PARENT_LINK_TYPE))
+
+        result = asyncio.run(self.tools.get_ancestors("LEVEL-0", max_depth=5))
+
+        self.assertEqual([ancestor.key for ancestor in result.ancestors], chain[1:])
+        self.assertEqual(self.mock_client.get_issue.call_count, 6)
+        for call in self.mock_client.get_issue.call_args_list:
+            self.assertEqual(call[1]["fields"], "customfield_100,issuetype,parent,project,status,summary")
+
+    def _descendant_tools(self, subtasks_of):
+        """Build tools over a JiraClient whose searches serve a subtask hierarchy."""
+        client = JiraClient("https://test.jira.com")
+        client.session = Mock()
+
+        def get(url, params=None, **kwargs):
+            requested = re.findall(r'"([^"]+)"', params["jql"])
+            issues = [{
+                "key": key,
+                "fields": {
+                    "summary": f"Summary {key}",
+                    "status": {"name": "Open"},
+                    "subtasks": [{"key": child} for child in subtasks_of.get(key, [])]
+                }
+            } for key in requested]
+            return json_response({"issues": issues, "total": len(issues)})
+
+        client.session.get.side_effect = get
+        return JiraTools(client), client
+
+    def test_tools_46_get_descendants_complete_traversal(self):
+        """TOOLS-46: get_descendants returns all descendants when within budget."""
+        tools, client = self._descendant_tools({"ROOT-1": ["SUB-1", "SUB-2"], "SUB-1": ["SUB-3"]})
+
+        result = asyncio.run(tools.get_descendants("ROOT-1", max_depth=-1))
+
+        self.assertIsInstance(result, DescendantTree)
+        self.assertTrue(result.complete)
+        self.assertIsNone(result.continuation_token)
+        self.assertEqual(sorted(issue.key for issue in result.descendants), ["SUB-1", "SUB-2", "SUB-3"])
+        self.assertEqual(result.total_descendants, 3)
+        params = client.session.get.call_args[1]["params"]
+        self.assertEqual(params["fields"], "summary,status,issuetype,subtasks,issuelinks")
+
+    def test_tools_47_get_descendants_node_budget_and_continuation(self):
+        """TOOLS-47: Node budget returns partial results that resume from the continuation token."""
+        subtasks_of = {"ROOT-1": [f"SUB-{i}" for i in range(5)]}
+        tools, client = self._descendant_tools(subtasks_of)
+
+        first = asyncio.run(tools.get_descendants("ROOT-1", max_depth=-1, max_nodes=3))
+        self.assertFalse(first.complete)
+        self.assertIsNotNone(first.continuation_token)
+        self.assertEqual(len(first.descendants), 2)
+
+        second = asyncio.run(tools.get_descendants(
+            "ROOT-1", max_nodes=10, continuation_token=first.continuation_token
+        ))
+        self.assertTrue(second.complete)
+        seen = [issue.key for issue in first.descendants + second.descendants]
+        self.assertEqual(sorted(seen), [f"SUB-{i}" for i in range(5)])
+        self.assertEqual(len(seen), len(set(seen)))
+        # The original call's depth survives the round trip through the token
+        self.assertEqual(second.max_depth, -1)
+
+    def test_tools_48_get_descendants_time_budget(self):
+        """TOOLS-48: An exhausted time budget returns a token without fetching."""
+        tools, client = self._descendant_tools({"ROOT-1": ["SUB-1"]})
+
+        result = asyncio.run(tools.get_descendants("ROOT-1", max_seconds=0))
+
+        self.assertFalse(result.complete)
+        self.assertEqual(result.descendants, [])
+        client.session.get.assert_not_called()
+
+        resumed = asyncio.run(tools.get_descendants("ROOT-1", continuation_token=result.continuation_token))
+        self.assertTrue(resumed.complete)
+        self.assertEqual([issue.key for issue in resumed.descendants], ["SUB-1"])
+
+    def test_tools_49_get_descendants_rejects_bad_tokens(self):
+        """TOOLS-49: Malformed or mismatched continuation tokens are rejected."""
+        tools, client = self._descendant_tools({"ROOT-1": ["SUB-1"]})
+        partial = asyncio.run(tools.get_descendants("ROOT-1", max_seconds=0))
+
+        with self.assertRaises(ValueError):
+            asyncio.run(tools.get_descendants("ROOT-1", continuation_token="not-a-token"))
+        with self.assertRaises(ValueError):
+            asyncio.run(tools.get_descendants("OTHER-1", continuation_token=partial.continuation_token))
+        with self.assertRaises(ValueError):
+            asyncio.run(tools.get_descendants("ROOT-1", max_nodes=0))
+
+    def test_tools_51_get_descendants_only_walks_down(self):
+        """TOOLS-51: get_descendants follows subtasks and outward child-type links, not parents or other links."""
+        tools, client = self._descendant_tools({"ROOT-1": ["SUB-1"]})
+        get = client.session.get.side_effect
+
+        def link(type_name, side, key):
+            return {"type": {"name": type_name}, side: {"key": key}}
+
+        def get_with_relations(url, params=None, **kwargs):
+            response = get(url, params=params, **kwargs)
+            payload = json.loads(response.content)
+            for issue in payload["issues"]:
+                if issue["key"] == "ROOT-1":
+                    issue["fields"]["parent"] = {"key": "EPIC-1"}
+                    issue["fields"]["issuelinks"] = [
+                        link("Blocks", "outwardIssue", "BLOCKED-1"), link("Blocks", "inwardIssue", "BLOCKER-1"),
+                        link("Relates", "outwardIssue", "REL-1"), link("Duplicate", "outwardIssue", "DUP-1")]
+            return json_response(payload)
+        client.session.get.side_effect = get_with_relations
+
+        result = asyncio.run(tools.get_descendants("ROOT-1", max_depth=-1))
+        relates = asyncio.run(tools.get_descendants("ROOT-1", max_depth=-1, child_link_types=["relates"]))
+
+        self.assertEqual(sorted(issue.key for issue in result.descendants), ["BLOCKED-1", "SUB-1"])
+        self.assertEqual(sorted(issue.key for issue in relates.descendants), ["REL-1", "SUB-1"])
+
+
+class TestServerStats(unittest.TestCase):
+    """Test the diagnostics tool."""
+
+    def test_tools_52_server_stats_report_every_component(self):
+        """TOOLS-52: get_server_stats reports client, cache and pool metrics without contacting JIRA."""
+        client = JiraClient("https://test.jira.com")
+        client.session = Mock()
+        client.session.get.return_value = json_response({"key": "TEST-1", "fields": {"summary": "S"}})
+        tools = JiraTools(client)
+        client.get_issue("TEST-1", fields="summary")
+        client.get_issue("TEST-1", fields="summary")
+        client.session.get.reset_mock()
+
+        stats = asyncio.run(tools.server_stats())
+
+        client.session.get.assert_not_called()
+        self.assertEqual((stats.issue_cache["hits"], stats.issue_cache["misses"]), (1, 1))
+        self.assertEqual(stats.circuit_breaker["state"], "closed")
+        self.assertEqual(stats.connection_pool["max_size"], client.pool_stats()["max_size"])
+        self.assertEqual(stats.worker_pool["completed"], 0)
+        self.assertEqual((stats.in_flight_requests, stats.search_pages), (0, 0))
+        self.assertIsNone(stats.store)
+        self.assertIsNone(stats.delta_sync)
 
 
 if __name__ == "__main__":
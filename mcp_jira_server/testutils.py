@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""Shared helpers for the unit tests
+
+Stand-ins used by several test modules: a manually advanced clock for code
+that takes an injectable time source, and mock HTTP responses for tests that
+replace a client's session.
+"""
+
+import json
+from typing import Any, Dict, Optional
+from unittest.mock import Mock
+
+import requests
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def json_response(payload: Any = None, status_code: int = 200, headers: Optional[Dict[str, str]] = None) -> Mock:
+    """Build a mock requests.Response whose body is *payload* serialized as JSON.
+
+    Like a real response, ``raise_for_status`` raises for 4xx and 5xx statuses.
+    """
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.content = json.dumps(payload).encode("utf-8")
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(f"{status_code} Error")
+    return response